@@ -39,6 +39,7 @@ from calendarbot_lite.calendar.lite_datetime_utils import (
 from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
 from calendarbot_lite.core.monitoring_logging import get_logger
 from calendarbot_lite.core.timezone_utils import parse_request_timezone
+from calendarbot_lite.domain.event_window import EventWindow
 
 if TYPE_CHECKING:
     from calendarbot_lite.alexa.alexa_presentation import AlexaPresenter
@@ -197,7 +198,7 @@ class AlexaEndpointBase(ABC):
 
             # Read event window with lock
             async with window_lock:
-                window = tuple(event_window_ref[0])
+                window = event_window_ref[0]
 
             # Delegate to subclass-specific logic with exception handling
             response = await self.handle_request(request, window, now)
@@ -331,21 +332,11 @@ class AlexaEndpointBase(ABC):
         Returns:
             Tuple of (event, seconds_until) or None if no meetings found
         """
-        for ev in window:
-            start = ev.start.date_time
-            if not isinstance(start, datetime.datetime):
-                continue
-
-            seconds_until = int((start - now).total_seconds())
-
-            # For all-day events: active for the entire day, always include
-            # For timed events: skip if already ended OR currently in progress
-            # (in-progress meetings are handled by _find_current_meeting)
-            if not ev.is_all_day:
-                end = ev.end.date_time
-                # Skip if meeting has ended or is in progress
-                if isinstance(end, datetime.datetime) and (end <= now or (start <= now < end)):
-                    continue
+        # All-day events are active for the entire day and always included; timed
+        # events that ended or are in progress are skipped (in-progress meetings
+        # are handled by _find_current_meeting)
+        for ev in EventWindow.of(window).upcoming(now):
+            seconds_until = int((ev.start.date_time - now).total_seconds())
 
             # Skip focus time events if requested
             if skip_focus_time and self._is_focus_time(ev):
@@ -990,14 +981,10 @@ class LaunchSummaryHandler(AlexaEndpointBase):
         Returns:
             Dictionary with current meeting details or None if no meeting is in progress
         """
-        for ev in window:
+        for ev in EventWindow.of(window).covering(now):
             start = ev.start.date_time
             end = ev.end.date_time
 
-            # Skip if not datetime events
-            if not isinstance(start, datetime.datetime) or not isinstance(end, datetime.datetime):
-                continue
-
             # For all-day events, extract date from UTC time (which represents the calendar date)
             # For timed events, convert to local timezone for date comparison
             if ev.is_all_day:
@@ -1012,22 +999,20 @@ class LaunchSummaryHandler(AlexaEndpointBase):
             if event_date != today_date:
                 continue
 
-            # Check if meeting is currently in progress (start <= now < end)
-            if start <= now < end:
-                # Check if skipped
-                if self._is_skipped(ev):
-                    continue
+            # The index only returns meetings in progress (start <= now < end)
+            if self._is_skipped(ev):
+                continue
 
-                # Calculate seconds until end (for duration display)
-                seconds_until_end = int((end - now).total_seconds())
+            # Calculate seconds until end (for duration display)
+            seconds_until_end = int((end - now).total_seconds())
 
-                # Found a meeting in progress
-                return {
-                    "event": ev,
-                    "seconds_until_end": seconds_until_end,
-                    "subject": ev.subject,
-                    "is_current": True,
-                }
+            # Found a meeting in progress
+            return {
+                "event": ev,
+                "seconds_until_end": seconds_until_end,
+                "subject": ev.subject,
+                "is_current": True,
+            }
 
         return None
 
@@ -1051,10 +1036,11 @@ class LaunchSummaryHandler(AlexaEndpointBase):
         Returns:
             Dictionary with meeting details or None if no meeting found
         """
-        for ev in window:
+        # All-day events are active for the entire day and always included; timed
+        # events that ended or are in progress are skipped (in-progress meetings
+        # are handled by _find_current_meeting)
+        for ev in EventWindow.of(window).upcoming(now):
             start = ev.start.date_time
-            if not isinstance(start, datetime.datetime):
-                continue
 
             # For all-day events, extract date from UTC time (which represents the calendar date)
             # For timed events, convert to local timezone for date comparison
@@ -1073,15 +1059,7 @@ class LaunchSummaryHandler(AlexaEndpointBase):
             elif event_date <= today_date:
                 continue  # Skip today's and past meetings
 
-            # For all-day events: active for the entire day, always include
-            # For timed events: skip if already ended OR currently in progress
-            # (in-progress meetings are handled by _find_current_meeting)
             seconds_until = int((start - now).total_seconds())
-            if not ev.is_all_day:
-                end = ev.end.date_time
-                # Skip if meeting has ended or is in progress
-                if isinstance(end, datetime.datetime) and (end <= now or (start <= now < end)):
-                    continue
 
             # Check if skipped
             if self._is_skipped(ev):
@@ -1263,7 +1241,7 @@ class MorningSummaryHandler(AlexaEndpointBase):
 
             # Generate morning summary (window is already LiteCalendarEvent objects)
             service = MorningSummaryService()
-            summary_result = await service.generate_summary(list(window), summary_request)
+            summary_result = await service.generate_summary(window, summary_request)
 
             # Use presenter to format response (returns speech_text and optional SSML)
             # Note: We use the speech_text from summary_result, presenter just adds SSML if requested
@@ -14,6 +14,7 @@ from calendarbot_lite.alexa.alexa_types import AlexaDoneForDayInfo
 from calendarbot_lite.calendar.lite_datetime_utils import serialize_datetime_optional
 from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
 from calendarbot_lite.core.timezone_utils import parse_request_timezone
+from calendarbot_lite.domain.event_window import EventWindow
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +50,16 @@ async def compute_done_for_day_info(
     today_start = now.astimezone(tz).replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = today_start + datetime.timedelta(days=1)
 
-    # Use pipeline stages to filter events for today (with skipped events removed)
+    # Narrow to events near today with the window index (or the occurrence query
+    # published with it, which also sees meetings cut by the window's size limit),
+    # then let the pipeline stages apply the exact rules (with skipped events removed)
+    window = EventWindow.of(events)
+    if window.occurrences is not None:
+        candidates = window.occurrences.overlapping(today_start, today_end)
+    else:
+        candidates = window.overlapping(today_start, today_end)
     filtered_events = await filter_events_fn(
-        events=events,
+        events=candidates,
         window_start=today_start,
         window_end=today_end,
         apply_skipped_filter=True,
@@ -86,6 +86,9 @@ def register_api_routes(
                 "last_refresh_success_age_s": health_status.last_refresh_success_age_seconds,
                 "initial_refresh_complete": initial_refresh_complete,
                 "event_window_initialized": event_window_initialized,
+                "revalidation": health_tracker.get_revalidation_summary(),
+                "disk_cache": health_tracker.get_warm_start_status(),
+                "sources": health_tracker.get_source_status(),
             },
             "background_tasks": health_status.background_tasks,
             "display_probe": {
@@ -113,7 +116,7 @@ def register_api_routes(
 
         # Read window with lock to be consistent
         async with window_lock:
-            window = tuple(event_window_ref[0])
+            window = event_window_ref[0]
 
         logger.debug(" /api/whats-next called - window has %d events", len(window))
 
@@ -279,7 +282,7 @@ def register_api_routes(
 
         # Read window with lock to be consistent
         async with window_lock:
-            window = tuple(event_window_ref[0])
+            window = event_window_ref[0]
 
         logger.debug(
             "/api/done-for-day called - window has %d events, tz=%s", len(window), request_tz
@@ -327,7 +330,7 @@ def register_api_routes(
 
             # Read window with lock to be consistent
             async with window_lock:
-                window = tuple(event_window_ref[0])
+                window = event_window_ref[0]
 
             # Window now contains LiteCalendarEvent objects directly (no conversion needed)
             from calendarbot_lite.domain.morning_summary import (
@@ -336,7 +339,8 @@ def register_api_routes(
             )
 
             # Events are already LiteCalendarEvent objects from the event window
-            lite_events = list(window)
+            # (passed as-is so the summary can use the window's start/end index)
+            lite_events = window
 
             # Create morning summary request (no prefer_ssml for general API)
             summary_request = MorningSummaryRequest(
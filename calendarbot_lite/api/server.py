@@ -18,11 +18,12 @@ import contextlib
 import datetime
 import logging
 import signal
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional, cast
 
 # Import models for type annotations
-from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
+from calendarbot_lite.calendar.lite_models import ExpandedOccurrence, LiteCalendarEvent
 
 # Import shared HTTP client for connection reuse optimization
 from calendarbot_lite.core.http_client import close_all_clients, get_shared_client
@@ -32,6 +33,8 @@ from calendarbot_lite.core.timezone_utils import (
     get_server_timezone as _get_server_timezone,
     now_utc as _now_utc,
 )
+from calendarbot_lite.domain.event_window import EventWindow
+from calendarbot_lite.domain.occurrence_query import OccurrenceQuery
 
 # Import and configure logging early for Pi Zero 2W optimization
 try:
@@ -73,7 +76,6 @@ def log_monitoring_event(event: str, message: str, level: str = "INFO", **kwargs
 
 # Health tracking infrastructure - lightweight in-memory tracking for monitoring
 import os
-from typing import Optional
 
 # Initialize health tracker (replaces global health variables)
 from calendarbot_lite.core.health_tracker import HealthTracker, get_system_diagnostics
@@ -94,12 +96,22 @@ class SourceCacheEntry:
         last_fetch_success: UTC timestamp of last successful fetch
         cached_events: List of parsed LiteCalendarEvent objects
         consecutive_failures: Counter for tracking source health
+        etag: ETag validator from the last full response (for If-None-Match)
+        last_modified: Last-Modified validator from the last full response
+            (for If-Modified-Since)
+        content_bytes: Size of the last full body, reported as bytes saved on 304
+        fingerprints: Per-VEVENT fingerprint state for incremental reparsing
+            (ICSFingerprintState), None until a buffered parse succeeded
     """
 
     content_hash: str  # Normalized SHA-256 (DTSTAMP removed)
     last_fetch_success: datetime.datetime
     cached_events: list[Any]  # list[LiteCalendarEvent]
     consecutive_failures: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_bytes: int = 0
+    fingerprints: Optional[Any] = None
 
 
 # In-memory cache for ICS source metadata and events
@@ -107,12 +119,28 @@ class SourceCacheEntry:
 # Value: SourceCacheEntry with hash and cached events
 #
 # Memory overhead: ~100KB per source x 3 sources = ~300KB total
-# No persistence needed (single-user app, acceptable to rebuild on restart)
+# Mirrored to disk by _event_cache_store (when configured) for warm starts
 _source_cache_metadata: dict[str, SourceCacheEntry] = {}
 
 # Async lock for thread-safe cache updates
 _cache_lock: asyncio.Lock | None = None
 
+# Optional on-disk mirror of _source_cache_metadata (EventCacheStore), set by _serve
+# when event_cache_path is configured
+_event_cache_store: Any = None
+
+# Optional process pool for ICS parsing (ParseExecutor), set by _serve when
+# parse_workers is configured. Buffered feeds are parsed incrementally, so it
+# receives the whole feed on a source's first parse and only its changed VEVENTs
+# afterwards; streamed feeds are parsed in-process as they download.
+_parse_executor: Any = None
+
+# Optional MemoryBudgetGovernor, set by _serve when memory_budget_mb is configured
+_memory_governor: Any = None
+
+# Sources still refreshing after this many seconds are cancelled and served from cache
+SOURCE_REFRESH_TIMEOUT_S = 120.0
+
 # Import SSML generation for Alexa endpoints
 try:
     from calendarbot_lite.alexa.alexa_ssml import (
@@ -479,8 +507,11 @@ def _compute_last_meeting_end_for_today(
 def _lite_event_to_dict(event: Any, source_name: str = "") -> EventDict:
     """Convert LiteCalendarEvent to EventDict format for server compatibility.
 
+    Compact ExpandedOccurrence records are read field by field (shared fields
+    come from their master), without materializing a LiteCalendarEvent.
+
     Args:
-        event: LiteCalendarEvent object from parser
+        event: LiteCalendarEvent or ExpandedOccurrence object from parser
         source_name: Source name for tracking origin
 
     Returns:
@@ -565,12 +596,45 @@ def _compute_normalized_hash(content: str) -> str:
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
+class _NormalizedStreamHash:
+    """Incremental equivalent of _compute_normalized_hash for streamed bodies.
+
+    Lines are split on LF, so content that only differs in exotic line separators
+    may hash differently than the buffered path; that only costs one extra parse.
+    """
+
+    def __init__(self) -> None:
+        import hashlib
+
+        self._sha = hashlib.sha256()
+        self._partial = b""
+        self.bytes_seen = 0
+
+    def update(self, chunk: bytes) -> None:
+        """Feed a raw body chunk."""
+        self.bytes_seen += len(chunk)
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if not line.startswith(b"DTSTAMP:"):
+                self._sha.update(line + b"\n")
+
+    def hexdigest(self) -> str:
+        """Return the digest of everything fed so far."""
+        if self._partial and not self._partial.startswith(b"DTSTAMP:"):
+            self._sha.update(self._partial)
+        self._partial = b""
+        return self._sha.hexdigest()
+
+
 async def _fetch_and_parse_source(
     semaphore: asyncio.Semaphore,
     src_cfg: Any,
     config: Any,
     rrule_days: int,
     shared_http_client: Any = None,
+    keep_cached: bool = False,
+    on_start: Optional[Callable[[], None]] = None,
 ) -> tuple[str, list[LiteCalendarEvent], dict[str, Any]] | list[Any]:
     """Fetch and parse a single source using existing lite_fetcher and lite_parser abstractions.
 
@@ -583,16 +647,27 @@ async def _fetch_and_parse_source(
         config: Application configuration
         rrule_days: Days to expand RRULE patterns (passed to parser settings)
         shared_http_client: Optional shared HTTP client for connection reuse
+        keep_cached: Reuse the source's cached events, when it has any, instead of
+            fetching it (the refresh does not fit the memory budget)
+        on_start: Called once the semaphore is acquired, when the source's own
+            work starts (its latency excludes the wait for a free slot)
 
     Returns:
         3-tuple of (source_name, events, metadata_dict) where metadata contains:
         - hash_matched: bool indicating cache hit (skipped parsing)
+        - not_modified: bool indicating a 304 revalidation (skipped download and parsing)
+        - bytes_saved: int body size not downloaded thanks to the 304
         - parsed: bool indicating new parsing was performed
+        - streamed: bool indicating the body was parsed while downloading
+        - memory_deferred: bool indicating cached events were kept because the
+          source did not fit the memory budget
         Or empty list on error
     """
     global _cache_lock
 
     async with semaphore:
+        if on_start is not None:
+            on_start()
         logger.debug("Processing source configuration: %r", src_cfg)
         try:
             # Import required modules
@@ -621,17 +696,96 @@ async def _fetch_and_parse_source(
                 retry_backoff_factor = float(_get_config_value(config, "retry_backoff_factor", 1.5))
                 rrule_expansion_days = rrule_days
                 enable_rrule_expansion = True
+                rrule_expansion_processes = int(
+                    _get_config_value(config, "rrule_expansion_processes", 0) or 0
+                )
+                # Single events ending more than this many days ago are not parsed
+                # (None parses everything); post-processing keeps the last 24 hours
+                parse_window_lookback_days = _get_config_value(
+                    config, "parse_window_lookback_days", None
+                )
+
+            # Revalidate with the validators from the last full response. Only worth
+            # sending when there are cached events to fall back on after a 304.
+            cache_entry = _source_cache_metadata.get(source.url)
+
+            if keep_cached and cache_entry and cache_entry.cached_events:
+                logger.warning(
+                    "Memory budget exceeded - keeping %d cached events for source %r",
+                    len(cache_entry.cached_events),
+                    source.url,
+                )
+                return (source.name, cache_entry.cached_events, {"memory_deferred": True})
+
+            # Streaming mode feeds the body straight into the parser as it downloads
+            streaming_fetch = bool(_get_config_value(config, "streaming_fetch", False))
 
             # Fetch ICS data using LiteICSFetcher
             logger.debug("Fetching ICS data from source: %r", source.url)
             fetcher = LiteICSFetcher(_Settings(), shared_http_client)
             async with fetcher:
-                response = await fetcher.fetch_ics(source, conditional_headers=None)
+                conditional_headers = None
+                if cache_entry and cache_entry.cached_events:
+                    conditional_headers = (
+                        fetcher.get_conditional_headers(
+                            etag=cache_entry.etag, last_modified=cache_entry.last_modified
+                        )
+                        or None
+                    )
+                response = await fetcher.fetch_ics(
+                    source, conditional_headers=conditional_headers, stream=streaming_fetch
+                )
+
+                # The body must be consumed before the fetcher releases its client
+                if (
+                    streaming_fetch
+                    and response
+                    and response.success
+                    and response.stream_handle is not None
+                ):
+                    return await _parse_streamed_source(
+                        source,
+                        src_cfg,
+                        response,
+                        LiteICSParser(_Settings()),
+                        rrule_days,
+                        cache_entry,
+                    )
 
             if not response or not response.success:
                 logger.warning("Fetch failed for source %r", src_cfg)
                 return []
 
+            # 304 Not Modified - nothing downloaded, skip hashing and parsing entirely
+            if response.is_not_modified:
+                if not cache_entry or not cache_entry.cached_events:
+                    logger.warning(
+                        "Source %r answered 304 but no cached events are available", source.url
+                    )
+                    return []
+
+                logger.info(
+                    "Source %r not modified (304) - reusing %d cached events (saved %d bytes)",
+                    source.url,
+                    len(cache_entry.cached_events),
+                    cache_entry.content_bytes,
+                )
+
+                if _cache_lock is None:
+                    _cache_lock = asyncio.Lock()
+                async with _cache_lock:
+                    cache_entry.last_fetch_success = datetime.datetime.now(datetime.UTC)
+                    cache_entry.consecutive_failures = 0
+                    # Servers may rotate validators on a 304; keep the newest ones
+                    cache_entry.etag = response.etag or cache_entry.etag
+                    cache_entry.last_modified = response.last_modified or cache_entry.last_modified
+
+                return (
+                    source.name,
+                    cache_entry.cached_events,
+                    {"not_modified": True, "bytes_saved": cache_entry.content_bytes},
+                )
+
             # Get ICS content (handle both streaming and buffered responses)
             ics_content = None
             if hasattr(response, "stream_handle") and response.stream_handle:
@@ -650,7 +804,6 @@ async def _fetch_and_parse_source(
 
             # Check if content changed via normalized hash (OPTIMIZATION)
             # This allows skipping expensive parsing (~400ms) when calendar unchanged
-            cache_entry = _source_cache_metadata.get(source.url)
             if cache_entry:
                 # Compute normalized hash (strips DTSTAMP which changes on every export)
                 new_hash = _compute_normalized_hash(ics_content)
@@ -669,6 +822,9 @@ async def _fetch_and_parse_source(
                     async with _cache_lock:
                         cache_entry.last_fetch_success = datetime.datetime.now(datetime.UTC)
                         cache_entry.consecutive_failures = 0
+                        cache_entry.etag = response.etag
+                        cache_entry.last_modified = response.last_modified
+                        cache_entry.content_bytes = len(ics_content.encode("utf-8"))
 
                     # Return cached events (skip parsing)
                     return (source.name, cache_entry.cached_events, {"hash_matched": True})
@@ -690,96 +846,46 @@ async def _fetch_and_parse_source(
             logger.info("=== Source Pipeline: Processing ICS from %r ===", source.name)
             logger.debug("ICS content size: %d bytes from %r", len(ics_content), source.url)
 
-            from calendarbot_lite.domain.pipeline import EventProcessingPipeline, ProcessingContext
-            from calendarbot_lite.domain.pipeline_stages import (
-                DeduplicationStage,
-                ParseStage,
-                SortStage,
-            )
-
-            # Create per-source processing pipeline (runs once per ICS source)
-            # This pipeline handles: parsing raw ICS → expanding RRULEs → removing source-internal duplicates → sorting
-            # Note: Filtering/windowing/limiting happen later in _refresh_once after all sources are combined
-            parser = LiteICSParser(_Settings())
-            pipeline = (
-                EventProcessingPipeline()
-                .add_stage(ParseStage(parser))  # Parse ICS + expand RRULEs
-                .add_stage(DeduplicationStage())  # Remove source-internal duplicates
-                .add_stage(SortStage())  # Sort by time
-            )
+            from calendarbot_lite.domain.pipeline import ProcessingContext
 
-            # Create processing context
             context = ProcessingContext(
                 raw_content=ics_content,
                 source_url=source.url,
                 source_name=source.name,
                 rrule_expansion_days=rrule_days,
+                # Only VEVENTs changed since the last parse are parsed and expanded again
+                extra={"fingerprint_state": cache_entry.fingerprints if cache_entry else None},
             )
-
-            # Process through pipeline
-            result = await pipeline.process(context)
-
-            if not result.success:
-                logger.warning(
-                    "Pipeline processing failed for source %r: %s",
-                    src_cfg,
-                    "; ".join(result.errors) if result.errors else "Unknown error",
-                )
-                return []
-
-            if not context.events:
-                logger.debug("No events found in source %r", src_cfg)
+            content_bytes = len(ics_content.encode("utf-8"))
+            async with _memory_reservation(content_bytes) as fits:
+                if not fits and cache_entry and cache_entry.cached_events:
+                    logger.warning(
+                        "Source %r (%d bytes) does not fit the memory budget - "
+                        "keeping %d cached events",
+                        source.url,
+                        content_bytes,
+                        len(cache_entry.cached_events),
+                    )
+                    return (source.name, cache_entry.cached_events, {"memory_deferred": True})
+                events = await _run_source_pipeline(LiteICSParser(_Settings()), context, src_cfg)
+            if events is None:
                 return []
 
-            # Log pipeline statistics
-            logger.debug(
-                "Pipeline processed %d events from source %r (warnings: %d)",
-                len(context.events),
-                src_cfg,
-                len(result.warnings),
-            )
-
             # Successfully processed events - store in cache for future optimization
             # Compute normalized hash of ICS content (DTSTAMP removed for stability)
-            try:
-                # Ensure lock is initialized
-                if _cache_lock is None:
-                    _cache_lock = asyncio.Lock()
-
-                async with _cache_lock:
-                    # Evict oldest cache entry if limit reached
-                    max_cached_sources = 10  # Allow headroom for testing different URLs
-                    if len(_source_cache_metadata) >= max_cached_sources:
-                        oldest_url = min(
-                            _source_cache_metadata.items(), key=lambda x: x[1].last_fetch_success
-                        )[0]
-                        logger.debug("Evicting stale cache entry for %s", oldest_url)
-                        del _source_cache_metadata[oldest_url]
-
-                    # Store new cache entry
-                    normalized_hash = _compute_normalized_hash(ics_content)
-                    _source_cache_metadata[source.url] = SourceCacheEntry(
-                        content_hash=normalized_hash,
-                        last_fetch_success=datetime.datetime.now(datetime.UTC),
-                        cached_events=list(context.events),  # Shallow copy - assumes events immutable
-                        consecutive_failures=0,
-                    )
-                    logger.debug(
-                        "Cached %d events for source %r with hash %s...",
-                        len(context.events),
-                        source.url,
-                        normalized_hash[:8],
-                    )
-            except Exception as e:
-                # Cache storage failure shouldn't break the refresh flow
-                logger.warning("Failed to cache events for source %r: %s", source.url, e)
+            await _store_source_cache_entry(
+                source.url,
+                events,
+                _compute_normalized_hash(ics_content),
+                response,
+                content_bytes,
+                fingerprints=context.extra.get("fingerprint_state"),
+            )
 
             # Return tuple of (source_name, events) to preserve source information
             # Conversion to EventDict happens later after all sources are processed and filtered
-            logger.debug(
-                "Successfully processed %d events from source %r", len(context.events), src_cfg
-            )
-            return (source.name, context.events, {"parsed": True})
+            logger.debug("Successfully processed %d events from source %r", len(events), src_cfg)
+            return (source.name, events, {"parsed": True})
 
         except ImportError:
             logger.exception("Required modules not available")
@@ -789,6 +895,628 @@ async def _fetch_and_parse_source(
             return []
 
 
+def _memory_reservation(content_bytes: int) -> Any:
+    """Return an async context manager holding the memory needed to parse a feed.
+
+    It yields whether the feed fits the memory budget (always True without a
+    configured budget). See MemoryBudgetGovernor.reserve().
+
+    Args:
+        content_bytes: Size of the downloaded feed
+    """
+    if _memory_governor is None:
+        return contextlib.nullcontext(True)
+
+    from calendarbot_lite.core.memory_budget import estimate_source_mb
+
+    return _memory_governor.reserve(estimate_source_mb(content_bytes))
+
+
+def _plan_refresh_memory(sources_cfg: list[Any], fetch_concurrency: int) -> tuple[int, bool]:
+    """Fit a refresh's concurrency to the memory budget.
+
+    Feed sizes come from the last full download of each source.
+
+    Args:
+        sources_cfg: Source configurations of the refresh
+        fetch_concurrency: Configured concurrent sources
+
+    Returns:
+        Tuple of (fetch_concurrency, keep_cached) to refresh with
+    """
+    if _memory_governor is None:
+        return fetch_concurrency, False
+
+    from calendarbot_lite.core.memory_budget import DEFAULT_SOURCE_BYTES
+
+    source_bytes = []
+    for src_cfg in sources_cfg:
+        entry = _source_cache_metadata.get(_get_source_url(src_cfg))
+        known = entry.content_bytes if entry else None
+        source_bytes.append(known or DEFAULT_SOURCE_BYTES)
+
+    plan = _memory_governor.plan_refresh(source_bytes, fetch_concurrency)
+    if plan.degraded:
+        log_monitoring_event(
+            "refresh.memory.degraded",
+            f"Refresh degraded to fit the memory budget: {', '.join(plan.steps)}",
+            "WARNING",
+            details={
+                "steps": plan.steps,
+                "headroom_mb": plan.headroom_mb,
+                "budget_mb": _memory_governor.budget_mb,
+                "fetch_concurrency": plan.fetch_concurrency,
+                "source_bytes": source_bytes,
+            },
+            include_system_state=True,
+        )
+    return plan.fetch_concurrency, plan.keep_cached
+
+
+async def _parse_streamed_source(
+    source: Any,
+    src_cfg: Any,
+    response: Any,
+    parser: Any,
+    rrule_days: int,
+    cache_entry: Optional[SourceCacheEntry] = None,
+) -> tuple[str, list[LiteCalendarEvent], dict[str, Any]] | list[Any]:
+    """Parse a streamed response body while it downloads.
+
+    Chunks go straight from the socket into LiteICSParser.parse_ics_stream_incremental,
+    so peak memory does not scale with feed size. The normalized hash and the
+    per-VEVENT fingerprints are computed on the fly, so the cache entry stays
+    comparable with the buffered path: UIDs unchanged since the last refresh are
+    not expanded again, and an unchanged feed keeps its cached events.
+
+    Args:
+        source: LiteICSSource being refreshed
+        src_cfg: Original source configuration (for logging)
+        response: Successful LiteICSResponse carrying a StreamHandle
+        parser: LiteICSParser configured for this refresh
+        rrule_days: Days to expand RRULE patterns
+        cache_entry: The source's cache entry, if any
+
+    Returns:
+        3-tuple of (source_name, events, metadata) with metadata
+        {"parsed": True, "streamed": True}, or {"hash_matched": True, "streamed": True}
+        when the feed was unchanged; or empty list on error
+    """
+    global _cache_lock
+
+    from calendarbot_lite.domain.pipeline import ProcessingContext
+
+    stream_handle = response.stream_handle
+    digest = _NormalizedStreamHash()
+
+    async def _hashed_chunks() -> Any:
+        async for chunk in stream_handle.iter_bytes():
+            digest.update(chunk)
+            yield chunk
+
+    logger.info("=== Source Pipeline: Streaming ICS from %r ===", source.name)
+    context = ProcessingContext(
+        raw_stream=_hashed_chunks(),
+        source_url=source.url,
+        source_name=source.name,
+        rrule_expansion_days=rrule_days,
+        # Only VEVENTs changed since the last parse are expanded again
+        extra={"fingerprint_state": cache_entry.fingerprints if cache_entry else None},
+    )
+    try:
+        events = await _run_source_pipeline(parser, context, src_cfg)
+    finally:
+        await stream_handle.aclose()
+
+    if events is None:
+        return []
+
+    logger.debug("Streamed %d bytes from source %r", digest.bytes_seen, source.url)
+    content_hash = digest.hexdigest()
+    if cache_entry and cache_entry.cached_events and content_hash == cache_entry.content_hash:
+        # Unchanged feed: keep serving the cached events (the parse reused their
+        # expansions) so the published window does not churn
+        logger.info(
+            "Source %r content unchanged (hash match) - reusing %d cached events",
+            source.url,
+            len(cache_entry.cached_events),
+        )
+        if _cache_lock is None:
+            _cache_lock = asyncio.Lock()
+        async with _cache_lock:
+            cache_entry.last_fetch_success = datetime.datetime.now(datetime.UTC)
+            cache_entry.consecutive_failures = 0
+            cache_entry.etag = response.etag
+            cache_entry.last_modified = response.last_modified
+            cache_entry.content_bytes = digest.bytes_seen
+            cache_entry.fingerprints = context.extra.get("fingerprint_state")
+        return (source.name, cache_entry.cached_events, {"hash_matched": True, "streamed": True})
+
+    await _store_source_cache_entry(
+        source.url,
+        events,
+        content_hash,
+        response,
+        digest.bytes_seen,
+        fingerprints=context.extra.get("fingerprint_state"),
+    )
+    return (source.name, events, {"parsed": True, "streamed": True})
+
+
+async def _run_source_pipeline(
+    parser: Any, context: Any, src_cfg: Any
+) -> Optional[list[LiteCalendarEvent]]:
+    """Run the per-source pipeline (parse, dedupe, sort) over a prepared context.
+
+    Args:
+        parser: LiteICSParser configured for this refresh
+        context: ProcessingContext carrying raw_content or raw_stream
+        src_cfg: Original source configuration (for logging)
+
+    Returns:
+        Processed events (empty when the feed has none), or None when processing failed
+    """
+    from calendarbot_lite.domain.pipeline import EventProcessingPipeline
+    from calendarbot_lite.domain.pipeline_stages import (
+        DeduplicationStage,
+        ParseStage,
+        SortStage,
+    )
+
+    # Create per-source processing pipeline (runs once per ICS source)
+    # This pipeline handles: parsing raw ICS → expanding RRULEs → removing source-internal duplicates → sorting
+    # Note: Filtering/windowing/limiting happen later in _refresh_once after all sources are combined
+    pipeline = (
+        EventProcessingPipeline()
+        .add_stage(ParseStage(parser, executor=_parse_executor))  # Parse ICS + expand RRULEs
+        .add_stage(DeduplicationStage())  # Remove source-internal duplicates
+        .add_stage(SortStage())  # Sort by time
+    )
+
+    # Process through pipeline
+    result = await pipeline.process(context)
+
+    if not result.success:
+        logger.warning(
+            "Pipeline processing failed for source %r: %s",
+            src_cfg,
+            "; ".join(result.errors) if result.errors else "Unknown error",
+        )
+        return None
+
+    # Per-phase parse timings pin a slow refresh to a phase without a profiler
+    phase_timings = context.extra.get("parse_phase_timings")
+    if isinstance(phase_timings, dict) and phase_timings:
+        log_monitoring_event(
+            "refresh.source.parse_phases",
+            f"Parsed source {context.source_name!r} in "
+            f"{sum(t['ms'] for t in phase_timings.values()):.0f}ms of profiled phases",
+            "INFO",
+            details={"source_url": context.source_url, "phases": phase_timings},
+        )
+
+    if not context.events:
+        logger.debug("No events found in source %r", src_cfg)
+        return []
+
+    # Log pipeline statistics
+    logger.debug(
+        "Pipeline processed %d events from source %r (warnings: %d)",
+        len(context.events),
+        src_cfg,
+        len(result.warnings),
+    )
+    return context.events
+
+
+async def _store_source_cache_entry(
+    source_url: str,
+    events: list[LiteCalendarEvent],
+    content_hash: str,
+    response: Any,
+    content_bytes: int,
+    fingerprints: Optional[Any] = None,
+) -> None:
+    """Store freshly parsed events and validators for hash/304 reuse on later refreshes.
+
+    Args:
+        source_url: Source URL (cache key)
+        events: Parsed events for the source
+        content_hash: Normalized content hash (DTSTAMP removed)
+        response: LiteICSResponse providing ETag/Last-Modified validators
+        content_bytes: Body size, reported as bytes saved on a later 304
+        fingerprints: Per-VEVENT fingerprint state for the next incremental parse
+    """
+    global _cache_lock
+
+    try:
+        # Ensure lock is initialized
+        if _cache_lock is None:
+            _cache_lock = asyncio.Lock()
+
+        async with _cache_lock:
+            # Evict oldest cache entry if limit reached
+            max_cached_sources = 10  # Allow headroom for testing different URLs
+            if len(_source_cache_metadata) >= max_cached_sources:
+                oldest_url = min(
+                    _source_cache_metadata.items(), key=lambda x: x[1].last_fetch_success
+                )[0]
+                logger.debug("Evicting stale cache entry for %s", oldest_url)
+                del _source_cache_metadata[oldest_url]
+
+            # Store new cache entry
+            _source_cache_metadata[source_url] = SourceCacheEntry(
+                content_hash=content_hash,
+                last_fetch_success=datetime.datetime.now(datetime.UTC),
+                cached_events=list(events),  # Shallow copy - assumes events immutable
+                consecutive_failures=0,
+                etag=response.etag,
+                last_modified=response.last_modified,
+                content_bytes=content_bytes,
+                fingerprints=fingerprints,
+            )
+            logger.debug(
+                "Cached %d events for source %r with hash %s...",
+                len(events),
+                source_url,
+                content_hash[:8],
+            )
+    except Exception as e:
+        # Cache storage failure shouldn't break the refresh flow
+        logger.warning("Failed to cache events for source %r: %s", source_url, e)
+
+
+def _get_source_url(src_cfg: Any) -> str:
+    """Extract URL from source config (handles dict, object, or string)."""
+    if isinstance(src_cfg, dict):
+        return src_cfg.get("url", str(src_cfg))
+    if hasattr(src_cfg, "url"):
+        return src_cfg.url
+    return str(src_cfg)
+
+
+def _get_source_name(src_cfg: Any) -> str:
+    """Extract name from source config."""
+    if isinstance(src_cfg, dict):
+        return src_cfg.get("name", _get_source_url(src_cfg))
+    if hasattr(src_cfg, "name"):
+        return src_cfg.name
+    return _get_source_url(src_cfg)
+
+
+async def _build_window_events(
+    config: Any,
+    skipped_store: object | None,
+    parsed_events: list[LiteCalendarEvent],
+) -> list[LiteCalendarEvent]:
+    """Filter skipped events, apply the time window and limit to the display size.
+
+    Args:
+        config: Application configuration
+        skipped_store: Optional store for skipped events
+        parsed_events: Combined events from all sources
+
+    Returns:
+        Events to publish in the event window
+    """
+    # Get current time and window size for pipeline configuration
+    now = _now_utc()
+    window_size = int(_get_config_value(config, "event_window_size", 50))
+
+    # Get skipped event IDs from store if available
+    skipped_event_ids: set[str] = set()
+    if skipped_store is not None:
+        try:
+            active_list_fn = getattr(skipped_store, "active_list", None)
+            if callable(active_list_fn):
+                active_skips = active_list_fn()
+                if active_skips and hasattr(active_skips, "keys"):
+                    skipped_event_ids = set(active_skips.keys())  # type: ignore[attr-defined]
+                    logger.debug("Loaded %d skipped event IDs from store", len(skipped_event_ids))
+        except Exception as e:
+            logger.warning("Failed to get skipped event IDs: %s", e)
+
+    # Pipeline 2 (multi-source post-processing): processes combined events from all sources
+    logger.info(
+        "=== Post-Processing Pipeline: Filtering and limiting %d combined events ===",
+        len(parsed_events),
+    )
+
+    from calendarbot_lite.domain.pipeline import EventProcessingPipeline, ProcessingContext
+    from calendarbot_lite.domain.pipeline_stages import (
+        EventLimitStage,
+        SkippedEventsFilterStage,
+        TimeWindowStage,
+    )
+
+    # Create multi-source post-processing pipeline (runs once after combining all sources)
+    # This pipeline handles: filtering skipped events → applying time window → limiting to display size
+    post_pipeline = (
+        EventProcessingPipeline()
+        .add_stage(SkippedEventsFilterStage())
+        .add_stage(TimeWindowStage())
+        .add_stage(EventLimitStage())
+    )
+
+    # Calculate window start to include past events from today
+    # Go back 24 hours to ensure we capture events from "today" in any timezone
+    # This is needed for done-for-day queries that need to see completed meetings
+    import datetime
+
+    window_start = now - datetime.timedelta(hours=24)
+
+    # Create context for post-processing
+    post_context = ProcessingContext(
+        events=parsed_events,
+        skipped_event_ids=skipped_event_ids,
+        window_start=window_start,  # Start from 24 hours ago to include past events from today
+        window_end=None,  # No end limit (TimeWindowStage will handle)
+        event_window_size=window_size,
+        now=now,
+    )
+
+    # Process through post-processing pipeline
+    post_result = await post_pipeline.process(post_context)
+
+    if not post_result.success:
+        logger.warning(
+            "Post-processing pipeline failed: %s",
+            "; ".join(post_result.errors) if post_result.errors else "Unknown error",
+        )
+        # Fall back to using all parsed events if post-processing fails
+        final_events = parsed_events
+    else:
+        final_events = post_context.events
+        logger.debug(
+            "Post-processing pipeline complete: %d → %d events (filtered: %d, warnings: %d)",
+            post_result.events_in,
+            post_result.events_out,
+            post_result.events_in - post_result.events_out,
+            len(post_result.warnings),
+        )
+
+    return final_events
+
+
+async def _warm_start_from_disk(
+    config: Any,
+    skipped_store: object | None,
+    event_window_ref: list[tuple[LiteCalendarEvent, ...]],
+    window_lock: asyncio.Lock,
+) -> int:
+    """Seed the source cache and event window from the on-disk event cache.
+
+    Runs once at startup, before the first network refresh, so the window can be
+    served immediately. Restored sources are reported as stale in /api/health until
+    they are fetched successfully.
+
+    Args:
+        config: Application configuration
+        skipped_store: Optional store for skipped events
+        event_window_ref: Reference to event window for atomic updates
+        window_lock: Lock for thread-safe event window updates
+
+    Returns:
+        Number of events placed in the window (0 when nothing was restored)
+    """
+    global _cache_lock
+
+    store = _event_cache_store
+    if store is None:
+        return 0
+
+    sources_cfg = _get_config_value(config, "ics_sources", []) or []
+    loaded = await asyncio.to_thread(store.load, [_get_source_url(s) for s in sources_cfg])
+    if not loaded.sources:
+        return 0
+
+    if _cache_lock is None:
+        _cache_lock = asyncio.Lock()
+
+    parsed_events: list[LiteCalendarEvent] = []
+    async with _cache_lock:
+        for url, persisted in loaded.sources.items():
+            _source_cache_metadata[url] = SourceCacheEntry(
+                content_hash=persisted.content_hash,
+                last_fetch_success=persisted.last_fetch_success,
+                cached_events=persisted.events,
+                etag=persisted.etag,
+                last_modified=persisted.last_modified,
+                content_bytes=persisted.content_bytes,
+            )
+            parsed_events.extend(persisted.events)
+
+    final_events = await _build_window_events(config, skipped_store, parsed_events)
+    window = EventWindow(final_events, OccurrenceQuery(parsed_events))
+    async with window_lock:
+        event_window_ref[0] = window
+
+    saved_at = loaded.saved_at or min(p.last_fetch_success for p in loaded.sources.values())
+    _health_tracker.record_warm_start(list(loaded.sources), saved_at.timestamp())
+    logger.info(
+        "Warm start: restored %d sources from %s (%d events in window, saved %s)",
+        len(loaded.sources),
+        store.path,
+        len(final_events),
+        saved_at.isoformat(),
+    )
+    return len(final_events)
+
+
+async def _persist_event_cache(config: Any) -> None:
+    """Mirror the in-memory source cache of the configured sources to disk.
+
+    Args:
+        config: Application configuration (selects which sources are persisted)
+    """
+    store = _event_cache_store
+    if store is None:
+        return
+
+    from calendarbot_lite.domain.event_cache_store import PersistedSource
+
+    if _cache_lock is None:
+        return
+
+    source_urls = {_get_source_url(s) for s in _get_config_value(config, "ics_sources", []) or []}
+    async with _cache_lock:
+        snapshot = {
+            url: PersistedSource(
+                content_hash=entry.content_hash,
+                last_fetch_success=entry.last_fetch_success,
+                events=list(entry.cached_events),
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                content_bytes=entry.content_bytes,
+            )
+            for url, entry in _source_cache_metadata.items()
+            if url in source_urls
+        }
+
+    if not snapshot:
+        return
+    try:
+        await asyncio.to_thread(store.save, snapshot, datetime.datetime.now(datetime.UTC))
+    except Exception as e:
+        # Persistence failure shouldn't break the refresh flow
+        logger.warning("Failed to persist event cache: %s", e)
+
+
+async def _collect_source_results(
+    fetch_tasks: dict[asyncio.Task[Any], int],
+    sources_cfg: list[Any],
+    timeout: float,
+    on_progress: Callable[[list[Any]], Awaitable[None]],
+    fetch_started: Optional[dict[int, float]] = None,
+) -> list[Any]:
+    """Wait for per-source refresh tasks as they complete, up to a deadline.
+
+    Records each source's latency in the health tracker. Sources still running
+    at the deadline are cancelled and reported as AsyncTimeoutError, and sources
+    whose refresh failed (an empty list) as RuntimeError, so every failure falls
+    back to the source's cached events the same way.
+
+    Args:
+        fetch_tasks: Task -> index of its source in sources_cfg
+        sources_cfg: Source configurations
+        timeout: Seconds to wait for all sources
+        on_progress: Called with the results so far (None for sources still
+            running) after each completion while other sources are pending
+        fetch_started: Loop time at which each source's fetch started, by index
+            in sources_cfg; latency of sources missing from it (still waiting
+            for a free slot) counts from the start of the refresh
+
+    Returns:
+        Result tuple or exception per source, in sources_cfg order
+    """
+    from calendarbot_lite.core.async_utils import AsyncTimeoutError
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + timeout
+    results: list[Any] = [None] * len(sources_cfg)
+    pending: set[asyncio.Task[Any]] = set(fetch_tasks)
+    if fetch_started is None:
+        fetch_started = {}
+
+    while pending:
+        done, pending = await asyncio.wait(
+            pending,
+            timeout=max(0.0, deadline - loop.time()),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not done:
+            for task in pending:
+                task.cancel()
+                i = fetch_tasks[task]
+                results[i] = AsyncTimeoutError(f"Source did not complete within {timeout:.0f}s")
+                ran = deadline - fetch_started[i] if i in fetch_started else timeout
+                _health_tracker.record_source_latency(
+                    _get_source_url(sources_cfg[i]), _get_source_name(sources_cfg[i]), ran
+                )
+            logger.warning(
+                "%d of %d sources timed out after %.0fs", len(pending), len(results), timeout
+            )
+            break
+
+        for task in done:
+            i = fetch_tasks[task]
+            if task.cancelled():
+                results[i] = RuntimeError("Source refresh was cancelled")
+            elif task.exception() is not None:
+                results[i] = task.exception()
+            elif task.result() == []:
+                # _fetch_and_parse_source logs and swallows its own errors
+                results[i] = RuntimeError("Source fetch or parse failed")
+            else:
+                results[i] = task.result()
+            _health_tracker.record_source_latency(
+                _get_source_url(sources_cfg[i]),
+                _get_source_name(sources_cfg[i]),
+                loop.time() - fetch_started.get(i, started),
+            )
+
+        if pending:
+            await on_progress(results)
+
+    return results
+
+
+async def _publish_partial_window(
+    config: Any,
+    skipped_store: object | None,
+    event_window_ref: list[tuple[LiteCalendarEvent, ...]],
+    window_lock: asyncio.Lock,
+    sources_cfg: list[Any],
+    results: list[Any],
+    response_cache: Any = None,
+) -> None:
+    """Publish a window from the sources refreshed so far while others are still running.
+
+    Completed sources contribute their fresh events; sources still running or
+    failed contribute their cached events. Nothing is published unless a source
+    was freshly parsed, or while a running source has no cached events (its
+    events would briefly vanish from a populated window).
+
+    Args:
+        config: Application configuration
+        skipped_store: Optional store for skipped events
+        event_window_ref: Reference to event window for atomic updates
+        window_lock: Lock for thread-safe event window updates
+        sources_cfg: Source configurations
+        results: Result, exception or None (still running) per source
+        response_cache: Optional ResponseCache to invalidate on window update
+    """
+    if not any(isinstance(r, tuple) and len(r) > 2 and r[2].get("parsed") for r in results):
+        return
+
+    parsed_events: list[LiteCalendarEvent] = []
+    for src_cfg, result in zip(sources_cfg, results, strict=True):
+        if isinstance(result, tuple) and len(result) >= 2:
+            parsed_events.extend(result[1])
+            continue
+        cache_entry = _source_cache_metadata.get(_get_source_url(src_cfg))
+        if cache_entry and cache_entry.cached_events:
+            parsed_events.extend(cache_entry.cached_events)
+        elif result is None and len(event_window_ref[0]) > 0:
+            return
+
+    final_events = await _build_window_events(config, skipped_store, parsed_events)
+    window = EventWindow(final_events, OccurrenceQuery(parsed_events))
+    async with window_lock:
+        event_window_ref[0] = window
+    if response_cache:
+        response_cache.invalidate_all()
+
+    fresh = sum(1 for r in results if isinstance(r, tuple))
+    logger.info(
+        "Published partial event window: %d events, %d/%d sources refreshed",
+        len(final_events),
+        fresh,
+        len(sources_cfg),
+    )
+
+
 async def _refresh_once(
     config: Any,
     skipped_store: object | None,
@@ -802,7 +1530,10 @@ async def _refresh_once(
     This function performs lazy imports of the calendarbot parsing/fetching modules
     and is resilient if those modules are not present yet.
 
-    Uses bounded concurrency for fetching sources.
+    Uses bounded concurrency for fetching sources. Sources complete independently:
+    while others are still running, each freshly parsed source is published right
+    away (see _publish_partial_window), and sources still running after
+    SOURCE_REFRESH_TIMEOUT_S fall back to their cached events.
 
     Args:
         config: Application configuration
@@ -833,6 +1564,10 @@ async def _refresh_once(
     # How many days to expand recurrences
     rrule_days = int(_get_config_value(config, "rrule_expansion_days", 14))
 
+    # Serialize sources or keep cached events when the refresh would not fit the
+    # memory budget
+    fetch_concurrency, keep_cached = _plan_refresh_memory(sources_cfg, fetch_concurrency)
+
     logger.debug(
         "Refresh configuration: rrule_expansion_days=%d, sources_count=%d, fetch_concurrency=%d",
         rrule_days,
@@ -851,24 +1586,47 @@ async def _refresh_once(
         )
         return
 
-    # Import AsyncOrchestrator for centralized async patterns
-    from calendarbot_lite.core.async_utils import get_global_orchestrator
+    # Use bounded concurrency for fetching sources. Each source's latency counts
+    # from when it gets a slot, not from when it was queued behind the others.
+    semaphore = asyncio.Semaphore(fetch_concurrency)
+    loop = asyncio.get_running_loop()
+    fetch_started: dict[int, float] = {}
 
-    orchestrator = get_global_orchestrator()
+    def _mark_started(i: int) -> Callable[[], None]:
+        return lambda: fetch_started.__setitem__(i, loop.time())
 
-    # Use bounded concurrency for fetching sources
-    semaphore = asyncio.Semaphore(fetch_concurrency)
-    fetch_tasks = [
+    fetch_tasks = {
         asyncio.create_task(
-            _fetch_and_parse_source(semaphore, src_cfg, config, rrule_days, shared_http_client)
-        )
-        for src_cfg in sources_cfg
-    ]
+            _fetch_and_parse_source(
+                semaphore,
+                src_cfg,
+                config,
+                rrule_days,
+                shared_http_client,
+                keep_cached,
+                on_start=_mark_started(i),
+            )
+        ): i
+        for i, src_cfg in enumerate(sources_cfg)
+    }
 
-    # Execute all fetch tasks concurrently with timeout management
-    # Use 120s timeout for fetching all sources (reasonable for multiple ICS fetches)
-    fetch_results = await orchestrator.gather_with_timeout(
-        *fetch_tasks, timeout=120.0, return_exceptions=True
+    # Each source completes on its own: its fresh events are published right away
+    # (merged with the cached events of the others) instead of waiting for the
+    # slowest source. Sources still running after 120s count as failed.
+    fetch_results = await _collect_source_results(
+        fetch_tasks,
+        sources_cfg,
+        SOURCE_REFRESH_TIMEOUT_S,
+        lambda results: _publish_partial_window(
+            config,
+            skipped_store,
+            event_window_ref,
+            window_lock,
+            sources_cfg,
+            results,
+            response_cache,
+        ),
+        fetch_started,
     )
 
     # Process results and collect parsed LiteCalendarEvent objects
@@ -880,24 +1638,6 @@ async def _refresh_once(
 
     max_cache_age_seconds = 3600  # 1 hour
 
-    # Helper to get source URL from config
-    def _get_source_url(src_cfg: Any) -> str:
-        """Extract URL from source config (handles dict, object, or string)."""
-        if isinstance(src_cfg, dict):
-            return src_cfg.get("url", str(src_cfg))
-        if hasattr(src_cfg, "url"):
-            return src_cfg.url
-        return str(src_cfg)
-
-    # Helper to get source name from config
-    def _get_source_name(src_cfg: Any) -> str:
-        """Extract name from source config."""
-        if isinstance(src_cfg, dict):
-            return src_cfg.get("name", _get_source_url(src_cfg))
-        if hasattr(src_cfg, "name"):
-            return src_cfg.name
-        return _get_source_url(src_cfg)
-
     for i, result in enumerate(fetch_results):
         if isinstance(result, Exception):
             logger.error("DEBUG: Source %r failed: %s", sources_cfg[i], result)
@@ -953,9 +1693,17 @@ async def _refresh_once(
 
             logger.debug(" Source %r returned %d events", sources_cfg[i], len(events))
 
-            # Track success in health tracker
+            # Track success in health tracker. Cached events kept to fit the memory
+            # budget were not fetched, so the source stays stale.
             src_url = _get_source_url(sources_cfg[i])
-            _health_tracker.record_source_success(src_url)
+            if len(result) > 2 and result[2].get("memory_deferred", False):
+                _health_tracker.record_source_deferred(src_url)
+            else:
+                _health_tracker.record_source_success(src_url)
+            if len(result) > 2 and result[2].get("not_modified", False):
+                _health_tracker.record_source_not_modified(
+                    src_url, int(result[2].get("bytes_saved", 0))
+                )
 
             # Add events to parsed list
             for event in events:
@@ -970,6 +1718,9 @@ async def _refresh_once(
             for item in result:
                 if isinstance(item, LiteCalendarEvent):
                     parsed_events.append(item)
+                elif isinstance(item, ExpandedOccurrence):
+                    # Compact occurrences stand in for LiteCalendarEvent downstream
+                    parsed_events.append(cast("LiteCalendarEvent", item))
                 elif isinstance(item, dict):
                     # Skip EventDict objects - these are from old code paths
                     logger.warning(
@@ -1015,86 +1766,16 @@ async def _refresh_once(
 
     logger.debug(" Total parsed events from all sources: %d", len(parsed_events))
 
-    # Get current time and window size for pipeline configuration
-    now = _now_utc()
-    window_size = int(_get_config_value(config, "event_window_size", 50))
-
-    # Get skipped event IDs from store if available
-    skipped_event_ids: set[str] = set()
-    if skipped_store is not None:
-        try:
-            active_list_fn = getattr(skipped_store, "active_list", None)
-            if callable(active_list_fn):
-                active_skips = active_list_fn()
-                if active_skips and hasattr(active_skips, "keys"):
-                    skipped_event_ids = set(active_skips.keys())  # type: ignore[attr-defined]
-                    logger.debug("Loaded %d skipped event IDs from store", len(skipped_event_ids))
-        except Exception as e:
-            logger.warning("Failed to get skipped event IDs: %s", e)
-
-    # Pipeline 2 (multi-source post-processing): processes combined events from all sources
-    logger.info(
-        "=== Post-Processing Pipeline: Filtering and limiting %d combined events ===",
-        len(parsed_events),
-    )
-
-    from calendarbot_lite.domain.pipeline import EventProcessingPipeline, ProcessingContext
-    from calendarbot_lite.domain.pipeline_stages import (
-        EventLimitStage,
-        SkippedEventsFilterStage,
-        TimeWindowStage,
-    )
-
-    # Create multi-source post-processing pipeline (runs once after combining all sources)
-    # This pipeline handles: filtering skipped events → applying time window → limiting to display size
-    post_pipeline = (
-        EventProcessingPipeline()
-        .add_stage(SkippedEventsFilterStage())
-        .add_stage(TimeWindowStage())
-        .add_stage(EventLimitStage())
-    )
-
-    # Calculate window start to include past events from today
-    # Go back 24 hours to ensure we capture events from "today" in any timezone
-    # This is needed for done-for-day queries that need to see completed meetings
-    import datetime
-
-    window_start = now - datetime.timedelta(hours=24)
-
-    # Create context for post-processing
-    post_context = ProcessingContext(
-        events=parsed_events,
-        skipped_event_ids=skipped_event_ids,
-        window_start=window_start,  # Start from 24 hours ago to include past events from today
-        window_end=None,  # No end limit (TimeWindowStage will handle)
-        event_window_size=window_size,
-        now=now,
-    )
-
-    # Process through post-processing pipeline
-    post_result = await post_pipeline.process(post_context)
-
-    if not post_result.success:
-        logger.warning(
-            "Post-processing pipeline failed: %s",
-            "; ".join(post_result.errors) if post_result.errors else "Unknown error",
-        )
-        # Fall back to using all parsed events if post-processing fails
-        final_events = parsed_events
-    else:
-        final_events = post_context.events
-        logger.debug(
-            "Post-processing pipeline complete: %d → %d events (filtered: %d, warnings: %d)",
-            post_result.events_in,
-            post_result.events_out,
-            post_result.events_in - post_result.events_out,
-            len(post_result.warnings),
-        )
+    final_events = await _build_window_events(config, skipped_store, parsed_events)
 
     # Update the event window atomically with LiteCalendarEvent objects
     # NOTE: Changed from EventDict to LiteCalendarEvent for consistency across codebase
+    # The start/end index is built here, once per refresh, outside the lock, along
+    # with the occurrence query over all parsed events that whats-next and
+    # done-for-day use to see past the window's size limit
+    window = EventWindow(final_events, OccurrenceQuery(parsed_events))
     async with window_lock:
-        event_window_ref[0] = tuple(final_events)
+        event_window_ref[0] = window
         final_count = len(final_events)
 
     # Invalidate response cache since event window has changed
@@ -1113,15 +1794,23 @@ async def _refresh_once(
         if isinstance(r, tuple) and len(r) > 2
         and r[2].get('parsed', False)
     )
+    sources_not_modified = sum(
+        1 for r in fetch_results
+        if isinstance(r, tuple) and len(r) > 2
+        and r[2].get('not_modified', False)
+    )
     sources_failed = sum(1 for r in fetch_results if isinstance(r, Exception))
 
     # Log optimization metrics
-    if sources_hash_matched > 0:
-        time_saved_ms = sources_hash_matched * 400  # ~400ms saved per skipped parse
+    if sources_hash_matched > 0 or sources_not_modified > 0:
+        # ~400ms saved per skipped parse (304s also skip the download)
+        time_saved_ms = (sources_hash_matched + sources_not_modified) * 400
         logger.info(
-            "Refresh optimization: %d parsed, %d hash matched, %d failed (saved ~%dms)",
+            "Refresh optimization: %d parsed, %d hash matched, %d not modified, %d failed "
+            "(saved ~%dms)",
             sources_parsed,
             sources_hash_matched,
+            sources_not_modified,
             sources_failed,
             time_saved_ms
         )
@@ -1132,6 +1821,11 @@ async def _refresh_once(
             sources_failed
         )
 
+    # Persist freshly parsed sources for the next warm start (hash matches and 304s
+    # leave the cached events unchanged, so there is nothing new to write)
+    if sources_parsed > 0:
+        await _persist_event_cache(config)
+
     updated = True  # We successfully updated the window
     message = f"Updated event window with {final_count} events"
 
@@ -1278,11 +1972,14 @@ async def _refresh_loop(
             logger.exception("DEBUG: Refresh loop unexpected error")
 
 
-def _event_to_api_model(ev: LiteCalendarEvent) -> dict[str, Any]:
+def _event_to_api_model(ev: LiteCalendarEvent | ExpandedOccurrence) -> dict[str, Any]:
     """Serialize LiteCalendarEvent to API response fields.
 
+    Compact ExpandedOccurrence records are read field by field (shared fields
+    come from their master), without materializing a LiteCalendarEvent.
+
     Args:
-        ev: LiteCalendarEvent object from event window
+        ev: LiteCalendarEvent or ExpandedOccurrence object from event window
 
     Returns:
         Dictionary with API response fields
@@ -1427,12 +2124,12 @@ async def _serve(
             If None, signal handlers are registered internally.
     """
     # Initialize global cache lock for thread-safe cache updates
-    global _cache_lock
+    global _cache_lock, _event_cache_store, _parse_executor, _memory_governor
     if _cache_lock is None:
         _cache_lock = asyncio.Lock()
 
     # Event window stored as single-element list for atomic replacement semantics.
-    event_window_ref: list[tuple[LiteCalendarEvent, ...]] = [()]
+    event_window_ref: list[tuple[LiteCalendarEvent, ...]] = [EventWindow()]
     window_lock = asyncio.Lock()
     stop_event = external_stop_event or asyncio.Event()
 
@@ -1490,6 +2187,39 @@ async def _serve(
     )
     logger.debug("Web application created")
 
+    # Parse in worker processes so a large feed does not stall the API
+    parse_workers = int(_get_config_value(config, "parse_workers", 0) or 0)
+    if parse_workers > 0:
+        from calendarbot_lite.calendar.lite_parse_executor import ParseExecutor
+
+        _parse_executor = ParseExecutor(
+            parse_workers, sharded=bool(_get_config_value(config, "sharded_parse", False))
+        )
+        logger.info(
+            "Parsing ICS feeds in %d worker processes%s",
+            _parse_executor.max_workers,
+            " (large feeds sharded)" if _parse_executor.sharded else "",
+        )
+
+    # Keep refreshes within a memory budget (degrading them when it gets tight)
+    memory_budget_mb = _get_config_value(config, "memory_budget_mb", None)
+    if isinstance(memory_budget_mb, (int, float)) and memory_budget_mb > 0:
+        from calendarbot_lite.core.memory_budget import MemoryBudgetGovernor
+
+        _memory_governor = MemoryBudgetGovernor(memory_budget_mb)
+        logger.info("Refresh memory budget: %s MB", memory_budget_mb)
+
+    # Serve the last persisted events right away instead of an empty window
+    event_cache_path = _get_config_value(config, "event_cache_path", None)
+    if event_cache_path:
+        try:
+            from calendarbot_lite.domain.event_cache_store import EventCacheStore
+
+            _event_cache_store = EventCacheStore(event_cache_path)
+            await _warm_start_from_disk(config, skipped_store, event_window_ref, window_lock)
+        except Exception as e:
+            logger.warning("Event cache warm start failed, continuing cold: %s", e)
+
     # Setup runner and TCP site
     from aiohttp import web  # type: ignore
 
@@ -1619,6 +2349,16 @@ async def _serve(
     except Exception as e:
         logger.warning("Error cleaning up shared HTTP clients: %s", e)
 
+    # Stop parse worker processes
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=False)
+        _parse_executor = None
+
+    # Stop RRULE expansion worker processes (started on first pooled expansion)
+    from calendarbot_lite.calendar.lite_rrule_process_pool import shutdown_rrule_process_pool
+
+    shutdown_rrule_process_pool(wait=False)
+
     # Shutdown global orchestrator (thread pool cleanup)
     try:
         from calendarbot_lite.core.async_utils import shutdown_global_orchestrator
@@ -1653,11 +2393,37 @@ def start_server(config: Any, skipped_store: object | None = None) -> None:
             - expansion_days_window: expansion time window in days (int, default 365)
             - expansion_time_budget_ms_per_rule: time budget per RRULE in ms (int, default 200)
             - expansion_yield_frequency: yield to event loop after N events (int, default 50)
+            - expansion_cache_entries: recurring masters whose occurrences are reused
+              across refreshes (int, default 1024, 0 disables)
+            - rrule_expansion_processes: compute occurrences of many recurring
+              masters in this many worker processes (int, default 0 = in-process)
+            - parse_window_lookback_days: skip parsing single events that ended
+              more than this many days ago or start after expansion_days_window
+              (int, default None = parse every event; 1 matches the 24-hour
+              post-processing window)
 
             # HTTP Fetcher Configuration
             - request_timeout: HTTP request timeout in seconds (int, default 30)
             - max_retries: maximum HTTP retries (int, default 3)
             - retry_backoff_factor: retry backoff multiplier (float, default 1.5)
+            - streaming_fetch: parse ICS bodies while they download instead of
+              buffering them first (bool, default False)
+
+            # Parse Offloading
+            - parse_workers: parse ICS content in this many worker processes
+              (int, default 0 = parse on the event loop, max 3)
+            - sharded_parse: split feeds of 1 MB or more at VEVENT boundaries
+              and parse the shards in all workers at once (bool, default False)
+
+            # Memory Budget
+            - memory_budget_mb: memory a refresh may use for fetching, parsing and
+              expanding sources (int, default None = no budget). When it gets
+              tight, sources are serialized, the expansion window is shrunk or
+              cached events are kept
+
+            # Warm Start
+            - event_cache_path: file to persist parsed events to and restore them
+              from at startup (str, default None = no on-disk cache)
 
         skipped_store: optional object implementing:
             - is_skipped(meeting_id) -> bool
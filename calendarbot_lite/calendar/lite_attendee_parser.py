@@ -5,8 +5,11 @@ Extracted from lite_parser.py to improve modularity and testability.
 """
 
 import logging
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any, Optional
 
+from calendarbot_lite.calendar.lite_fast_tokenizer import RawProperty
 from calendarbot_lite.calendar.lite_models import LiteAttendee, LiteAttendeeType, LiteResponseStatus
 
 logger = logging.getLogger(__name__)
@@ -95,3 +98,28 @@ class LiteAttendeeParser:
                     attendees.append(attendee)
 
         return attendees
+
+    def parse_attendee_lines(self, lines: Iterable[str]) -> list[LiteAttendee]:
+        """Parse raw ATTENDEE content lines (deferred by the fast tokenizer).
+
+        Equal lines share one LiteAttendee instance, as with a parse-time
+        InternTable, so decoding attendees for many events stays compact.
+
+        Args:
+            lines: Unfolded ATTENDEE content lines
+
+        Returns:
+            List of parsed LiteAttendee objects
+        """
+        attendees = []
+        for line in lines:
+            attendee = _parse_attendee_line(line)
+            if attendee:
+                attendees.append(attendee)
+        return attendees
+
+
+@lru_cache(maxsize=4096)
+def _parse_attendee_line(line: str) -> Optional[LiteAttendee]:
+    """Parse one raw ATTENDEE line (memoized so equal lines share the result)."""
+    return LiteAttendeeParser().parse_attendee(RawProperty(line))
@@ -253,17 +253,16 @@ class TimezoneParser:
             if tzid == "UTC" or dt_part.endswith("Z"):
                 return dt_naive.replace(tzinfo=UTC)
 
-            # Use comprehensive timezone normalization (handles Windows TZ, aliases, etc.)
-            from calendarbot_lite.core.timezone_utils import normalize_timezone_name
+            # Comprehensive timezone normalization (handles Windows TZ, aliases, etc.),
+            # memoized per TZID since a feed repeats the same few zones
+            from calendarbot_lite.calendar.lite_timezone_cache import resolve_tzid_name
 
-            iana_tz = normalize_timezone_name(tzid)
-            if iana_tz is None:
+            tz = resolve_tzid_name(tzid)
+            if tz is None:
                 # Log warning but fallback gracefully
                 logger.warning("Unknown timezone %r in %r, assuming UTC", tzid, datetime_str)
                 return dt_naive.replace(tzinfo=UTC)
 
-            # Apply timezone using zoneinfo (Python 3.12+ standard library)
-            tz = ZoneInfo(iana_tz)
             dt_with_tz = dt_naive.replace(tzinfo=tz)
             return dt_with_tz.astimezone(UTC)
 
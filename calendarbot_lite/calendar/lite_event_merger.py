@@ -9,6 +9,7 @@ import logging
 from typing import Optional
 
 from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
+from calendarbot_lite.calendar.lite_uid_index import UIDIndex
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class LiteEventMerger:
         self,
         original_events: list[LiteCalendarEvent],
         expanded_events: list[LiteCalendarEvent],
+        uid_index: Optional[UIDIndex] = None,
     ) -> list[LiteCalendarEvent]:
         """Merge expanded events with original events.
 
@@ -31,12 +33,16 @@ class LiteEventMerger:
         Args:
             original_events: Original parsed events (including RECURRENCE-ID instances)
             expanded_events: Expanded recurring event instances from RRULE
+            uid_index: Optional UIDIndex built from original_events during parsing;
+                its RECURRENCE-ID overrides are used instead of rescanning all events
 
         Returns:
             Combined list of events with overrides properly handled
         """
         # First, collect RECURRENCE-ID events and their original times for suppression
-        recurrence_overrides = self._collect_recurrence_overrides(original_events)
+        recurrence_overrides = self._collect_recurrence_overrides(
+            uid_index.override_events() if uid_index is not None else original_events
+        )
 
         # Filter expanded events to exclude those overridden by RECURRENCE-ID
         filtered_expanded, suppressed_count = self._filter_overridden_occurrences(
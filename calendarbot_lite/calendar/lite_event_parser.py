@@ -14,12 +14,15 @@ from icalendar import Event as ICalEvent
 
 from calendarbot_lite.calendar.lite_attendee_parser import LiteAttendeeParser
 from calendarbot_lite.calendar.lite_datetime_utils import LiteDateTimeParser
+from calendarbot_lite.calendar.lite_fast_tokenizer import RawProperty
+from calendarbot_lite.calendar.lite_intern import InternTable
 from calendarbot_lite.calendar.lite_models import (
     LiteCalendarEvent,
     LiteDateTimeInfo,
     LiteEventStatus,
     LiteLocation,
 )
+from calendarbot_lite.calendar.lite_parser_telemetry import ParserTelemetry
 from calendarbot_lite.core.config_manager import (
     MAX_EVENT_DESCRIPTION_LENGTH,
     MAX_EVENT_LOCATION_LENGTH,
@@ -48,17 +51,22 @@ class LiteEventComponentParser:
         self.datetime_parser = datetime_parser
         self.attendee_parser = attendee_parser
         self.settings = settings
+        # Phase timers; LiteICSParser installs a fresh telemetry for each parse
+        self.telemetry = ParserTelemetry()
 
     def parse_event_component(
         self,
         component: ICalEvent,
         default_timezone: Optional[str] = None,
+        intern_table: Optional[InternTable] = None,
     ) -> Optional[LiteCalendarEvent]:
         """Parse a single VEVENT component into LiteCalendarEvent.
 
         Args:
             component: iCalendar VEVENT component
             default_timezone: Default timezone for the calendar
+            intern_table: Optional per-refresh table; repeated field values of
+                the parsed event are replaced by their shared instances
 
         Returns:
             Parsed LiteCalendarEvent or None if parsing fails
@@ -67,12 +75,20 @@ class LiteEventComponentParser:
             # Extract basic properties
             basic_props = self._extract_basic_properties(component)
 
-            # Parse event times
-            try:
-                start_info, end_info = self._parse_event_times(component, default_timezone)
-            except ValueError as e:
-                logger.warning("Event %s %s, skipping", basic_props["uid"], e)
-                return None
+            telemetry = self.telemetry
+            with telemetry.phase("datetime"):
+                # Parse event times
+                try:
+                    start_info, end_info = self._parse_event_times(component, default_timezone)
+                except ValueError as e:
+                    logger.warning("Event %s %s, skipping", basic_props["uid"], e)
+                    return None
+
+                # Additional metadata
+                created = self.datetime_parser.parse_datetime_optional(component.get("CREATED"))
+                last_modified = self.datetime_parser.parse_datetime_optional(
+                    component.get("LAST-MODIFIED")
+                )
 
             # Event status and visibility
             status = self._parse_status(component.get("STATUS"))
@@ -80,21 +96,17 @@ class LiteEventComponentParser:
             show_as = self._map_transparency_to_status(transp, status, component)
 
             # Extract attendee info
-            attendee_info = self._extract_attendee_info(component)
+            with telemetry.phase("attendees"):
+                attendee_info = self._extract_attendee_info(component)
 
             # Extract recurrence info
             recurrence_info = self._extract_recurrence_info(component)
 
-            # Additional metadata
-            created = self.datetime_parser.parse_datetime_optional(component.get("CREATED"))
-            last_modified = self.datetime_parser.parse_datetime_optional(
-                component.get("LAST-MODIFIED")
-            )
-
             # Online meeting detection (Microsoft-specific)
-            is_online_meeting, online_meeting_url = self._detect_online_meeting(
-                basic_props["description"]
-            )
+            with telemetry.phase("online_meeting"):
+                is_online_meeting, online_meeting_url = self._detect_online_meeting(
+                    basic_props["description"]
+                )
 
             # Create LiteCalendarEvent
             calendar_event = LiteCalendarEvent(
@@ -117,6 +129,10 @@ class LiteEventComponentParser:
                 online_meeting_url=online_meeting_url,
             )
 
+            # Attendees still in raw form are decoded when first read
+            if attendee_info["deferred_lines"]:
+                calendar_event.defer_attendees(attendee_info["deferred_lines"])
+
             # Attach RRULE and EXDATE metadata onto the parsed event so downstream
             # helpers (debug scripts and expanders) can discover RRULEs directly
             # from the parsed event object. This is defensive and preserves the
@@ -127,6 +143,9 @@ class LiteEventComponentParser:
                 recurrence_info["exdate_props"],
             )
 
+            if intern_table is not None:
+                self.intern_event_fields(calendar_event, intern_table)
+
         except Exception:
             logger.exception("Failed to parse event component")
             return None
@@ -441,6 +460,35 @@ class LiteEventComponentParser:
             # Non-fatal: expansion code will fall back to raw component mapping if needed
             logger.debug("Failed to attach rrule/exdate metadata to parsed event", exc_info=True)
 
+    def intern_event_fields(
+        self, calendar_event: LiteCalendarEvent, intern_table: InternTable
+    ) -> None:
+        """Replace repeated field values of a parsed event with their shared instances.
+
+        Args:
+            calendar_event: Parsed calendar event (updated in place)
+            intern_table: Per-refresh intern table
+        """
+        # Write through __dict__ (as _attach_rrule_metadata does) so the values
+        # are swapped without pydantic marking the fields as explicitly set
+        fields = calendar_event.__dict__
+        for name in ("id", "subject", "body_preview", "online_meeting_url", "rrule_string"):
+            if fields.get(name) is not None:
+                fields[name] = intern_table.string(fields[name])
+        if fields.get("exdates"):
+            fields["exdates"] = intern_table.strings(fields["exdates"])
+        if calendar_event.location is not None:
+            fields["location"] = intern_table.location(calendar_event.location.display_name)
+        deferred_lines = calendar_event.deferred_attendee_lines
+        if deferred_lines is not None:
+            calendar_event.defer_attendees(
+                tuple(intern_table.string(line) for line in deferred_lines)
+            )
+        elif calendar_event.attendees:
+            fields["attendees"] = [intern_table.attendee(a) for a in calendar_event.attendees]
+        for when in (calendar_event.start, calendar_event.end):
+            when.__dict__["time_zone"] = intern_table.string(when.time_zone)
+
     def _extract_basic_properties(self, component: ICalEvent) -> dict[str, Any]:
         """Extract basic event properties from component.
 
@@ -557,7 +605,8 @@ class LiteEventComponentParser:
             component: iCalendar VEVENT component
 
         Returns:
-            Dictionary with attendee info: is_organizer, attendees
+            Dictionary with attendee info: is_organizer, attendees, deferred_lines
+            (raw ATTENDEE lines left undecoded by the fast tokenizer, else None)
         """
         # Organizer and attendees
         organizer = component.get("ORGANIZER")
@@ -573,12 +622,24 @@ class LiteEventComponentParser:
             # (more conservative than always True)
             is_organizer = False
 
+        # Raw attendee lines from the fast tokenizer stay undecoded
+        attendee_props = component.get("ATTENDEE")
+        if not isinstance(attendee_props, list):
+            attendee_props = [attendee_props]
+        if all(isinstance(prop, RawProperty) for prop in attendee_props):
+            return {
+                "is_organizer": is_organizer,
+                "attendees": None,
+                "deferred_lines": tuple(prop.line for prop in attendee_props),
+            }
+
         # Parse attendees using the dedicated parser
         attendees = self.attendee_parser.parse_attendees(component)
 
         return {
             "is_organizer": is_organizer,
             "attendees": attendees if attendees else None,
+            "deferred_lines": None,
         }
 
     def _extract_recurrence_info(self, component: ICalEvent) -> dict[str, Any]:
@@ -0,0 +1,450 @@
+"""Fast-path VEVENT tokenizer for common ICS feeds - CalendarBot Lite.
+
+The streaming parser used to rebuild a miniature VCALENDAR for every VEVENT
+and hand it to ``Calendar.from_ical``. Most events in real feeds only use a
+dozen plain properties, for which icalendar's generic content-line machinery
+(parameter objects, type factories, component classes) dominates parse time.
+
+This module tokenizes the already-unfolded lines of one VEVENT by hand and
+builds a lightweight component exposing the small read-only mapping API that
+LiteEventComponentParser uses (``get``, ``in``, ``[]``). Values mimic the
+icalendar types they replace: text values are ``str`` subclasses carrying
+``.params``, date/time values expose ``.dt``. Status/transparency mapping and
+everything downstream keep running through the existing component mapper.
+
+ATTENDEE lines are the bulk of a meeting-heavy feed but are only read when an
+endpoint asks for attendees. They are kept as RawProperty (the unparsed
+content line) and decoded on first read; LiteEventComponentParser stores the
+raw lines on the event so the attendee models are only built on demand.
+
+Anything the tokenizer does not fully understand makes parse_vevent_lines()
+return None, and the caller falls back to icalendar. This includes recurrence
+properties (RRULE, RDATE, EXDATE, EXRULE, RECURRENCE-ID), unknown non-X
+properties, repeated single-valued properties, nested components other than
+VALARM, escaped or RFC 6868 encoded parameters, multi-valued parameters and
+malformed values.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+
+from icalendar.parser import Contentline
+from icalendar.timezone import tzp
+
+from calendarbot_lite.calendar.lite_timezone_cache import TimezoneResolver
+
+_NAME_RE = re.compile(r"[A-Za-z0-9-]+\Z")
+_UNESCAPE_RE = re.compile(r"\\([\\,;:nN])")
+_DURATION_RE = re.compile(
+    r"([-+]?)P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?\Z"
+)
+
+# Property name -> value kind. Kinds mirror the icalendar value types:
+#   text     vText (backslash escapes removed)
+#   address  vCalAddress (backslash escapes removed)
+#   deferred vCalAddress kept as its raw line (RawProperty) until read
+#   raw      vUnknown (value kept verbatim)
+#   dt_tz    vDDDTypes honouring TZID
+#   dt       vDDDTypes ignoring TZID
+#   duration vDDDTypes holding a timedelta
+_PROPERTY_KINDS: dict[str, str] = {
+    "UID": "text",
+    "SUMMARY": "text",
+    "DESCRIPTION": "text",
+    "LOCATION": "text",
+    "STATUS": "text",
+    "TRANSP": "text",
+    "ORGANIZER": "address",
+    "ATTENDEE": "deferred",
+    "X-OUTLOOK-DELETED": "raw",
+    "X-MICROSOFT-CDO-BUSYSTATUS": "raw",
+    "DTSTART": "dt_tz",
+    "DTEND": "dt_tz",
+    "CREATED": "dt",
+    "LAST-MODIFIED": "dt",
+    "DURATION": "duration",
+}
+
+# Properties that may repeat (icalendar then returns a list from get())
+_MULTI_VALUED = frozenset({"ATTENDEE"})
+
+# Standard properties calendarbot never reads; other X-* properties are skipped too.
+_IGNORED = frozenset(
+    {
+        "DTSTAMP",
+        "SEQUENCE",
+        "CLASS",
+        "PRIORITY",
+        "CATEGORIES",
+        "URL",
+        "GEO",
+        "COMMENT",
+        "CONTACT",
+        "RELATED-TO",
+        "RESOURCES",
+        "ATTACH",
+    }
+)
+
+
+class FastText(str):
+    """Text or calendar-address value with its parameters (like icalendar's vText)."""
+
+    params: dict[str, str]
+
+    def __new__(cls, value: str, params: dict[str, str]) -> "FastText":
+        """Create a text value carrying ``params``."""
+        obj = super().__new__(cls, value)
+        obj.params = params
+        return obj
+
+
+class RawProperty:
+    """Calendar-address property kept as its content line until first read.
+
+    ``str()`` and ``.params`` decode the line like the ``address`` kind would
+    have at tokenize time; lines the fast rules reject are decoded by
+    icalendar instead, so the result always matches icalendar's.
+    """
+
+    __slots__ = ("_decoded", "line")
+
+    def __init__(self, line: str) -> None:
+        """Wrap an unfolded content line such as ``ATTENDEE;CN=A:mailto:a@x``."""
+        self.line = line
+        self._decoded: Optional[FastText] = None
+
+    def decode(self) -> FastText:
+        """Return the decoded value with its parameters."""
+        if self._decoded is None:
+            self._decoded = decode_address_line(self.line)
+        return self._decoded
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """Decoded parameters."""
+        return self.decode().params
+
+    def __str__(self) -> str:
+        """Return the decoded value."""
+        return str(self.decode())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by decoded value, like the str values it stands in for."""
+        if isinstance(other, RawProperty):
+            return self.decode() == other.decode()
+        return self.decode() == other
+
+    def __hash__(self) -> int:
+        """Hash the decoded value."""
+        return hash(self.decode())
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"RawProperty({self.line!r})"
+
+
+class FastDateValue:
+    """Date, date-time or duration value (like icalendar's vDDDTypes)."""
+
+    __slots__ = ("dt", "params")
+
+    def __init__(self, dt: Any, params: dict[str, str]) -> None:
+        """Create a value wrapping ``dt`` (date, datetime or timedelta)."""
+        self.dt = dt
+        self.params = params
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"FastDateValue({self.dt!r})"
+
+
+class FastVEvent:
+    """Read-only VEVENT component produced by the fast tokenizer.
+
+    Implements the subset of the icalendar component mapping API used by the
+    event and RRULE parsers. Property names are case-insensitive.
+    """
+
+    name = "VEVENT"
+    __slots__ = ("_props",)
+
+    def __init__(self, props: dict[str, Any]) -> None:
+        """Create a component from uppercased property name -> value."""
+        self._props = props
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of property ``key`` or ``default``."""
+        return self._props.get(key.upper(), default)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of property ``key``."""
+        return self._props[key.upper()]
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the property is present."""
+        return isinstance(key, str) and key.upper() in self._props
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Return (name, value) pairs."""
+        return list(self._props.items())
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"FastVEvent({self._props.get('UID')!r})"
+
+
+def _split_content_line(line: str) -> Optional[tuple[str, str, str]]:
+    """Split a content line into (name, raw parameters, raw value).
+
+    The value starts at the first colon outside double quotes. Lines that
+    use backslash escapes before the value are left to icalendar.
+    """
+    pos = 0
+    while True:
+        colon = line.find(":", pos)
+        if colon < 0:
+            return None
+        quote = line.find('"', pos, colon)
+        if quote < 0:
+            break
+        close = line.find('"', quote + 1)
+        if close < 0:
+            return None
+        pos = close + 1
+
+    head = line[:colon]
+    if "\\" in head:
+        return None
+    semi = head.find(";")
+    if semi < 0:
+        return head, "", line[colon + 1 :]
+    if semi + 1 == colon:
+        return None
+    return head[:semi], head[semi + 1 :], line[colon + 1 :]
+
+
+def _parse_params(raw: str) -> Optional[dict[str, str]]:
+    """Parse ``NAME=value;NAME="quoted value"`` parameters.
+
+    Returns None for anything icalendar would decode differently from a plain
+    string: RFC 6868 caret escapes, unquoted multi-values and stray whitespace.
+    """
+    if "^" in raw:
+        return None
+
+    if '"' in raw:
+        parts: list[str] = []
+        start = 0
+        in_quotes = False
+        for i, ch in enumerate(raw):
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ";" and not in_quotes:
+                parts.append(raw[start:i])
+                start = i + 1
+        parts.append(raw[start:])
+    else:
+        parts = raw.split(";")
+
+    params: dict[str, str] = {}
+    for part in parts:
+        key, sep, value = part.partition("=")
+        if not sep or not _NAME_RE.match(key):
+            return None
+        if value.startswith('"'):
+            if len(value) < 2 or not value.endswith('"') or '"' in value[1:-1]:
+                return None
+            value = value[1:-1]
+        elif not value or "," in value or '"' in value or value != value.strip():
+            return None
+        params[key.upper()] = value
+    return params
+
+
+def decode_address_line(line: str) -> FastText:
+    """Decode a calendar-address content line (for example a raw ATTENDEE line).
+
+    Args:
+        line: Unfolded content line, including the property name
+
+    Returns:
+        FastText holding the unescaped value and the line's parameters
+    """
+    parts = _split_content_line(line)
+    params: Optional[dict[str, Any]] = None
+    if parts is not None:
+        _, raw_params, value = parts
+        params = _parse_params(raw_params) if raw_params else {}
+    if params is None:
+        _, ical_params, value = Contentline(line).parts()
+        params = dict(ical_params)
+    return FastText(_unescape(value), params)
+
+
+def _plain_params(raw: str) -> bool:
+    """Cheap check that deferred parameters need no RFC 6868 or multi-value decoding."""
+    return "^" not in raw and ("," not in raw or '"' in raw)
+
+
+def _parse_date_value(
+    value: str, tzid: Optional[str], resolver: Optional[TimezoneResolver] = None
+) -> Optional[Any]:
+    """Parse a DATE or DATE-TIME value the way icalendar's vDDDTypes does.
+
+    TZIDs are resolved through the feed's resolver when one is given.
+    Returns None if the value is not a plain date or date-time.
+    """
+    length = len(value)
+    if length == 8:
+        if tzid or not value.isdigit():
+            # icalendar turns a TZID date into a localized datetime; leave it to icalendar
+            return None
+        return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+
+    if length not in (15, 16) or value[8] != "T":
+        return None
+    if not (value[:8].isdigit() and value[9:15].isdigit()):
+        return None
+    utc = length == 16
+    if utc and (value[15] != "Z" or tzid):
+        return None
+
+    dt = datetime(
+        int(value[:4]),
+        int(value[4:6]),
+        int(value[6:8]),
+        int(value[9:11]),
+        int(value[11:13]),
+        int(value[13:15]),
+    )
+    if tzid:
+        tzinfo = resolver.resolve(tzid) if resolver is not None else tzp.timezone(tzid)
+        # Unknown TZIDs stay naive, exactly as icalendar leaves them
+        return dt if tzinfo is None else tzp.localize(dt, tzinfo)
+    if utc:
+        return tzp.localize_utc(dt)
+    return dt
+
+
+def _parse_duration(value: str) -> Optional[timedelta]:
+    """Parse an RFC 5545 DURATION value, or return None if malformed."""
+    match = _DURATION_RE.match(value)
+    if not match:
+        return None
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(
+        weeks=int(weeks or 0),
+        days=int(days or 0),
+        hours=int(hours or 0),
+        minutes=int(minutes or 0),
+        seconds=int(seconds or 0),
+    )
+    return -duration if sign == "-" else duration
+
+
+def _unescape(value: str) -> str:
+    """Remove TEXT backslash escapes (same rules as icalendar's unescape_backslash)."""
+    if "\\" not in value:
+        return value
+    return _UNESCAPE_RE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def _parse_value(
+    kind: str, value: str, params: dict[str, str], resolver: Optional[TimezoneResolver]
+) -> Optional[Any]:
+    """Convert a raw property value according to its kind."""
+    if kind in ("text", "address"):
+        return FastText(_unescape(value), params)
+    if kind == "raw":
+        return FastText(value, params)
+    if kind == "duration":
+        duration = _parse_duration(value)
+        return None if duration is None else FastDateValue(duration, params)
+
+    value_type = params.get("VALUE")
+    if value_type is not None and not (
+        (value_type == "DATE" and len(value) == 8)
+        or (value_type == "DATE-TIME" and len(value) != 8)
+    ):
+        return None
+    tzid = params.get("TZID") if kind == "dt_tz" else None
+    parsed = _parse_date_value(value, tzid, resolver)
+    return None if parsed is None else FastDateValue(parsed, params)
+
+
+def parse_vevent_lines(
+    lines: list[str], resolver: Optional[TimezoneResolver] = None
+) -> Optional[FastVEvent]:
+    """Tokenize one VEVENT without icalendar.
+
+    Args:
+        lines: Unfolded content lines of the event, including the
+            ``BEGIN:VEVENT`` and ``END:VEVENT`` lines
+        resolver: Optional per-feed TZID resolver (knows the feed's VTIMEZONEs)
+
+    Returns:
+        FastVEvent, or None if the event needs the full icalendar parser
+    """
+    if len(lines) < 2 or lines[0].upper() != "BEGIN:VEVENT" or lines[-1].upper() != "END:VEVENT":
+        return None
+
+    props: dict[str, Any] = {}
+    in_alarm = False
+    try:
+        for line in lines[1:-1]:
+            parts = _split_content_line(line)
+            if parts is None:
+                return None
+            name, raw_params, value = parts
+            if not _NAME_RE.match(name):
+                return None
+            name = name.upper()
+
+            if name in ("BEGIN", "END"):
+                if value.upper() != "VALARM" or in_alarm == (name == "BEGIN"):
+                    return None
+                in_alarm = name == "BEGIN"
+                continue
+            if in_alarm or name in _IGNORED:
+                continue
+
+            kind = _PROPERTY_KINDS.get(name)
+            if kind is None:
+                if name.startswith("X-"):
+                    continue
+                return None
+
+            parsed: Any
+            if kind == "deferred":
+                if raw_params and not _plain_params(raw_params):
+                    return None
+                parsed = RawProperty(line)
+            else:
+                params = _parse_params(raw_params) if raw_params else {}
+                if params is None:
+                    return None
+                if "VALUE" in params and kind != "dt_tz":
+                    return None
+                parsed = _parse_value(kind, value, params, resolver)
+                if parsed is None:
+                    return None
+
+            existing = props.get(name)
+            if existing is None:
+                props[name] = parsed
+            elif name in _MULTI_VALUED:
+                if isinstance(existing, list):
+                    existing.append(parsed)
+                else:
+                    props[name] = [existing, parsed]
+            else:
+                return None
+    except (ValueError, OverflowError):
+        # Out-of-range dates and similar: let icalendar report them
+        return None
+
+    if in_alarm:
+        return None
+    return FastVEvent(props)
@@ -4,6 +4,7 @@
 import asyncio
 import logging
 import random
+from collections.abc import AsyncIterator
 from typing import Any, NoReturn, Optional
 from urllib.parse import urlparse
 
@@ -24,6 +25,9 @@ MAX_BACKOFF_SECONDS = 30.0  # Maximum backoff time for corruption scenarios
 JITTER_MIN_FACTOR = 0.1  # Minimum jitter multiplier
 JITTER_MAX_FACTOR = 0.3  # Maximum jitter multiplier
 
+# Streaming fetch constants
+STREAM_CHUNK_SIZE_BYTES = 8192  # Matches the streaming parser's read chunk size
+
 
 # Lite exceptions for CalendarBot Lite
 class LiteICSFetchError(Exception):
@@ -72,6 +76,69 @@ class LiteSecurityEventLogger:
             logger.warning(message)
 
 
+class StreamHandle:
+    """Open HTTP response whose body has not been read yet.
+
+    Returned inside LiteICSResponse.stream_handle when fetch_ics() is called with
+    stream=True. The body is consumed exactly once, either chunk by chunk through
+    iter_bytes() (for LiteICSParser.parse_ics_stream) or all at once through
+    read_all(). The underlying connection is released when the body is exhausted
+    or aclose() is called.
+    """
+
+    def __init__(self, response: httpx.Response, chunk_size: int = STREAM_CHUNK_SIZE_BYTES) -> None:
+        """Initialize stream handle.
+
+        Args:
+            response: httpx response opened with stream=True
+            chunk_size: Size of chunks yielded by iter_bytes()
+        """
+        self._response = response
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code of the underlying response."""
+        return self._response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        """Headers of the underlying response."""
+        return self._response.headers
+
+    async def iter_bytes(self) -> AsyncIterator[bytes]:
+        """Yield the response body in chunks, closing the response when done.
+
+        Yields:
+            Raw (content-decoded) body chunks
+        """
+        try:
+            async for chunk in self._response.aiter_bytes(self.chunk_size):
+                self.bytes_read += len(chunk)
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def read_all(self) -> str:
+        """Read the remaining body and decode it as text.
+
+        Returns:
+            Response body as a string
+        """
+        try:
+            await self._response.aread()
+            self.bytes_read = len(self._response.content)
+            return self._response.text
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the underlying connection."""
+        if not self._response.is_closed:
+            await self._response.aclose()
+
+
 def _raise_client_not_initialized() -> NoReturn:
     """Raise LiteICSFetchError for uninitialized HTTP client."""
     raise LiteICSFetchError("HTTP client not initialized")
@@ -215,7 +282,10 @@ class LiteICSFetcher:
             return False
 
     async def fetch_ics(
-        self, source: LiteICSSource, conditional_headers: Optional[dict[str, str]] = None
+        self,
+        source: LiteICSSource,
+        conditional_headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
     ) -> LiteICSResponse:
         """Download ICS content from source with comprehensive error handling and security validation.
 
@@ -233,11 +303,16 @@ class LiteICSFetcher:
             conditional_headers: Optional caching headers for bandwidth optimization:
                                 - "If-Modified-Since": RFC 2822 date string
                                 - "If-None-Match": ETag value from previous response
+            stream: When True, return as soon as the response headers arrive and hand
+                    the unread body back as a StreamHandle (stream_mode="bytes") so it
+                    can be parsed while it downloads. The caller must consume or close
+                    the handle before leaving the fetcher context.
 
         Returns:
             LiteICSResponse: Response object containing:
                         - success (bool): Operation success indicator
-                        - content (str): ICS calendar data (if successful)
+                        - content (str): ICS calendar data (if successful, buffered mode)
+                        - stream_handle (StreamHandle): Unread body (if successful, stream mode)
                         - status_code (int): HTTP response code
                         - error_message (str): Detailed error description (if failed)
                         - headers (Dict[str, str]): Response headers
@@ -320,12 +395,11 @@ class LiteICSFetcher:
             # Add custom headers
             headers.update(source.custom_headers)
 
-            # Add conditional request headers
-            if conditional_headers:
-                headers.update(conditional_headers)
-
-            # Make request with retry logic and possible streaming
-            response = await self._make_request_with_retry(source.url, headers, source.timeout)
+            # Make request with retry logic; conditional headers are applied last so
+            # the browser defaults cannot mask them
+            response = await self._make_request_with_retry(
+                source.url, headers, source.timeout, conditional_headers, stream=stream
+            )
 
             return self._create_response(response)
 
@@ -396,12 +470,27 @@ class LiteICSFetcher:
         return base_backoff + jitter
 
     async def _make_request_with_retry(
-        self, url: str, headers: dict[str, str], timeout: int
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: int,
+        conditional_headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         """Make HTTP request with retry logic and streaming decision.
 
         Enhanced with network corruption detection and jittered backoff.
 
+        Args:
+            url: URL to fetch
+            headers: Auth and custom headers (browser headers take precedence)
+            timeout: Request timeout in seconds
+            conditional_headers: Optional If-None-Match/If-Modified-Since validators.
+                These override the browser defaults, and the forced "no-cache"
+                directive is relaxed so the origin can answer 304 Not Modified.
+            stream: Return once headers arrive, leaving the body unread. Retries only
+                cover establishing the response, not reading the body.
+
         Returns:
             Either an httpx.Response (buffered) or a StreamHandle (streaming).
         """
@@ -422,6 +511,15 @@ class LiteICSFetcher:
                 # Merge existing headers with browser headers (browser headers take precedence)
                 combined_headers = {**headers, **DEFAULT_BROWSER_HEADERS}
 
+                # Revalidation: validators must survive the merge, and "no-cache" would
+                # make some servers ignore them and resend the full body
+                if conditional_headers:
+                    combined_headers.update(conditional_headers)
+                    combined_headers["Cache-Control"] = "max-age=0"
+
+                if stream:
+                    return await self._open_stream(url, combined_headers, timeout)
+
                 # DEAD SIMPLE: Use httpx.get() to download entire file at once like a browser
                 logger.debug("Using dead simple GET request for %s", url)
                 response = await self.client.get(
@@ -503,6 +601,47 @@ class LiteICSFetcher:
             raise last_exception
         raise LiteICSFetchError("Maximum retries exceeded")
 
+    async def _open_stream(self, url: str, headers: dict[str, str], timeout: int) -> Any:
+        """Send a GET request without reading the body.
+
+        Args:
+            url: URL to fetch
+            headers: Final request headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            The closed httpx.Response for 304 Not Modified, otherwise a StreamHandle
+        """
+        if self.client is None:
+            _raise_client_not_initialized()
+
+        logger.debug("Using streaming GET request for %s", url)
+        request = self.client.build_request("GET", url, headers=headers, timeout=timeout)
+        response = await self.client.send(request, stream=True, follow_redirects=True)
+
+        if response.status_code == 304:
+            logger.debug("ICS content not modified (304)")
+            await response.aclose()
+            if self._use_shared_client:
+                await record_client_success(self._client_id)
+            return response
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            await response.aclose()
+            raise
+
+        if self._use_shared_client:
+            await record_client_success(self._client_id)
+
+        logger.debug(
+            "Streaming ICS from %s (content-length: %s)",
+            url,
+            response.headers.get("content-length", "unknown"),
+        )
+        return StreamHandle(response)
+
     def _create_response(self, http_response: Any) -> LiteICSResponse:
         """Create ICS response from HTTP response or StreamHandle.
 
@@ -512,9 +651,27 @@ class LiteICSFetcher:
         Returns:
             ICS response object
         """
-        # Always buffered httpx.Response now
         headers = dict(http_response.headers)
 
+        # Streaming: body is still on the wire, so content checks are left to the parser
+        if isinstance(http_response, StreamHandle):
+            content_type = headers.get("content-type", "").lower()
+            if content_type and not any(
+                ct in content_type for ct in ["text/calendar", "text/plain"]
+            ):
+                logger.warning("Unexpected content type: %s", content_type)
+
+            return LiteICSResponse(
+                success=True,
+                status_code=http_response.status_code,
+                headers=headers,
+                etag=headers.get("etag"),
+                last_modified=headers.get("last-modified"),
+                cache_control=headers.get("cache-control"),
+                stream_handle=http_response,
+                stream_mode="bytes",
+            )
+
         # Handle 304 Not Modified
         if http_response.status_code == 304:
             logger.debug("ICS content not modified (304)")
@@ -0,0 +1,263 @@
+"""Per-VEVENT content fingerprints for incremental ICS reparsing - CalendarBot Lite.
+
+A whole-feed hash only says "something changed". This module splits a feed into
+its VEVENT blocks and fingerprints each one (UID + RECURRENCE-ID + body without
+DTSTAMP), so a refresh can reuse the parsed and expanded events of every UID whose
+blocks are unchanged and only reparse the UIDs that were added or modified.
+
+Blocks are grouped by UID because a recurring master, its RECURRENCE-ID overrides
+and its EXDATEs are expanded and merged together: a change to any of them
+invalidates the whole series.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Properties that never affect the parsed event (regenerated on every export)
+VOLATILE_PROPERTIES = ("DTSTAMP",)
+
+
+@dataclass
+class VEventBlock:
+    """One raw VEVENT block and its identity."""
+
+    text: str  # Raw block, BEGIN:VEVENT through END:VEVENT, original line endings ("" if streamed)
+    uid: Optional[str]
+    recurrence_id: Optional[str]
+    digest: str  # SHA-256 of the unfolded block without volatile properties
+    has_rrule: bool
+
+
+@dataclass
+class SplitICS:
+    """A feed split into its calendar envelope and VEVENT blocks."""
+
+    envelope_head: str  # Everything before the first VEVENT (header, VTIMEZONEs, ...)
+    envelope_tail: str  # Non-VEVENT content after the first VEVENT (incl. END:VCALENDAR)
+    blocks: list[VEventBlock]
+
+    @property
+    def envelope_digest(self) -> str:
+        """Fingerprint of the calendar-level content that every event depends on."""
+        return hashlib.sha256(
+            (self.envelope_head + "\x00" + self.envelope_tail).encode("utf-8")
+        ).hexdigest()
+
+    def group_digests(self) -> dict[str, str]:
+        """Combined fingerprint per UID (blocks without a UID are left out).
+
+        Returns:
+            Mapping of UID -> digest over all of that UID's blocks
+        """
+        parts: dict[str, list[str]] = {}
+        for block in self.blocks:
+            if block.uid:
+                parts.setdefault(block.uid, []).append(
+                    f"{block.recurrence_id or ''}:{block.digest}"
+                )
+        return {
+            uid: hashlib.sha256("\n".join(sorted(items)).encode("utf-8")).hexdigest()
+            for uid, items in parts.items()
+        }
+
+    def build_calendar(self, blocks: list[VEventBlock]) -> str:
+        """Rebuild a parseable calendar containing only the given blocks.
+
+        Args:
+            blocks: Subset of self.blocks to include
+
+        Returns:
+            ICS text with the original envelope around the selected blocks
+        """
+        return self.envelope_head + "".join(b.text for b in blocks) + self.envelope_tail
+
+
+@dataclass
+class ICSFingerprintState:
+    """Parsed output of a previous refresh, keyed by UID for reuse."""
+
+    envelope_digest: str
+    expansion_key: str  # Invalidates everything when the RRULE window moves
+    group_digests: dict[str, str] = field(default_factory=dict)
+    events_by_uid: dict[str, list[Any]] = field(default_factory=dict)
+
+
+@dataclass
+class IncrementalParsePlan:
+    """What an incremental parse still has to parse, given the previous state."""
+
+    ics_content: str  # Full feed as fetched
+    content_to_parse: str  # Full feed, or an envelope holding only the changed blocks
+    split: Optional[SplitICS]  # None when the feed is empty (nothing to fingerprint)
+    expansion_key: str = ""
+    group_digests: dict[str, str] = field(default_factory=dict)
+    unchanged: set[str] = field(default_factory=set)  # UIDs whose events are reused
+    changed_blocks: list[VEventBlock] = field(default_factory=list)
+
+
+def _unfold(lines: list[str]) -> list[str]:
+    """Join RFC 5545 folded continuation lines."""
+    unfolded: list[str] = []
+    for line in lines:
+        if line[:1] in (" ", "\t") and unfolded:
+            unfolded[-1] += line[1:]
+        else:
+            unfolded.append(line)
+    return unfolded
+
+
+def _property_name(line: str) -> str:
+    """Upper-cased property name of a content line (without parameters)."""
+    end = len(line)
+    for sep in (":", ";"):
+        idx = line.find(sep)
+        if idx != -1:
+            end = min(end, idx)
+    return line[:end].upper()
+
+
+def _make_block(block_lines: list[str], keep_text: bool = True) -> VEventBlock:
+    """Fingerprint one VEVENT given its raw lines (with line endings)."""
+    uid: Optional[str] = None
+    recurrence_id: Optional[str] = None
+    has_rrule = False
+    depth = 0
+    sha = hashlib.sha256()
+
+    for line in _unfold([raw.rstrip("\r\n") for raw in block_lines]):
+        name = _property_name(line)
+        if name in ("BEGIN", "END"):
+            depth += 1 if name == "BEGIN" else -1
+        # Only the event's own properties identify it, not those of nested VALARMs
+        elif depth == 1:
+            if name in VOLATILE_PROPERTIES:
+                continue
+            if name == "UID":
+                uid = line.split(":", 1)[-1].strip() or None
+            elif name == "RECURRENCE-ID":
+                recurrence_id = line.split(":", 1)[-1].strip()
+            elif name == "RRULE":
+                has_rrule = True
+        sha.update(line.encode("utf-8"))
+        sha.update(b"\n")
+
+    return VEventBlock(
+        text="".join(block_lines) if keep_text else "",
+        uid=uid,
+        recurrence_id=recurrence_id,
+        digest=sha.hexdigest(),
+        has_rrule=has_rrule,
+    )
+
+
+def reusable_groups(
+    previous_state: Optional[ICSFingerprintState],
+    split: SplitICS,
+    group_digests: dict[str, str],
+    expansion_key: str,
+) -> set[str]:
+    """Return the UIDs whose events from the previous parse can be reused.
+
+    Nothing is reused when the calendar envelope or the RRULE expansion window
+    changed, since every event depends on them.
+
+    Args:
+        previous_state: Fingerprint state of the previous parse, if any
+        split: The feed being parsed
+        group_digests: split.group_digests()
+        expansion_key: Expansion window key of this parse
+
+    Returns:
+        UIDs whose blocks are unchanged and whose events were kept
+    """
+    if (
+        previous_state is None
+        or previous_state.envelope_digest != split.envelope_digest
+        or previous_state.expansion_key != expansion_key
+    ):
+        return set()
+    return {
+        uid
+        for uid, digest in group_digests.items()
+        if previous_state.group_digests.get(uid) == digest and uid in previous_state.events_by_uid
+    }
+
+
+class ICSSplitter:
+    """Builds a SplitICS line by line, from text or from a streamed byte body.
+
+    A streamed feed is fingerprinted while it downloads: only the envelope and
+    the VEVENT being read are held, finished blocks keep their digest but (with
+    keep_text=False) not their text. Byte chunks are split into lines on LF, so a
+    feed with bare CR line endings fingerprints differently than split_ics(); that
+    only costs one full reparse.
+    """
+
+    def __init__(self, keep_text: bool = True) -> None:
+        """Initialize the splitter.
+
+        Args:
+            keep_text: Keep each block's raw text (needed for build_calendar())
+        """
+        self.keep_text = keep_text
+        self._head: list[str] = []
+        self._tail: list[str] = []
+        self._blocks: list[VEventBlock] = []
+        self._current: Optional[list[str]] = None
+        self._partial = b""
+
+    def add_line(self, raw: str) -> None:
+        """Add one raw content line, line ending included."""
+        stripped = raw.strip().upper()
+        if self._current is not None:
+            self._current.append(raw)
+            if stripped == "END:VEVENT":
+                self._blocks.append(_make_block(self._current, self.keep_text))
+                self._current = None
+        elif stripped == "BEGIN:VEVENT":
+            self._current = [raw]
+        elif self._blocks:
+            self._tail.append(raw)
+        else:
+            self._head.append(raw)
+
+    def update(self, chunk: bytes) -> None:
+        """Add a chunk of a UTF-8 byte body."""
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self.add_line((line + b"\n").decode("utf-8", errors="replace"))
+
+    def finish(self) -> SplitICS:
+        """Return the split of everything added so far."""
+        if self._partial:
+            self.add_line(self._partial.decode("utf-8", errors="replace"))
+            self._partial = b""
+        if self._current is not None:
+            # Unterminated block: keep it verbatim so the parser reports it as before
+            self._tail.extend(self._current)
+            self._current = None
+        return SplitICS(
+            envelope_head="".join(self._head),
+            envelope_tail="".join(self._tail),
+            blocks=self._blocks,
+        )
+
+
+def split_ics(ics_content: str) -> SplitICS:
+    """Split ICS text into envelope and fingerprinted VEVENT blocks.
+
+    Args:
+        ics_content: Raw ICS file content
+
+    Returns:
+        SplitICS with the envelope around the first VEVENT and all blocks in order
+    """
+    splitter = ICSSplitter()
+    for raw in ics_content.splitlines(keepends=True):
+        splitter.add_line(raw)
+    return splitter.finish()
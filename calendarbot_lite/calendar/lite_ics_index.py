@@ -0,0 +1,225 @@
+"""Index-then-parse for huge ICS feeds - CalendarBot Lite.
+
+Archive calendars carry years of events, and the streaming parser still
+unfolds and tokenizes every one of them before the parse window (see
+lite_parse_window) can drop it. index_ics() makes a cheap first pass instead:
+one regular-expression scan that records, per VEVENT, its character range in
+the feed, UID, DTSTART/DTEND (or DURATION), RECURRENCE-ID and whether it
+recurs (RRULE/RDATE), without tokenizing anything else. ICSIndex.select() then
+keeps the events the window may need, and build_calendar() rebuilds a feed
+from the calendar envelope and just those ranges for the real parse.
+
+The index is a conservative superset of ParseWindow.admits(): recurring
+masters and events whose times it cannot read are always kept, and local
+times (TZID or floating) are padded by LOCAL_TIME_MARGIN since their offset
+is unknown at this point. The full parse applies the exact check again.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+
+from icalendar.prop import vDuration
+
+from calendarbot_lite.calendar.lite_parse_window import WINDOW_MARGIN, ParseWindow
+
+# Widest UTC offset a TZID or floating time can have (UTC+14)
+LOCAL_TIME_MARGIN = timedelta(hours=14)
+
+# Component boundaries and the few properties the index reads: name, then
+# parameters (quoted values may hold colons), then the value with its folded
+# continuation lines
+_INDEXED_LINE = re.compile(
+    r"^(BEGIN|END|UID|DTSTART|DTEND|DURATION|RRULE|RDATE|RECURRENCE-ID)"
+    r'(?:;(?:[^":\r\n]|"[^"\r\n]*"|\r?\n[ \t])*)?'
+    r":([^\r\n]*(?:\r?\n[ \t][^\r\n]*)*)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_FOLD = re.compile(r"\r?\n[ \t]")
+
+
+@dataclass(slots=True)
+class IndexedVEvent:
+    """Location and scheduling properties of one VEVENT, as read by the index.
+
+    Attributes:
+        start: Offset of the BEGIN:VEVENT line in the feed
+        end: Offset just past the END:VEVENT line
+        uid: UID, if the event has one
+        dtstart: DTSTART in UTC (local times read as UTC), None if unreadable
+        dtend: DTEND, or DTSTART + DURATION, in UTC; None if unreadable
+        recurrence_id: RECURRENCE-ID in UTC, for overrides
+        duration: DURATION, when the event has one instead of DTEND
+        recurring: Has an RRULE or RDATE
+        local_time: Some time is a TZID, floating or all-day value
+        unreadable: Some time or duration could not be read (the event is kept)
+    """
+
+    start: int
+    end: int
+    uid: Optional[str] = None
+    dtstart: Optional[datetime] = None
+    dtend: Optional[datetime] = None
+    recurrence_id: Optional[datetime] = None
+    duration: Optional[timedelta] = None
+    recurring: bool = False
+    local_time: bool = False
+    unreadable: bool = False
+
+
+@dataclass
+class ICSIndex:
+    """VEVENT ranges of a feed and the calendar envelope around them."""
+
+    content: str
+    events: list[IndexedVEvent]
+    envelope_head: str  # Everything before the first VEVENT
+    envelope_tail: str  # Non-VEVENT content after the first VEVENT (incl. END:VCALENDAR)
+
+    def select(self, window: ParseWindow) -> list[IndexedVEvent]:
+        """Return the events a parse restricted to ``window`` may need, in feed order.
+
+        Args:
+            window: Parse window of the refresh
+
+        Returns:
+            Recurring masters, events with unreadable times and events (or
+            overrides) that may touch the window
+        """
+        selected = []
+        for event in self.events:
+            if event.recurring or event.unreadable or event.dtstart is None:
+                selected.append(event)
+                continue
+            end = event.dtend or event.dtstart
+            margin = WINDOW_MARGIN + LOCAL_TIME_MARGIN if event.local_time else WINDOW_MARGIN
+            if window.admits_span(event.dtstart, end, event.recurrence_id, margin):
+                selected.append(event)
+        return selected
+
+    def build_calendar(self, events: list[IndexedVEvent]) -> str:
+        """Rebuild a parseable calendar holding only the given events.
+
+        Args:
+            events: Subset of self.events, in feed order
+
+        Returns:
+            ICS text with the original envelope around the selected ranges
+        """
+        content = self.content
+        return (
+            self.envelope_head
+            + "".join(content[event.start : event.end] for event in events)
+            + self.envelope_tail
+        )
+
+
+def _value(raw: str) -> str:
+    """Return a property value without folding and surrounding whitespace."""
+    return (_FOLD.sub("", raw) if "\n" in raw else raw).strip()
+
+
+def _read_time(value: str) -> tuple[Optional[datetime], bool]:
+    """Read a DATE or DATE-TIME property value.
+
+    Args:
+        value: Property value (e.g. ``20250616T090000Z``)
+
+    Returns:
+        Tuple of (UTC datetime, local-time flag); local times are read as UTC.
+        The datetime is None when the value is not a DATE or DATE-TIME.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)  # Accepts the RFC 5545 basic format
+    except ValueError:
+        return None, False
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC), True
+    return parsed.astimezone(UTC), False
+
+
+def _line_end(content: str, offset: int) -> int:
+    """Return the offset just past the line ending at or after ``offset``."""
+    newline = content.find("\n", offset)
+    return len(content) if newline == -1 else newline + 1
+
+
+def index_ics(content: str) -> Optional[ICSIndex]:
+    """Index the VEVENTs of a feed without parsing them.
+
+    Args:
+        content: Raw ICS content
+
+    Returns:
+        ICSIndex, or None when the feed has no VEVENT or its VEVENTs are not
+        properly nested (it is then parsed as a whole)
+    """
+    events: list[IndexedVEvent] = []
+    gaps: list[str] = []
+    current: Optional[IndexedVEvent] = None
+    nested = 0  # Components open inside the current VEVENT (VALARMs)
+    previous_end = 0
+
+    for match in _INDEXED_LINE.finditer(content):
+        name, value = match.groups()
+        name = name.upper()
+        value = _value(value)
+
+        if name in ("BEGIN", "END"):
+            is_vevent = value.upper() == "VEVENT"
+            if current is None:
+                if name == "BEGIN" and is_vevent:
+                    if events:
+                        gaps.append(content[previous_end : match.start()])
+                    current = IndexedVEvent(start=match.start(), end=match.start())
+                elif is_vevent:
+                    return None  # END:VEVENT without BEGIN
+            elif name == "BEGIN":
+                if is_vevent:
+                    return None  # VEVENT inside a VEVENT
+                nested += 1
+            elif nested:
+                nested -= 1
+            elif not is_vevent:
+                return None  # Component closed inside a VEVENT it did not open in
+            else:
+                current.end = previous_end = _line_end(content, match.end())
+                if current.dtend is None and current.dtstart and current.duration is not None:
+                    current.dtend = current.dtstart + current.duration
+                events.append(current)
+                current = None
+            continue
+
+        if current is None or nested:
+            continue  # Calendar-level or VALARM properties
+        if name == "UID":
+            current.uid = value or None
+        elif name in ("RRULE", "RDATE"):
+            current.recurring = True
+        elif name == "DURATION":
+            try:
+                current.duration = vDuration.from_ical(value)
+            except Exception:
+                current.unreadable = True
+        else:
+            instant, local_time = _read_time(value)
+            current.unreadable = current.unreadable or instant is None
+            current.local_time = current.local_time or local_time
+            if name == "DTSTART":
+                current.dtstart = instant
+            elif name == "DTEND":
+                current.dtend = instant
+            else:
+                current.recurrence_id = instant
+
+    if current is not None or not events:
+        return None
+
+    gaps.append(content[previous_end:])
+    return ICSIndex(
+        content=content,
+        events=events,
+        envelope_head=content[: events[0].start],
+        envelope_tail="".join(gaps),
+    )
@@ -0,0 +1,99 @@
+"""Per-refresh intern table for repeated event field values - CalendarBot Lite.
+
+Subjects, UIDs, TZID names, locations, attendees, meeting URLs and RRULE
+strings repeat across the components of a feed (recurring masters and their
+RECURRENCE-ID overrides, the same attendees on every meeting of a team).
+Parsing creates a fresh string or model for each copy, and all of them stay
+alive until the next window swap. InternTable maps every value to the first
+equal one seen during the refresh so identical values share one object.
+
+Sharing is safe because parsed events are not mutated after parsing, and
+pydantic keeps the passed str and sub-model instances rather than copying
+them. A table lives for one parse and is dropped with it, so values from old
+refreshes are never kept alive by the table.
+"""
+
+from typing import Optional, overload
+
+from calendarbot_lite.calendar.lite_models import (
+    LiteAttendee,
+    LiteAttendeeType,
+    LiteLocation,
+    LiteResponseStatus,
+)
+
+
+class InternTable:
+    """Canonical instances of repeated strings, locations and attendees.
+
+    Attributes:
+        lookups: Number of values passed through the table
+        hits: Number of lookups answered with an already-seen instance
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._strings: dict[str, str] = {}
+        self._locations: dict[str, LiteLocation] = {}
+        self._attendees: dict[
+            tuple[str, str, LiteAttendeeType, LiteResponseStatus], LiteAttendee
+        ] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        """Return the number of distinct values held."""
+        return len(self._strings) + len(self._locations) + len(self._attendees)
+
+    @overload
+    def string(self, value: str) -> str: ...
+
+    @overload
+    def string(self, value: None) -> None: ...
+
+    def string(self, value: Optional[str]) -> Optional[str]:
+        """Return the canonical instance of ``value`` (None passes through)."""
+        if value is None:
+            return None
+        self.lookups += 1
+        canonical = self._strings.setdefault(value, value)
+        if canonical is not value:
+            self.hits += 1
+        return canonical
+
+    @overload
+    def strings(self, values: list[str]) -> list[str]: ...
+
+    @overload
+    def strings(self, values: None) -> None: ...
+
+    def strings(self, values: Optional[list[str]]) -> Optional[list[str]]:
+        """Return ``values`` with every item replaced by its canonical instance."""
+        if values is None:
+            return None
+        return [self.string(v) for v in values]
+
+    def location(self, display_name: str) -> LiteLocation:
+        """Return the shared LiteLocation for ``display_name``."""
+        self.lookups += 1
+        location = self._locations.get(display_name)
+        if location is None:
+            location = LiteLocation(display_name=self.string(display_name))
+            self._locations[display_name] = location
+        else:
+            self.hits += 1
+        return location
+
+    def attendee(self, attendee: LiteAttendee) -> LiteAttendee:
+        """Return the shared instance of an attendee equal to ``attendee``."""
+        self.lookups += 1
+        key = (attendee.name, attendee.email, attendee.type, attendee.response_status)
+        canonical = self._attendees.get(key)
+        if canonical is None:
+            canonical = attendee.model_copy(
+                update={"name": self.string(attendee.name), "email": self.string(attendee.email)}
+            )
+            self._attendees[key] = canonical
+        else:
+            self.hits += 1
+        return canonical
@@ -1,10 +1,19 @@
 """Data models for ICS calendar processing - CalendarBot Lite version."""
 
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, Optional
-
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from typing import Any, ClassVar, Optional, overload
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    field_serializer,
+    field_validator,
+)
+from pydantic_core import core_schema
 
 # Import validation constants
 from calendarbot_lite.core.config_manager import (
@@ -163,6 +172,12 @@ class LiteICSParseResult(BaseModel):
         default_factory=dict, description="Mapping of event IDs to individual raw ICS content"
     )
 
+    # Per-phase profiling (ParserTelemetry.get_phase_timings())
+    phase_timings: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Cumulative milliseconds and calls per parse phase",
+    )
+
 
 class LiteICSValidationResult(BaseModel):
     """Result of ICS source validation."""
@@ -294,8 +309,104 @@ class LiteAttendee(BaseModel):
     )
 
 
+class DeferredAttendees(Sequence[LiteAttendee]):
+    """Event attendees kept as raw ATTENDEE lines until they are first read.
+
+    A read-only sequence of LiteAttendee: the lines are decoded on first access
+    and the decoded models replace them. Compares equal to a list of the same
+    attendees and serializes like one, without keeping what it decoded for that.
+    """
+
+    __slots__ = ("_attendees", "_lines")
+
+    # Unhashable like the list it stands in for: equality depends on the decoded attendees
+    __hash__: ClassVar[None]  # type: ignore[assignment]
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        """Initialize the deferred attendees.
+
+        Args:
+            lines: Unfolded ATTENDEE content lines (RawProperty.line)
+        """
+        self._lines: Optional[tuple[str, ...]] = tuple(lines)
+        self._attendees: Optional[list[LiteAttendee]] = None
+
+    @property
+    def lines(self) -> Optional[tuple[str, ...]]:
+        """Raw ATTENDEE lines, or None once they are decoded."""
+        return self._lines
+
+    def _decode(self) -> list[LiteAttendee]:
+        """Decode the lines the way the eager parse would have, without keeping the result."""
+        if self._attendees is not None:
+            return self._attendees
+
+        from calendarbot_lite.calendar.lite_attendee_parser import LiteAttendeeParser
+
+        return LiteAttendeeParser().parse_attendee_lines(self._lines or ())
+
+    def _decoded(self) -> list[LiteAttendee]:
+        """Decode the lines once and keep the attendees in their place."""
+        if self._attendees is None:
+            self._attendees = self._decode()
+            self._lines = None
+        return self._attendees
+
+    @overload
+    def __getitem__(self, index: int) -> LiteAttendee: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[LiteAttendee]: ...
+
+    def __getitem__(self, index: int | slice) -> LiteAttendee | list[LiteAttendee]:
+        return self._decoded()[index]
+
+    def __len__(self) -> int:
+        return len(self._decoded())
+
+    def __iter__(self) -> Iterator[LiteAttendee]:
+        return iter(self._decoded())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DeferredAttendees):
+            if self._lines is not None and self._lines == other._lines:
+                return True
+            return self._decoded() == other._decoded()
+        if isinstance(other, list):
+            return self._decoded() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if self._lines is not None:
+            return f"DeferredAttendees(<{len(self._lines)} undecoded lines>)"
+        return f"DeferredAttendees({self._attendees!r})"
+
+    def _serialize(self) -> Optional[list[LiteAttendee]]:
+        """Serialize like the eager parse's attendees, without keeping the decoded models."""
+        return self._decode() or None
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Accept instances as they are and serialize them as a list of attendees."""
+        list_schema = handler.generate_schema(list[LiteAttendee])
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize,
+                return_schema=core_schema.nullable_schema(list_schema),
+            ),
+        )
+
+
 class LiteCalendarEvent(BaseModel):
-    """Calendar event model for ICS-based events."""
+    """Calendar event model for ICS-based events.
+
+    Attendees may be deferred (see defer_attendees()): the raw ATTENDEE lines
+    are kept and decoded into LiteAttendee models on first read, since most
+    consumers never read them.
+    """
 
     # Core properties
     id: str = Field(..., description="Event ID")
@@ -323,7 +434,9 @@ class LiteCalendarEvent(BaseModel):
     # Organizer and attendees
     is_organizer: bool = Field(default=False, description="Is current user the organizer")
     location: Optional[LiteLocation] = Field(default=None, description="Event location")
-    attendees: Optional[list[LiteAttendee]] = Field(default=None, description="Event attendees")
+    attendees: Optional[DeferredAttendees | list[LiteAttendee]] = Field(
+        default=None, description="Event attendees"
+    )
 
     # Recurrence
     is_recurring: bool = Field(default=False, description="Recurring event flag")
@@ -338,6 +451,16 @@ class LiteCalendarEvent(BaseModel):
     rrule_master_uid: Optional[str] = Field(
         default=None, description="UID of master recurring event for expanded instances"
     )
+    # Set on recurring masters when they are expanded; lets OccurrenceQuery step the
+    # series past the expanded window without reparsing the feed. Not serialized.
+    rrule_string: Optional[str] = Field(
+        default=None, exclude=True, description="RRULE the master was expanded with"
+    )
+    rrule_exdates: Optional[list[str]] = Field(
+        default=None,
+        exclude=True,
+        description="EXDATE and RECURRENCE-ID values the master was expanded with",
+    )
 
     # Metadata
     created_date_time: Optional[datetime] = Field(default=None, description="Creation time")
@@ -398,12 +521,159 @@ class LiteCalendarEvent(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
+    @property
+    def deferred_attendee_lines(self) -> Optional[tuple[str, ...]]:
+        """Raw ATTENDEE lines not decoded yet, or None once attendees are decoded."""
+        attendees = self.attendees
+        return attendees.lines if isinstance(attendees, DeferredAttendees) else None
+
+    def defer_attendees(self, lines: tuple[str, ...]) -> None:
+        """Keep raw ATTENDEE lines and decode them on first read of attendees.
+
+        Args:
+            lines: Unfolded ATTENDEE content lines (RawProperty.line)
+        """
+        if lines:
+            self.attendees = DeferredAttendees(lines)
+
     @field_serializer("created_date_time", "last_modified_date_time", when_used="unless-none")
     def serialize_datetime(self, dt: datetime) -> str:
         """Serialize datetime fields to ISO format."""
         return dt.isoformat()
 
 
+def _master_field(name: str) -> property:
+    """Return a read-only property exposing the master event's field ``name``."""
+    return property(lambda self: getattr(self.master, name), doc=f"Master event's {name}.")
+
+
+class OccurrenceTime:
+    """Start or end of an expanded occurrence (same attributes as LiteDateTimeInfo)."""
+
+    __slots__ = ("date_time", "time_zone")
+
+    def __init__(self, date_time: datetime, time_zone: str = "UTC") -> None:
+        """Initialize the occurrence time.
+
+        Args:
+            date_time: The date and time
+            time_zone: Time zone name
+        """
+        self.date_time = date_time
+        self.time_zone = time_zone
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (OccurrenceTime, LiteDateTimeInfo)):
+            return (self.date_time, self.time_zone) == (other.date_time, other.time_zone)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.date_time, self.time_zone))
+
+    def __repr__(self) -> str:
+        return f"OccurrenceTime(date_time={self.date_time!r}, time_zone={self.time_zone!r})"
+
+
+class ExpandedOccurrence:
+    """Compact RRULE-expanded occurrence sharing its recurring master's fields.
+
+    Holds only a reference to the master plus its own ID, start and end; every
+    other field reads through to the master, so expanding a series does not
+    copy and revalidate the master's fields per occurrence. Exposes the same
+    attributes as the LiteCalendarEvent the expander used to build (attendees
+    and RECURRENCE-ID are not carried over) and materializes one on
+    to_event() / model_dump().
+    """
+
+    __slots__ = ("end", "id", "master", "start")
+
+    is_recurring = False
+    is_expanded_instance = True
+    recurrence_id = None
+    attendees = None
+    created_date_time = None
+
+    subject = _master_field("subject")
+    body_preview = _master_field("body_preview")
+    is_all_day = _master_field("is_all_day")
+    show_as = _master_field("show_as")
+    is_cancelled = _master_field("is_cancelled")
+    is_organizer = _master_field("is_organizer")
+    location = _master_field("location")
+    is_online_meeting = _master_field("is_online_meeting")
+    online_meeting_url = _master_field("online_meeting_url")
+    last_modified_date_time = _master_field("last_modified_date_time")
+
+    def __init__(
+        self, master: LiteCalendarEvent, instance_id: str, start: datetime, end: datetime
+    ) -> None:
+        """Initialize the occurrence.
+
+        Args:
+            master: Recurring master event
+            instance_id: Occurrence ID (see make_instance_id)
+            start: Occurrence start
+            end: Occurrence end
+        """
+        self.master = master
+        self.id = instance_id
+        self.start = OccurrenceTime(start, master.start.time_zone)
+        self.end = OccurrenceTime(end, master.end.time_zone)
+
+    @property
+    def rrule_master_uid(self) -> str:
+        """UID of the recurring master."""
+        return self.master.id
+
+    @property
+    def is_busy_status(self) -> bool:
+        """Check if event has busy status (not free)."""
+        return self.master.is_busy_status
+
+    def to_event(self) -> LiteCalendarEvent:
+        """Materialize the occurrence as a standalone LiteCalendarEvent."""
+        master = self.master
+        return LiteCalendarEvent(
+            id=self.id,
+            subject=master.subject,
+            body_preview=master.body_preview,
+            start=LiteDateTimeInfo(date_time=self.start.date_time, time_zone=self.start.time_zone),
+            end=LiteDateTimeInfo(date_time=self.end.date_time, time_zone=self.end.time_zone),
+            is_all_day=master.is_all_day,
+            show_as=master.show_as,
+            is_cancelled=master.is_cancelled,
+            is_organizer=master.is_organizer,
+            location=master.location,
+            is_online_meeting=master.is_online_meeting,
+            online_meeting_url=master.online_meeting_url,
+            is_recurring=False,
+            is_expanded_instance=True,
+            rrule_master_uid=master.id,
+            last_modified_date_time=master.last_modified_date_time,
+        )
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Serialize like LiteCalendarEvent.model_dump() (accepts the same arguments)."""
+        return self.to_event().model_dump(**kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ExpandedOccurrence):
+            return (self.id, self.start, self.end, self.master) == (
+                other.id,
+                other.start,
+                other.end,
+                other.master,
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Equal occurrences share ID, start and end; the (unhashable) master is left out
+        return hash((self.id, self.start, self.end))
+
+    def __repr__(self) -> str:
+        return f"ExpandedOccurrence(id={self.id!r}, start={self.start.date_time!r})"
+
+
 # Internal helper classes for RRULE expansion
 # These classes are used to create lightweight event representations for recurring events
 
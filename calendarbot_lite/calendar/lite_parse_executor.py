@@ -0,0 +1,296 @@
+"""Process-pool ICS parse executor - CalendarBot Lite.
+
+Parsing a large feed with icalendar is CPU-bound and holds the GIL, so running it
+inside the aiohttp event loop stalls every API endpoint for the whole parse. This
+module runs parse_ics_content() in a small, long-lived pool of worker processes
+and hands results back as compact picklable records: parsed events are pickled
+whole (unpickling does not run pydantic validation), and RRULE-expanded
+occurrences travel as (master index, ID, start, end) tuples that are rebuilt into
+ExpandedOccurrence objects sharing their master in the server process.
+
+Workers are started with the "spawn" method so they never inherit the server's
+event loop, sockets or thread state, and are reused across refreshes so the
+import cost is paid once.
+
+In sharded mode, large feeds are split at VEVENT boundaries (see lite_sharding)
+and the shards are parsed by all workers at once; the parsed events are then
+expanded and merged in this process.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from calendarbot_lite.calendar.lite_models import (
+    ExpandedOccurrence,
+    LiteCalendarEvent,
+    LiteICSParseResult,
+)
+from calendarbot_lite.calendar.lite_sharding import SHARD_MIN_BYTES, ParsedShard
+
+logger = logging.getLogger(__name__)
+
+# Two workers leave the remaining cores of a 4-core Pi Zero 2W / Pi 3 for the
+# event loop and the kiosk browser.
+DEFAULT_PARSE_WORKERS = 2
+MAX_PARSE_WORKERS = 3
+
+# Per-process parser cache: settings snapshot -> LiteICSParser (worker side only)
+_worker_parsers: dict[tuple[tuple[str, Any], ...], Any] = {}
+
+# An expanded occurrence sent back by a worker: (index of its master, ID, start, end)
+OccurrenceRecord = tuple[int, str, datetime, datetime]
+
+
+def snapshot_settings(settings: Any) -> dict[str, Any]:
+    """Copy the plain-valued public attributes of a settings object.
+
+    Settings objects are often ad-hoc classes that cannot be pickled; the parser
+    only reads simple attributes from them, so a dict of those is enough to
+    rebuild an equivalent settings object in a worker.
+
+    Args:
+        settings: Settings object passed to LiteICSParser
+
+    Returns:
+        Mapping of attribute name -> value for str/int/float/bool/None attributes
+    """
+    snapshot: dict[str, Any] = {}
+    for name in dir(settings):
+        if name.startswith("_"):
+            continue
+        try:
+            value = getattr(settings, name)
+        except Exception:  # nosec B112 - properties may raise; skip them
+            continue
+        if value is None or isinstance(value, (str, int, float, bool)):
+            snapshot[name] = value
+    return snapshot
+
+
+def _get_worker_parser(settings: dict[str, Any]) -> Any:
+    """Return this worker's LiteICSParser for a settings snapshot."""
+    from calendarbot_lite.calendar.lite_parser import LiteICSParser
+
+    key = tuple(sorted(settings.items()))
+    parser = _worker_parsers.get(key)
+    if parser is None:
+        parser = LiteICSParser(SimpleNamespace(**settings))
+        _worker_parsers[key] = parser
+    return parser
+
+
+def _compact_events(
+    events: list[Any],
+) -> tuple[list[LiteCalendarEvent], list[LiteCalendarEvent | OccurrenceRecord]]:
+    """Reduce parsed events to the records a worker sends back.
+
+    Args:
+        events: Parsed events (LiteCalendarEvent or ExpandedOccurrence)
+
+    Returns:
+        Tuple of (masters of the occurrences, one record per event in order)
+    """
+    masters: list[LiteCalendarEvent] = []
+    master_index: dict[int, int] = {}
+    records: list[LiteCalendarEvent | OccurrenceRecord] = []
+    for event in events:
+        if isinstance(event, ExpandedOccurrence):
+            index = master_index.get(id(event.master))
+            if index is None:
+                index = master_index[id(event.master)] = len(masters)
+                masters.append(event.master)
+            records.append((index, event.id, event.start.date_time, event.end.date_time))
+        else:
+            records.append(event)
+    return masters, records
+
+
+def _parse_in_worker(
+    ics_content: str, settings: dict[str, Any], source_url: Optional[str], optimized: bool
+) -> tuple[dict[str, Any], list[LiteCalendarEvent], list[LiteCalendarEvent | OccurrenceRecord]]:
+    """Parse ICS content in a worker process.
+
+    Args:
+        ics_content: Raw ICS content
+        settings: Settings snapshot from snapshot_settings()
+        source_url: Optional source URL for audit trail
+        optimized: Use parse_ics_content_optimized() instead of parse_ics_content()
+
+    Returns:
+        Tuple of (result fields without events/raw_content, occurrence masters,
+        event records); see _compact_events()
+    """
+    parser = _get_worker_parser(settings)
+    if optimized:
+        result = parser.parse_ics_content_optimized(ics_content, source_url)
+    else:
+        result = parser.parse_ics_content(ics_content, source_url)
+    fields = result.model_dump(exclude={"events", "raw_content"})
+    fields["has_raw_content"] = result.raw_content is not None
+    masters, records = _compact_events(result.events)
+    return fields, masters, records
+
+
+def _parse_shard_in_worker(shard_content: str, settings: dict[str, Any]) -> ParsedShard:
+    """Parse one shard of a sharded parse in a worker process.
+
+    The parsed events are pickled whole (not as records) so their timezones and
+    RRULE metadata reach the expansion in the server process unchanged.
+
+    Args:
+        shard_content: One of ShardedParsePlan.shards
+        settings: Settings snapshot from snapshot_settings()
+
+    Returns:
+        ParsedShard from LiteICSParser.parse_ics_shard()
+    """
+    return _get_worker_parser(settings).parse_ics_shard(shard_content)
+
+
+def _rebuild_result(
+    fields: dict[str, Any],
+    masters: list[LiteCalendarEvent],
+    records: list[LiteCalendarEvent | OccurrenceRecord],
+    ics_content: str,
+) -> LiteICSParseResult:
+    """Rebuild a LiteICSParseResult from the records returned by a worker."""
+    has_raw_content = fields.pop("has_raw_content", False)
+    result = LiteICSParseResult.model_validate(fields)
+    result.events = [
+        ExpandedOccurrence(masters[record[0]], record[1], record[2], record[3])
+        if isinstance(record, tuple)
+        else record
+        for record in records
+    ]
+    if has_raw_content:
+        result.raw_content = ics_content
+    return result
+
+
+class ParseExecutor:
+    """Long-lived process pool that parses ICS content off the event loop."""
+
+    def __init__(self, max_workers: int = DEFAULT_PARSE_WORKERS, sharded: bool = False) -> None:
+        """Initialize the executor. Worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes (clamped to 1..MAX_PARSE_WORKERS
+                and to the number of CPUs)
+            sharded: Split feeds of at least SHARD_MIN_BYTES across all workers
+                (see parse_sharded) when there is more than one worker
+        """
+        cpu_count = os.cpu_count() or 1
+        self.max_workers = max(1, min(max_workers, MAX_PARSE_WORKERS, cpu_count))
+        self.sharded = sharded
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.debug("Started ICS parse pool with %d workers", self.max_workers)
+        return self._pool
+
+    async def parse(
+        self,
+        parser: Any,
+        ics_content: str,
+        source_url: Optional[str] = None,
+        optimized: bool = False,
+    ) -> LiteICSParseResult:
+        """Parse ICS content in a worker process, equivalent to parser.parse_ics_content().
+
+        If the pool is broken (e.g. a worker was OOM-killed) it is discarded and
+        the content is parsed in-process so the refresh still completes; a fresh
+        pool is started on the next call.
+
+        Args:
+            parser: LiteICSParser whose settings the worker should use
+            ics_content: Raw ICS content
+            source_url: Optional source URL for audit trail
+            optimized: Parse like parse_ics_content_optimized() (streaming parser for
+                large content) instead of parse_ics_content()
+
+        Returns:
+            Parse result with events rebuilt in this process
+        """
+        if self.sharded and self.max_workers > 1 and len(ics_content) >= SHARD_MIN_BYTES:
+            return await self.parse_sharded(parser, ics_content, source_url)
+
+        loop = asyncio.get_running_loop()
+        settings = snapshot_settings(parser.settings)
+        try:
+            fields, masters, records = await loop.run_in_executor(
+                self._get_pool(), _parse_in_worker, ics_content, settings, source_url, optimized
+            )
+        except BrokenProcessPool:
+            logger.warning("ICS parse pool broken; parsing in-process and restarting pool")
+            self.shutdown(wait=False)
+            if optimized:
+                return parser.parse_ics_content_optimized(ics_content, source_url)
+            return parser.parse_ics_content(ics_content, source_url)
+
+        return _rebuild_result(fields, masters, records, ics_content)
+
+    async def parse_sharded(
+        self,
+        parser: Any,
+        ics_content: str,
+        source_url: Optional[str] = None,
+        shard_count: Optional[int] = None,
+    ) -> LiteICSParseResult:
+        """Parse ICS content split into shards that all workers parse in parallel.
+
+        Equivalent to parser.parse_ics_content_sharded(): the same result as
+        parser.parse_ics_content() below STREAMING_THRESHOLD, and a full in-memory
+        parse above it. Splitting the feed and expanding the combined events run
+        in a thread so the event loop keeps serving requests.
+
+        Args:
+            parser: LiteICSParser whose settings the workers should use
+            ics_content: Raw ICS content
+            source_url: Optional source URL for audit trail
+            shard_count: Number of shards (defaults to the number of workers)
+
+        Returns:
+            Parse result with events rebuilt in this process
+        """
+        loop = asyncio.get_running_loop()
+        settings = snapshot_settings(parser.settings)
+        plan = await asyncio.to_thread(
+            parser.prepare_sharded_parse, ics_content, shard_count or self.max_workers
+        )
+        try:
+            pool = self._get_pool()
+            shards = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _parse_shard_in_worker, shard, settings)
+                    for shard in plan.shards
+                )
+            )
+        except BrokenProcessPool:
+            logger.warning("ICS parse pool broken; parsing in-process and restarting pool")
+            self.shutdown(wait=False)
+            return parser.parse_ics_content_sharded(ics_content, source_url)
+
+        logger.debug("Parsed %d ICS shards in %d workers", len(shards), self.max_workers)
+        return await asyncio.to_thread(parser.complete_sharded_parse, plan, shards, source_url)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes.
+
+        Args:
+            wait: Wait for running parses to finish
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
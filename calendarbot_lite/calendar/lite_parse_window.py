@@ -0,0 +1,112 @@
+"""Parse-time event window for skipping out-of-range VEVENTs - CalendarBot Lite.
+
+Feeds often carry years of history. Every past single event used to be
+mapped into a full LiteCalendarEvent (attendees, description, location) only
+for TimeWindowStage to discard it after the parse. ParseWindow lets the parser
+decide from the raw component's DTSTART/DTEND/DURATION, before mapping, that a
+single event cannot reach the effective window (the configured lookback
+before now up to expansion_days_window after it) and skip it.
+
+Recurring masters (RRULE/RDATE) are always kept, since their instances are
+only known after expansion. RECURRENCE-ID overrides are kept when either
+their own time or the slot they replace touches the window, so moved
+instances still show and replaced slots are still excluded from expansion.
+
+The check is deliberately generous: it pads the window by WINDOW_MARGIN to
+absorb floating times and all-day dates (interpreted in the calendar's
+timezone later) and the window sliding forward between refreshes. Exact
+filtering stays with TimeWindowStage.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any, Optional
+
+WINDOW_MARGIN = timedelta(days=1)
+
+
+def _instant(prop: Any) -> Optional[datetime]:
+    """Return a DTSTART/DTEND-style property as an aware UTC datetime, if it is one."""
+    value = getattr(prop, "dt", None)
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+    if isinstance(value, date):
+        return datetime.combine(value, time.min, UTC)
+    return None
+
+
+@dataclass(frozen=True)
+class ParseWindow:
+    """UTC range a parsed single event must touch to be worth materializing."""
+
+    start: datetime
+    end: datetime
+
+    @classmethod
+    def from_settings(cls, settings: Any, now: datetime) -> Optional["ParseWindow"]:
+        """Build the effective window from parser settings.
+
+        Args:
+            settings: Parser settings; ``parse_window_lookback_days`` (days before
+                now, unset/None disables prefiltering) and ``expansion_days_window``
+                (days after now, default 365)
+            now: Current time (UTC)
+
+        Returns:
+            ParseWindow, or None when prefiltering is not configured
+        """
+        lookback_days = getattr(settings, "parse_window_lookback_days", None)
+        if not isinstance(lookback_days, int) or lookback_days < 0:
+            return None
+        ahead_days = getattr(settings, "expansion_days_window", 365)
+        if not isinstance(ahead_days, int):
+            ahead_days = 365
+        return cls(start=now - timedelta(days=lookback_days), end=now + timedelta(days=ahead_days))
+
+    def _touches(self, start: datetime, end: datetime, margin: timedelta) -> bool:
+        return end >= self.start - margin and start <= self.end + margin
+
+    def admits(self, component: Any) -> bool:
+        """Return True unless the VEVENT component certainly lies outside the window.
+
+        Args:
+            component: icalendar VEVENT or fast-tokenizer component
+
+        Returns:
+            False only for single events (and overrides) wholly outside the window
+        """
+        if component.get("RRULE") is not None or component.get("RDATE") is not None:
+            return True
+
+        start = _instant(component.get("DTSTART"))
+        if start is None:
+            return True  # Let the event parser report or default it
+        end = _instant(component.get("DTEND"))
+        if end is None:
+            duration = getattr(component.get("DURATION"), "dt", None)
+            end = start + duration if isinstance(duration, timedelta) else start
+        return self.admits_span(start, end, _instant(component.get("RECURRENCE-ID")))
+
+    def admits_span(
+        self,
+        start: datetime,
+        end: datetime,
+        recurrence_id: Optional[datetime] = None,
+        margin: timedelta = WINDOW_MARGIN,
+    ) -> bool:
+        """Return True unless a single event with these UTC times lies outside the window.
+
+        Args:
+            start: Event start
+            end: Event end (or start when it has no duration)
+            recurrence_id: Slot an override replaces, if the event is one
+            margin: Padding around the window
+
+        Returns:
+            False when neither the event nor the slot it replaces touches the window
+        """
+        if self._touches(start, end, margin):
+            return True
+        return recurrence_id is not None and self._touches(
+            recurrence_id, recurrence_id + max(end - start, timedelta()), margin
+        )
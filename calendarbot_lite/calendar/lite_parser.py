@@ -1,6 +1,9 @@
 """iCalendar parser with Microsoft Outlook compatibility - CalendarBot Lite version."""
 
 import logging
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional, cast
 
@@ -10,6 +13,15 @@ from calendarbot_lite.calendar.lite_attendee_parser import LiteAttendeeParser
 from calendarbot_lite.calendar.lite_datetime_utils import LiteDateTimeParser
 from calendarbot_lite.calendar.lite_event_merger import LiteEventMerger
 from calendarbot_lite.calendar.lite_event_parser import LiteEventComponentParser
+from calendarbot_lite.calendar.lite_fingerprint import (
+    ICSFingerprintState,
+    ICSSplitter,
+    IncrementalParsePlan,
+    VEventBlock,
+    reusable_groups,
+    split_ics,
+)
+from calendarbot_lite.calendar.lite_intern import InternTable
 from calendarbot_lite.calendar.lite_models import (
     DateTimeWrapper,
     LiteAttendee,
@@ -21,7 +33,11 @@ from calendarbot_lite.calendar.lite_models import (
 # Backward compatibility aliases (these classes were previously defined here with underscore prefix)
 _SimpleEvent = SimpleEvent
 _DateTimeWrapper = DateTimeWrapper
+from calendarbot_lite.calendar.lite_ics_index import index_ics
+from calendarbot_lite.calendar.lite_parse_window import ParseWindow
+from calendarbot_lite.calendar.lite_parser_telemetry import ParserTelemetry
 from calendarbot_lite.calendar.lite_rrule_expander import LiteRRuleExpander
+from calendarbot_lite.calendar.lite_sharding import ParsedShard, ShardedParsePlan, plan_shards
 from calendarbot_lite.calendar.lite_streaming_parser import (
     MAX_ICS_SIZE_BYTES,
     MAX_ICS_SIZE_WARNING,
@@ -29,6 +45,7 @@ from calendarbot_lite.calendar.lite_streaming_parser import (
     LiteICSContentTooLargeError,
     LiteStreamingICSParser,
 )
+from calendarbot_lite.calendar.lite_uid_index import UIDIndex
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +63,85 @@ def _is_production_mode() -> bool:
     return os.environ.get("CALENDARBOT_PRODUCTION", "false").lower() in ("true", "1")
 
 
+@dataclass
+class _StreamingParseState:
+    """Running state shared by the synchronous and async streaming parse paths."""
+
+    settings: Any
+    filtered_events: list[LiteCalendarEvent] = field(default_factory=list)
+    # Bounded FIFO windows over the raw components (oldest evicted first); sized in __post_init__
+    raw_components_masters: deque[Any] = field(default_factory=deque)
+    raw_components_nonmasters: deque[Any] = field(default_factory=deque)
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    calendar_metadata: dict[str, str] = field(default_factory=dict)
+    intern_table: InternTable = field(default_factory=InternTable)
+    parse_window: Optional[ParseWindow] = None
+    total_components: int = 0
+    event_count: int = 0
+    recurring_event_count: int = 0
+    # Memory-bounded processing: limit stored events for typical calendar view usage
+    max_stored_events: int = 1000
+    masters_limit: int = 0
+    nonmasters_limit: int = 0
+
+    def __post_init__(self) -> None:
+        # Issue #49: Bounded memory for component superset
+        # Track masters (recurring) and non-masters (single events) separately with hard limits
+        try:
+            max_superset = getattr(self.settings, "raw_components_superset_limit", 1500)
+        except Exception:
+            max_superset = 1500
+
+        # Split limit: 70% for masters (recurring events), 30% for non-masters (single events)
+        # This prioritizes recurring events for RRULE expansion while preventing unbounded growth
+        self.masters_limit = max(0, int(max_superset * 0.7))
+        self.nonmasters_limit = max(0, int(max_superset * 0.3))
+        self.raw_components_masters = deque(maxlen=self.masters_limit)
+        self.raw_components_nonmasters = deque(maxlen=self.nonmasters_limit)
+
+    def keep_raw_component(self, component: Any) -> None:
+        """Remember a raw component for RRULE expansion within the superset limits.
+
+        Masters (with RRULE) and other components are kept in separate bounded
+        deques; once one is full, appending evicts its oldest component in O(1),
+        so the newest components in the feed are the ones retained.
+
+        Args:
+            component: Raw VEVENT component
+        """
+        if bool(component.get("RRULE")):
+            self.raw_components_masters.append(component)
+        else:
+            self.raw_components_nonmasters.append(component)
+
+    def raw_components_superset(self) -> list[Any]:
+        """Return the retained masters followed by the retained other components."""
+        return [*self.raw_components_masters, *self.raw_components_nonmasters]
+
+    def drop_groups(self, blocks: list[VEventBlock]) -> None:
+        """Forget the events, raw components and counts of the given VEVENT blocks.
+
+        Used when the expanded events of their UIDs are reused from a previous
+        parse, so they are neither returned twice nor expanded again (the reuse
+        adds the blocks back to the counts).
+
+        Args:
+            blocks: Blocks of the reused UID groups
+        """
+        uids = {b.uid for b in blocks}
+        self.event_count = max(0, self.event_count - len(blocks))
+        self.total_components = max(0, self.total_components - len(blocks))
+        self.recurring_event_count = max(
+            0, self.recurring_event_count - sum(1 for b in blocks if b.has_rrule)
+        )
+        self.filtered_events = [e for e in self.filtered_events if e.id not in uids]
+        for components in (self.raw_components_masters, self.raw_components_nonmasters):
+            kept = [c for c in components if str(c.get("UID", "")).strip() not in uids]
+            components.clear()
+            components.extend(kept)
+
+
 class LiteICSParser:
     """iCalendar parser with Microsoft Outlook compatibility - CalendarBot Lite version."""
 
@@ -70,6 +166,9 @@ class LiteICSParser:
 
         self._rrule_orchestrator = RRuleOrchestrator(settings, self._event_parser)
 
+        # Per-phase timings of the most recent parse (see _begin_profile)
+        self.telemetry = ParserTelemetry()
+
         logger.debug("Lite ICS parser initialized")
 
     # NOTE: Previously, this class contained several methods for RRULE expansion logic
@@ -127,193 +226,416 @@ class LiteICSParser:
         logger.debug("Using traditional parser for small ICS content (%d bytes)", len(ics_content))
         return self.parse_ics_content(ics_content, source_url)
 
-    def _parse_with_streaming(
+    def parse_ics_content_incremental(
         self,
         ics_content: str,
+        previous_state: Optional[ICSFingerprintState] = None,
         source_url: Optional[str] = None,
-    ) -> LiteICSParseResult:
-        """Parse ICS content using streaming parser with memory-bounded processing."""
-        try:
-            # Initialize result tracking - NO event accumulation
-            filtered_events: list[LiteCalendarEvent] = []  # Only store final filtered results
-            raw_components: list[Any] = []  # Store raw components for RRULE expansion
+    ) -> tuple[LiteICSParseResult, Optional[ICSFingerprintState]]:
+        """Parse ICS content, reusing events of VEVENTs unchanged since the last parse.
 
-            # Issue #49: Bounded memory for component superset
-            # Track masters (recurring) and non-masters (single events) separately with hard limits
-            try:
-                max_superset = getattr(self.settings, "raw_components_superset_limit", 1500)
-            except Exception:
-                max_superset = 1500
+        Every VEVENT is fingerprinted (UID + RECURRENCE-ID + body without DTSTAMP) and
+        blocks are grouped by UID. Groups whose fingerprint matches previous_state keep
+        their already-parsed and expanded events; only added or changed groups are
+        parsed and expanded, and removed groups simply drop out. Everything is
+        reparsed when the calendar envelope (header, VTIMEZONEs) or the RRULE
+        expansion window changed.
 
-            # Split limit: 70% for masters (recurring events), 30% for non-masters (single events)
-            # This prioritizes recurring events for RRULE expansion while preventing unbounded growth
-            masters_limit = int(max_superset * 0.7)
-            nonmasters_limit = int(max_superset * 0.3)
+        Args:
+            ics_content: Raw ICS file content
+            previous_state: Fingerprint state returned by the previous call, if any
+            source_url: Optional source URL for audit trail
 
-            raw_components_masters: list[Any] = []  # Bounded list of recurring events
-            raw_components_nonmasters: list[Any] = []  # Bounded list of non-recurring events
+        Returns:
+            Tuple of (parse result, fingerprint state for the next call). The state is
+            None when parsing failed.
+        """
+        plan = self.prepare_incremental_parse(ics_content, previous_state)
+        result = self.parse_ics_content(plan.content_to_parse, source_url)
+        return self.complete_incremental_parse(plan, result, previous_state)
 
-            warnings = []
-            errors = []
-            total_components = 0
-            event_count = 0
-            recurring_event_count = 0
-            calendar_metadata = {}
+    def prepare_incremental_parse(
+        self,
+        ics_content: str,
+        previous_state: Optional[ICSFingerprintState] = None,
+    ) -> IncrementalParsePlan:
+        """Work out which part of the feed has to be parsed for an incremental parse.
 
-            # Memory-bounded processing: limit stored events for typical calendar view usage
-            max_stored_events = 1000  # Increased to handle calendars with many recurring events
+        Split from parse_ics_content_incremental() so the parse itself can run
+        elsewhere (e.g. in a worker process) between preparing and completing.
 
-            # Process stream with immediate filtering to prevent memory accumulation
-            for item in self._streaming_parser.parse_stream(ics_content):
-                if item["type"] == "event":
-                    try:
-                        # Parse the iCalendar component using existing logic
-                        component = item["component"]
-                        calendar_metadata.update(item["metadata"])
-
-                        # Issue #49: Add component to appropriate bounded list
-                        # This prevents unbounded memory growth by enforcing hard limits on BOTH
-                        # recurring and non-recurring events
-                        if bool(component.get("RRULE")):
-                            # Recurring event (master with RRULE)
-                            raw_components_masters.append(component)
-                            # Enforce limit: keep only the most recent masters_limit items
-                            if len(raw_components_masters) > masters_limit:
-                                # Remove oldest items (FIFO) to stay within limit
-                                raw_components_masters = raw_components_masters[-masters_limit:]
-                        else:
-                            # Non-recurring event (single occurrence)
-                            raw_components_nonmasters.append(component)
-                            # Enforce limit: keep only the most recent nonmasters_limit items
-                            if len(raw_components_nonmasters) > nonmasters_limit:
-                                # Remove oldest items (FIFO) to stay within limit
-                                raw_components_nonmasters = raw_components_nonmasters[
-                                    -nonmasters_limit:
-                                ]
-
-                        # DEBUG: log raw component fields prior to mapping to LiteCalendarEvent
-                        try:
-                            raw_summary = component.get("SUMMARY")
-                            raw_description = component.get("DESCRIPTION")
-                            raw_attendees = component.get("ATTENDEE")
-                            logger.debug(
-                                "Streaming parser received component - SUMMARY=%r, DESCRIPTION_present=%s, ATTENDEE=%s",
-                                raw_summary,
-                                bool(raw_description),
-                                raw_attendees,
-                            )
-                        except Exception:
-                            logger.debug(
-                                "Streaming parser - failed to read raw component fields",
-                                exc_info=True,
-                            )
-
-                        # Use existing event parsing logic
-                        event = self._parse_event_component(
-                            cast("ICalEvent", component),
-                            calendar_metadata.get("X-WR-TIMEZONE"),
-                        )
+        Args:
+            ics_content: Raw ICS file content
+            previous_state: Fingerprint state returned by the previous parse, if any
 
-                        # DEBUG: log mapped event fields for validation
-                        if event:
-                            try:
-                                attendees_len = len(event.attendees) if event.attendees else 0
-                            except Exception:
-                                attendees_len = -1
-                            logger.debug(
-                                "Streaming parser mapped event - subject=%r, body_preview_present=%s, attendees_count=%s",
-                                getattr(event, "subject", None),
-                                bool(getattr(event, "body_preview", None)),
-                                attendees_len,
-                            )
+        Returns:
+            Plan whose content_to_parse must be parsed with parse_ics_content()
+        """
+        if not ics_content or not ics_content.strip():
+            return IncrementalParsePlan(
+                ics_content=ics_content, content_to_parse=ics_content, split=None
+            )
 
-                        if event:
-                            event_count += 1
-                            total_components += 1
+        split = split_ics(ics_content)
+        group_digests = split.group_digests()
+        expansion_key = self._expansion_key()
+
+        unchanged = reusable_groups(previous_state, split, group_digests, expansion_key)
+
+        if unchanged:
+            # Blocks without a UID cannot be matched and are always reparsed
+            changed_blocks = [b for b in split.blocks if b.uid not in unchanged]
+            content_to_parse = split.build_calendar(changed_blocks)
+        else:
+            changed_blocks = split.blocks
+            content_to_parse = ics_content
+
+        return IncrementalParsePlan(
+            ics_content=ics_content,
+            content_to_parse=content_to_parse,
+            split=split,
+            expansion_key=expansion_key,
+            group_digests=group_digests,
+            unchanged=unchanged,
+            changed_blocks=changed_blocks,
+        )
 
-                            if event.is_recurring:
-                                recurring_event_count += 1
+    def complete_incremental_parse(
+        self,
+        plan: IncrementalParsePlan,
+        result: LiteICSParseResult,
+        previous_state: Optional[ICSFingerprintState] = None,
+    ) -> tuple[LiteICSParseResult, Optional[ICSFingerprintState]]:
+        """Merge reused events into the result of parsing plan.content_to_parse.
 
-                            # Apply filtering immediately to prevent memory accumulation
-                            if event.is_busy_status and not event.is_cancelled:
-                                # Only store filtered events, and cap the total
-                                if len(filtered_events) < max_stored_events:
-                                    filtered_events.append(event)
-                                    # Store raw component for RRULE expansion (needed for recurring events)
-                                    raw_components.append(component)
-                                elif len(filtered_events) == max_stored_events:
-                                    warning = f"Event limit reached ({max_stored_events}), truncating results"
-                                    warnings.append(warning)
-                                    logger.warning(warning)
-
-                            # Explicitly release event object for garbage collection
-                            del event
+        Args:
+            plan: Plan returned by prepare_incremental_parse()
+            result: Result of parsing plan.content_to_parse
+            previous_state: The state the plan was prepared against
 
-                    except Exception as e:
-                        warning = f"Failed to parse streamed event: {e}"
-                        warnings.append(warning)
-                        logger.warning(warning)
+        Returns:
+            Tuple of (parse result, fingerprint state for the next parse). The state is
+            None when parsing failed or the feed was empty.
+        """
+        split = plan.split
+        if split is None or not result.success:
+            return result, None
+
+        unchanged = plan.unchanged
+        changed_blocks = plan.changed_blocks
+
+        # Attribute parsed events to their UID group (expanded instances via their master)
+        parsed_uids = {b.uid for b in changed_blocks if b.uid}
+        events_by_uid: dict[str, list[Any]] = {uid: [] for uid in parsed_uids}
+        for event in result.events:
+            group_uid = getattr(event, "rrule_master_uid", None) or getattr(event, "id", None)
+            if group_uid in events_by_uid:
+                events_by_uid[group_uid].append(event)
+
+        if unchanged and previous_state is not None:
+            reused_events: list[Any] = []
+            for uid in unchanged:
+                events_by_uid[uid] = previous_state.events_by_uid[uid]
+                reused_events.extend(events_by_uid[uid])
+
+            reused_blocks = [b for b in split.blocks if b.uid in unchanged]
+            result.events = list(result.events) + reused_events
+            result.event_count += len(reused_blocks)
+            result.recurring_event_count += sum(1 for b in reused_blocks if b.has_rrule)
+            result.total_components += len(reused_blocks)
+            if result.raw_content is not None:
+                result.raw_content = plan.ics_content
+
+            logger.info(
+                "Incremental parse: reused %d of %d UID groups (%d events), reparsed %d blocks",
+                len(unchanged),
+                len(plan.group_digests),
+                len(reused_events),
+                len(changed_blocks),
+            )
 
-                elif item["type"] == "error":
-                    errors.append(item["error"])
+        state = ICSFingerprintState(
+            envelope_digest=split.envelope_digest,
+            expansion_key=plan.expansion_key,
+            group_digests=plan.group_digests,
+            events_by_uid=events_by_uid,
+        )
+        return result, state
 
-            # If there were errors during streaming, return failure
-            if errors:
-                return LiteICSParseResult(
-                    success=False,
-                    error_message="; ".join(errors),
-                    warnings=warnings,
-                    source_url=source_url,
-                )
+    def _expansion_key(self) -> str:
+        """Identify the RRULE expansion window so reused expansions are not stale.
 
-            logger.debug(
-                "Streaming parser processed %s events (%s total events, %s busy/tentative)",
-                len(filtered_events),
-                event_count,
-                len(filtered_events),
+        Expansion (and the parse window) is anchored to the current UTC day, so
+        reused events are dropped at most once per day and whenever the expansion
+        settings change.
+
+        Returns:
+            Opaque key combining the anchor date and expansion settings
+        """
+        now = self._rrule_orchestrator.worker_pool.current_time()
+        return ":".join(
+            str(part)
+            for part in (
+                now.date().isoformat(),
+                getattr(self.settings, "enable_rrule_expansion", True),
+                getattr(self.settings, "rrule_expansion_days", 365),
+                getattr(self.settings, "expansion_days_window", 365),
+                getattr(self.settings, "max_occurrences_per_rule", 250),
+                getattr(self.settings, "parse_window_lookback_days", None),
             )
+        )
+
+    def _parse_window(self) -> Optional[ParseWindow]:
+        """Return the window single events must touch to be parsed, if configured.
+
+        See lite_parse_window: with ``parse_window_lookback_days`` set, single
+        events wholly outside [now - lookback, now + expansion_days_window] are
+        skipped before they are mapped to LiteCalendarEvent objects.
+
+        Returns:
+            ParseWindow for this parse, or None to parse every event
+        """
+        now = self._rrule_orchestrator.worker_pool.current_time()
+        return ParseWindow.from_settings(self.settings, now)
+
+    def _begin_profile(self, source_url: Optional[str] = None) -> ParserTelemetry:
+        """Start per-phase timing of a parse with a fresh ParserTelemetry.
+
+        Args:
+            source_url: Optional source URL for logging context
 
-            # IMPORTANT: Expand recurring events (RRULE) to generate instances
-            # This was missing from the streaming parser, causing recurring events
-            # to not show their future occurrences
-            expanded_events = []
-            if recurring_event_count > 0:
+        Returns:
+            The telemetry shared with the event and streaming parsers
+        """
+        telemetry = ParserTelemetry(source_url=source_url)
+        self.telemetry = telemetry
+        self._event_parser.telemetry = telemetry
+        self._streaming_parser.telemetry = telemetry
+        return telemetry
+
+    def _phase_timings(self) -> dict[str, dict[str, Any]]:
+        """Log and return the phase timings of the current parse, for its result."""
+        self.telemetry.log_phase_timings()
+        return self.telemetry.get_phase_timings()
+
+    def _log_window_skips(self, skipped: int) -> None:
+        if skipped:
+            logger.debug("Skipped %d events outside the parse window", skipped)
+
+    def parse_ics_content_sharded(
+        self,
+        ics_content: str,
+        source_url: Optional[str] = None,
+        shard_count: int = 2,
+    ) -> LiteICSParseResult:
+        """Parse ICS content shard by shard, as the parse executor does across processes.
+
+        The result equals parse_ics_content() for content below STREAMING_THRESHOLD;
+        larger content is parsed in full instead of through the bounded streaming
+        path.
+
+        Args:
+            ics_content: Raw ICS file content
+            source_url: Optional source URL for audit trail
+            shard_count: Number of shards to split the VEVENTs into
+
+        Returns:
+            Parse result with events and metadata
+        """
+        plan = self.prepare_sharded_parse(ics_content, shard_count)
+        shards = [self.parse_ics_shard(shard) for shard in plan.shards]
+        return self.complete_sharded_parse(plan, shards, source_url)
+
+    def prepare_sharded_parse(self, ics_content: str, shard_count: int) -> ShardedParsePlan:
+        """Split ICS content into shards that parse_ics_shard() can parse independently.
+
+        Args:
+            ics_content: Raw ICS file content
+            shard_count: Desired number of shards
+
+        Returns:
+            Plan whose shards must each be parsed with parse_ics_shard()
+        """
+        if not ics_content or not ics_content.strip():
+            return ShardedParsePlan(ics_content=ics_content, envelope=ics_content, shards=[])
+        return plan_shards(ics_content, shard_count)
+
+    def parse_ics_shard(self, shard_content: str) -> ParsedShard:
+        """Parse the VEVENTs of one shard without expanding or filtering them.
+
+        Args:
+            shard_content: One of ShardedParsePlan.shards
+
+        Returns:
+            ParsedShard (picklable, so it can be returned from a worker process)
+        """
+        telemetry = self._begin_profile()
+        try:
+            with telemetry.phase("from_ical"):
+                calendar = Calendar.from_ical(shard_content)
+            timezone_str = self._get_calendar_property(calendar, "X-WR-TIMEZONE")
+
+            # Shares repeated values within the shard (also shrinks the pickled result)
+            intern_table = InternTable()
+            parse_window = self._parse_window()
+            shard = ParsedShard()
+            for component in calendar.walk():
+                shard.total_components += 1
+                if component.name != "VEVENT":
+                    continue
+                if parse_window is not None and not parse_window.admits(component):
+                    continue
                 try:
-                    # Combine bounded masters and non-masters for RRULE expansion
-                    # This ensures RRULE masters are available while maintaining memory bounds
-                    raw_components_superset = raw_components_masters + raw_components_nonmasters
-                    expanded_events = self._expand_recurring_events(
-                        filtered_events, raw_components_superset
+                    event = self._parse_event_component(
+                        cast("ICalEvent", component), timezone_str, intern_table
                     )
-                    if expanded_events:
-                        # Merge expanded events with original events and deduplicate
-                        filtered_events = self._merge_expanded_events(
-                            filtered_events, expanded_events
-                        )
-                        logger.debug(
-                            "Streaming parser: Added %s expanded recurring event instances",
-                            len(expanded_events),
+                    if event:
+                        # Only RRULE masters are read by expansion; other components
+                        # are represented by their UID
+                        has_rrule = bool(component.get("RRULE"))
+                        shard.events.append(event)
+                        shard.components.append(
+                            (str(component.get("UID")), component if has_rrule else None)
                         )
+                        if event.is_recurring:
+                            shard.recurring_event_count += 1
                 except Exception as e:
-                    logger.warning("Failed to expand recurring events in streaming parser: %s", e)
-                    # Continue with unexpanded events
+                    warning = f"Failed to parse event: {e}"
+                    shard.warnings.append(warning)
+                    logger.warning(warning)
+        except Exception as e:
+            logger.exception("Failed to parse ICS shard")
+            return ParsedShard(success=False, error_message=str(e))
+        else:
+            shard.phase_timings = telemetry.get_phase_timings()
+            return shard
+
+    def complete_sharded_parse(
+        self,
+        plan: ShardedParsePlan,
+        shards: list[ParsedShard],
+        source_url: Optional[str] = None,
+    ) -> LiteICSParseResult:
+        """Combine parsed shards and expand, merge and filter them like parse_ics_content().
+
+        Args:
+            plan: Plan returned by prepare_sharded_parse()
+            shards: parse_ics_shard() results, one per plan shard and in the same order
+            source_url: Optional source URL for audit trail
+
+        Returns:
+            Parse result with events and metadata
+        """
+        if not plan.shards:
+            logger.warning("Empty ICS content provided")
+            return LiteICSParseResult(
+                success=False,
+                error_message="Empty ICS content",
+                source_url=source_url,
+            )
+
+        raw_content = None
+        telemetry = self._begin_profile(source_url)
+        try:
+            raw_content = self._capture_raw_content(plan.ics_content)
+
+            failed = next((shard for shard in shards if not shard.success), None)
+            if failed is not None:
+                raise ValueError(failed.error_message)
+
+            # Shards were timed where they were parsed
+            for shard in shards:
+                telemetry.add_phase_timings(shard.phase_timings)
+
+            with telemetry.phase("from_ical"):
+                calendar = Calendar.from_ical(plan.envelope)
+            envelope_components = sum(1 for _ in calendar.walk())
+
+            events: list[LiteCalendarEvent] = []
+            raw_components: list[Any] = []
+            uid_index = UIDIndex()
+            intern_table = InternTable()
+            warnings: list[str] = []
+            for shard in shards:
+                warnings.extend(shard.warnings)
+                for event, (comp_uid, rrule_component) in zip(
+                    shard.events, shard.components, strict=True
+                ):
+                    # Events from worker processes were unpickled per shard
+                    self._event_parser.intern_event_fields(event, intern_table)
+                    # Non-RRULE components only need to hold their UID's place in the index
+                    component = (
+                        rrule_component if rrule_component is not None else {"UID": comp_uid}
+                    )
+                    events.append(event)
+                    raw_components.append(component)
+                    uid_index.add_component(component)
+                    uid_index.add_event(event)
+
+            filtered_events = self._expand_and_filter_events(
+                events, raw_components, uid_index, intern_table
+            )
+            logger.debug(
+                "Parsed %s events from %d ICS shards (%s total events)",
+                len(filtered_events),
+                len(shards),
+                len(events),
+            )
 
             return LiteICSParseResult(
                 success=True,
                 events=filtered_events,
-                calendar_name=calendar_metadata.get("X-WR-CALNAME"),
-                calendar_description=calendar_metadata.get("X-WR-CALDESC"),
-                timezone=calendar_metadata.get("X-WR-TIMEZONE"),
-                total_components=total_components,
-                event_count=event_count,
-                recurring_event_count=recurring_event_count,
+                calendar_name=self._get_calendar_property(calendar, "X-WR-CALNAME"),
+                calendar_description=self._get_calendar_property(calendar, "X-WR-CALDESC"),
+                timezone=self._get_calendar_property(calendar, "X-WR-TIMEZONE"),
+                total_components=envelope_components
+                + sum(shard.total_components - envelope_components for shard in shards),
+                event_count=len(events),
+                recurring_event_count=sum(shard.recurring_event_count for shard in shards),
                 warnings=warnings,
-                ics_version=calendar_metadata.get("VERSION"),
-                prodid=calendar_metadata.get("PRODID"),
-                raw_content=None,  # Don't store raw content for large files
+                ics_version=self._get_calendar_property(calendar, "VERSION"),
+                prodid=self._get_calendar_property(calendar, "PRODID"),
+                raw_content=raw_content,
                 source_url=source_url,
+                phase_timings=self._phase_timings(),
             )
 
+        except Exception as e:
+            logger.exception("Failed to parse sharded ICS content")
+            return LiteICSParseResult(
+                success=False,
+                error_message=str(e),
+                raw_content=raw_content,
+                source_url=source_url,
+            )
+
+    def _parse_with_streaming(
+        self,
+        ics_content: str,
+        source_url: Optional[str] = None,
+    ) -> LiteICSParseResult:
+        """Parse ICS content using streaming parser with memory-bounded processing."""
+        telemetry = self._begin_profile(source_url)
+        try:
+            state = _StreamingParseState(self.settings, parse_window=self._parse_window())
+
+            # With a parse window, only stream the VEVENTs a cheap first pass keeps
+            indexed_skips = 0
+            if state.parse_window is not None:
+                with telemetry.phase("index"):
+                    ics_content, indexed_skips = self._select_window_events(
+                        ics_content, state.parse_window
+                    )
+
+            # Process stream with immediate filtering to prevent memory accumulation
+            self._streaming_parser.parse_window = state.parse_window
+            self._streaming_parser.window_skipped_events = indexed_skips
+            for item in self._streaming_parser.parse_stream(ics_content):
+                self._consume_streamed_item(state, item)
+
+            self._log_window_skips(self._streaming_parser.window_skipped_events)
+            return self._finish_streaming_parse(state, source_url)
+
         except Exception as e:
             logger.exception("Failed to parse ICS content with streaming parser")
             return LiteICSParseResult(
@@ -322,6 +644,307 @@ class LiteICSParser:
                 source_url=source_url,
             )
 
+    def _select_window_events(self, ics_content: str, parse_window: ParseWindow) -> tuple[str, int]:
+        """Drop the VEVENTs a windowed parse cannot need before tokenizing anything.
+
+        See lite_ics_index: the feed is indexed (VEVENT ranges, UID, DTSTART,
+        DTEND/DURATION, RECURRENCE-ID, RRULE/RDATE) and rebuilt around the events
+        that may touch the window. Recurring masters are always kept.
+
+        Args:
+            ics_content: Raw ICS content
+            parse_window: Parse window of this parse
+
+        Returns:
+            Tuple of (feed with only those VEVENTs, number of VEVENTs dropped); the
+            feed is unchanged when nothing is dropped or it cannot be indexed
+        """
+        index = index_ics(ics_content)
+        if index is None:
+            return ics_content, 0
+        selected = index.select(parse_window)
+        if len(selected) == len(index.events):
+            return ics_content, 0
+        logger.debug(
+            "Indexed %d events, parsing %d that may touch the parse window",
+            len(index.events),
+            len(selected),
+        )
+        return index.build_calendar(selected), len(index.events) - len(selected)
+
+    async def parse_ics_stream(
+        self,
+        byte_stream: AsyncIterator[bytes],
+        source_url: Optional[str] = None,
+    ) -> LiteICSParseResult:
+        """Parse ICS content straight from an async byte stream (e.g. an HTTP body).
+
+        Events are decoded and mapped as chunks arrive, so parsing overlaps with the
+        download and peak memory does not scale with feed size. Produces the same
+        result as the size-triggered streaming path of parse_ics_content().
+
+        Args:
+            byte_stream: Async iterator yielding raw ICS byte chunks
+            source_url: Optional source URL for audit trail
+
+        Returns:
+            Parse result with events and metadata (raw content is never stored)
+        """
+        try:
+            state = await self._consume_stream(byte_stream, source_url)
+            return self._finish_streaming_parse(state, source_url)
+
+        except Exception as e:
+            logger.exception("Failed to parse ICS byte stream")
+            return LiteICSParseResult(
+                success=False,
+                error_message=str(e),
+                source_url=source_url,
+            )
+
+    async def parse_ics_stream_incremental(
+        self,
+        byte_stream: AsyncIterator[bytes],
+        previous_state: Optional[ICSFingerprintState] = None,
+        source_url: Optional[str] = None,
+    ) -> tuple[LiteICSParseResult, Optional[ICSFingerprintState]]:
+        """Parse an ICS byte stream, reusing events of VEVENTs unchanged since the last parse.
+
+        The streamed counterpart of parse_ics_content_incremental(): VEVENTs are
+        fingerprinted as the chunks arrive (see ICSSplitter) and every event is
+        still mapped while streaming, but UID groups whose fingerprint matches
+        previous_state keep their already-expanded events instead of being
+        expanded again. The state is compatible with the buffered path's.
+
+        Args:
+            byte_stream: Async iterator yielding raw ICS byte chunks
+            previous_state: Fingerprint state returned by the previous parse, if any
+            source_url: Optional source URL for audit trail
+
+        Returns:
+            Tuple of (parse result, fingerprint state for the next parse). The state is
+            None when parsing failed or the feed was empty.
+        """
+        splitter = ICSSplitter(keep_text=False)
+
+        async def _fingerprinted() -> AsyncIterator[bytes]:
+            async for chunk in byte_stream:
+                splitter.update(chunk)
+                yield chunk
+
+        try:
+            state = await self._consume_stream(_fingerprinted(), source_url)
+            split = splitter.finish()
+            group_digests = split.group_digests()
+            expansion_key = self._expansion_key()
+            unchanged = reusable_groups(previous_state, split, group_digests, expansion_key)
+            if unchanged:
+                state.drop_groups([b for b in split.blocks if b.uid in unchanged])
+            result = self._finish_streaming_parse(state, source_url)
+
+        except Exception as e:
+            logger.exception("Failed to parse ICS byte stream")
+            return (
+                LiteICSParseResult(success=False, error_message=str(e), source_url=source_url),
+                None,
+            )
+
+        if not result.success or not split.blocks:
+            return result, None
+
+        plan = IncrementalParsePlan(
+            ics_content="",
+            content_to_parse="",
+            split=split,
+            expansion_key=expansion_key,
+            group_digests=group_digests,
+            unchanged=unchanged,
+            changed_blocks=[b for b in split.blocks if b.uid not in unchanged],
+        )
+        return self.complete_incremental_parse(plan, result, previous_state)
+
+    async def _consume_stream(
+        self, byte_stream: AsyncIterator[bytes], source_url: Optional[str]
+    ) -> "_StreamingParseState":
+        """Decode and map every event of a byte stream, leaving expansion to the caller.
+
+        Args:
+            byte_stream: Async iterator yielding raw ICS byte chunks
+            source_url: Optional source URL for audit trail
+
+        Returns:
+            The streaming parse state, ready for _finish_streaming_parse()
+        """
+        telemetry = self._begin_profile(source_url)
+        state = _StreamingParseState(self.settings, parse_window=self._parse_window())
+
+        # Fresh tokenizer per stream: it buffers partial lines/events between chunks
+        streaming_parser = LiteStreamingICSParser()
+        streaming_parser.parse_window = state.parse_window
+        streaming_parser.telemetry = telemetry
+        async for item in streaming_parser.parse_from_bytes_iter(byte_stream):
+            self._consume_streamed_item(state, item)
+
+        self._log_window_skips(streaming_parser.window_skipped_events)
+        return state
+
+    def _consume_streamed_item(self, state: "_StreamingParseState", item: dict[str, Any]) -> None:
+        """Map one item yielded by LiteStreamingICSParser into the running parse state.
+
+        Args:
+            state: Accumulated streaming parse state
+            item: Parser item ({"type": "event" | "error", ...})
+        """
+        if item["type"] == "event":
+            try:
+                # Parse the iCalendar component using existing logic
+                component = item["component"]
+                state.calendar_metadata.update(item["metadata"])
+
+                # Issue #49: Add component to the appropriate bounded deque
+                # This prevents unbounded memory growth by enforcing hard limits on BOTH
+                # recurring and non-recurring events
+                state.keep_raw_component(component)
+
+                # DEBUG: log raw component fields prior to mapping to LiteCalendarEvent
+                try:
+                    raw_summary = component.get("SUMMARY")
+                    raw_description = component.get("DESCRIPTION")
+                    raw_attendees = component.get("ATTENDEE")
+                    logger.debug(
+                        "Streaming parser received component - SUMMARY=%r, DESCRIPTION_present=%s, ATTENDEE=%s",
+                        raw_summary,
+                        bool(raw_description),
+                        raw_attendees,
+                    )
+                except Exception:
+                    logger.debug(
+                        "Streaming parser - failed to read raw component fields",
+                        exc_info=True,
+                    )
+
+                # Use existing event parsing logic
+                event = self._parse_event_component(
+                    cast("ICalEvent", component),
+                    state.calendar_metadata.get("X-WR-TIMEZONE"),
+                    state.intern_table,
+                )
+
+                # DEBUG: log mapped event fields for validation (reading attendees decodes them)
+                if event and logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        attendees_len = len(event.attendees) if event.attendees else 0
+                    except Exception:
+                        attendees_len = -1
+                    logger.debug(
+                        "Streaming parser mapped event - subject=%r, body_preview_present=%s, attendees_count=%s",
+                        getattr(event, "subject", None),
+                        bool(getattr(event, "body_preview", None)),
+                        attendees_len,
+                    )
+
+                if event:
+                    state.event_count += 1
+                    state.total_components += 1
+
+                    if event.is_recurring:
+                        state.recurring_event_count += 1
+
+                    # Apply filtering immediately to prevent memory accumulation
+                    if event.is_busy_status and not event.is_cancelled:
+                        # Only store filtered events, and cap the total
+                        if len(state.filtered_events) < state.max_stored_events:
+                            state.filtered_events.append(event)
+                        elif len(state.filtered_events) == state.max_stored_events:
+                            warning = f"Event limit reached ({state.max_stored_events}), truncating results"
+                            state.warnings.append(warning)
+                            logger.warning(warning)
+
+                    # Explicitly release event object for garbage collection
+                    del event
+
+            except Exception as e:
+                warning = f"Failed to parse streamed event: {e}"
+                state.warnings.append(warning)
+                logger.warning(warning)
+
+        elif item["type"] == "error":
+            state.errors.append(item["error"])
+
+    def _finish_streaming_parse(
+        self, state: "_StreamingParseState", source_url: Optional[str]
+    ) -> LiteICSParseResult:
+        """Expand recurring events and build the result for a completed stream.
+
+        Args:
+            state: Accumulated streaming parse state
+            source_url: Optional source URL for audit trail
+
+        Returns:
+            Parse result with events and metadata
+        """
+        filtered_events = state.filtered_events
+        calendar_metadata = state.calendar_metadata
+
+        # If there were errors during streaming, return failure
+        if state.errors:
+            return LiteICSParseResult(
+                success=False,
+                error_message="; ".join(state.errors),
+                warnings=state.warnings,
+                source_url=source_url,
+            )
+
+        logger.debug(
+            "Streaming parser processed %s events (%s total events, %s busy/tentative)",
+            len(filtered_events),
+            state.event_count,
+            len(filtered_events),
+        )
+
+        # IMPORTANT: Expand recurring events (RRULE) to generate instances
+        # This was missing from the streaming parser, causing recurring events
+        # to not show their future occurrences
+        expanded_events = []
+        if state.recurring_event_count > 0:
+            try:
+                # Combine bounded masters and non-masters for RRULE expansion
+                # This ensures RRULE masters are available while maintaining memory bounds
+                raw_components_superset = state.raw_components_superset()
+                uid_index = UIDIndex.build(filtered_events, raw_components_superset)
+                expanded_events = self._expand_recurring_events(
+                    filtered_events, raw_components_superset, uid_index, state.intern_table
+                )
+                if expanded_events:
+                    # Merge expanded events with original events and deduplicate
+                    filtered_events = self._merge_expanded_events(
+                        filtered_events, expanded_events, uid_index
+                    )
+                    logger.debug(
+                        "Streaming parser: Added %s expanded recurring event instances",
+                        len(expanded_events),
+                    )
+            except Exception as e:
+                logger.warning("Failed to expand recurring events in streaming parser: %s", e)
+                # Continue with unexpanded events
+
+        return LiteICSParseResult(
+            success=True,
+            events=filtered_events,
+            calendar_name=calendar_metadata.get("X-WR-CALNAME"),
+            calendar_description=calendar_metadata.get("X-WR-CALDESC"),
+            timezone=calendar_metadata.get("X-WR-TIMEZONE"),
+            total_components=state.total_components,
+            event_count=state.event_count,
+            recurring_event_count=state.recurring_event_count,
+            warnings=state.warnings,
+            ics_version=calendar_metadata.get("VERSION"),
+            prodid=calendar_metadata.get("PRODID"),
+            raw_content=None,  # Don't store raw content for large files
+            source_url=source_url,
+            phase_timings=self._phase_timings(),
+        )
+
     def _validate_ics_size(self, ics_content: str) -> None:
         """Validate ICS content size before processing.
 
@@ -387,26 +1010,16 @@ class LiteICSParser:
 
         # Initialize variables that might be used in error handling
         raw_content = None
+        telemetry = self._begin_profile(source_url)
 
         try:
             logger.debug("Starting traditional ICS content parsing")
 
-            # Capture raw content and validate size (with error handling)
-            # Only store full raw ICS content in development environment
-            if not _is_production_mode():
-                try:
-                    self._validate_ics_size(ics_content)
-                    raw_content = ics_content
-                    logger.debug("Raw ICS content captured: %d bytes", len(ics_content))
-                except LiteICSContentTooLargeError:
-                    logger.exception("ICS content too large, skipping raw content storage")
-                    raise  # Re-raise to stop processing
-                except Exception as e:
-                    logger.warning("Failed to capture raw ICS content: %s", e)
-                    # Continue parsing without raw content
+            raw_content = self._capture_raw_content(ics_content)
 
             # Parse the calendar
-            calendar = Calendar.from_ical(ics_content)
+            with telemetry.phase("from_ical"):
+                calendar = Calendar.from_ical(ics_content)
 
             # Extract calendar metadata
             calendar_name = self._get_calendar_property(cast("Calendar", calendar), "X-WR-CALNAME")
@@ -421,23 +1034,33 @@ class LiteICSParser:
             # Parse events
             events = []
             raw_components = []  # Store raw components for phantom filtering
+            uid_index = UIDIndex()  # Shared by RRULE expansion and override merging
+            intern_table = InternTable()  # Shares repeated field values within this parse
             total_components = 0
             event_count = 0
             recurring_event_count = 0
             warnings = []
+            parse_window = self._parse_window()
+            window_skipped = 0
 
             for component in calendar.walk():
                 total_components += 1
 
                 if component.name == "VEVENT":
+                    if parse_window is not None and not parse_window.admits(component):
+                        window_skipped += 1
+                        continue
                     try:
                         event = self._parse_event_component(
                             cast("ICalEvent", component),
                             timezone_str,
+                            intern_table,
                         )
                         if event:
                             events.append(event)
                             raw_components.append(component)  # Store raw component
+                            uid_index.add_component(component)
+                            uid_index.add_event(event)
                             event_count += 1
 
                             if event.is_recurring:
@@ -448,25 +1071,10 @@ class LiteICSParser:
                         warnings.append(warning)
                         logger.warning(warning)
 
-            # Apply RRULE expansion if enabled
-            expanded_events = []
-            if getattr(self.settings, "enable_rrule_expansion", True):
-                try:
-                    expanded_events = self._expand_recurring_events(events, raw_components)
-                    if expanded_events:
-                        # Merge expanded events with original events and deduplicate
-                        events = self._merge_expanded_events(events, expanded_events)
-                        events = self._deduplicate_events(events)
-                        logger.debug(
-                            "Added %s expanded recurring event instances", len(expanded_events)
-                        )
-                except Exception as e:
-                    logger.warning("RRULE expansion failed, continuing without expansion: %s", e)
-                    # Continue with original events only
-
-            # Filter to only busy/tentative events (same as Graph API behavior)
-            # TODO: This should respect the filter_busy_only configuration setting
-            filtered_events = [e for e in events if e.is_busy_status and not e.is_cancelled]
+            self._log_window_skips(window_skipped)
+            filtered_events = self._expand_and_filter_events(
+                events, raw_components, uid_index, intern_table
+            )
 
             logger.debug(
                 "Parsed %s events from ICS content (%s total events, %s busy/tentative)",
@@ -489,6 +1097,7 @@ class LiteICSParser:
                 prodid=prodid,
                 raw_content=raw_content,
                 source_url=source_url,
+                phase_timings=self._phase_timings(),
             )
 
         except Exception as e:
@@ -500,10 +1109,78 @@ class LiteICSParser:
                 source_url=source_url,
             )
 
+    def _capture_raw_content(self, ics_content: str) -> Optional[str]:
+        """Validate the content size and return the content to keep as raw_content.
+
+        Only the development environment stores the full raw ICS content.
+
+        Args:
+            ics_content: Raw ICS file content
+
+        Returns:
+            ics_content, or None in production or when it could not be captured
+
+        Raises:
+            LiteICSContentTooLargeError: If content exceeds maximum size limit
+        """
+        if _is_production_mode():
+            return None
+        try:
+            self._validate_ics_size(ics_content)
+        except LiteICSContentTooLargeError:
+            logger.exception("ICS content too large, skipping raw content storage")
+            raise  # Re-raise to stop processing
+        except Exception as e:
+            logger.warning("Failed to capture raw ICS content: %s", e)
+            return None  # Continue parsing without raw content
+        logger.debug("Raw ICS content captured: %d bytes", len(ics_content))
+        return ics_content
+
+    def _expand_and_filter_events(
+        self,
+        events: list[LiteCalendarEvent],
+        raw_components: list[Any],
+        uid_index: UIDIndex,
+        intern_table: Optional[InternTable] = None,
+    ) -> list[LiteCalendarEvent]:
+        """Expand and merge recurring events, then keep only busy, non-cancelled events.
+
+        Args:
+            events: Parsed calendar events in calendar order
+            raw_components: Raw components the events were parsed from
+            uid_index: UIDIndex of events and raw_components
+            intern_table: Optional per-parse table the events were parsed with
+
+        Returns:
+            Events to publish
+        """
+        # Apply RRULE expansion if enabled
+        expanded_events = []
+        if getattr(self.settings, "enable_rrule_expansion", True):
+            try:
+                expanded_events = self._expand_recurring_events(
+                    events, raw_components, uid_index, intern_table
+                )
+                if expanded_events:
+                    # Merge expanded events with original events and deduplicate
+                    events = self._merge_expanded_events(events, expanded_events, uid_index)
+                    events = self._deduplicate_events(events)
+                    logger.debug(
+                        "Added %s expanded recurring event instances", len(expanded_events)
+                    )
+            except Exception as e:
+                logger.warning("RRULE expansion failed, continuing without expansion: %s", e)
+                # Continue with original events only
+
+        # Filter to only busy/tentative events (same as Graph API behavior)
+        # TODO: This should respect the filter_busy_only configuration setting
+        return [e for e in events if e.is_busy_status and not e.is_cancelled]
+
     def _parse_event_component(
         self,
         component: ICalEvent,
         default_timezone: Optional[str] = None,
+        intern_table: Optional[InternTable] = None,
     ) -> Optional[LiteCalendarEvent]:
         """Parse a single VEVENT component into LiteCalendarEvent.
 
@@ -512,11 +1189,12 @@ class LiteICSParser:
         Args:
             component: iCalendar VEVENT component
             default_timezone: Default timezone for the calendar
+            intern_table: Optional per-parse table sharing repeated field values
 
         Returns:
             Parsed LiteCalendarEvent or None if parsing fails
         """
-        return self._event_parser.parse_event_component(component, default_timezone)
+        return self._event_parser.parse_event_component(component, default_timezone, intern_table)
 
     def _parse_datetime(self, dt_prop: Any, default_timezone: Optional[str] = None) -> datetime:
         """Parse iCalendar datetime property.
@@ -627,6 +1305,8 @@ class LiteICSParser:
         self,
         events: list[LiteCalendarEvent],
         raw_components: list[ICalEvent],
+        uid_index: Optional[UIDIndex] = None,
+        intern_table: Optional[InternTable] = None,
     ) -> list[LiteCalendarEvent]:
         """Expand recurring events using RRuleOrchestrator.
 
@@ -639,17 +1319,23 @@ class LiteICSParser:
         Args:
             events: List of parsed calendar events
             raw_components: List of raw iCalendar components for RRULE extraction
+            uid_index: Optional UIDIndex of events and raw_components, shared with merging
+            intern_table: Optional per-parse table the events were parsed with
 
         Returns:
             List of expanded event instances
         """
         # Delegate to RRuleOrchestrator for centralized RRULE expansion
-        return self._rrule_orchestrator.expand_recurring_events(events, raw_components)
+        with self.telemetry.phase("rrule_expansion"):
+            return self._rrule_orchestrator.expand_recurring_events(
+                events, raw_components, uid_index, intern_table
+            )
 
     def _merge_expanded_events(
         self,
         original_events: list[LiteCalendarEvent],
         expanded_events: list[LiteCalendarEvent],
+        uid_index: Optional[UIDIndex] = None,
     ) -> list[LiteCalendarEvent]:
         """Merge expanded events with original events.
 
@@ -658,11 +1344,12 @@ class LiteICSParser:
         Args:
             original_events: Original parsed events
             expanded_events: Expanded recurring event instances
+            uid_index: Optional UIDIndex of original_events, shared with expansion
 
         Returns:
             Combined list of events
         """
-        return self._event_merger.merge_expanded_events(original_events, expanded_events)
+        return self._event_merger.merge_expanded_events(original_events, expanded_events, uid_index)
 
     def _deduplicate_events(self, events: list[LiteCalendarEvent]) -> list[LiteCalendarEvent]:
         """Remove duplicate events based on UID and start time.
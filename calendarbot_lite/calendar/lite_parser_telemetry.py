@@ -1,15 +1,56 @@
 """Parser telemetry and circuit breaker for ICS calendar processing - CalendarBot Lite.
 
 This module handles progress tracking, duplicate detection, and circuit breaker
-logic to prevent infinite loops from corrupted/malformed ICS feeds.
+logic to prevent infinite loops from corrupted/malformed ICS feeds. It also
+keeps cumulative per-phase timers (VEVENT indexing, line unfolding, tokenizing,
+icalendar parsing, datetime parsing, attendee extraction, online-meeting
+detection and RRULE expansion) so a slow refresh can be pinned to a phase
+without a profiler.
 Extracted from lite_parser.py to improve modularity and testability.
 """
 
 import logging
-from typing import Optional
+from time import perf_counter
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Profiled parse phases, in pipeline order
+PARSE_PHASES = (
+    "index",  # Locating the VEVENTs a windowed parse needs (huge feeds)
+    "unfold",  # Splitting chunks into lines and joining folded lines (streaming)
+    "tokenize",  # Fast VEVENT tokenizer (streaming)
+    "from_ical",  # icalendar Calendar.from_ical (whole feed, shard or fallback event)
+    "datetime",  # DTSTART/DTEND/CREATED/LAST-MODIFIED mapping
+    "attendees",  # ORGANIZER/ATTENDEE extraction
+    "online_meeting",  # Meeting URL detection in descriptions
+    "rrule_expansion",  # RRULE expansion of recurring masters
+)
+
+
+class PhaseTimer:
+    """Cumulative wall time and call count of one parse phase.
+
+    Reusable (but not re-entrant) context manager: each ``with`` block adds its
+    elapsed time and one call.
+    """
+
+    __slots__ = ("_started", "calls", "seconds")
+
+    def __init__(self) -> None:
+        """Initialize an idle timer."""
+        self.seconds = 0.0
+        self.calls = 0
+        self._started = 0.0
+
+    def __enter__(self) -> "PhaseTimer":
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.seconds += perf_counter() - self._started
+        self.calls += 1
+
 
 class ParserTelemetry:
     """Tracks parsing progress, detects duplicates, and triggers circuit breaker.
@@ -44,6 +85,9 @@ class ParserTelemetry:
         self.duplicate_ids: set[str] = set()
         self.warnings = 0
 
+        # Per-phase profiling
+        self.phases: dict[str, PhaseTimer] = {}
+
     def record_item(self) -> None:
         """Record that an item was processed."""
         self.total_items += 1
@@ -127,6 +171,60 @@ class ParserTelemetry:
         """
         return len(self.duplicate_ids)
 
+    def phase(self, name: str) -> PhaseTimer:
+        """Get the timer of a parse phase, to be used as ``with telemetry.phase(name):``.
+
+        Args:
+            name: Phase name (one of PARSE_PHASES)
+
+        Returns:
+            The phase's cumulative timer
+        """
+        timer = self.phases.get(name)
+        if timer is None:
+            timer = self.phases[name] = PhaseTimer()
+        return timer
+
+    def add_phase_timings(self, timings: dict[str, dict[str, Any]]) -> None:
+        """Add timings measured elsewhere (e.g. by a worker process) to the phase timers.
+
+        Args:
+            timings: Timings as returned by get_phase_timings()
+        """
+        for name, timing in timings.items():
+            timer = self.phase(name)
+            timer.seconds += timing.get("ms", 0.0) / 1000
+            timer.calls += int(timing.get("calls", 0))
+
+    def get_phase_timings(self) -> dict[str, dict[str, Any]]:
+        """Get cumulative time and calls per phase, in pipeline order.
+
+        Returns:
+            {phase: {"ms": milliseconds, "calls": timed sections}} for phases that ran
+        """
+        order = {name: i for i, name in enumerate(PARSE_PHASES)}
+        return {
+            name: {"ms": round(timer.seconds * 1000, 3), "calls": timer.calls}
+            for name, timer in sorted(
+                self.phases.items(), key=lambda item: order.get(item[0], len(order))
+            )
+            if timer.calls
+        }
+
+    def log_phase_timings(self) -> None:
+        """Log the per-phase timings at debug level."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            "Parse phase timings - source_url=%s, %s",
+            self.source_url,
+            ", ".join(
+                f"{name}={timing['ms']:.1f}ms/{timing['calls']}"
+                for name, timing in self.get_phase_timings().items()
+            )
+            or "none",
+        )
+
     def get_content_size_estimate(self) -> int:
         """Estimate content size in bytes.
 
@@ -0,0 +1,114 @@
+"""Sliding-window RRULE expansion cache for CalendarBot Lite.
+
+Each refresh expands every recurring master over a window that has only moved
+forward by one refresh interval since the previous run. RRuleExpansionCache
+remembers the UTC occurrences produced for each master, so the next expansion
+only has to drop occurrences that slid out of the window and compute the newly
+exposed tail.
+
+Entries are keyed by master UID and carry a fingerprint of everything that
+determines occurrence times (UID, RRULE, EXDATE set, DTSTART, TZID). A master
+whose fingerprint changed is expanded from scratch and replaces its entry, so
+edits invalidate exactly the affected series. Only occurrence times are cached;
+instance events are still built from the current master on every refresh.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+DEFAULT_CACHE_ENTRIES = 1024
+
+
+def expansion_fingerprint(
+    master_event: Any, rrule_string: str, exdates: Optional[list[str]]
+) -> tuple[str, ...]:
+    """Build the cache fingerprint for one recurring master.
+
+    Args:
+        master_event: Master LiteCalendarEvent
+        rrule_string: RRULE pattern string
+        exdates: EXDATE (and RECURRENCE-ID) strings excluded from the series
+
+    Returns:
+        Tuple of the values that determine the series' occurrence times
+    """
+    start = master_event.start
+    return (
+        str(master_event.id),
+        rrule_string,
+        "\n".join(sorted(set(exdates or ()))),
+        start.date_time.isoformat(),
+        str(start.date_time.tzinfo),
+        str(start.time_zone),
+    )
+
+
+@dataclass
+class CachedExpansion:
+    """Occurrences of one master over a previously expanded window.
+
+    ``occurrences`` holds every occurrence (UTC, ascending) between
+    ``window_start`` and ``covered_until`` inclusive; beyond ``covered_until``
+    nothing is known. ``anchor`` is the last generated occurrence in its
+    original timezone, used to restart rules that can be rebased.
+    """
+
+    fingerprint: tuple[str, ...]
+    window_start: datetime
+    covered_until: datetime
+    occurrences: list[datetime]
+    anchor: Optional[datetime] = None
+
+
+class RRuleExpansionCache:
+    """Bounded LRU map of master UID -> CachedExpansion."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of masters to remember (0 disables caching)
+        """
+        self.max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, CachedExpansion] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, uid: str, fingerprint: tuple[str, ...]) -> Optional[CachedExpansion]:
+        """Return the entry for ``uid`` if it was built from the same fingerprint.
+
+        A stale entry (the master changed) is dropped immediately.
+        """
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is None or entry.fingerprint != fingerprint:
+                if entry is not None:
+                    del self._entries[uid]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(uid)
+            self.hits += 1
+            return entry
+
+    def put(self, uid: str, entry: CachedExpansion) -> None:
+        """Store ``entry`` for ``uid``, evicting the least recently used masters."""
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[uid] = entry
+            self._entries.move_to_end(uid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all cached expansions."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached masters."""
+        return len(self._entries)
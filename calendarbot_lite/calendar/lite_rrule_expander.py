@@ -6,22 +6,84 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta, UTC
 import logging
 import time
-from typing import Any, Optional
+import multiprocessing
+from typing import Any, Optional, TYPE_CHECKING
 from collections.abc import AsyncIterator
-import uuid
+from concurrent.futures.process import BrokenProcessPool
 
 from dateutil.rrule import rrulestr, rruleset
 
+from calendarbot_lite.calendar.lite_rrule_cache import (
+    DEFAULT_CACHE_ENTRIES,
+    CachedExpansion,
+    RRuleExpansionCache,
+    expansion_fingerprint,
+)
+from calendarbot_lite.calendar.lite_rrule_fastpath import (
+    SimpleRecurrence,
+    SimpleRule,
+)
 from calendarbot_lite.calendar.lite_models import (
     DateTimeWrapper,
+    ExpandedOccurrence,
     LiteCalendarEvent,
     LiteDateTimeInfo,
     SimpleEvent,
 )
+from calendarbot_lite.calendar.lite_intern import InternTable
+from calendarbot_lite.calendar.lite_uid_index import UIDIndex
+
+if TYPE_CHECKING:
+    from calendarbot_lite.calendar.lite_rrule_process_pool import RRuleProcessPool
 
 logger = logging.getLogger(__name__)
 
 
+def make_instance_id(master_uid: str, occurrence: datetime) -> str:
+    """Build the stable ID of one expanded occurrence.
+
+    The ID depends only on the master UID and the occurrence's UTC start, so the
+    same occurrence keeps its ID across refreshes (skip lookups, caches and
+    ETags rely on this). Naive datetimes are treated as UTC.
+
+    Args:
+        master_uid: UID of the recurring master
+        occurrence: Start of the occurrence
+
+    Returns:
+        Instance ID of the form ``<master_uid>_<YYYYMMDDTHHMMSS>Z``
+    """
+    occurrence_utc = (
+        occurrence.replace(tzinfo=UTC) if occurrence.tzinfo is None else occurrence.astimezone(UTC)
+    )
+    return f"{master_uid}_{occurrence_utc.strftime('%Y%m%dT%H%M%S')}Z"
+
+
+def _is_rebasable(rrule_string: str) -> bool:
+    """Return True if the rule yields the same later occurrences from any of its occurrences.
+
+    Restarting a rule at one of its occurrences keeps the INTERVAL phase and
+    the DTSTART-derived defaults (weekday, month day, time of day). COUNT and
+    BYSETPOS depend on earlier occurrences, and multi-line rule sets may mix
+    in RDATEs, so those are always expanded from the original DTSTART.
+    """
+    upper = rrule_string.strip().upper()
+    return "COUNT=" not in upper and "BYSETPOS=" not in upper and "\n" not in upper
+
+
+def _original_timezone(occurrence: datetime, master_event: Any) -> datetime:
+    """Convert a UTC occurrence back to the timezone its rule generates it in."""
+    tzinfo = master_event.start.date_time.tzinfo
+    if tzinfo is None:
+        return occurrence.replace(tzinfo=None)
+    return occurrence.astimezone(tzinfo)
+
+
+def _cache_covers(entry: CachedExpansion, start_window: datetime, end_window: datetime) -> bool:
+    """Return True if a cached expansion can answer the window by sliding forward."""
+    return entry.window_start <= start_window <= entry.covered_until <= end_window
+
+
 @dataclass
 class RRuleExpanderConfig:
     """Configuration for RRULE expansion.
@@ -35,6 +97,8 @@ class RRuleExpanderConfig:
     expansion_days_window: int = 365
     expansion_time_budget_ms_per_rule: int = 200
     expansion_yield_frequency: int = 50
+    expansion_cache_entries: int = DEFAULT_CACHE_ENTRIES
+    rrule_expansion_processes: int = 0
 
     # Legacy expander settings
     rrule_expansion_days: int = 365
@@ -50,6 +114,13 @@ class RRuleExpanderConfig:
         Returns:
             RRuleExpanderConfig with values from settings or defaults
         """
+        cache_entries = getattr(settings, "expansion_cache_entries", DEFAULT_CACHE_ENTRIES)
+        if not isinstance(cache_entries, int):
+            cache_entries = DEFAULT_CACHE_ENTRIES
+        processes = getattr(settings, "rrule_expansion_processes", 0)
+        if not isinstance(processes, int):
+            processes = 0
+
         return cls(
             rrule_worker_concurrency=getattr(settings, "rrule_worker_concurrency", 1),
             max_occurrences_per_rule=getattr(settings, "max_occurrences_per_rule", 250),
@@ -58,6 +129,8 @@ class RRuleExpanderConfig:
                 settings, "expansion_time_budget_ms_per_rule", 200
             ),
             expansion_yield_frequency=getattr(settings, "expansion_yield_frequency", 50),
+            expansion_cache_entries=cache_entries,
+            rrule_expansion_processes=processes,
             rrule_expansion_days=getattr(settings, "rrule_expansion_days", 365),
             enable_rrule_expansion=getattr(settings, "enable_rrule_expansion", True),
         )
@@ -84,6 +157,8 @@ class RRuleWorkerPool:
         self.expansion_days = config.expansion_days_window
         self.time_budget_ms = config.expansion_time_budget_ms_per_rule
         self.yield_frequency = config.expansion_yield_frequency
+        self.expansion_cache = RRuleExpansionCache(config.expansion_cache_entries)
+        self.expansion_processes = config.rrule_expansion_processes
 
         self._semaphore = asyncio.Semaphore(self.concurrency)
         self._active_tasks: set[asyncio.Task] = set()
@@ -103,7 +178,7 @@ class RRuleWorkerPool:
         master_event: LiteCalendarEvent,
         rrule_string: str,
         exdates: Optional[list[str]] = None,
-    ) -> AsyncIterator[LiteCalendarEvent]:
+    ) -> AsyncIterator[LiteCalendarEvent | ExpandedOccurrence]:
         """Expand RRULE pattern asynchronously with true streaming (no list materialization).
 
         Args:
@@ -112,7 +187,8 @@ class RRuleWorkerPool:
             exdates: Optional list of excluded dates
 
         Yields:
-            Individual LiteCalendarEvent instances for each occurrence
+            One instance per occurrence: a compact ExpandedOccurrence for parsed
+            LiteCalendarEvent masters, otherwise a standalone LiteCalendarEvent
 
         Raises:
             LiteRRuleExpansionError: If RRULE expansion fails
@@ -128,167 +204,22 @@ class RRuleWorkerPool:
             start_time = time.time()
 
             try:
-                # Set up expansion window
-                # For recurring events, we need to balance two concerns:
-                # 1. RRULE semantics require starting from the event's original start date
-                # 2. Old recurring events would generate too many past occurrences, hitting
-                #    max_occurrences limit before reaching current dates (DATA LOSS bug)
-                #
-                # Solution: For infinite recurring events (no COUNT/UNTIL), start from
-                # max(now - 7 days, master_start) to avoid the data loss bug.
-                # For events with COUNT/UNTIL, always start from master_start to honor those constraints.
-
-                # Get current time, respecting test overrides
-                now = self._get_current_time()
-                master_start = master_event.start.date_time
-
-                # Normalize master_start to UTC for comparison
-                if master_start.tzinfo is None:
-                    master_start_utc = master_start.replace(tzinfo=UTC)
-                else:
-                    master_start_utc = master_start.astimezone(UTC)
-
-                # Check if this is an infinite recurring event (no COUNT or UNTIL)
-                # We check the RRULE string directly to avoid accessing private members
-                is_infinite = (
-                    "COUNT=" not in rrule_string.upper() and "UNTIL=" not in rrule_string.upper()
-                )
-
-                # For infinite recurring events, start from recent past to avoid data loss
-                # For finite events (COUNT/UNTIL), start from master_start to honor constraints
-                if is_infinite and master_start_utc < (now - timedelta(days=7)):
-                    # Old infinite recurring event: start from recent past
-                    lookback_start = now - timedelta(days=7)
-                    start_date = lookback_start
-                    logger.debug(
-                        "Using lookback window for old infinite recurring event: "
-                        "master_start=%s, lookback_start=%s",
-                        master_start_utc,
-                        lookback_start,
-                    )
-                else:
-                    # Finite event or recent event: start from master_start
-                    start_date = master_start_utc
-
-                end_date = now + timedelta(days=self.expansion_days)
+                start_window, end_window = self._expansion_window(master_event, rrule_string)
 
-                # Parse RRULE and build rruleset with exdates
-                rule_set = rruleset()
-
-                parsed_rule = rrulestr(rrule_string, dtstart=master_event.start.date_time)
-                if isinstance(parsed_rule, rruleset):
-                    rule_set = parsed_rule
-                else:
-                    rule_set.rrule(parsed_rule)
-
-                # Apply EXDATEs if provided
-                logger.debug("EXDATE processing for event %s: exdates=%r", event_subject, exdates)
-                if exdates:
-                    logger.debug("Processing %d EXDATE entries", len(exdates))
-                    for i, ex in enumerate(exdates):
-                        try:
-                            ex_dt = self._parse_datetime(ex)
-                            logger.debug(
-                                "EXDATE %d: raw='%s' parsed=%r tzinfo=%r",
-                                i,
-                                ex,
-                                ex_dt,
-                                ex_dt.tzinfo if hasattr(ex_dt, "tzinfo") else None,
-                            )
-                            if ex_dt.tzinfo is None:
-                                ex_dt = ex_dt.replace(tzinfo=UTC)
-                                logger.debug("EXDATE %d: added UTC timezone -> %r", i, ex_dt)
-                            else:
-                                ex_dt = ex_dt.astimezone(UTC)
-                                logger.debug("EXDATE %d: converted to UTC -> %r", i, ex_dt)
-                            rule_set.exdate(ex_dt)
-                            logger.debug("EXDATE %d: successfully added to ruleset", i)
-                        except Exception as ex_e:
-                            logger.warning("Failed to parse EXDATE '%s': %s", ex, ex_e)
-                            continue
-                else:
-                    logger.debug("No EXDATE entries provided for event %s", event_subject)
-
-                # Normalize window datetimes
-                start_window = (
-                    start_date.replace(tzinfo=UTC)
-                    if start_date.tzinfo is None
-                    else start_date.astimezone(UTC)
-                )
-                end_window = (
-                    end_date.replace(tzinfo=UTC)
-                    if end_date.tzinfo is None
-                    else end_date.astimezone(UTC)
+                occurrences = self._window_occurrences(
+                    master_event, rrule_string, exdates, start_window, end_window, start_time
                 )
 
-                # Stream occurrences directly from iterator without materialization
+                duration = master_event.end.date_time - master_event.start.date_time
+                compact = isinstance(master_event, LiteCalendarEvent)
                 event_count = 0
-                for i, occurrence in enumerate(
-                    rule_set.between(start_window, end_window, inc=True)
-                ):
-                    # Check time budget
-                    elapsed_ms = (time.time() - start_time) * 1000
-                    if elapsed_ms > self.time_budget_ms:
-                        logger.warning(
-                            "RRULE streaming exceeded time budget (%dms > %dms) after %d events",
-                            elapsed_ms,
-                            self.time_budget_ms,
-                            i,
-                        )
-                        break
-
-                    # Check occurrence limit
-                    if i >= self.max_occurrences:
-                        logger.debug(
-                            "RRULE streaming limited to %d occurrences for Pi Zero 2W",
-                            self.max_occurrences,
-                        )
-                        break
-
-                    # Normalize occurrence
-                    if not isinstance(occurrence, datetime):
-                        continue
-                    normalized_occurrence = (
-                        occurrence.replace(tzinfo=UTC)
-                        if occurrence.tzinfo is None
-                        else occurrence.astimezone(UTC)
+                for i, normalized_occurrence in enumerate(occurrences):
+                    yield self._build_instance(
+                        master_event,
+                        normalized_occurrence,
+                        normalized_occurrence + duration,
+                        compact,
                     )
-
-                    # Generate event instance
-                    duration = master_event.end.date_time - master_event.start.date_time
-                    end_time = normalized_occurrence + duration
-
-                    instance_id = (
-                        f"{master_event.id}_{normalized_occurrence.strftime('%Y%m%dT%H%M%S')}_"
-                        f"{uuid.uuid4().hex[:8]}"
-                    )
-
-                    event = LiteCalendarEvent(
-                        id=instance_id,
-                        subject=master_event.subject,
-                        body_preview=master_event.body_preview,
-                        start=LiteDateTimeInfo(
-                            date_time=normalized_occurrence,
-                            time_zone=master_event.start.time_zone,
-                        ),
-                        end=LiteDateTimeInfo(
-                            date_time=end_time,
-                            time_zone=master_event.end.time_zone,
-                        ),
-                        is_all_day=master_event.is_all_day,
-                        show_as=master_event.show_as,
-                        is_cancelled=master_event.is_cancelled,
-                        is_organizer=master_event.is_organizer,
-                        location=master_event.location,
-                        is_online_meeting=master_event.is_online_meeting,
-                        online_meeting_url=master_event.online_meeting_url,
-                        is_recurring=False,
-                        is_expanded_instance=True,
-                        rrule_master_uid=master_event.id,
-                        last_modified_date_time=master_event.last_modified_date_time,
-                    )
-
-                    yield event
                     event_count += 1
 
                     # Cooperative yield to event loop
@@ -309,12 +240,625 @@ class RRuleWorkerPool:
                 )
                 raise LiteRRuleExpansionError(f"Failed to stream RRULE expansion: {e}") from e
 
+    def process_settings(self) -> dict[str, Any]:
+        """Return the settings expansion workers need, as a picklable dict."""
+        return {
+            "max_occurrences_per_rule": self.max_occurrences,
+            "expansion_time_budget_ms_per_rule": self.time_budget_ms,
+            "expansion_days_window": self.expansion_days,
+        }
+
+    def occurrence_times(
+        self,
+        dtstart: datetime,
+        rrule_string: str,
+        exdates: Optional[list[str]],
+        master_event: Any,
+        start_window: datetime,
+        end_window: datetime,
+        start_time: float,
+    ) -> tuple[list[datetime], bool]:
+        """Compute a rule's UTC occurrences in a window, bypassing the expansion cache.
+
+        Used by expansion worker processes, which only receive the rule's inputs.
+
+        Args:
+            dtstart: Start of the recurrence
+            rrule_string: RRULE pattern string
+            exdates: Optional list of excluded dates
+            master_event: Master recurring event (for logging)
+            start_window: Window start (UTC)
+            end_window: Window end (UTC)
+            start_time: time.time() at the start of this expansion (for the time budget)
+
+        Returns:
+            Tuple of (ascending UTC occurrences, whether the occurrence limit or
+            time budget cut the window short)
+        """
+        rule_set = self._build_recurrence(dtstart, rrule_string, exdates, master_event)
+        occurrences, _, truncated = self._generate_occurrences(
+            rule_set, start_window, end_window, self.max_occurrences, start_time
+        )
+        return occurrences, truncated
+
+    @classmethod
+    def build_rule_set(
+        cls,
+        dtstart: datetime,
+        rrule_string: str,
+        exdates: Optional[list[str]],
+        master_event: Any,
+    ) -> rruleset:
+        """Build the dateutil rule set full expansion would iterate, for lazy stepping.
+
+        Needs no pool settings, so OccurrenceQuery can call it on the class to
+        step series past the expanded window.
+
+        Args:
+            dtstart: Start of the recurrence
+            rrule_string: RRULE pattern string
+            exdates: Optional list of excluded dates (including RECURRENCE-IDs)
+            master_event: Master recurring event (for logging)
+
+        Returns:
+            rruleset with the rule and exclusions
+        """
+        return cls._build_rule_set(dtstart, rrule_string, exdates, master_event)
+
+    async def expand_in_processes(
+        self,
+        events_with_rrules: list[tuple[Any, str, Optional[list[str]]]],
+        process_pool: "RRuleProcessPool",
+    ) -> AsyncIterator[LiteCalendarEvent | ExpandedOccurrence]:
+        """Expand many masters with their occurrence times computed in worker processes.
+
+        Yields the same instances, in the same order, as expand_rrule_stream()
+        over each (event, rrule, exdates) tuple. Masters whose window can be
+        answered from the expansion cache are expanded here; the others are
+        sent to the pool, and their occurrences are cached on return.
+
+        Args:
+            events_with_rrules: List of (event, rrule_string, exdates) tuples
+            process_pool: Pool that computes occurrence times
+
+        Yields:
+            One instance per occurrence, master by master
+
+        Raises:
+            BrokenProcessPool: If a worker died before any instance was yielded
+        """
+        from calendarbot_lite.calendar.lite_rrule_process_pool import ExpansionJob
+
+        # Plan: per master, either cached occurrences or a job for the pool
+        planned: list[tuple[Any, Optional[list[datetime]], Any]] = []
+        jobs: list[ExpansionJob] = []
+        for master_event, rrule_string, exdates in events_with_rrules:
+            try:
+                uid = str(master_event.id)
+                fingerprint = expansion_fingerprint(master_event, rrule_string, exdates)
+                start_window, end_window = self._expansion_window(master_event, rrule_string)
+                entry = self.expansion_cache.get(uid, fingerprint)
+                if entry is not None and _cache_covers(entry, start_window, end_window):
+                    occurrences, anchor, truncated = self._extend_cached_occurrences(
+                        entry,
+                        master_event,
+                        rrule_string,
+                        exdates,
+                        start_window,
+                        end_window,
+                        time.time(),
+                    )
+                    planned.append(
+                        (
+                            master_event,
+                            self._remember_occurrences(
+                                uid,
+                                fingerprint,
+                                start_window,
+                                end_window,
+                                occurrences,
+                                anchor,
+                                truncated,
+                            ),
+                            None,
+                        )
+                    )
+                    continue
+                jobs.append(
+                    ExpansionJob(
+                        master_id=uid,
+                        dtstart=master_event.start.date_time,
+                        duration=master_event.end.date_time - master_event.start.date_time,
+                        rrule_string=rrule_string,
+                        exdates=exdates,
+                        start_window=start_window,
+                        end_window=end_window,
+                    )
+                )
+                planned.append((master_event, None, (fingerprint, start_window, end_window)))
+            except Exception:
+                logger.exception(
+                    "Failed to plan RRULE expansion for %s", getattr(master_event, "id", None)
+                )
+
+        batch = await process_pool.expand(jobs, self.process_settings())
+
+        # Merge: group the compact tuples by master, keeping their ascending order
+        times_by_master: dict[str, list[tuple[float, float]]] = {}
+        for master_id, start_epoch, end_epoch in batch.occurrences:
+            times_by_master.setdefault(master_id, []).append((start_epoch, end_epoch))
+        failed = dict(batch.failures)
+        truncated_ids = set(batch.truncated)
+
+        event_count = 0
+        for master_event, cached, pending in planned:
+            uid = str(master_event.id)
+            compact = isinstance(master_event, LiteCalendarEvent)
+            if cached is not None:
+                duration = master_event.end.date_time - master_event.start.date_time
+                times = [(o, o + duration) for o in cached]
+            elif uid in failed:
+                logger.warning("RRULE expansion failed for %s: %s", uid, failed[uid])
+                continue
+            else:
+                times = [
+                    (datetime.fromtimestamp(start, UTC), datetime.fromtimestamp(end, UTC))
+                    for start, end in times_by_master.get(uid, ())
+                ]
+                fingerprint, start_window, end_window = pending
+                occurrences = [start for start, _ in times]
+                self._remember_occurrences(
+                    uid,
+                    fingerprint,
+                    start_window,
+                    end_window,
+                    occurrences,
+                    _original_timezone(occurrences[-1], master_event) if occurrences else None,
+                    uid in truncated_ids,
+                )
+
+            for i, (start, end) in enumerate(times):
+                yield self._build_instance(master_event, start, end, compact)
+                event_count += 1
+
+                # Cooperative yield to event loop
+                if i % self.yield_frequency == 0:
+                    await asyncio.sleep(0)
+
+        logger.debug(
+            "Process-pool RRULE expansion completed: masters=%d (%d in workers), yielded=%d events",
+            len(planned),
+            len(jobs),
+            event_count,
+        )
+
+    def _expansion_window(
+        self, master_event: LiteCalendarEvent, rrule_string: str
+    ) -> tuple[datetime, datetime]:
+        """Return the UTC window a master is expanded over on this refresh.
+
+        Args:
+            master_event: Master recurring event
+            rrule_string: RRULE pattern string
+
+        Returns:
+            Tuple of (window start, window end), both aware UTC datetimes
+        """
+        # For recurring events, we need to balance two concerns:
+        # 1. RRULE semantics require starting from the event's original start date
+        # 2. Old recurring events would generate too many past occurrences, hitting
+        #    max_occurrences limit before reaching current dates (DATA LOSS bug)
+        #
+        # Solution: For infinite recurring events (no COUNT/UNTIL), start from
+        # max(now - 7 days, master_start) to avoid the data loss bug.
+        # For events with COUNT/UNTIL, always start from master_start to honor those constraints.
+
+        # Get current time, respecting test overrides
+        now = self._get_current_time()
+        master_start = master_event.start.date_time
+
+        # Normalize master_start to UTC for comparison
+        if master_start.tzinfo is None:
+            master_start_utc = master_start.replace(tzinfo=UTC)
+        else:
+            master_start_utc = master_start.astimezone(UTC)
+
+        # Check if this is an infinite recurring event (no COUNT or UNTIL)
+        # We check the RRULE string directly to avoid accessing private members
+        is_infinite = "COUNT=" not in rrule_string.upper() and "UNTIL=" not in rrule_string.upper()
+
+        # For infinite recurring events, start from recent past to avoid data loss
+        # For finite events (COUNT/UNTIL), start from master_start to honor constraints
+        if is_infinite and master_start_utc < (now - timedelta(days=7)):
+            # Old infinite recurring event: start from recent past
+            lookback_start = now - timedelta(days=7)
+            start_date = lookback_start
+            logger.debug(
+                "Using lookback window for old infinite recurring event: "
+                "master_start=%s, lookback_start=%s",
+                master_start_utc,
+                lookback_start,
+            )
+        else:
+            # Finite event or recent event: start from master_start
+            start_date = master_start_utc
+
+        end_date = now + timedelta(days=self.expansion_days)
+
+        # Normalize window datetimes
+        start_window = (
+            start_date.replace(tzinfo=UTC)
+            if start_date.tzinfo is None
+            else start_date.astimezone(UTC)
+        )
+        end_window = (
+            end_date.replace(tzinfo=UTC) if end_date.tzinfo is None else end_date.astimezone(UTC)
+        )
+
+        return start_window, end_window
+
+    def _build_instance(
+        self,
+        master_event: LiteCalendarEvent,
+        normalized_occurrence: datetime,
+        end_time: datetime,
+        compact: bool,
+    ) -> LiteCalendarEvent | ExpandedOccurrence:
+        """Build the event instance for one UTC occurrence of a master.
+
+        Parsed masters get compact occurrences that share the master's fields;
+        other master objects (synthesized or duck-typed) get standalone events.
+
+        Args:
+            master_event: Master recurring event
+            normalized_occurrence: Occurrence start (UTC)
+            end_time: Occurrence end (UTC)
+            compact: Build an ExpandedOccurrence instead of a LiteCalendarEvent
+
+        Returns:
+            The instance for this occurrence
+        """
+        instance_id = make_instance_id(master_event.id, normalized_occurrence)
+
+        event: LiteCalendarEvent | ExpandedOccurrence
+        if compact:
+            event = ExpandedOccurrence(master_event, instance_id, normalized_occurrence, end_time)
+        else:
+            event = LiteCalendarEvent(
+                id=instance_id,
+                subject=master_event.subject,
+                body_preview=master_event.body_preview,
+                start=LiteDateTimeInfo(
+                    date_time=normalized_occurrence,
+                    time_zone=master_event.start.time_zone,
+                ),
+                end=LiteDateTimeInfo(
+                    date_time=end_time,
+                    time_zone=master_event.end.time_zone,
+                ),
+                is_all_day=master_event.is_all_day,
+                show_as=master_event.show_as,
+                is_cancelled=master_event.is_cancelled,
+                is_organizer=master_event.is_organizer,
+                location=master_event.location,
+                is_online_meeting=master_event.is_online_meeting,
+                online_meeting_url=master_event.online_meeting_url,
+                is_recurring=False,
+                is_expanded_instance=True,
+                rrule_master_uid=master_event.id,
+                last_modified_date_time=master_event.last_modified_date_time,
+            )
+
+        return event
+
+    def _window_occurrences(
+        self,
+        master_event: LiteCalendarEvent,
+        rrule_string: str,
+        exdates: Optional[list[str]],
+        start_window: datetime,
+        end_window: datetime,
+        start_time: float,
+    ) -> list[datetime]:
+        """Return the master's UTC occurrences in [start_window, end_window].
+
+        Reuses the occurrences cached by the previous expansion of the same master
+        when the window has only slid forward: occurrences before start_window are
+        dropped and only the part of the window past the cached range is expanded.
+
+        Args:
+            master_event: Master recurring event
+            rrule_string: RRULE pattern string
+            exdates: Optional list of excluded dates
+            start_window: Window start (UTC)
+            end_window: Window end (UTC)
+            start_time: time.time() at the start of this expansion (for the time budget)
+
+        Returns:
+            Ascending list of at most max_occurrences UTC datetimes
+        """
+        uid = str(master_event.id)
+        fingerprint = expansion_fingerprint(master_event, rrule_string, exdates)
+        entry = self.expansion_cache.get(uid, fingerprint)
+
+        if entry is not None and _cache_covers(entry, start_window, end_window):
+            occurrences, anchor, truncated = self._extend_cached_occurrences(
+                entry, master_event, rrule_string, exdates, start_window, end_window, start_time
+            )
+        else:
+            rule_set = self._build_recurrence(
+                master_event.start.date_time, rrule_string, exdates, master_event
+            )
+            occurrences, anchor, truncated = self._generate_occurrences(
+                rule_set, start_window, end_window, self.max_occurrences, start_time
+            )
+
+        return self._remember_occurrences(
+            uid, fingerprint, start_window, end_window, occurrences, anchor, truncated
+        )
+
+    def _extend_cached_occurrences(
+        self,
+        entry: CachedExpansion,
+        master_event: LiteCalendarEvent,
+        rrule_string: str,
+        exdates: Optional[list[str]],
+        start_window: datetime,
+        end_window: datetime,
+        start_time: float,
+    ) -> tuple[list[datetime], Optional[datetime], bool]:
+        """Answer a window from a cached expansion that covers its start.
+
+        Occurrences before start_window are dropped and only the part of the
+        window past the cached range is expanded.
+
+        Args:
+            entry: Cached expansion of the same master (see _cache_covers)
+            master_event: Master recurring event
+            rrule_string: RRULE pattern string
+            exdates: Optional list of excluded dates
+            start_window: Window start (UTC)
+            end_window: Window end (UTC)
+            start_time: time.time() at the start of this expansion (for the time budget)
+
+        Returns:
+            Same as _generate_occurrences() for the whole window
+        """
+        occurrences = [o for o in entry.occurrences if o >= start_window]
+        anchor = entry.anchor
+        truncated = len(occurrences) >= self.max_occurrences
+        if truncated:
+            occurrences = occurrences[: self.max_occurrences]
+        elif end_window > entry.covered_until:
+            # Restart the rule at the last known occurrence when that preserves
+            # its semantics, so dateutil does not iterate again from DTSTART.
+            dtstart = master_event.start.date_time
+            if anchor is not None and _is_rebasable(rrule_string):
+                dtstart = anchor
+            rule_set = self._build_recurrence(
+                dtstart,
+                rrule_string,
+                exdates,
+                master_event,
+            )
+            tail, tail_anchor, truncated = self._generate_occurrences(
+                rule_set,
+                entry.covered_until,
+                end_window,
+                self.max_occurrences - len(occurrences),
+                start_time,
+                exclusive_start=True,
+            )
+            occurrences.extend(tail)
+            anchor = tail_anchor or anchor
+        logger.debug(
+            "RRULE cache hit for %s: reused %d occurrences",
+            master_event.id,
+            len(entry.occurrences),
+        )
+        return occurrences, anchor, truncated
+
+    def _remember_occurrences(
+        self,
+        uid: str,
+        fingerprint: tuple[str, ...],
+        start_window: datetime,
+        end_window: datetime,
+        occurrences: list[datetime],
+        anchor: Optional[datetime],
+        truncated: bool,
+    ) -> list[datetime]:
+        """Cache a master's window occurrences for the next refresh.
+
+        Returns:
+            A copy of ``occurrences`` the caller may keep
+        """
+        if truncated and not occurrences:
+            return occurrences
+        self.expansion_cache.put(
+            uid,
+            CachedExpansion(
+                fingerprint=fingerprint,
+                window_start=start_window,
+                covered_until=occurrences[-1] if truncated else end_window,
+                occurrences=occurrences,
+                anchor=anchor,
+            ),
+        )
+        return list(occurrences)
+
+    def _build_recurrence(
+        self,
+        dtstart: datetime,
+        rrule_string: str,
+        exdates: Optional[list[str]],
+        master_event: LiteCalendarEvent,
+    ) -> rruleset | SimpleRecurrence:
+        """Build the recurrence to iterate, using the arithmetic fast path when possible.
+
+        Plain DAILY/WEEKLY rules (INTERVAL, BYDAY, WKST, UNTIL, COUNT) with an aware
+        DTSTART get a SimpleRecurrence; everything else goes through dateutil.
+
+        Args:
+            dtstart: Start of the recurrence (master DTSTART or a rebased occurrence)
+            rrule_string: RRULE pattern string
+            exdates: Optional list of excluded dates
+            master_event: Master recurring event (for logging)
+
+        Returns:
+            SimpleRecurrence or rruleset with the rule and exclusions
+        """
+        if isinstance(dtstart, datetime) and dtstart.tzinfo is not None:
+            rule = SimpleRule.parse(rrule_string)
+            if rule is not None:
+                return SimpleRecurrence(rule, dtstart, self._parse_exdates(exdates, master_event))
+        return self._build_rule_set(dtstart, rrule_string, exdates, master_event)
+
+    @classmethod
+    def _build_rule_set(
+        cls,
+        dtstart: datetime,
+        rrule_string: str,
+        exdates: Optional[list[str]],
+        master_event: LiteCalendarEvent,
+    ) -> rruleset:
+        """Parse the RRULE from dtstart and apply EXDATEs.
+
+        Args:
+            dtstart: Start of the recurrence (master DTSTART or a rebased occurrence)
+            rrule_string: RRULE pattern string
+            exdates: Optional list of excluded dates
+            master_event: Master recurring event (for logging)
+
+        Returns:
+            rruleset with the rule and exclusions
+        """
+        rule_set = rruleset()
+
+        parsed_rule = rrulestr(rrule_string, dtstart=dtstart)
+        if isinstance(parsed_rule, rruleset):
+            rule_set = parsed_rule
+        else:
+            rule_set.rrule(parsed_rule)
+
+        for ex_dt in cls._parse_exdates(exdates, master_event):
+            rule_set.exdate(ex_dt)
+
+        return rule_set
+
+    @classmethod
+    def _parse_exdates(
+        cls,
+        exdates: Optional[list[str]],
+        master_event: LiteCalendarEvent,
+    ) -> list[datetime]:
+        """Parse EXDATE strings into UTC datetimes, skipping malformed values.
+
+        Args:
+            exdates: Optional list of excluded dates
+            master_event: Master recurring event (for logging)
+
+        Returns:
+            Excluded instants as aware UTC datetimes
+        """
+        event_subject = getattr(master_event, "subject", "")
+        parsed: list[datetime] = []
+
+        logger.debug("EXDATE processing for event %s: exdates=%r", event_subject, exdates)
+        if exdates:
+            logger.debug("Processing %d EXDATE entries", len(exdates))
+            for i, ex in enumerate(exdates):
+                try:
+                    ex_dt = cls._parse_datetime(ex)
+                    logger.debug(
+                        "EXDATE %d: raw='%s' parsed=%r tzinfo=%r",
+                        i,
+                        ex,
+                        ex_dt,
+                        ex_dt.tzinfo if hasattr(ex_dt, "tzinfo") else None,
+                    )
+                    if ex_dt.tzinfo is None:
+                        ex_dt = ex_dt.replace(tzinfo=UTC)
+                        logger.debug("EXDATE %d: added UTC timezone -> %r", i, ex_dt)
+                    else:
+                        ex_dt = ex_dt.astimezone(UTC)
+                        logger.debug("EXDATE %d: converted to UTC -> %r", i, ex_dt)
+                    parsed.append(ex_dt)
+                    logger.debug("EXDATE %d: successfully parsed", i)
+                except Exception as ex_e:
+                    logger.warning("Failed to parse EXDATE '%s': %s", ex, ex_e)
+                    continue
+        else:
+            logger.debug("No EXDATE entries provided for event %s", event_subject)
+
+        return parsed
+
+    def _generate_occurrences(
+        self,
+        rule_set: rruleset | SimpleRecurrence,
+        after: datetime,
+        before: datetime,
+        limit: int,
+        start_time: float,
+        exclusive_start: bool = False,
+    ) -> tuple[list[datetime], Optional[datetime], bool]:
+        """Collect occurrences between two instants, honouring the limits.
+
+        Args:
+            rule_set: Rule set (or fast-path recurrence) to iterate
+            after: Range start (UTC, inclusive unless exclusive_start)
+            before: Range end (UTC, inclusive)
+            limit: Maximum number of occurrences to collect
+            start_time: time.time() at the start of this expansion (for the time budget)
+            exclusive_start: Skip an occurrence falling exactly on ``after``
+
+        Returns:
+            Tuple of (UTC occurrences, last occurrence in its original timezone,
+            whether the range was cut short by the occurrence limit or time budget)
+        """
+        occurrences: list[datetime] = []
+        last_raw: Optional[datetime] = None
+        for i, occurrence in enumerate(rule_set.between(after, before, inc=True)):
+            # Check time budget
+            elapsed_ms = (time.time() - start_time) * 1000
+            if elapsed_ms > self.time_budget_ms:
+                logger.warning(
+                    "RRULE streaming exceeded time budget (%dms > %dms) after %d events",
+                    elapsed_ms,
+                    self.time_budget_ms,
+                    i,
+                )
+                return occurrences, last_raw, True
+
+            # Check occurrence limit
+            if len(occurrences) >= limit:
+                logger.debug(
+                    "RRULE streaming limited to %d occurrences for Pi Zero 2W",
+                    self.max_occurrences,
+                )
+                return occurrences, last_raw, True
+
+            # Normalize occurrence
+            if not isinstance(occurrence, datetime):
+                continue
+            normalized_occurrence = (
+                occurrence.replace(tzinfo=UTC)
+                if occurrence.tzinfo is None
+                else occurrence.astimezone(UTC)
+            )
+            if exclusive_start and normalized_occurrence <= after:
+                continue
+            occurrences.append(normalized_occurrence)
+            last_raw = occurrence
+
+        return occurrences, last_raw, False
+
     async def expand_event_async(
         self,
         master_event: LiteCalendarEvent,
         rrule_string: str,
         exdates: Optional[list[str]] = None,
-    ) -> AsyncIterator[LiteCalendarEvent]:
+    ) -> AsyncIterator[LiteCalendarEvent | ExpandedOccurrence]:
         """Expand RRULE pattern asynchronously with cooperative multitasking.
 
         Args:
@@ -323,12 +867,20 @@ class RRuleWorkerPool:
             exdates: Optional list of excluded dates
 
         Yields:
-            Individual LiteCalendarEvent instances for each occurrence
+            One instance per occurrence, as expand_rrule_stream() does
         """
         # Delegate to the streaming implementation
         async for event in self.expand_rrule_stream(master_event, rrule_string, exdates):
             yield event
 
+    def current_time(self) -> datetime:
+        """Return the current UTC time expansion windows are anchored to.
+
+        Returns:
+            Current datetime in UTC timezone (CALENDARBOT_TEST_TIME when set)
+        """
+        return self._get_current_time()
+
     def _get_current_time(self) -> datetime:
         """Get current time, respecting test time overrides.
 
@@ -352,7 +904,8 @@ class RRuleWorkerPool:
         # Return current UTC time
         return datetime.now(UTC)
 
-    def _parse_datetime(self, datetime_str: str) -> datetime:
+    @classmethod
+    def _parse_datetime(cls, datetime_str: str) -> datetime:
         """Parse datetime string in various formats.
 
         Delegates to TimezoneParser for simplified, maintainable parsing.
@@ -376,7 +929,7 @@ class RRuleWorkerPool:
         master_event: LiteCalendarEvent,
         rrule_string: str,
         exdates: Optional[list[str]] = None,
-    ) -> list[LiteCalendarEvent]:
+    ) -> list[LiteCalendarEvent | ExpandedOccurrence]:
         """Expand RRULE pattern and return as list.
 
         Args:
@@ -385,7 +938,7 @@ class RRuleWorkerPool:
             exdates: Optional list of excluded dates
 
         Returns:
-            List of expanded LiteCalendarEvent instances
+            List of expanded occurrences, as yielded by expand_event_async()
         """
         events = []
         async for event in self.expand_event_async(master_event, rrule_string, exdates):
@@ -436,17 +989,44 @@ def get_worker_pool(settings: Any) -> RRuleWorkerPool:
 # Provide thin wrappers that delegate to the current worker-pool based implementation.
 
 
+def _use_process_pool(pool: RRuleWorkerPool, master_count: int) -> bool:
+    """Return True if this expansion should be spread over worker processes."""
+    from calendarbot_lite.calendar.lite_rrule_process_pool import MIN_POOLED_MASTERS
+
+    # Never nest pools inside parse or expansion worker processes
+    return (
+        pool.expansion_processes > 0
+        and master_count >= MIN_POOLED_MASTERS
+        and multiprocessing.parent_process() is None
+    )
+
+
 async def expand_events_streaming(
     events_with_rrules: list[tuple[Any, str, Optional[list[str]]]],
     settings: Any,
 ) -> AsyncIterator[Any]:
     """Compatibility async generator: yields expanded events for each (event, rrule, exdates).
 
-    Delegates to get_worker_pool(settings).expand_rrule_stream for each tuple.
+    Delegates to get_worker_pool(settings).expand_rrule_stream for each tuple, or
+    to expand_in_processes when rrule_expansion_processes is set and there are
+    at least MIN_POOLED_MASTERS masters.
     """
     if not events_with_rrules:
         return
     pool = get_worker_pool(settings)
+
+    if _use_process_pool(pool, len(events_with_rrules)):
+        from calendarbot_lite.calendar.lite_rrule_process_pool import get_rrule_process_pool
+
+        try:
+            async for inst in pool.expand_in_processes(
+                events_with_rrules, get_rrule_process_pool(pool.expansion_processes)
+            ):
+                yield inst
+            return
+        except BrokenProcessPool:
+            logger.warning("RRULE expansion pool broken; expanding in-process")
+
     for ev, rrule_str, exdates in events_with_rrules:
         try:
             async for inst in pool.expand_rrule_stream(ev, rrule_str, exdates):
@@ -636,10 +1216,8 @@ class LiteRRuleExpander(RRuleWorkerPool):
             duration = master_event.end.date_time - master_event.start.date_time
             end_time = occurrence + duration
 
-            # Create unique ID for this instance
-            instance_id = (
-                f"{master_event.id}_{occurrence.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
-            )
+            # Stable ID for this instance
+            instance_id = make_instance_id(master_event.id, occurrence)
 
             # Create new event instance
             event = LiteCalendarEvent(
@@ -721,7 +1299,7 @@ class RRuleOrchestrator:
     """Centralized RRULE expansion orchestration.
 
     Consolidates all RRULE-related logic including:
-    - Building UID mappings between components and events
+    - Indexing components, events and RECURRENCE-ID overrides by UID
     - Collecting expansion candidates with RRULE patterns
     - Handling EXDATE properties and RECURRENCE-ID instances
     - Executing async RRULE expansion via worker pool
@@ -745,94 +1323,41 @@ class RRuleOrchestrator:
         self,
         events: list[Any],
         raw_components: list[Any],
+        uid_index: Optional[UIDIndex] = None,
+        intern_table: Optional[InternTable] = None,
     ) -> list[Any]:
         """Expand recurring events using RRULE patterns.
 
         This is the main entry point for RRULE expansion. It:
-        1. Builds mappings of UIDs to components and events
+        1. Indexes components, events and RECURRENCE-ID overrides by UID
         2. Collects expansion candidates (events with RRULE)
         3. Executes async RRULE expansion
 
         Args:
             events: List of parsed calendar events
             raw_components: List of raw iCalendar components for RRULE extraction
+            uid_index: Optional UIDIndex already built from events and raw_components
+                (built here when omitted)
+            intern_table: Optional per-refresh table the events were parsed with;
+                masters synthesized from raw components share its values too
 
         Returns:
             List of expanded event instances
         """
-        # Phase 1: Build mappings of UIDs to components and events
-        component_map, events_by_id = self._build_component_and_event_maps(events, raw_components)
+        # Phase 1: Index components, events and overrides by UID
+        if uid_index is None:
+            uid_index = UIDIndex.build(events, raw_components)
 
         # Phase 2: Collect RRULE expansion candidates
-        candidates = self._collect_expansion_candidates(component_map, events_by_id, events)
+        candidates = self._collect_expansion_candidates(uid_index, intern_table)
 
         # Phase 3: Execute async RRULE expansion
         return self._execute_expansion(candidates)
 
-    def _build_component_and_event_maps(
-        self,
-        events: list[Any],
-        raw_components: list[Any],
-    ) -> tuple[dict[str, Any], dict[str, Any]]:
-        """Build mappings of UIDs to components and parsed events.
-
-        Creates two maps prioritizing recurring masters over instances:
-        1. component_map: UID -> raw iCalendar component
-        2. events_by_id: UID -> parsed LiteCalendarEvent
-
-        Args:
-            events: List of parsed calendar events
-            raw_components: List of raw iCalendar components
-
-        Returns:
-            Tuple of (component_map, events_by_id)
-        """
-        # Build component map: UID -> component, prioritizing recurring masters
-        component_map = {}
-        for component in raw_components:
-            try:
-                comp_uid = str(component.get("UID"))
-            except Exception:
-                comp_uid = None
-            if not comp_uid:
-                continue
-
-            # If we haven't seen this UID yet, store it
-            if comp_uid not in component_map:
-                component_map[comp_uid] = component
-            else:
-                # Prefer a component that contains an RRULE (recurring master) over instances
-                existing = component_map[comp_uid]
-                existing_has_rrule = bool(existing.get("RRULE"))
-                current_has_rrule = bool(component.get("RRULE"))
-                if not existing_has_rrule and current_has_rrule:
-                    component_map[comp_uid] = component
-
-        # Build events map: UID -> parsed event, prioritizing recurring masters
-        events_by_id: dict[str, Any] = {}
-        for e in events:
-            event_id = getattr(e, "id", None)
-            if not event_id:
-                continue
-
-            # If we haven't seen this UID yet, add it
-            if event_id not in events_by_id:
-                events_by_id[event_id] = e
-            else:
-                # Prefer recurring masters over instances
-                existing = events_by_id[event_id]
-                if not getattr(existing, "is_recurring", False) and getattr(
-                    e, "is_recurring", False
-                ):
-                    events_by_id[event_id] = e
-
-        return component_map, events_by_id
-
     def _collect_expansion_candidates(
         self,
-        component_map: dict[str, Any],
-        events_by_id: dict[str, Any],
-        events: list[Any],
+        uid_index: UIDIndex,
+        intern_table: Optional[InternTable] = None,
     ) -> list[tuple[Any, str, Optional[list[str]]]]:
         """Collect RRULE expansion candidates from components.
 
@@ -842,16 +1367,16 @@ class RRuleOrchestrator:
         - Optional list of EXDATE strings
 
         Args:
-            component_map: Mapping of UID -> raw component
-            events_by_id: Mapping of UID -> parsed event
-            events: List of all parsed events (for RECURRENCE-ID detection)
+            uid_index: UID index of raw components, parsed events and overrides
+            intern_table: Optional per-refresh table for the RRULE, EXDATE and
+                synthesized master values
 
         Returns:
             List of (event, rrule_string, exdates) tuples for expansion
         """
         candidates: list[tuple[Any, str, Optional[list[str]]]] = []
 
-        for comp_uid, component in component_map.items():
+        for comp_uid, component in uid_index.components.items():
             try:
                 # Only consider components that contain an RRULE
                 if not component.get("RRULE"):
@@ -865,13 +1390,25 @@ class RRuleOrchestrator:
                     rrule_string = str(rrule_prop)
 
                 # Collect EXDATE properties
-                exdates = self._collect_exdates(component, events, comp_uid)
+                exdates = self._collect_exdates(component, uid_index, comp_uid)
 
                 # Get or create candidate event
                 candidate_event = self._get_or_create_candidate_event(
-                    comp_uid, component, events_by_id
+                    comp_uid, component, uid_index.events_by_id
                 )
 
+                if intern_table is not None:
+                    rrule_string = intern_table.string(rrule_string)
+                    exdates = intern_table.strings(exdates)
+                    if isinstance(candidate_event, SimpleEvent):
+                        candidate_event.id = intern_table.string(candidate_event.id)
+                        candidate_event.subject = intern_table.string(candidate_event.subject)
+
+                # Parsed masters keep their rule so OccurrenceQuery can step the series
+                if isinstance(candidate_event, LiteCalendarEvent):
+                    candidate_event.rrule_string = rrule_string
+                    candidate_event.rrule_exdates = exdates if exdates else None
+
                 candidates.append((candidate_event, rrule_string, exdates if exdates else None))
             except Exception as e:
                 logger.warning("Failed to build RRULE candidate for UID=%s: %s", comp_uid, e)
@@ -882,14 +1419,14 @@ class RRuleOrchestrator:
     def _collect_exdates(
         self,
         component: Any,
-        events: list[Any],
+        uid_index: UIDIndex,
         comp_uid: str,
     ) -> list[str]:
         """Collect EXDATE properties and RECURRENCE-ID instances.
 
         Args:
             component: Raw iCalendar component
-            events: List of all parsed events
+            uid_index: UID index providing the RECURRENCE-ID overrides of comp_uid
             comp_uid: Component UID
 
         Returns:
@@ -920,16 +1457,9 @@ class RRuleOrchestrator:
                     continue  # nosec B112 - skip malformed EXDATE values
 
         # Add RECURRENCE-ID instances to exdates to exclude them from normal expansion
-        for event in events:
-            if (
-                getattr(event, "id", None) == comp_uid
-                and hasattr(event, "recurrence_id")
-                and event.recurrence_id
-            ):
-                exdates.append(event.recurrence_id)
-                logger.debug(
-                    "Adding RECURRENCE-ID to exdates for %s: %s", comp_uid, event.recurrence_id
-                )
+        for recurrence_id in uid_index.recurrence_ids(comp_uid):
+            exdates.append(recurrence_id)
+            logger.debug("Adding RECURRENCE-ID to exdates for %s: %s", comp_uid, recurrence_id)
 
         return exdates
 
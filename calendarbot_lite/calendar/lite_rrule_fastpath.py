@@ -0,0 +1,211 @@
+"""Arithmetic fast path for simple DAILY and WEEKLY RRULEs - CalendarBot Lite.
+
+Most recurring meetings use plain DAILY or WEEKLY rules with only INTERVAL,
+BYDAY, WKST, UNTIL or COUNT. For those, the occurrence dates are an
+arithmetic progression of day ordinals (filtered by weekday, or offset within
+each week), so they can be computed in bulk instead of stepping dateutil's
+general rrule iterator one datetime at a time. NumPy is used for the ordinal
+arithmetic when installed; otherwise the same arithmetic runs on ranges.
+
+SimpleRecurrence mirrors the dateutil rruleset behaviour the expander relies
+on: occurrences keep DTSTART's wall-clock time and tzinfo (so they follow DST
+in the rule's TZID), microseconds are dropped, COUNT counts occurrences before
+EXDATEs are removed, and between() compares instants. Any other rule returns
+None from SimpleRule.parse() and is expanded by dateutil.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from types import ModuleType
+from typing import Optional
+
+np: Optional[ModuleType]
+try:
+    import numpy as np
+except ImportError:  # numpy is only installed with the epaper extra
+    np = None
+
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_SUPPORTED_KEYS = frozenset({"FREQ", "INTERVAL", "BYDAY", "WKST", "UNTIL", "COUNT"})
+
+
+def _parse_until(value: str) -> Optional[datetime]:
+    """Parse a UTC UNTIL value (YYYYMMDDTHHMMSSZ); other forms are left to dateutil."""
+    try:
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class SimpleRule:
+    """A DAILY or WEEKLY rule using only INTERVAL, BYDAY, WKST, UNTIL or COUNT."""
+
+    freq: str
+    interval: int = 1
+    byday: tuple[int, ...] = ()
+    wkst: int = 0
+    until: Optional[datetime] = None
+    count: Optional[int] = None
+
+    @classmethod
+    def parse(cls, rrule_string: str) -> Optional["SimpleRule"]:
+        """Return the rule if the fast path supports it, otherwise None.
+
+        Args:
+            rrule_string: RRULE value, e.g. ``FREQ=WEEKLY;BYDAY=MO,WE``
+
+        Returns:
+            SimpleRule, or None for rules that must go through dateutil
+        """
+        text = rrule_string.strip()
+        if "\n" in text or ":" in text:
+            return None
+        try:
+            parts = dict(part.split("=", 1) for part in text.upper().split(";") if part)
+        except ValueError:
+            return None
+        if not parts.keys() <= _SUPPORTED_KEYS or parts.get("FREQ") not in ("DAILY", "WEEKLY"):
+            return None
+        if "UNTIL" in parts and "COUNT" in parts:
+            return None
+
+        try:
+            interval = int(parts.get("INTERVAL", "1"))
+            count = int(parts["COUNT"]) if "COUNT" in parts else None
+            byday = tuple(sorted({_WEEKDAYS[d] for d in parts.get("BYDAY", "").split(",") if d}))
+            wkst = _WEEKDAYS[parts.get("WKST", "MO")]
+        except (KeyError, ValueError):
+            return None  # Ordinal BYDAY (e.g. 1MO), unknown weekday or bad number
+        if interval < 1 or (count is not None and count < 1):
+            return None
+
+        until = None
+        if "UNTIL" in parts:
+            until = _parse_until(parts["UNTIL"])
+            if until is None:
+                return None
+        return cls(parts["FREQ"], interval, byday, wkst, until, count)
+
+
+class SimpleRecurrence:
+    """Occurrences of a SimpleRule from an aware DTSTART, minus EXDATEs.
+
+    Provides the between() call the expander uses on dateutil rule sets.
+    """
+
+    def __init__(self, rule: SimpleRule, dtstart: datetime, exdates: Sequence[datetime] = ()):
+        """Initialize the recurrence.
+
+        Args:
+            rule: Parsed simple rule
+            dtstart: Timezone-aware recurrence start
+            exdates: Timezone-aware excluded instants
+        """
+        if dtstart.tzinfo is None:
+            raise ValueError("SimpleRecurrence requires a timezone-aware DTSTART")
+        self.rule = rule
+        self.dtstart = dtstart.replace(microsecond=0)
+        self._time = self.dtstart.timetz()
+        self._exdates = {ex.astimezone(UTC): ex for ex in exdates}
+
+    def between(self, after: datetime, before: datetime, inc: bool = False) -> list[datetime]:
+        """Return occurrences between two aware instants, in ascending order.
+
+        Args:
+            after: Range start
+            before: Range end
+            inc: Include occurrences equal to after or before
+
+        Returns:
+            Occurrences in DTSTART's timezone
+        """
+        found = []
+        for ordinal in self._ordinals(after, before):
+            occurrence = datetime.combine(date.fromordinal(ordinal), self._time)
+            instant = occurrence.astimezone(UTC)
+            if instant < after or instant > before:
+                continue
+            if not inc and instant in (after, before):
+                continue
+            if self.rule.until is not None and instant > self.rule.until:
+                break
+            excluded = self._exdates.get(instant)
+            if excluded is not None and occurrence == excluded:
+                continue
+            found.append(occurrence)
+        return found
+
+    def _ordinals(self, after: datetime, before: datetime) -> list[int]:
+        """Return candidate day ordinals covering [after, before] in ascending order.
+
+        Bounds are widened by a day so local dates on either side of UTC are
+        included; between() applies the exact instant comparisons.
+        """
+        rule = self.rule
+        first = self.dtstart.toordinal()
+        last = before.astimezone(UTC).toordinal() + 1
+        if rule.until is not None:
+            last = min(last, rule.until.toordinal() + 1)
+        if last < first:
+            return []
+
+        if rule.freq == "DAILY":
+            step = rule.interval
+            base = first
+            offsets: tuple[int, ...] = (0,)
+        else:
+            step = 7 * rule.interval
+            base = first - (self.dtstart.weekday() - rule.wkst) % 7  # Start of DTSTART's week
+            weekdays = rule.byday or (self.dtstart.weekday(),)
+            offsets = tuple(sorted((wd - rule.wkst) % 7 for wd in weekdays))
+
+        # Rules without COUNT can skip straight to the periods overlapping the range
+        start_period = 0
+        if rule.count is None:
+            low = after.astimezone(UTC).toordinal() - 1
+            start_period = max(0, (low - base) // step - 1)
+        end_period = (last - base) // step
+
+        if np is not None:
+            periods = base + np.arange(start_period, end_period + 1, dtype=np.int64) * step
+            ordinals = (periods[:, None] + np.asarray(offsets, dtype=np.int64)).ravel()
+            ordinals = ordinals[(ordinals >= first) & (ordinals <= last)]
+            if rule.freq == "DAILY" and rule.byday:
+                ordinals = ordinals[np.isin((ordinals - 1) % 7, rule.byday)]
+            candidates: list[int] = ordinals.tolist()
+        else:
+            candidates = [
+                ordinal
+                for period in range(base + start_period * step, base + end_period * step + 1, step)
+                for ordinal in (period + offset for offset in offsets)
+                if first <= ordinal <= last
+            ]
+            if rule.freq == "DAILY" and rule.byday:
+                candidates = [o for o in candidates if (o - 1) % 7 in rule.byday]
+
+        if rule.count is not None:
+            candidates = candidates[: rule.count]
+        return candidates
+
+
+def build_simple_recurrence(
+    dtstart: datetime, rrule_string: str, exdates: Sequence[datetime] = ()
+) -> Optional[SimpleRecurrence]:
+    """Return a SimpleRecurrence if the rule and DTSTART qualify for the fast path.
+
+    Args:
+        dtstart: Recurrence start
+        rrule_string: RRULE value
+        exdates: Timezone-aware excluded instants
+
+    Returns:
+        SimpleRecurrence, or None when dateutil must expand the rule
+    """
+    if not isinstance(dtstart, datetime) or dtstart.tzinfo is None:
+        return None
+    rule = SimpleRule.parse(rrule_string)
+    if rule is None:
+        return None
+    return SimpleRecurrence(rule, dtstart, exdates)
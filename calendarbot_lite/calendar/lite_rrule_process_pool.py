@@ -0,0 +1,241 @@
+"""Process-pool RRULE expansion - CalendarBot Lite.
+
+RRuleWorkerPool expands recurring masters one after another on a single
+thread, so a calendar with a few hundred long-running series spends most of a
+refresh inside dateutil. Each master expands independently, which makes the
+work easy to partition: this module ships batches of masters to a small,
+long-lived pool of worker processes and gets back compact
+(master ID, start epoch, end epoch) tuples.
+
+Workers only compute occurrence times. Window selection, the sliding-window
+cache, and building instance events from the current master all stay in the
+server process (see RRuleWorkerPool.expand_in_processes), so the result is the
+same as an in-process expansion. The per-rule time budget and occurrence limit
+are enforced inside the worker for each master.
+
+Workers are started with the "spawn" method, like the ICS parse pool, so they
+never inherit the server's event loop, sockets or thread state.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Below this many masters to expand, the pool round trip costs more than it saves
+MIN_POOLED_MASTERS = 16
+
+# Batches per worker; more, smaller batches even out series of very different cost
+BATCHES_PER_WORKER = 4
+
+# Per-process expanders: settings snapshot -> RRuleWorkerPool (worker side only)
+_worker_expanders: dict[tuple[tuple[str, Any], ...], Any] = {}
+
+
+@dataclass
+class ExpansionJob:
+    """Everything a worker needs to compute one master's occurrence times."""
+
+    master_id: str
+    dtstart: datetime  # Master DTSTART in its original timezone
+    duration: timedelta
+    rrule_string: str
+    exdates: Optional[list[str]]
+    start_window: datetime  # UTC
+    end_window: datetime  # UTC
+
+
+@dataclass
+class ExpandedBatch:
+    """Occurrence times computed by a worker for one batch of masters.
+
+    Attributes:
+        occurrences: (master ID, start epoch, end epoch) per occurrence, ascending
+            per master
+        truncated: IDs of masters cut short by the occurrence limit or time budget
+        failures: (master ID, error message) for masters that could not be expanded
+    """
+
+    occurrences: list[tuple[str, float, float]] = field(default_factory=list)
+    truncated: list[str] = field(default_factory=list)
+    failures: list[tuple[str, str]] = field(default_factory=list)
+
+
+def partition_jobs(jobs: list[ExpansionJob], batch_count: int) -> list[list[ExpansionJob]]:
+    """Split jobs into at most ``batch_count`` batches of similar length.
+
+    Masters are dealt round-robin so long and short series from the same part
+    of the feed end up in different batches.
+
+    Args:
+        jobs: Jobs in candidate order
+        batch_count: Desired number of batches
+
+    Returns:
+        Non-empty batches
+    """
+    batch_count = max(1, min(batch_count, len(jobs)))
+    return [jobs[i::batch_count] for i in range(batch_count) if jobs[i::batch_count]]
+
+
+def _get_worker_expander(settings: dict[str, Any]) -> Any:
+    """Return this worker's RRuleWorkerPool for a settings snapshot."""
+    from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool
+
+    key = tuple(sorted(settings.items()))
+    expander = _worker_expanders.get(key)
+    if expander is None:
+        # The server process owns the expansion cache; workers expand from scratch
+        expander = RRuleWorkerPool(SimpleNamespace(**settings, expansion_cache_entries=0))
+        _worker_expanders[key] = expander
+    return expander
+
+
+def _expand_batch_in_worker(jobs: list[ExpansionJob], settings: dict[str, Any]) -> ExpandedBatch:
+    """Compute the occurrence times of a batch of masters in a worker process.
+
+    Args:
+        jobs: Masters to expand
+        settings: Expansion settings (occurrence limit, time budget)
+
+    Returns:
+        ExpandedBatch with the occurrences of every master that expanded
+    """
+    expander = _get_worker_expander(settings)
+    batch = ExpandedBatch()
+    for job in jobs:
+        start_time = time.time()
+        master = SimpleNamespace(id=job.master_id, subject="")
+        try:
+            occurrences, truncated = expander.occurrence_times(
+                job.dtstart,
+                job.rrule_string,
+                job.exdates,
+                master,
+                job.start_window,
+                job.end_window,
+                start_time,
+            )
+        except Exception as e:
+            batch.failures.append((job.master_id, str(e)))
+            continue
+        for occurrence in occurrences:
+            batch.occurrences.append(
+                (
+                    job.master_id,
+                    occurrence.timestamp(),
+                    (occurrence + job.duration).timestamp(),
+                )
+            )
+        if truncated:
+            batch.truncated.append(job.master_id)
+    return batch
+
+
+class RRuleProcessPool:
+    """Long-lived process pool that computes RRULE occurrence times."""
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize the pool. Worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes (clamped to 1..number of CPUs)
+        """
+        self.max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.debug("Started RRULE expansion pool with %d workers", self.max_workers)
+        return self._pool
+
+    async def expand(self, jobs: list[ExpansionJob], settings: dict[str, Any]) -> ExpandedBatch:
+        """Expand all jobs across the workers and merge the batches.
+
+        Raises BrokenProcessPool (after discarding the pool) if a worker died,
+        so the caller can expand in-process instead.
+
+        Args:
+            jobs: Masters to expand
+            settings: Expansion settings (see RRuleWorkerPool.process_settings())
+
+        Returns:
+            One ExpandedBatch with the results of every job
+        """
+        merged = ExpandedBatch()
+        if not jobs:
+            return merged
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        try:
+            batches = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _expand_batch_in_worker, batch, settings)
+                    for batch in partition_jobs(jobs, self.max_workers * BATCHES_PER_WORKER)
+                )
+            )
+        except Exception:
+            self.shutdown(wait=False)
+            raise
+
+        for batch in batches:
+            merged.occurrences.extend(batch.occurrences)
+            merged.truncated.extend(batch.truncated)
+            merged.failures.extend(batch.failures)
+        logger.debug(
+            "Expanded %d masters in %d workers: %d occurrences",
+            len(jobs),
+            self.max_workers,
+            len(merged.occurrences),
+        )
+        return merged
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes.
+
+        Args:
+            wait: Wait for running expansions to finish
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+# Global expansion pool (created on first use)
+_process_pool: Optional[RRuleProcessPool] = None
+
+
+def get_rrule_process_pool(max_workers: int) -> RRuleProcessPool:
+    """Get or create the global RRULE expansion process pool.
+
+    Args:
+        max_workers: Number of worker processes for a newly created pool
+
+    Returns:
+        RRuleProcessPool instance
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = RRuleProcessPool(max_workers)
+    return _process_pool
+
+
+def shutdown_rrule_process_pool(wait: bool = True) -> None:
+    """Stop the global RRULE expansion pool if it was started."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=wait)
+        _process_pool = None
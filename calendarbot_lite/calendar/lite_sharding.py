@@ -0,0 +1,91 @@
+"""Sharding of large ICS feeds for parallel parsing - CalendarBot Lite.
+
+Turning VEVENT components into LiteCalendarEvent objects is CPU-bound and
+independent per component, but a single parse uses one core. This module
+splits a feed at BEGIN:VEVENT boundaries into contiguous runs of blocks, each
+wrapped in the calendar envelope (header, VTIMEZONE definitions and other
+calendar-level components) so every shard parses on its own with the same
+timezones and X-WR-TIMEZONE.
+
+Shards only produce the parsed events and the raw RRULE masters. Everything
+that looks across components (RRULE expansion, RECURRENCE-ID overrides,
+deduplication) runs once over the concatenated shards, in calendar order, so
+the result is the same as parsing the feed in one piece.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from calendarbot_lite.calendar.lite_fingerprint import split_ics
+
+# Feeds smaller than this parse faster in one piece than with the pool round trip
+SHARD_MIN_BYTES = 1024 * 1024
+
+
+@dataclass
+class ShardedParsePlan:
+    """A feed split into independently parseable shards."""
+
+    ics_content: str  # Full feed as fetched
+    envelope: str  # Calendar without any VEVENT (header, VTIMEZONEs, ...)
+    shards: list[str]  # Envelope around contiguous VEVENT runs, in calendar order
+
+
+@dataclass
+class ParsedShard:
+    """Per-component parse output of one shard.
+
+    Attributes:
+        success: False when the shard could not be parsed as a calendar
+        error_message: Parse error when success is False
+        total_components: Components walked, including the shard's envelope
+        events: Parsed events in calendar order
+        components: (UID, raw component if it has an RRULE, else None) per event
+        warnings: Per-event parse failures in calendar order
+        recurring_event_count: Parsed events with an RRULE
+        phase_timings: Per-phase parse timings of the shard
+    """
+
+    success: bool = True
+    error_message: Optional[str] = None
+    total_components: int = 0
+    events: list[Any] = field(default_factory=list)
+    components: list[tuple[str, Optional[Any]]] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    recurring_event_count: int = 0
+    phase_timings: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def plan_shards(ics_content: str, shard_count: int) -> ShardedParsePlan:
+    """Split a feed into at most ``shard_count`` shards of similar size.
+
+    Feeds that cannot be split safely (no VEVENT, an unterminated VEVENT) give
+    a single shard holding the whole feed.
+
+    Args:
+        ics_content: Raw ICS file content
+        shard_count: Desired number of shards
+
+    Returns:
+        ShardedParsePlan whose shards concatenate to the feed's VEVENTs in order
+    """
+    split = split_ics(ics_content)
+    if not split.blocks or "BEGIN:VEVENT" in split.envelope_tail.upper():
+        return ShardedParsePlan(ics_content=ics_content, envelope=ics_content, shards=[ics_content])
+
+    total_size = sum(len(block.text) for block in split.blocks)
+    target = total_size / max(1, min(shard_count, len(split.blocks)))
+    runs: list[list[str]] = [[]]
+    run_size = 0
+    for block in split.blocks:
+        if runs[-1] and run_size >= target:
+            runs.append([])
+            run_size = 0
+        runs[-1].append(block.text)
+        run_size += len(block.text)
+
+    return ShardedParsePlan(
+        ics_content=ics_content,
+        envelope=split.envelope_head + split.envelope_tail,
+        shards=[split.envelope_head + "".join(run) + split.envelope_tail for run in runs],
+    )
@@ -18,8 +18,12 @@ from icalendar import Calendar
 from calendarbot_lite.calendar.lite_attendee_parser import LiteAttendeeParser
 from calendarbot_lite.calendar.lite_datetime_utils import LiteDateTimeParser
 from calendarbot_lite.calendar.lite_event_parser import LiteEventComponentParser
+from calendarbot_lite.calendar.lite_fast_tokenizer import parse_vevent_lines
+from calendarbot_lite.calendar.lite_intern import InternTable
 from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteICSParseResult
+from calendarbot_lite.calendar.lite_parse_window import ParseWindow
 from calendarbot_lite.calendar.lite_parser_telemetry import ParserTelemetry
+from calendarbot_lite.calendar.lite_timezone_cache import TimezoneResolver
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +68,23 @@ class LiteStreamingICSParser:
         self._in_event = False  # Track if we're inside a VEVENT
         self._calendar_metadata: dict[str, str] = {}  # Store calendar properties
         self._pending_folded_line = ""  # Buffer for incomplete folded lines across chunks
+        self._current_timezone_lines: list[str] = []  # Buffer for current VTIMEZONE
+        self._in_timezone = False  # Track if we're inside a VTIMEZONE
+
+        # The feed's VTIMEZONE definitions and memoized TZID resolution
+        self.timezone_resolver = TimezoneResolver()
+
+        # Fast VEVENT tokenizer (falls back to icalendar per event) and its hit counters
+        self.use_fast_tokenizer = True
+        self.fast_path_events = 0
+        self.fallback_events = 0
+
+        # Optional parse-time window: single events wholly outside it are not yielded
+        self.parse_window: Optional[ParseWindow] = None
+        self.window_skipped_events = 0
+
+        # Phase timers (unfold, tokenize, from_ical); the owning parser may replace it
+        self.telemetry = ParserTelemetry()
 
         # Additional configuration attributes
         self.read_chunk_size_bytes = DEFAULT_READ_CHUNK_SIZE_BYTES
@@ -207,47 +228,50 @@ class LiteStreamingICSParser:
 
     def _process_chunk(self, chunk: str) -> Generator[dict[str, Any], None, None]:
         """Process a chunk of ICS data, handling line and event boundaries."""
-        # Combine with buffered incomplete line
-        content = self._line_buffer + chunk
-        lines = content.split("\n")
+        with self.telemetry.phase("unfold"):
+            # Combine with buffered incomplete line
+            content = self._line_buffer + chunk
+            lines = content.split("\n")
+
+            # Keep last line in buffer if chunk doesn't end with newline
+            if not chunk.endswith("\n"):
+                self._line_buffer = lines[-1]
+                lines = lines[:-1]
+            else:
+                self._line_buffer = ""
 
-        # Keep last line in buffer if chunk doesn't end with newline
-        if not chunk.endswith("\n"):
-            self._line_buffer = lines[-1]
-            lines = lines[:-1]
-        else:
-            self._line_buffer = ""
+            logical_lines = self._unfold_lines(lines)
 
         # Process complete lines
-        yield from self._process_lines(lines)
+        for line in logical_lines:
+            yield from self._process_line(line)
 
     def _process_lines(self, lines: list[str]) -> Generator[dict[str, Any], None, None]:
         """Process ICS lines, handling line folding and event boundaries across chunks."""
+        for line in self._unfold_lines(lines):
+            yield from self._process_line(line)
+
+    def _unfold_lines(self, lines: list[str]) -> list[str]:
+        """Join folded lines, returning the logical lines that ``lines`` completes.
+
+        The last logical line stays pending, since the next chunk may continue it.
+        """
+        complete: list[str] = []
         for raw_line in lines:
             line = raw_line.rstrip("\r")
 
-            # Handle pending folded line from previous chunk
+            if line.startswith((" ", "\t")):
+                # Continuation line - add to pending (remove leading whitespace, add space).
+                # Without a pending line it is orphaned (shouldn't happen in valid ICS)
+                if self._pending_folded_line:
+                    self._pending_folded_line += " " + line[1:]
+                continue
+
+            # Pending line is complete; this line starts a folded sequence that might span chunks
             if self._pending_folded_line:
-                if line.startswith((" ", "\t")):
-                    # This is a continuation line - add to pending
-                    self._pending_folded_line += (
-                        " " + line[1:]
-                    )  # Remove leading whitespace, add space
-                    continue
-                else:
-                    # Pending line is complete, process it
-                    yield from self._process_line(self._pending_folded_line)
-                    self._pending_folded_line = ""
-                    # Fall through to process current line
-
-            # Check if this line starts a folded sequence that might span chunks
-            if line and not line.startswith((" ", "\t")):
-                # This is a potential start of a folded line
-                self._pending_folded_line = line
-            elif line.startswith((" ", "\t")) and self._pending_folded_line:
-                # This is a continuation of an existing folded line
-                self._pending_folded_line += " " + line[1:]  # Add continuation
-                # If no pending line, this is an orphaned continuation (shouldn't happen in valid ICS)
+                complete.append(self._pending_folded_line)
+            self._pending_folded_line = line
+        return complete
 
     def _process_line(self, line: str) -> Generator[dict[str, Any], None, None]:
         """Process a single complete ICS line."""
@@ -255,6 +279,19 @@ class LiteStreamingICSParser:
         if not line:
             return
 
+        # Keep VTIMEZONE definitions so custom TZIDs resolve
+        if self._in_timezone:
+            self._current_timezone_lines.append(line)
+            if line == "END:VTIMEZONE":
+                self.timezone_resolver.add_vtimezone("\n".join(self._current_timezone_lines))
+                self._current_timezone_lines = []
+                self._in_timezone = False
+            return
+        if line == "BEGIN:VTIMEZONE" and not self._in_event:
+            self._in_timezone = True
+            self._current_timezone_lines = [line]
+            return
+
         # Handle calendar metadata
         if not self._in_event and ":" in line:
             prop, value = line.split(":", 1)
@@ -277,41 +314,66 @@ class LiteStreamingICSParser:
             self._current_event_lines.append(line)
 
     def _parse_complete_event(self) -> Generator[dict[str, Any], None, None]:
-        """Parse a complete event from buffered lines."""
-        try:
-            # Create minimal ICS content for this event
-            event_ics = "BEGIN:VCALENDAR\n"
-            event_ics += "VERSION:2.0\n"
-            event_ics += "PRODID:CalendarBot-Lite-Streaming\n"
-            event_ics += "\n".join(self._current_event_lines) + "\n"
-            event_ics += "END:VCALENDAR\n"
-
-            # Parse using icalendar library
-            calendar = Calendar.from_ical(event_ics)
+        """Parse a complete event from buffered lines.
 
-            for component in calendar.walk():
+        Plain events are tokenized by the fast path; events it does not handle
+        (recurrence, unusual properties or parameters) go through icalendar.
+        Events outside parse_window (when set) are dropped here, before mapping.
+        """
+        try:
+            components: Any = None
+            if self.use_fast_tokenizer:
+                with self.telemetry.phase("tokenize"):
+                    fast_component = parse_vevent_lines(
+                        self._current_event_lines, self.timezone_resolver
+                    )
+                if fast_component is not None:
+                    components = (fast_component,)
+                    self.fast_path_events += 1
+
+            if components is None:
+                # Create minimal ICS content for this event
+                event_ics = "BEGIN:VCALENDAR\n"
+                event_ics += "VERSION:2.0\n"
+                event_ics += "PRODID:CalendarBot-Lite-Streaming\n"
+                event_ics += "\n".join(self._current_event_lines) + "\n"
+                event_ics += "END:VCALENDAR\n"
+
+                # Parse using icalendar library
+                with self.telemetry.phase("from_ical"):
+                    components = Calendar.from_ical(event_ics).walk()
+                self.fallback_events += 1
+
+            for component in components:
                 if component.name == "VEVENT":
+                    if self.parse_window is not None and not self.parse_window.admits(component):
+                        self.window_skipped_events += 1
+                        break
+
                     # DEBUG: log raw VEVENT fields to validate streaming/folding behavior
-                    try:
-                        raw_summary = component.get("SUMMARY")
-                        raw_description = component.get("DESCRIPTION")
-                        raw_attendees = component.get("ATTENDEE")
-                        # Normalize debug-friendly representations
-                        attendees_repr = (
-                            [str(raw_attendees)]
-                            if not getattr(raw_attendees, "__iter__", None)
-                            else [str(a) for a in raw_attendees]
-                        )
-                        logger.debug(
-                            "Streaming parsed VEVENT raw fields - SUMMARY=%r, DESCRIPTION_present=%s, ATTENDEE=%s",
-                            raw_summary,
-                            bool(raw_description),
-                            attendees_repr,
-                        )
-                    except Exception:
-                        logger.debug(
-                            "Streaming parsed VEVENT - failed to extract raw fields", exc_info=True
-                        )
+                    # (only when enabled: stringifying attendees decodes them)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        try:
+                            raw_summary = component.get("SUMMARY")
+                            raw_description = component.get("DESCRIPTION")
+                            raw_attendees = component.get("ATTENDEE")
+                            # Normalize debug-friendly representations
+                            attendees_repr = (
+                                [str(raw_attendees)]
+                                if not getattr(raw_attendees, "__iter__", None)
+                                else [str(a) for a in raw_attendees]
+                            )
+                            logger.debug(
+                                "Streaming parsed VEVENT raw fields - SUMMARY=%r, DESCRIPTION_present=%s, ATTENDEE=%s",
+                                raw_summary,
+                                bool(raw_description),
+                                attendees_repr,
+                            )
+                        except Exception:
+                            logger.debug(
+                                "Streaming parsed VEVENT - failed to extract raw fields",
+                                exc_info=True,
+                            )
 
                     yield {
                         "type": "event",
@@ -403,6 +465,8 @@ async def parse_ics_stream(
             _MinimalSettings(),
         )
 
+        intern_table = InternTable()  # Shares repeated field values within this parse
+
         # Process the stream and collect results
         events: list[LiteCalendarEvent] = []
         warnings: list[str] = []
@@ -415,8 +479,10 @@ async def parse_ics_stream(
         # Parse stream with memory-bounded processing
         max_stored_events = 1000  # Increased to handle calendars with many recurring events
 
-        # Initialize telemetry for progress tracking and circuit breaker
+        # Initialize telemetry for progress tracking, circuit breaker and phase timings
         telemetry = ParserTelemetry(source_url=source_url)
+        parser.telemetry = telemetry
+        event_parser.telemetry = telemetry
 
         # DoS protection: Track iterations and wall-clock time (CWE-835)
         iteration_count = 0
@@ -508,6 +574,7 @@ async def parse_ics_stream(
                     event = event_parser.parse_event_component(
                         component,
                         calendar_metadata.get("X-WR-TIMEZONE"),
+                        intern_table,
                     )
 
                     if event:
@@ -572,6 +639,7 @@ async def parse_ics_stream(
 
         # Log comprehensive parsing telemetry at completion
         telemetry.log_completion(len(events), len(warnings))
+        telemetry.log_phase_timings()
 
         return LiteICSParseResult(
             success=True,
@@ -587,6 +655,7 @@ async def parse_ics_stream(
             prodid=calendar_metadata.get("PRODID"),
             raw_content=None,  # Don't store raw content for streaming
             source_url=source_url,
+            phase_timings=telemetry.get_phase_timings(),
         )
 
     except Exception as e:
@@ -0,0 +1,146 @@
+"""Memoized TZID and VTIMEZONE resolution - CalendarBot Lite.
+
+Every DTSTART/DTEND with a TZID used to be resolved from scratch: icalendar's
+provider walks its candidate IDs (cleaned name, Windows name, globally unique
+suffixes) and the TZID-prefixed strings handed to the RRULE expander go
+through the TimezoneDetector maps and a ZoneInfo construction. A feed usually
+references three or four distinct zones, so nearly all of that work repeats.
+
+TimezoneResolver resolves each zone of one feed once. It keeps the feed's
+VTIMEZONE definitions and memoizes results by (TZID, definition digest), so a
+feed that redefines a custom zone between refreshes gets the new definition
+instead of the one resolved first. TZIDs that name a known zone (IANA, alias or
+Windows name) resolve to the system zone; custom TZIDs are built from the
+feed's own VTIMEZONE, and anything else goes to icalendar's provider.
+
+resolve_tzid_name() memoizes the name-only resolution used for
+"TZID=<zone>:<datetime>" strings (EXDATEs, RECURRENCE-IDs), which never see
+VTIMEZONE definitions.
+"""
+
+import hashlib
+import logging
+from datetime import tzinfo
+from functools import lru_cache
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+from icalendar import Timezone
+from icalendar.timezone import tzp
+
+from calendarbot_lite.core.timezone_utils import normalize_timezone_name
+
+logger = logging.getLogger(__name__)
+
+# Zones built from custom VTIMEZONE definitions, by definition digest. Shared
+# across feeds and refreshes so an unchanged definition is only built once.
+_MAX_CUSTOM_ZONES = 128
+_custom_zones: dict[str, tzinfo] = {}
+
+
+def _definition_digest(text: str) -> str:
+    """Return a stable digest of a VTIMEZONE block, ignoring line endings."""
+    normalized = "\n".join(line.strip() for line in text.splitlines() if line.strip())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=128)
+def resolve_tzid_name(tzid: str) -> Optional[ZoneInfo]:
+    """Resolve a TZID name (IANA, alias or Windows name) to a ZoneInfo.
+
+    Args:
+        tzid: Timezone name as found after ``TZID=``
+
+    Returns:
+        ZoneInfo, or None if the name is not a known zone
+    """
+    iana_tz = normalize_timezone_name(tzid)
+    return None if iana_tz is None else ZoneInfo(iana_tz)
+
+
+class TimezoneResolver:
+    """Per-feed cache of TZID -> tzinfo, aware of the feed's VTIMEZONE blocks.
+
+    Attributes:
+        lookups: Number of resolve() calls
+        hits: Number of lookups answered from the cache
+    """
+
+    def __init__(self) -> None:
+        """Initialize a resolver with no VTIMEZONE definitions."""
+        self._definitions: dict[str, tuple[str, Any]] = {}  # TZID -> (digest, component)
+        self._resolved: dict[tuple[str, str], Optional[tzinfo]] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        """Return the number of resolved (TZID, definition) pairs held."""
+        return len(self._resolved)
+
+    @property
+    def defined_tzids(self) -> list[str]:
+        """TZIDs defined by the feed's VTIMEZONE blocks, in first-seen order."""
+        return list(self._definitions)
+
+    def add_vtimezone(self, text: str) -> Optional[str]:
+        """Register a VTIMEZONE block from the feed.
+
+        Parsing the block also registers custom zones with icalendar's provider,
+        so events that fall back to the icalendar parser resolve them as well.
+
+        Args:
+            text: The block, from ``BEGIN:VTIMEZONE`` to ``END:VTIMEZONE``
+
+        Returns:
+            The block's TZID, or None if it could not be parsed
+        """
+        digest = _definition_digest(text)
+        try:
+            component = Timezone.from_ical(text)
+            tzid = str(component["TZID"])
+        except Exception as e:
+            logger.debug("Ignoring unparseable VTIMEZONE block: %s", e)
+            return None
+        known = self._definitions.get(tzid)
+        if known is None or known[0] != digest:
+            self._definitions[tzid] = (digest, component)
+        return tzid
+
+    def resolve(self, tzid: str) -> Optional[tzinfo]:
+        """Return the tzinfo for a TZID parameter value.
+
+        Args:
+            tzid: TZID parameter value
+
+        Returns:
+            tzinfo, or None if the zone is neither known nor defined by the feed
+        """
+        self.lookups += 1
+        definition = self._definitions.get(tzid)
+        key = (tzid, definition[0] if definition is not None else "")
+        if key in self._resolved:
+            self.hits += 1
+            return self._resolved[key]
+
+        zone: Optional[tzinfo] = resolve_tzid_name(tzid)
+        if zone is None and definition is not None:
+            zone = self._build_custom_zone(*definition)
+        if zone is None:
+            zone = tzp.timezone(tzid)  # Globally unique TZIDs and the like
+        self._resolved[key] = zone
+        return zone
+
+    @staticmethod
+    def _build_custom_zone(digest: str, component: Any) -> Optional[tzinfo]:
+        """Build (once per definition) the zone described by a custom VTIMEZONE."""
+        zone = _custom_zones.get(digest)
+        if zone is None:
+            try:
+                zone = component.to_tz(tzp, lookup_tzid=False)
+            except Exception as e:
+                logger.warning("Could not build timezone %r: %s", str(component["TZID"]), e)
+                return None
+            if len(_custom_zones) >= _MAX_CUSTOM_ZONES:
+                _custom_zones.clear()
+            _custom_zones[digest] = zone
+        return zone
@@ -0,0 +1,84 @@
+"""UID index of recurring masters and RECURRENCE-ID overrides - CalendarBot Lite.
+
+RRULE expansion needs, for every recurring master, its raw component, its
+parsed event and the RECURRENCE-ID overrides that must be excluded from
+normal expansion; merging needs the same overrides again to suppress the
+expanded occurrences they replace. UIDIndex collects all of this in one pass
+while events are parsed, so both phases look up a UID instead of rescanning
+every event for every master.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+
+class UIDIndex:
+    """UID-keyed lookup of raw components, parsed events and RECURRENCE-ID overrides.
+
+    Attributes:
+        components: UID -> raw component, preferring components with an RRULE
+        events_by_id: UID -> parsed event, preferring recurring masters
+        overrides: UID -> parsed events carrying a RECURRENCE-ID, in parse order
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.components: dict[str, Any] = {}
+        self.events_by_id: dict[str, Any] = {}
+        self.overrides: dict[str, list[Any]] = {}
+        self._override_events: list[Any] = []
+
+    @classmethod
+    def build(cls, events: Iterable[Any], raw_components: Iterable[Any]) -> "UIDIndex":
+        """Build an index from already-parsed events and their raw components.
+
+        Args:
+            events: Parsed calendar events
+            raw_components: Raw iCalendar components
+
+        Returns:
+            Populated UIDIndex
+        """
+        index = cls()
+        for component in raw_components:
+            index.add_component(component)
+        for event in events:
+            index.add_event(event)
+        return index
+
+    def add_component(self, component: Any) -> None:
+        """Index a raw component by UID, letting RRULE masters replace instances."""
+        try:
+            comp_uid = str(component.get("UID"))
+        except Exception:
+            return
+        if not comp_uid:
+            return
+
+        existing = self.components.get(comp_uid)
+        if existing is None or (not existing.get("RRULE") and component.get("RRULE")):
+            self.components[comp_uid] = component
+
+    def add_event(self, event: Any) -> None:
+        """Index a parsed event by UID and record it if it is a RECURRENCE-ID override."""
+        event_id = getattr(event, "id", None)
+        if not event_id:
+            return
+
+        existing = self.events_by_id.get(event_id)
+        if existing is None or (
+            not getattr(existing, "is_recurring", False) and getattr(event, "is_recurring", False)
+        ):
+            self.events_by_id[event_id] = event
+
+        if getattr(event, "recurrence_id", None):
+            self.overrides.setdefault(event_id, []).append(event)
+            self._override_events.append(event)
+
+    def recurrence_ids(self, uid: str) -> list[str]:
+        """Return the RECURRENCE-ID values overriding occurrences of ``uid``."""
+        return [event.recurrence_id for event in self.overrides.get(uid, ())]
+
+    def override_events(self) -> list[Any]:
+        """Return every RECURRENCE-ID override event, in parse order."""
+        return list(self._override_events)
@@ -1,7 +1,7 @@
 """Centralized async orchestration utilities for CalendarBot Lite.
 
 This module provides consistent patterns for async operations including:
-- ThreadPoolExecutor management with proper lifecycle
+- A long-lived worker event loop for running async code from sync callers
 - Event loop detection and safe execution
 - Timeout management with cancellation
 - Concurrent async operations with gather
@@ -30,6 +30,8 @@ Usage Example:
 
 import asyncio
 import logging
+import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
@@ -44,6 +46,40 @@ class AsyncTimeoutError(AsyncOrchestratorError):
     """Raised when async operation exceeds timeout."""
 
 
+class _LoopWorker:
+    """Daemon thread running a long-lived event loop for sync-to-async calls.
+
+    Replaces creating a thread and an event loop for every
+    run_coroutine_from_sync() call; coroutines are submitted to the same loop.
+    """
+
+    def __init__(self) -> None:
+        """Start the worker thread and its event loop."""
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self._run, name="calendarbot-async-worker", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def run(self, coro: Any) -> Any:
+        """Run ``coro`` on the worker loop and block until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop and wait for the thread to exit."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+
+
 class AsyncOrchestrator:
     """Centralized async operation orchestration with consistent patterns.
 
@@ -65,11 +101,14 @@ class AsyncOrchestrator:
         """Initialize async orchestrator.
 
         Args:
-            max_workers: Maximum number of thread pool workers
+            max_workers: Maximum number of thread pool workers (kept for API
+                compatibility; sync-to-async calls share one worker thread)
             default_timeout: Default timeout for operations in seconds
         """
         self.max_workers = max_workers
         self.default_timeout = default_timeout
+        self._worker: Optional[_LoopWorker] = None
+        self._worker_lock = threading.Lock()
 
         logger.debug(
             "AsyncOrchestrator initialized: max_workers=%d, default_timeout=%.1fs",
@@ -119,13 +158,14 @@ class AsyncOrchestrator:
         This is a SYNCHRONOUS method that safely executes async code whether
         or not there's already a running event loop.
 
-        Automatically detects if there's a running event loop and chooses
-        the appropriate execution strategy:
-        - If no loop: Use asyncio.run()
-        - If loop exists: Run in new loop within thread pool
+        The coroutine runs on a long-lived worker thread with its own event
+        loop, so repeated calls (e.g. one per RRULE expansion pass) do not pay
+        for creating and tearing down a thread and an event loop each time.
+        This works whether or not the caller has a running event loop.
 
-        This consolidates the pattern from lite_rrule_expander.py:1018-1038
-        and lite_parser.py:390-410.
+        A call made from inside the worker loop itself (a nested sync call)
+        cannot block on that loop, so it falls back to a fresh loop in a
+        one-off thread.
 
         Args:
             coro_func: Function that returns a coroutine
@@ -146,36 +186,42 @@ class AsyncOrchestrator:
                 return result
             ```
         """
-        try:
-            # Check if there's a running event loop
-            asyncio.get_running_loop()
-            # There's a running loop - need to run in separate thread with new loop
-            logger.debug("Detected running event loop - using thread pool")
-
-            def run_in_new_loop() -> Any:
-                """Run coroutine in a new event loop in separate thread."""
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    coro = coro_func()
-                    if timeout:
-                        coro = asyncio.wait_for(coro, timeout=timeout)
-                    return new_loop.run_until_complete(coro)
-                finally:
-                    new_loop.close()
-
-            # Use blocking version - this is a sync method
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_in_new_loop)
-                return future.result()
-
-        except RuntimeError:
-            # No running loop - use asyncio.run() directly
-            logger.debug("No running event loop - using asyncio.run()")
+        worker = self._get_worker()
+        if threading.current_thread() is not worker.thread:
             coro = coro_func()
             if timeout:
                 coro = asyncio.wait_for(coro, timeout=timeout)
-            return asyncio.run(coro)
+            return worker.run(coro)
+
+        # Nested call from the worker loop: run in a new loop in a separate thread
+        logger.debug("Nested run_coroutine_from_sync on worker loop - using one-off thread")
+
+        def run_in_new_loop() -> Any:
+            """Run coroutine in a new event loop in separate thread."""
+            new_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(new_loop)
+            try:
+                coro = coro_func()
+                if timeout:
+                    coro = asyncio.wait_for(coro, timeout=timeout)
+                return new_loop.run_until_complete(coro)
+            finally:
+                new_loop.close()
+
+        # Use blocking version - this is a sync method
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(run_in_new_loop)
+            return future.result()
+
+    def _get_worker(self) -> _LoopWorker:
+        """Return the worker loop thread, starting it on first use (or after a fork)."""
+        with self._worker_lock:
+            worker = self._worker
+            if worker is None or worker.pid != os.getpid() or not worker.thread.is_alive():
+                worker = _LoopWorker()
+                self._worker = worker
+                logger.debug("Started AsyncOrchestrator worker loop thread")
+            return worker
 
     async def shutdown(self) -> None:
         """Shutdown orchestrator and clean up resources.
@@ -183,6 +229,10 @@ class AsyncOrchestrator:
         Should be called during application shutdown to properly
         clean up any resources.
         """
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None and worker.pid == os.getpid():
+            await asyncio.to_thread(worker.stop)
         logger.info("AsyncOrchestrator shutdown complete")
 
     async def __aenter__(self) -> "AsyncOrchestrator":
@@ -122,6 +122,13 @@ class ConfigManager:
         - CALENDARBOT_WEB_PORT or CALENDARBOT_SERVER_PORT -> 'server_port' (int)
         - CALENDARBOT_ALEXA_BEARER_TOKEN -> 'alexa_bearer_token'
         - CALENDARBOT_DEFAULT_TIMEZONE -> 'default_timezone'
+        - CALENDARBOT_STREAMING_FETCH -> 'streaming_fetch' (bool)
+        - CALENDARBOT_EVENT_CACHE_PATH -> 'event_cache_path'
+        - CALENDARBOT_PARSE_WORKERS -> 'parse_workers' (int)
+        - CALENDARBOT_SHARDED_PARSE -> 'sharded_parse' (bool)
+        - CALENDARBOT_RRULE_PROCESSES -> 'rrule_expansion_processes' (int)
+        - CALENDARBOT_PARSE_LOOKBACK_DAYS -> 'parse_window_lookback_days' (int)
+        - CALENDARBOT_MEMORY_BUDGET_MB -> 'memory_budget_mb' (int)
 
         Returns:
             Configuration dictionary compatible with start_server
@@ -169,6 +176,55 @@ class ConfigManager:
         if default_tz:
             cfg["default_timezone"] = default_tz
 
+        # Parse ICS bodies while they download (bounded memory on large feeds)
+        streaming_fetch = os.environ.get("CALENDARBOT_STREAMING_FETCH")
+        if streaming_fetch:
+            cfg["streaming_fetch"] = streaming_fetch.strip().lower() in ("true", "1", "yes")
+
+        # Persist parsed events to disk for an instant warm start after restarts
+        event_cache_path = os.environ.get("CALENDARBOT_EVENT_CACHE_PATH")
+        if event_cache_path:
+            cfg["event_cache_path"] = event_cache_path
+
+        # Parse ICS content in worker processes so the API stays responsive
+        parse_workers = os.environ.get("CALENDARBOT_PARSE_WORKERS")
+        if parse_workers:
+            try:
+                cfg["parse_workers"] = int(parse_workers)
+            except Exception:
+                logger.warning("Invalid CALENDARBOT_PARSE_WORKERS=%r; ignoring", parse_workers)
+
+        # Split large feeds across the parse workers
+        sharded_parse = os.environ.get("CALENDARBOT_SHARDED_PARSE")
+        if sharded_parse:
+            cfg["sharded_parse"] = sharded_parse.strip().lower() in ("true", "1", "yes")
+
+        # Expand many recurring masters in worker processes
+        rrule_processes = os.environ.get("CALENDARBOT_RRULE_PROCESSES")
+        if rrule_processes:
+            try:
+                cfg["rrule_expansion_processes"] = int(rrule_processes)
+            except Exception:
+                logger.warning("Invalid CALENDARBOT_RRULE_PROCESSES=%r; ignoring", rrule_processes)
+
+        # Skip parsing single events outside [now - lookback, now + expansion window]
+        parse_lookback = os.environ.get("CALENDARBOT_PARSE_LOOKBACK_DAYS")
+        if parse_lookback:
+            try:
+                cfg["parse_window_lookback_days"] = int(parse_lookback)
+            except Exception:
+                logger.warning(
+                    "Invalid CALENDARBOT_PARSE_LOOKBACK_DAYS=%r; ignoring", parse_lookback
+                )
+
+        # Keep refresh work within a memory budget, degrading it when memory is tight
+        memory_budget = os.environ.get("CALENDARBOT_MEMORY_BUDGET_MB")
+        if memory_budget:
+            try:
+                cfg["memory_budget_mb"] = int(memory_budget)
+            except Exception:
+                logger.warning("Invalid CALENDARBOT_MEMORY_BUDGET_MB=%r; ignoring", memory_budget)
+
         return cfg
 
     def load_full_config(self) -> dict[str, Any]:
@@ -6,6 +6,7 @@ import os
 import time
 from dataclasses import dataclass
 from typing import Any, Optional
+from urllib.parse import urlparse
 
 
 @dataclass
@@ -44,6 +45,8 @@ class HealthTracker:
         self._last_render_probe_ok: bool = False
         self._last_render_probe_notes: Optional[str] = None
         self._source_health: dict[str, dict[str, Any]] = {}
+        self._warm_start_saved_at: Optional[float] = None
+        self._warm_start_sources: set[str] = set()
 
     def record_refresh_attempt(self) -> None:
         """Record that a refresh attempt was made."""
@@ -246,17 +249,11 @@ class HealthTracker:
             source_url: URL of the failing source
             error_msg: Error message from the failure
         """
-        if source_url not in self._source_health:
-            self._source_health[source_url] = {
-                "consecutive_failures": 0,
-                "last_error": None,
-                "last_success": None,
-                "last_error_time": None,
-            }
-
-        self._source_health[source_url]["consecutive_failures"] += 1
-        self._source_health[source_url]["last_error"] = error_msg
-        self._source_health[source_url]["last_error_time"] = time.time()
+        health = self._source_health.setdefault(source_url, {})
+        health.setdefault("last_success", None)
+        health["consecutive_failures"] = health.get("consecutive_failures", 0) + 1
+        health["last_error"] = error_msg
+        health["last_error_time"] = time.time()
 
     def record_source_success(self, source_url: str) -> None:
         """Record a source fetch success.
@@ -270,6 +267,122 @@ class HealthTracker:
         self._source_health[source_url]["consecutive_failures"] = 0
         self._source_health[source_url]["last_error"] = None
         self._source_health[source_url]["last_success"] = time.time()
+        self._source_health[source_url]["deferred"] = False
+        self._warm_start_sources.discard(source_url)
+
+    def record_source_deferred(self, source_url: str) -> None:
+        """Record a refresh that kept a source's cached events to fit the memory budget.
+
+        The source was not fetched, so it counts as stale until its next success.
+
+        Args:
+            source_url: URL of the deferred source
+        """
+        health = self._source_health.setdefault(source_url, {})
+        health.setdefault("last_success", None)
+        health["deferred"] = True
+
+    def record_source_not_modified(self, source_url: str, bytes_saved: int) -> None:
+        """Record a refresh answered by HTTP 304 Not Modified.
+
+        Args:
+            source_url: URL of the revalidated source
+            bytes_saved: Size of the body that did not have to be downloaded
+        """
+        health = self._source_health.setdefault(source_url, {})
+        health["not_modified_refreshes"] = health.get("not_modified_refreshes", 0) + 1
+        health["bytes_saved"] = health.get("bytes_saved", 0) + max(0, bytes_saved)
+
+    def get_revalidation_summary(self) -> dict[str, int]:
+        """Get totals for refreshes answered by HTTP 304 across all sources.
+
+        Returns:
+            Dictionary with not_modified_refreshes and bytes_saved totals
+        """
+        return {
+            "not_modified_refreshes": sum(
+                h.get("not_modified_refreshes", 0) for h in self._source_health.values()
+            ),
+            "bytes_saved": sum(h.get("bytes_saved", 0) for h in self._source_health.values()),
+        }
+
+    def record_warm_start(self, source_urls: list[str], saved_at: Optional[float]) -> None:
+        """Record that the event window was seeded from the on-disk event cache.
+
+        The listed sources count as stale until each has a successful fetch.
+
+        Args:
+            source_urls: URLs of the sources restored from disk
+            saved_at: Unix timestamp at which the cache file was written, if known
+        """
+        self._warm_start_saved_at = saved_at
+        self._warm_start_sources = set(source_urls)
+
+    def get_warm_start_status(self) -> dict[str, Any]:
+        """Get on-disk event cache status for the health endpoint.
+
+        Returns:
+            Dictionary with warm_started, stale, stale_sources and cache_age_s
+        """
+        cache_age = (
+            None
+            if self._warm_start_saved_at is None
+            else max(0, int(time.time() - self._warm_start_saved_at))
+        )
+        return {
+            "warm_started": self._warm_start_saved_at is not None,
+            "stale": bool(self._warm_start_sources),
+            "stale_sources": len(self._warm_start_sources),
+            "cache_age_s": cache_age,
+        }
+
+    def record_source_latency(self, source_url: str, source_name: str, seconds: float) -> None:
+        """Record how long a source took to refresh in the latest cycle.
+
+        Args:
+            source_url: URL of the source
+            source_name: Display name of the source (shown instead of the URL)
+            seconds: Time from the start of the refresh until the source's events
+                were ready (or it failed or timed out)
+        """
+        health = self._source_health.setdefault(source_url, {})
+        health["name"] = source_name
+        health["last_latency_ms"] = int(max(0.0, seconds) * 1000)
+
+    def get_source_status(self) -> list[dict[str, Any]]:
+        """Get per-source latency and staleness for the health endpoint.
+
+        A source is stale when the events served for it did not come from its
+        latest refresh: that refresh failed, timed out or was deferred by the
+        memory budget, it has never been fetched, or its events were restored
+        from the disk cache.
+
+        Returns:
+            One dictionary per source with name, last_latency_ms,
+            last_success_age_s, consecutive_failures and stale
+        """
+        now = time.time()
+        status = []
+        for url, health in self._source_health.items():
+            last_success = health.get("last_success")
+            failures = health.get("consecutive_failures", 0)
+            status.append(
+                {
+                    "name": health.get("name") or urlparse(url).hostname or "unknown",
+                    "last_latency_ms": health.get("last_latency_ms"),
+                    "last_success_age_s": (
+                        None if last_success is None else max(0, int(now - last_success))
+                    ),
+                    "consecutive_failures": failures,
+                    "stale": bool(
+                        failures
+                        or last_success is None
+                        or health.get("deferred")
+                        or url in self._warm_start_sources
+                    ),
+                }
+            )
+        return status
 
     def get_source_health_summary(self) -> dict[str, Any]:
         """Get summary of all source health statuses.
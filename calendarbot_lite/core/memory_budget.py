@@ -0,0 +1,225 @@
+"""Memory-budget governor for the refresh pipeline - CalendarBot Lite.
+
+A refresh fetches, parses and expands every source while the previous event
+window is still being served. On a 512 MB device a few large sources at once
+can push the process into swap or the OOM killer. MemoryBudgetGovernor keeps a
+refresh within a configured budget, capped by the MemAvailable reading of
+SystemMetricsCollector, using rough per-stage size estimates:
+
+- Planning a refresh, it serializes the sources when the largest ones would
+  not fit side by side, and keeps the cached events of sources that have them
+  when even one would not fit.
+- Admitting a downloaded feed for parsing, it waits for the parses in flight
+  when the feed does not fit next to them. A feed that does not fit on its own
+  keeps the source's cached events when there are any.
+
+The estimates are deliberately coarse: they only need to tell "fits" from
+"does not fit" for feeds from a few KB to tens of MB.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from calendarbot_lite.core.monitoring_logging import SystemMetricsCollector
+
+logger = logging.getLogger(__name__)
+
+# Memory left to the OS and the rest of the process out of MemAvailable
+DEFAULT_RESERVE_MB = 32
+
+# Peak memory while parsing, per byte of ICS (icalendar components plus mapped events)
+PARSE_MEMORY_FACTOR = 6.0
+
+# Memory of expanded instances per byte of ICS. Expansion is bounded by the
+# RRULE worker pool (expansion_days_window, max_occurrences_per_rule), not by
+# anything a refresh can change, so it is a fixed share of the estimate.
+EXPANSION_MEMORY_FACTOR = 2.0
+
+# Assumed size of a feed that has not been downloaded yet
+DEFAULT_SOURCE_BYTES = 512 * 1024
+
+_MIB = 1024 * 1024
+
+
+def estimate_source_mb(content_bytes: int) -> float:
+    """Estimate the memory needed to parse and expand one feed.
+
+    Args:
+        content_bytes: Size of the ICS feed
+
+    Returns:
+        Estimated peak memory in MB
+    """
+    feed_mb = max(0, content_bytes) / _MIB
+    return feed_mb * (PARSE_MEMORY_FACTOR + EXPANSION_MEMORY_FACTOR)
+
+
+@dataclass
+class RefreshMemoryPlan:
+    """How a refresh should run to stay within the memory budget.
+
+    Attributes:
+        fetch_concurrency: Sources fetched and parsed at once
+        keep_cached: Reuse cached events instead of fetching sources that have them
+        headroom_mb: Memory the refresh could use when it was planned
+        steps: Degradations applied, in order ("serialize_sources",
+            "keep_cached_events")
+    """
+
+    fetch_concurrency: int
+    keep_cached: bool = False
+    headroom_mb: Optional[float] = None
+    steps: list[str] = field(default_factory=list)
+
+    @property
+    def degraded(self) -> bool:
+        """Whether the refresh runs with less than the configured resources."""
+        return bool(self.steps)
+
+
+class MemoryBudgetGovernor:
+    """Keeps the fetch/parse/expand work of refreshes within a memory budget.
+
+    Attributes:
+        budget_mb: Memory the refresh work may use at once
+        reserve_mb: Part of MemAvailable that is never planned for
+    """
+
+    def __init__(
+        self,
+        budget_mb: float,
+        reserve_mb: float = DEFAULT_RESERVE_MB,
+        metrics_provider: Optional[Callable[[], dict[str, Any]]] = None,
+    ) -> None:
+        """Initialize the governor.
+
+        Args:
+            budget_mb: Memory the refresh work may use at once
+            reserve_mb: Part of MemAvailable that is never planned for
+            metrics_provider: Returns system metrics with "memory_free_mb"
+                (defaults to SystemMetricsCollector.get_current_metrics)
+        """
+        self.budget_mb = float(budget_mb)
+        self.reserve_mb = float(reserve_mb)
+        self._metrics_provider = metrics_provider or SystemMetricsCollector.get_current_metrics
+        self._in_flight_mb = 0.0
+        self._released = asyncio.Condition()
+
+    @property
+    def in_flight_mb(self) -> float:
+        """Memory reserved by the parses admitted and not yet released."""
+        return self._in_flight_mb
+
+    def available_mb(self) -> Optional[float]:
+        """Return MemAvailable in MB, or None where it cannot be read."""
+        try:
+            value = self._metrics_provider().get("memory_free_mb")
+        except Exception:
+            logger.debug("Could not read available memory", exc_info=True)
+            return None
+        return float(value) if isinstance(value, (int, float)) else None
+
+    def headroom_mb(self) -> float:
+        """Return the memory new work may still use.
+
+        This is the budget less the reservations in flight, capped by MemAvailable
+        less the reserve. MemAvailable already reflects what the parses in flight
+        have allocated, so their reservations only count against the budget.
+        """
+        headroom = self.budget_mb - self._in_flight_mb
+        available = self.available_mb()
+        if available is not None:
+            headroom = min(headroom, available - self.reserve_mb)
+        return headroom
+
+    def plan_refresh(self, source_bytes: list[int], fetch_concurrency: int) -> RefreshMemoryPlan:
+        """Plan a refresh so its largest concurrent sources fit the headroom.
+
+        Degrades in order: fewer concurrent sources (down to one at a time), then
+        keeping cached events instead of refreshing the sources that have them.
+
+        Args:
+            source_bytes: Expected feed size per source (DEFAULT_SOURCE_BYTES when unknown)
+            fetch_concurrency: Configured number of concurrent sources
+
+        Returns:
+            The plan; unchanged settings when everything fits
+        """
+        headroom = self.headroom_mb()
+        sizes = sorted(source_bytes, reverse=True)
+        plan = RefreshMemoryPlan(
+            fetch_concurrency=fetch_concurrency,
+            headroom_mb=round(headroom, 1),
+        )
+
+        def needed_mb(concurrency: int) -> float:
+            return sum(estimate_source_mb(size) for size in sizes[:concurrency])
+
+        if not sizes or needed_mb(fetch_concurrency) <= headroom:
+            return plan
+
+        # More workers than sources run no more sources at once
+        concurrent_sources = min(fetch_concurrency, len(sizes))
+        plan.fetch_concurrency = concurrent_sources
+        while plan.fetch_concurrency > 1 and needed_mb(plan.fetch_concurrency) > headroom:
+            plan.fetch_concurrency -= 1
+        if plan.fetch_concurrency < concurrent_sources:
+            plan.steps.append("serialize_sources")
+
+        if needed_mb(1) > headroom:
+            plan.keep_cached = True
+            plan.steps.append("keep_cached_events")
+        return plan
+
+    async def admit(self, estimate_mb: float) -> bool:
+        """Reserve memory for parsing a feed.
+
+        When the estimate does not fit next to the parses in flight, waits until
+        they are released. The estimate is reserved either way and must be
+        released with release().
+
+        Args:
+            estimate_mb: Estimated memory of the parse (see estimate_source_mb)
+
+        Returns:
+            True if the estimate fits the headroom, False if it does not fit even
+            with nothing else in flight
+        """
+        async with self._released:
+            while self._in_flight_mb > 0 and estimate_mb > self.headroom_mb():
+                await self._released.wait()
+            fits = estimate_mb <= self.headroom_mb()
+            self._in_flight_mb += estimate_mb
+            return fits
+
+    async def release(self, estimate_mb: float) -> None:
+        """Release memory reserved by admit() and wake parses waiting for it.
+
+        Args:
+            estimate_mb: The estimate passed to admit()
+        """
+        async with self._released:
+            self._in_flight_mb = max(0.0, self._in_flight_mb - estimate_mb)
+            self._released.notify_all()
+
+    @asynccontextmanager
+    async def reserve(self, estimate_mb: float) -> AsyncIterator[bool]:
+        """Hold a reservation for the duration of a ``async with`` block.
+
+        Args:
+            estimate_mb: Estimated memory of the parse
+
+        Yields:
+            Whether the estimate fits (see admit())
+        """
+        fits = await self.admit(estimate_mb)
+        try:
+            yield fits
+        finally:
+            await self.release(estimate_mb)
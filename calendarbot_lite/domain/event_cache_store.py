@@ -0,0 +1,202 @@
+"""On-disk parsed-event cache for calendarbot_lite warm starts with atomic writes.
+
+The in-memory source cache (content hash, HTTP validators and parsed/expanded
+events per source) is mirrored to a compact JSON file after refreshes that
+produced new data. On startup the file is loaded back so the event window can
+be served immediately, before the first network refresh completes.
+
+Sources are keyed by the SHA-256 of their URL so calendar URLs (which often
+embed access tokens) are never written to disk. Files written by a different
+format version, or that fail to parse, are ignored.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the on-disk layout or the serialized event model changes.
+CACHE_FORMAT_VERSION = 1
+
+
+def source_key(source_url: str) -> str:
+    """Return the on-disk key for a source URL (SHA-256 hex digest)."""
+    return hashlib.sha256(source_url.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class PersistedSource:
+    """Cached state for one source as stored on disk."""
+
+    content_hash: str
+    last_fetch_success: datetime
+    events: list[Any]  # list[LiteCalendarEvent]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_bytes: int = 0
+
+
+@dataclass
+class LoadedEventCache:
+    """Result of loading the cache file."""
+
+    saved_at: Optional[datetime] = None
+    sources: dict[str, PersistedSource] = field(default_factory=dict)  # keyed by source URL
+
+
+class EventCacheStore:
+    """Persistent parsed-event cache backed by a single JSON file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Create an EventCacheStore.
+
+        Args:
+            path: Path to the JSON cache file. The parent directory is created if needed.
+        """
+        self._path = Path(path).expanduser()
+        self._lock = threading.Lock()
+
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            logger.debug("Could not ensure directory for event cache: %s", self._path.parent)
+
+    @property
+    def path(self) -> Path:
+        """Location of the cache file."""
+        return self._path
+
+    def load(self, source_urls: Iterable[str]) -> LoadedEventCache:
+        """Load cached sources for the given URLs.
+
+        Entries for sources that are no longer configured are dropped. A missing,
+        corrupt or version-mismatched file yields an empty result.
+
+        Args:
+            source_urls: Currently configured source URLs
+
+        Returns:
+            LoadedEventCache with the entries that could be restored
+        """
+        from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
+
+        with self._lock:
+            if not self._path.exists():
+                logger.debug("Event cache file not found; cold start: %s", self._path)
+                return LoadedEventCache()
+
+            try:
+                with self._path.open("r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+                if not isinstance(data, dict):
+                    raise TypeError("event cache JSON root must be an object")
+            except Exception as exc:
+                logger.warning("Ignoring unreadable event cache %s: %s", self._path, exc)
+                return LoadedEventCache()
+
+        version = data.get("version")
+        if version != CACHE_FORMAT_VERSION:
+            logger.info(
+                "Ignoring event cache %s with format version %r (expected %d)",
+                self._path,
+                version,
+                CACHE_FORMAT_VERSION,
+            )
+            return LoadedEventCache()
+
+        try:
+            saved_at: Optional[datetime] = datetime.fromisoformat(data["saved_at"])
+        except Exception:
+            saved_at = None
+
+        stored = data.get("sources")
+        if not isinstance(stored, dict):
+            return LoadedEventCache(saved_at=saved_at)
+
+        loaded = LoadedEventCache(saved_at=saved_at)
+        for url in source_urls:
+            raw = stored.get(source_key(url))
+            if not isinstance(raw, dict):
+                continue
+            try:
+                loaded.sources[url] = PersistedSource(
+                    content_hash=str(raw["content_hash"]),
+                    last_fetch_success=datetime.fromisoformat(raw["last_fetch_success"]),
+                    events=[LiteCalendarEvent.model_validate(ev) for ev in raw["events"]],
+                    etag=raw.get("etag"),
+                    last_modified=raw.get("last_modified"),
+                    content_bytes=int(raw.get("content_bytes", 0)),
+                )
+            except Exception as exc:
+                # One bad entry should not discard the other sources
+                logger.warning("Skipping malformed event cache entry: %s", exc)
+
+        logger.debug("Loaded event cache %s (%d sources)", self._path, len(loaded.sources))
+        return loaded
+
+    def save(self, sources: Mapping[str, PersistedSource], saved_at: datetime) -> bool:
+        """Persist the given sources to disk atomically, replacing the previous file.
+
+        Writes to a temporary file in the same directory then replaces the cache
+        file, so a crash mid-write leaves the previous cache intact.
+
+        Args:
+            sources: Mapping of source URL -> PersistedSource
+            saved_at: Timestamp recorded in the file (aware datetime)
+
+        Returns:
+            True if the file was written, False on failure
+        """
+        data: dict[str, Any] = {
+            "version": CACHE_FORMAT_VERSION,
+            "saved_at": saved_at.isoformat(),
+            "sources": {
+                source_key(url): {
+                    "content_hash": entry.content_hash,
+                    "last_fetch_success": entry.last_fetch_success.isoformat(),
+                    "etag": entry.etag,
+                    "last_modified": entry.last_modified,
+                    "content_bytes": entry.content_bytes,
+                    "events": [
+                        ev.model_dump(mode="json", exclude_defaults=True) for ev in entry.events
+                    ],
+                }
+                for url, entry in sources.items()
+            },
+        }
+
+        tmp_path = None
+        with self._lock:
+            try:
+                with tempfile.NamedTemporaryFile(
+                    "w", dir=self._path.parent, delete=False, encoding="utf-8"
+                ) as tf:
+                    tmp_path = Path(tf.name)
+                    json.dump(data, tf, ensure_ascii=False, separators=(",", ":"))
+                    tf.flush()
+                    with contextlib.suppress(Exception):
+                        os.fsync(tf.fileno())
+                tmp_path.replace(self._path)
+            except Exception as exc:
+                logger.warning("Failed to persist event cache to %s: %s", self._path, exc)
+                try:
+                    if tmp_path and tmp_path.exists():
+                        tmp_path.unlink()
+                except Exception:
+                    pass  # nosec B110 - best effort cleanup of temp file
+                return False
+
+        logger.debug("Persisted event cache %s (%d sources)", self._path, len(sources))
+        return True
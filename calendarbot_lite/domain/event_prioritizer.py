@@ -8,6 +8,7 @@ from enum import Enum
 from typing import Any
 
 from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
+from calendarbot_lite.domain.event_window import EventWindow
 from calendarbot_lite.domain.skipped_store import is_event_skipped
 
 logger = logging.getLogger(__name__)
@@ -60,18 +61,28 @@ class EventPrioritizer:
         """
         candidate_events: list[tuple[LiteCalendarEvent, int]] = []
 
-        for i, ev in enumerate(events):
-            logger.debug(" Checking event %d - ID: %r, Start: %r", i, ev.id, ev.start.date_time)
-
-            start = ev.start.date_time
-            if not isinstance(start, datetime.datetime):
-                continue
-
-            seconds_until = int((start - now).total_seconds())
-
-            # Skip past events
-            if seconds_until < 0:
-                continue
+        # Past events are skipped by the index: seconds_until truncates toward zero,
+        # so anything starting less than a second ago still counts as upcoming.
+        # The window's occurrence query, when published, continues past the window's
+        # size limit and the expansion horizon, so skipped or focus-time runs cannot
+        # hide the next meeting.
+        window = EventWindow.of(events)
+        after = now - datetime.timedelta(seconds=1)
+        if window.occurrences is not None:
+            upcoming = window.occurrences.starting_after(after)
+        else:
+            upcoming = window.starting_after(after)
+        for ev in upcoming:
+            logger.debug(" Checking event - ID: %r, Start: %r", ev.id, ev.start.date_time)
+
+            seconds_until = int((ev.start.date_time - now).total_seconds())
+
+            # Events arrive in start order: stop once past the earliest candidate's group
+            if (
+                candidate_events
+                and seconds_until - candidate_events[0][1] > self.time_grouping_threshold_seconds
+            ):
+                break
 
             # Skip focus time events
             if self.is_focus_time_event(ev):
@@ -88,9 +99,7 @@ class EventPrioritizer:
         if not candidate_events:
             return None
 
-        # Sort candidates by time (earliest first)
-        candidate_events.sort(key=lambda x: x[1])
-
+        # Candidates are already in start order (earliest first)
         # Apply priority logic to events that start at similar time to the earliest event
         earliest_time = candidate_events[0][1]
         early_group = [
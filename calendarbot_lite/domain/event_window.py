@@ -0,0 +1,128 @@
+"""Published event window with a sorted start/end index.
+
+The server publishes the event window once per refresh and answers many API
+requests from it ("what's next", "current meeting", "done for the day",
+morning summary). EventWindow is the published tuple plus an index built once
+at publish time, so those lookups bisect instead of scanning every event:
+
+- starting_after(t): events starting strictly after t, in start order
+- upcoming(t): all-day events plus timed events starting after t, in start order
+- covering(t): events in progress at t (start <= t < end)
+- overlapping(a, b): timed events with start <= b and end > a, plus all-day
+  events (a superset that callers narrow with their own boundary rules)
+
+EventWindow is a tuple subclass, so code that iterates or slices the window
+keeps working unchanged. The server also attaches an OccurrenceQuery over all
+refreshed events (``occurrences``) for lookups that must see past the window.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import accumulate, islice
+from typing import TYPE_CHECKING, Any, Optional
+
+from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
+
+if TYPE_CHECKING:
+    from calendarbot_lite.domain.occurrence_query import OccurrenceQuery
+
+
+def _aware_bounds(event: Any) -> tuple[datetime, datetime] | None:
+    """Return (start, end) for events with timezone-aware datetime bounds, else None."""
+    start = event.start.date_time
+    end = event.end.date_time
+    if not isinstance(start, datetime) or not isinstance(end, datetime):
+        return None
+    if start.tzinfo is None or end.tzinfo is None:
+        return None
+    return start, end
+
+
+class EventWindow(tuple[LiteCalendarEvent, ...]):
+    """Immutable event window (tuple of LiteCalendarEvent) with a start/end index.
+
+    Events with timezone-aware start and end are indexed by start. Others (naive or
+    non-datetime bounds) are kept in ``unindexed`` and returned by overlapping() as
+    candidates, since their UTC position depends on the caller's timezone rules.
+    ``occurrences`` is the OccurrenceQuery published with the window, if any.
+    """
+
+    _by_start: tuple[LiteCalendarEvent, ...]
+    _starts: list[datetime]
+    _max_ends: list[datetime]
+    all_day: tuple[LiteCalendarEvent, ...]
+    unindexed: tuple[LiteCalendarEvent, ...]
+    occurrences: Optional[OccurrenceQuery]
+
+    def __new__(
+        cls,
+        events: Iterable[LiteCalendarEvent] = (),
+        occurrences: Optional[OccurrenceQuery] = None,
+    ) -> EventWindow:
+        """Create the window and build its index."""
+        self = super().__new__(cls, events)
+        indexed: list[tuple[datetime, int, datetime]] = []
+        unindexed: list[LiteCalendarEvent] = []
+        for position, event in enumerate(self):
+            bounds = _aware_bounds(event)
+            if bounds is None:
+                unindexed.append(event)
+            else:
+                indexed.append((bounds[0], position, bounds[1]))
+        indexed.sort(key=lambda item: (item[0], item[1]))
+
+        self._by_start = tuple(self[position] for _, position, _ in indexed)
+        self._starts = [start for start, _, _ in indexed]
+        # Running maximum of end times in start order: monotone, so it can be bisected
+        # to find the first event that may still be in progress at a given instant.
+        self._max_ends = list(accumulate((end for _, _, end in indexed), max))
+        self.all_day = tuple(e for e in self._by_start if e.is_all_day)
+        self.unindexed = tuple(unindexed)
+        self.occurrences = occurrences
+        return self
+
+    @classmethod
+    def of(cls, events: Iterable[LiteCalendarEvent]) -> EventWindow:
+        """Return ``events`` if it is already an EventWindow, otherwise index it."""
+        return events if isinstance(events, cls) else cls(events)
+
+    def starting_after(self, instant: datetime) -> Iterator[LiteCalendarEvent]:
+        """Yield indexed events with start > instant in start order (ties keep window order)."""
+        return islice(self._by_start, bisect_right(self._starts, instant), None)
+
+    def upcoming(self, instant: datetime) -> Iterator[LiteCalendarEvent]:
+        """Yield all-day events and timed events starting after ``instant``, in start order.
+
+        All-day events count as active for their whole day, so they are included
+        regardless of their start; timed events that started already are not.
+        """
+        timed = (e for e in self.starting_after(instant) if not e.is_all_day)
+        return heapq.merge(self.all_day, timed, key=lambda e: e.start.date_time)
+
+    def covering(self, instant: datetime) -> list[LiteCalendarEvent]:
+        """Return indexed events in progress at ``instant`` (start <= instant < end)."""
+        first = bisect_right(self._max_ends, instant)
+        last = bisect_right(self._starts, instant)
+        return [e for e in self._by_start[first:last] if instant < e.end.date_time]
+
+    def overlapping(self, range_start: datetime, range_end: datetime) -> list[LiteCalendarEvent]:
+        """Return candidate events for [range_start, range_end].
+
+        Timed events qualify when start <= range_end and end > range_start. All-day
+        and unindexed events are always included, because callers match them by
+        calendar date or local timezone. Callers apply their exact boundary rules.
+        """
+        first = bisect_right(self._max_ends, range_start)
+        last = bisect_right(self._starts, range_end)
+        found = [
+            e
+            for e in self._by_start[first:last]
+            if not e.is_all_day and e.end.date_time > range_start
+        ]
+        found.extend(self.all_day)
+        found.extend(self.unindexed)
+        return found
@@ -17,6 +17,7 @@ All user stories from the Morning Summary Feature specification are implemented:
 
 import logging
 import time
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from functools import lru_cache
@@ -30,6 +31,7 @@ from calendarbot_lite.core.timezone_utils import (
     get_server_timezone as _get_server_timezone,
     now_utc as _now_utc,
 )
+from calendarbot_lite.domain.event_window import EventWindow
 
 logger = logging.getLogger(__name__)
 
@@ -264,13 +266,13 @@ class MorningSummaryService:
 
     async def generate_summary(
         self,
-        events: list[LiteCalendarEvent],
+        events: Sequence[LiteCalendarEvent],
         request: MorningSummaryRequest,
     ) -> MorningSummaryResult:
         """Generate morning summary from calendar events.
 
         Args:
-            events: List of calendar events to analyze
+            events: List of calendar events, or the published EventWindow, to analyze
             request: Summary generation request parameters
 
         Returns:
@@ -284,8 +286,8 @@ class MorningSummaryService:
 
         try:
             # Validate inputs
-            if not isinstance(events, list):
-                raise ValueError("Events must be a list")  # noqa: TRY004
+            if not isinstance(events, (list, EventWindow)):
+                raise ValueError("Events must be a list or an EventWindow")  # noqa: TRY004
 
             # Performance check (Story 8)
             if len(events) > MAX_EVENTS_LIMIT:
@@ -483,7 +485,7 @@ class MorningSummaryService:
 
     def _filter_morning_events(
         self,
-        events: list[LiteCalendarEvent],
+        events: Sequence[LiteCalendarEvent],
         timeframe_start: datetime,
         timeframe_end: datetime,
     ) -> list[LiteCalendarEvent]:
@@ -496,7 +498,14 @@ class MorningSummaryService:
 
         logger.debug("Morning window UTC: %s to %s", timeframe_start_utc, timeframe_end_utc)
 
-        for event in events:
+        # A published window carries a start/end index: only visit events near the morning
+        candidates = (
+            events.overlapping(timeframe_start_utc, timeframe_end_utc)
+            if isinstance(events, EventWindow)
+            else events
+        )
+
+        for event in candidates:
             # Skip cancelled events (Story 2)
             if event.is_cancelled:
                 continue
@@ -948,7 +957,7 @@ class MorningSummaryService:
         return " ".join(parts)
 
     def _get_cache_key(
-        self, events: list[LiteCalendarEvent], request: MorningSummaryRequest
+        self, events: Sequence[LiteCalendarEvent], request: MorningSummaryRequest
     ) -> str:
         """Generate cache key for result caching."""
         # Create a simple hash of event IDs and request parameters
@@ -0,0 +1,261 @@
+"""Lazy occurrence lookups past the published event window.
+
+The published EventWindow holds at most event_window_size events, and the
+expander builds at most max_occurrences_per_rule occurrences per rule within
+its expansion window. "What's next" and "am I done for the day" need only a
+handful of occurrences, but must not stop at those limits: a run of skipped or
+focus-time meetings can push the next real meeting past the window.
+
+OccurrenceQuery indexes every refreshed event (one-off events and the
+occurrences the expander already built) with the same start/end index as
+EventWindow, and continues each recurring series lazily past its last expanded
+occurrence. The master's RRULE and EXDATEs (recorded on it by the expander) are
+only turned into a rule set, and only stepped, when a lookup reads past that
+point. Series are merged with the indexed events through a heap, so a lookup
+costs a bisect plus the occurrences it actually reads:
+
+- starting_after(t): occurrences starting strictly after t, in start order
+- next_after(t, limit, where): the first ``limit`` of those matching ``where``
+- covering(t): occurrences in progress at t (start <= t < end)
+- overlapping(a, b): candidates for [a, b], as EventWindow.overlapping()
+- count_in_range(a, b): occurrences starting in [a, b)
+
+Continued occurrences are ExpandedOccurrence objects with the same instance IDs
+the expander assigns, so callers treat them like window events.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from itertools import islice
+from typing import Any, Optional
+
+from dateutil.rrule import rruleset
+
+from calendarbot_lite.calendar.lite_models import ExpandedOccurrence, LiteCalendarEvent
+from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool, make_instance_id
+from calendarbot_lite.domain.event_window import EventWindow
+
+logger = logging.getLogger(__name__)
+
+# All-day events are matched by local calendar date; no timezone is further than
+# this from UTC, so all-day events beyond it cannot fall on a date in the range.
+ALL_DAY_MARGIN = timedelta(days=1)
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Normalize a rule occurrence to aware UTC (naive values are treated as UTC)."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _near_range(event: Any, range_start: datetime, range_end: datetime) -> bool:
+    """Return False for events with aware bounds more than ALL_DAY_MARGIN outside the range."""
+    start = event.start.date_time
+    end = event.end.date_time
+    if not isinstance(start, datetime) or not isinstance(end, datetime):
+        return True
+    if start.tzinfo is None or end.tzinfo is None:
+        return True
+    return start <= range_end + ALL_DAY_MARGIN and end >= range_start - ALL_DAY_MARGIN
+
+
+def _merge_lazily(streams: Iterable[tuple[datetime, Iterator[Any]]]) -> Iterator[Any]:
+    """Merge start-ordered event streams, reading each only when it could be next.
+
+    Each stream comes with a lower bound for its starts. A stream is first read
+    when its bound reaches the top of the heap, so series that cannot contribute
+    to the part the caller consumes are never stepped (heapq.merge would read
+    the first item of every stream up front).
+    """
+    heap: list[tuple[datetime, int, Any, Iterator[Any]]] = [
+        (bound, order, None, stream) for order, (bound, stream) in enumerate(streams)
+    ]
+    heapq.heapify(heap)
+    while heap:
+        _, order, event, stream = heap[0]
+        if event is not None:
+            yield event
+        following = next(stream, None)
+        if following is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (following.start.date_time, order, following, stream))
+
+
+class RecurringSeries:
+    """A recurring master continued lazily after its last expanded occurrence.
+
+    The rule set is built on first use from the RRULE and EXDATEs recorded on
+    the master, exactly as full expansion builds it.
+    """
+
+    def __init__(self, master: LiteCalendarEvent, last_expanded: datetime) -> None:
+        """Initialize the series.
+
+        Args:
+            master: Recurring master with rrule_string (and rrule_exdates) set
+            last_expanded: UTC start of the master's last expanded occurrence
+        """
+        self.master = master
+        self.last_expanded = last_expanded
+        self.duration = master.end.date_time - master.start.date_time
+        self._rule_set: Optional[rruleset] = None
+        self._rule_failed = False
+
+    def _rules(self) -> Optional[rruleset]:
+        """Return the master's rule set, building it on first use (None if it fails)."""
+        if self._rule_set is None and not self._rule_failed:
+            master = self.master
+            try:
+                self._rule_set = RRuleWorkerPool.build_rule_set(
+                    master.start.date_time,
+                    str(master.rrule_string),
+                    master.rrule_exdates,
+                    master,
+                )
+            except Exception as e:
+                logger.warning("Cannot continue series UID=%s: %s", master.id, e)
+                self._rule_failed = True
+        return self._rule_set
+
+    def _local(self, instant: datetime) -> datetime:
+        """Convert a UTC instant to the rule set's naive/aware convention."""
+        if self.master.start.date_time.tzinfo is None:
+            return instant.astimezone(UTC).replace(tzinfo=None)
+        return instant
+
+    def _occurrence(self, start: datetime) -> ExpandedOccurrence:
+        """Build the occurrence the expander would build for a rule start."""
+        start_utc = _to_utc(start)
+        return ExpandedOccurrence(
+            self.master,
+            make_instance_id(self.master.id, start_utc),
+            start_utc,
+            start_utc + self.duration,
+        )
+
+    def starting_after(self, instant: datetime) -> Iterator[ExpandedOccurrence]:
+        """Yield occurrences after both ``instant`` and the last expanded one, in order."""
+        rule_set = self._rules()
+        if rule_set is None:
+            return
+        after = max(instant, self.last_expanded)
+        for start in rule_set.xafter(self._local(after), inc=False):
+            yield self._occurrence(start)
+
+    def overlapping(self, range_start: datetime, range_end: datetime) -> list[ExpandedOccurrence]:
+        """Return unexpanded occurrences with start <= range_end and end > range_start."""
+        if range_end <= self.last_expanded:
+            return []
+        rule_set = self._rules()
+        if rule_set is None:
+            return []
+        first = max(range_start - self.duration, self.last_expanded)
+        starts = rule_set.between(self._local(first), self._local(range_end), inc=True)
+        return [
+            occurrence
+            for occurrence in map(self._occurrence, starts)
+            if occurrence.start.date_time > self.last_expanded
+            and occurrence.end.date_time > range_start
+        ]
+
+
+class OccurrenceQuery:
+    """Answer next-after, covering and range questions over all refreshed events.
+
+    Built once per refresh from the combined events of all sources (before the
+    window's skip filter, time window and size limit) and published with the
+    EventWindow. Query instants must be timezone-aware.
+    """
+
+    def __init__(self, events: Iterable[LiteCalendarEvent]) -> None:
+        """Index the events and collect the series to continue.
+
+        Args:
+            events: Refreshed events, including the expander's occurrences
+        """
+        self.events = EventWindow(events)
+
+        last_expanded: dict[int, tuple[LiteCalendarEvent, datetime]] = {}
+        for event in self.events:
+            if not isinstance(event, ExpandedOccurrence) or not event.master.rrule_string:
+                continue
+            start = event.start.date_time
+            known = last_expanded.get(id(event.master))
+            if known is None or start > known[1]:
+                last_expanded[id(event.master)] = (event.master, start)
+        # Masters with no occurrence in the expansion window have none close enough to matter
+        self.series = [RecurringSeries(master, last) for master, last in last_expanded.values()]
+
+    def starting_after(self, instant: datetime) -> Iterator[Any]:
+        """Yield occurrences with start > instant in start order (indexed events first on ties)."""
+        streams: list[tuple[datetime, Iterator[Any]]] = [
+            (instant, self.events.starting_after(instant))
+        ]
+        streams.extend(
+            (max(instant, series.last_expanded), series.starting_after(instant))
+            for series in self.series
+        )
+        return _merge_lazily(streams)
+
+    def next_after(
+        self,
+        instant: datetime,
+        limit: int = 1,
+        where: Optional[Callable[[Any], bool]] = None,
+    ) -> list[Any]:
+        """Return the next ``limit`` occurrences starting after ``instant``.
+
+        Args:
+            instant: Point in time to search from
+            limit: Maximum number of occurrences to return
+            where: Optional predicate (e.g. to drop skipped meetings)
+
+        Returns:
+            Up to ``limit`` occurrences in start order
+        """
+        matches: Iterable[Any] = self.starting_after(instant)
+        if where is not None:
+            matches = filter(where, matches)
+        return list(islice(matches, max(0, limit)))
+
+    def covering(self, instant: datetime) -> list[Any]:
+        """Return occurrences in progress at ``instant`` (start <= instant < end)."""
+        found: list[Any] = self.events.covering(instant)
+        for series in self.series:
+            found.extend(series.overlapping(instant, instant))
+        return found
+
+    def overlapping(self, range_start: datetime, range_end: datetime) -> list[Any]:
+        """Return candidate occurrences for [range_start, range_end].
+
+        Same contract as EventWindow.overlapping(): timed occurrences with
+        start <= range_end and end > range_start, plus all-day and unindexed
+        events for the caller to match by calendar date. All-day events more
+        than ALL_DAY_MARGIN outside the range are left out.
+        """
+        found: list[Any] = [
+            e
+            for e in self.events.overlapping(range_start, range_end)
+            if not e.is_all_day or _near_range(e, range_start, range_end)
+        ]
+        for series in self.series:
+            if series.master.is_all_day:
+                found.extend(
+                    series.overlapping(range_start - ALL_DAY_MARGIN, range_end + ALL_DAY_MARGIN)
+                )
+            else:
+                found.extend(series.overlapping(range_start, range_end))
+        return found
+
+    def count_in_range(self, range_start: datetime, range_end: datetime) -> int:
+        """Count occurrences starting in [range_start, range_end)."""
+        count = 0
+        for occurrence in self.starting_after(range_start - timedelta.resolution):
+            if occurrence.start.date_time >= range_end:
+                break
+            count += 1
+        return count
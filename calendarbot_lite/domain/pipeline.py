@@ -20,6 +20,7 @@ Usage:
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional, Protocol
@@ -48,6 +49,7 @@ class ProcessingContext:
 
     # Processing state (modified by stages)
     raw_content: Optional[str] = None  # Raw ICS content
+    raw_stream: Optional[AsyncIterator[bytes]] = None  # Unread ICS body (streaming fetch)
     raw_components: list[Any] = field(default_factory=list)  # iCalendar components
     events: list[LiteCalendarEvent] = field(default_factory=list)  # Parsed events
 
@@ -370,14 +370,17 @@ class ParseStage:
     Wraps LiteICSParser to parse raw ICS content and populate context.events.
     """
 
-    def __init__(self, parser: Any) -> None:
+    def __init__(self, parser: Any, executor: Any = None) -> None:
         """Initialize parse stage.
 
         Args:
             parser: LiteICSParser instance
+            executor: Optional ParseExecutor that parses raw_content in a worker
+                process so the event loop keeps serving requests
         """
         self._name = "Parse"
         self.parser = parser
+        self.executor = executor
 
     @property
     def name(self) -> str:
@@ -385,10 +388,21 @@ class ParseStage:
         return self._name
 
     async def process(self, context: ProcessingContext) -> ProcessingResult:
-        """Parse ICS content from context.raw_content.
+        """Parse ICS content from context.raw_stream or context.raw_content.
+
+        A byte stream takes precedence: it is consumed chunk by chunk so parsing
+        overlaps with the download. When context.extra contains "fingerprint_state"
+        (None on a first parse), the stream or raw_content is parsed incrementally
+        and the key is updated with the state for the next refresh. With an
+        executor, raw_content is parsed in a worker process: the changed part of it
+        on the incremental path, which is the one the server's per-source refresh
+        always takes (the whole feed on a first parse), or all of it as
+        parse_ics_content_optimized() would for contexts without fingerprint state.
+        The parser's per-phase timings are stored in
+        context.extra["parse_phase_timings"].
 
         Args:
-            context: Processing context with raw_content
+            context: Processing context with raw_stream or raw_content
 
         Returns:
             Result with parsed events
@@ -399,15 +413,55 @@ class ParseStage:
         )
 
         try:
-            if not context.raw_content:
+            if context.raw_stream is not None and "fingerprint_state" in context.extra:
+                # Incremental over the stream: fingerprinted while it downloads
+                parse_result, next_state = await self.parser.parse_ics_stream_incremental(
+                    context.raw_stream,
+                    context.extra["fingerprint_state"],
+                    source_url=context.source_url,
+                )
+                context.extra["fingerprint_state"] = next_state
+                context.raw_stream = None
+            elif context.raw_stream is not None:
+                parse_result = await self.parser.parse_ics_stream(
+                    context.raw_stream, source_url=context.source_url
+                )
+                # The stream can only be consumed once
+                context.raw_stream = None
+            elif context.raw_content and "fingerprint_state" in context.extra:
+                # Incremental: reuse events of VEVENTs unchanged since the last refresh
+                if self.executor is not None:
+                    previous_state = context.extra["fingerprint_state"]
+                    plan = self.parser.prepare_incremental_parse(
+                        context.raw_content, previous_state
+                    )
+                    changed_result = await self.executor.parse(
+                        self.parser, plan.content_to_parse, source_url=context.source_url
+                    )
+                    parse_result, context.extra["fingerprint_state"] = (
+                        self.parser.complete_incremental_parse(plan, changed_result, previous_state)
+                    )
+                else:
+                    parse_result, context.extra["fingerprint_state"] = (
+                        self.parser.parse_ics_content_incremental(
+                            context.raw_content,
+                            context.extra["fingerprint_state"],
+                            source_url=context.source_url,
+                        )
+                    )
+            elif context.raw_content and self.executor is not None:
+                parse_result = await self.executor.parse(
+                    self.parser, context.raw_content, source_url=context.source_url, optimized=True
+                )
+            elif context.raw_content:
+                # Parse ICS content using existing parser
+                parse_result = self.parser.parse_ics_content_optimized(
+                    context.raw_content, source_url=context.source_url
+                )
+            else:
                 result.add_error("No raw ICS content to parse")
                 return result
 
-            # Parse ICS content using existing parser
-            parse_result = self.parser.parse_ics_content_optimized(
-                context.raw_content, source_url=context.source_url
-            )
-
             if not parse_result.success:
                 result.add_error(
                     f"ICS parsing failed: {parse_result.error_message or 'Unknown error'}"
@@ -424,6 +478,9 @@ class ParseStage:
                 "timezone": parse_result.timezone,
             }
 
+            # Per-phase parse timings, for the refresh's monitoring log
+            context.extra["parse_phase_timings"] = parse_result.phase_timings
+
             result.events = context.events
             result.events_out = len(context.events)
             result.success = True
@@ -434,9 +491,9 @@ class ParseStage:
                     result.add_warning(warning)
 
             logger.info(
-                "Parsed %s events from ICS content (%s bytes)",
+                "Parsed %s events from ICS content (%s)",
                 result.events_out,
-                len(context.raw_content),
+                f"{len(context.raw_content)} bytes" if context.raw_content else "streamed",
             )
 
             return result
@@ -677,6 +677,83 @@ async def test_fetcher_uses_default_browser_headers() -> None:
     assert captured_headers["User-Agent"] == _DEFAULT["User-Agent"]
 
 
+@pytest.mark.asyncio
+async def test_fetcher_when_conditional_headers_then_validators_sent_and_cache_relaxed() -> None:
+    """
+    Verify revalidation validators survive the browser header merge and that the
+    forced "no-cache" directive is relaxed so the origin can answer 304.
+    """
+    settings = SimpleNamespace(request_timeout=30, max_retries=1, retry_backoff_factor=1.0)
+    fetcher = LiteICSFetcher(settings)
+
+    captured: dict = {}
+
+    async def fake_get(*args, **kwargs):
+        captured["headers"] = dict(kwargs.get("headers") or {})
+        return SimpleNamespace(
+            status_code=304,
+            headers={"etag": '"v2"'},
+            text="",
+            content=b"",
+            raise_for_status=lambda: None,
+        )
+
+    mock_client = Mock()
+    mock_client.is_closed = False
+    mock_client.get = AsyncMock(side_effect=fake_get)
+    fetcher.client = mock_client
+
+    source = LiteICSSource(name="test", url="https://example.com/cal.ics")
+    conditional = fetcher.get_conditional_headers(
+        etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"
+    )
+
+    response = await fetcher.fetch_ics(source, conditional_headers=conditional)
+
+    assert response.success is True
+    assert response.is_not_modified is True
+    assert response.etag == '"v2"'
+    assert captured["headers"]["If-None-Match"] == '"v1"'
+    assert captured["headers"]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert captured["headers"]["Cache-Control"] == "max-age=0"
+
+
+@pytest.mark.asyncio
+async def test_fetcher_when_stream_mode_then_returns_unread_body_handle() -> None:
+    """
+    Verify stream=True returns a StreamHandle once headers arrive and that the body
+    is only read (chunk by chunk) when the caller iterates it.
+    """
+    from calendarbot_lite.calendar.lite_fetcher import StreamHandle
+
+    body = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/calendar", "etag": '"s1"'}, content=body
+        )
+
+    settings = SimpleNamespace(request_timeout=30, max_retries=0, retry_backoff_factor=1.0)
+    fetcher = LiteICSFetcher(settings)
+    fetcher.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    try:
+        source = LiteICSSource(name="test", url="https://example.com/cal.ics")
+        response = await fetcher.fetch_ics(source, stream=True)
+
+        assert response.success is True
+        assert response.content is None
+        assert response.stream_mode == "bytes"
+        assert response.etag == '"s1"'
+        assert isinstance(response.stream_handle, StreamHandle)
+
+        received = b"".join([chunk async for chunk in response.stream_handle.iter_bytes()])
+        assert received == body
+        assert response.stream_handle.bytes_read == len(body)
+    finally:
+        await fetcher.client.aclose()
+
+
 @pytest.mark.asyncio
 async def test_fetcher_with_immutable_settings() -> None:
     """
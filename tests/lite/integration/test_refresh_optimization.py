@@ -32,7 +32,8 @@ See /tmp/refresh_optimization_test_summary.md for complete documentation.
 
 import asyncio
 import datetime
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, ClassVar
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -331,6 +332,301 @@ class TestFetchAndParseSourceOptimization:
         pytest.skip("Full integration test implementation pending")
 
 
+class TestConditionalRevalidation:
+    """Integration tests for ETag/Last-Modified revalidation (HTTP 304)."""
+
+    @staticmethod
+    def _mock_fetcher(response: Any) -> MagicMock:
+        fetcher = MagicMock()
+        fetcher.__aenter__ = AsyncMock(return_value=fetcher)
+        fetcher.__aexit__ = AsyncMock(return_value=None)
+        fetcher.fetch_ics = AsyncMock(return_value=response)
+        fetcher.get_conditional_headers.side_effect = lambda etag=None, last_modified=None: {
+            k: v for k, v in (("If-None-Match", etag), ("If-Modified-Since", last_modified)) if v
+        }
+        return fetcher
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_not_modified_when_cached_then_reuses_events_without_parsing(
+        self, sample_event: LiteCalendarEvent
+    ) -> None:
+        """A 304 answer reuses cached events and reports the bytes not downloaded."""
+        from calendarbot_lite.calendar.lite_models import LiteICSResponse
+
+        source_url = "https://example.com/calendar.ics"
+        server_module._source_cache_metadata[source_url] = server_module.SourceCacheEntry(
+            content_hash="abc123",
+            last_fetch_success=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+            cached_events=[sample_event],
+            consecutive_failures=2,
+            etag='"v1"',
+            last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+            content_bytes=4096,
+        )
+        fetcher = self._mock_fetcher(LiteICSResponse(success=True, status_code=304, etag='"v2"'))
+
+        with (
+            patch("calendarbot_lite.calendar.lite_fetcher.LiteICSFetcher", return_value=fetcher),
+            patch("calendarbot_lite.calendar.lite_parser.LiteICSParser") as parser_cls,
+        ):
+            result = await server_module._fetch_and_parse_source(
+                asyncio.Semaphore(1),
+                {"name": "Test", "url": source_url},
+                {},
+                14,
+            )
+
+        assert result == (
+            "Test",
+            [sample_event],
+            {"not_modified": True, "bytes_saved": 4096},
+        )
+        _, kwargs = fetcher.fetch_ics.call_args
+        assert kwargs["conditional_headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        parser_cls.return_value.parse_ics_content.assert_not_called()
+
+        entry = server_module._source_cache_metadata[source_url]
+        assert entry.etag == '"v2"'
+        assert entry.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert entry.consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_first_fetch_when_no_cache_then_no_conditional_headers(self) -> None:
+        """Without cached events there is nothing to fall back on, so no validators are sent."""
+        from calendarbot_lite.calendar.lite_models import LiteICSResponse
+
+        fetcher = self._mock_fetcher(
+            LiteICSResponse(success=False, status_code=500, error_message="boom")
+        )
+
+        with patch("calendarbot_lite.calendar.lite_fetcher.LiteICSFetcher", return_value=fetcher):
+            result = await server_module._fetch_and_parse_source(
+                asyncio.Semaphore(1),
+                {"name": "Test", "url": "https://example.com/calendar.ics"},
+                {},
+                14,
+            )
+
+        assert result == []
+        _, kwargs = fetcher.fetch_ics.call_args
+        assert kwargs["conditional_headers"] is None
+
+
+class TestStreamingFetch:
+    """Integration tests for parsing ICS bodies while they download."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_streaming_fetch_when_enabled_then_parses_body_and_caches_hash(
+        self, sample_ics_content: str
+    ) -> None:
+        """Streamed bodies are parsed and cached with the same normalized hash as buffered ones."""
+        import httpx
+
+        body = sample_ics_content.encode("utf-8")
+        transport = httpx.MockTransport(
+            lambda _request: httpx.Response(
+                200, headers={"content-type": "text/calendar", "etag": '"s1"'}, content=body
+            )
+        )
+        source_url = "https://example.com/calendar.ics"
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch(
+                "calendarbot_lite.calendar.lite_fetcher.get_shared_client",
+                AsyncMock(return_value=client),
+            ):
+                result = await server_module._fetch_and_parse_source(
+                    asyncio.Semaphore(1),
+                    {"name": "Test", "url": source_url},
+                    {"streaming_fetch": True},
+                    14,
+                    shared_http_client=client,
+                )
+
+        assert isinstance(result, tuple)
+        name, events, metadata = result
+        assert name == "Test"
+        assert metadata == {"parsed": True, "streamed": True}
+        assert [e.subject for e in events] == ["Test Meeting"]
+
+        entry = server_module._source_cache_metadata[source_url]
+        assert entry.content_hash == server_module._compute_normalized_hash(sample_ics_content)
+        assert entry.content_bytes == len(body)
+        assert entry.etag == '"s1"'
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_streaming_fetch_when_feed_unchanged_then_cached_events_reused(
+        self, sample_ics_content: str
+    ) -> None:
+        """Streamed feeds store fingerprints, and an unchanged feed keeps its cached events."""
+        import httpx
+
+        body = sample_ics_content.encode("utf-8")
+        transport = httpx.MockTransport(
+            lambda _request: httpx.Response(
+                200, headers={"content-type": "text/calendar"}, content=body
+            )
+        )
+        source = {"name": "Test", "url": "https://example.com/calendar.ics"}
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch(
+                "calendarbot_lite.calendar.lite_fetcher.get_shared_client",
+                AsyncMock(return_value=client),
+            ):
+                results = [
+                    await server_module._fetch_and_parse_source(
+                        asyncio.Semaphore(1),
+                        source,
+                        {"streaming_fetch": True},
+                        14,
+                        shared_http_client=client,
+                    )
+                    for _ in range(2)
+                ]
+
+        first, second = results
+        assert isinstance(first, tuple)
+        assert isinstance(second, tuple)
+        assert first[2] == {"parsed": True, "streamed": True}
+        assert second[2] == {"hash_matched": True, "streamed": True}
+        entry = server_module._source_cache_metadata[source["url"]]
+        assert second[1] is entry.cached_events
+        assert second[1] == first[1]
+        assert entry.fingerprints is not None
+        assert set(entry.fingerprints.events_by_uid) == {e.id for e in first[1]}
+
+
+class TestParseExecutorPath:
+    """Integration tests for parsing buffered feeds in the parse worker pool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_refresh_when_parse_workers_configured_then_changed_vevents_sent(
+        self, sample_ics_content: str
+    ) -> None:
+        """The executor parses the whole feed first and only changed VEVENTs afterwards."""
+        from calendarbot_lite.calendar.lite_models import LiteICSResponse
+
+        second_event = (
+            "BEGIN:VEVENT\nUID:test-event-2@example.com\nSUMMARY:Review\n"
+            "DTSTART:20260216T100000Z\nDTEND:20260216T110000Z\nEND:VEVENT\n"
+        )
+        before = sample_ics_content.replace("END:VCALENDAR", second_event + "END:VCALENDAR")
+        after = before.replace("SUMMARY:Review", "SUMMARY:Review (moved)")
+        sent: list[str] = []
+
+        async def parse(parser: Any, content: str, source_url: Any = None, **kwargs: Any) -> Any:
+            sent.append(content)
+            return parser.parse_ics_content(content, source_url)
+
+        source = {"name": "Test", "url": "https://example.com/calendar.ics"}
+        results = []
+        with patch.object(server_module, "_parse_executor", SimpleNamespace(parse=parse)):
+            for content in (before, after):
+                fetcher = TestConditionalRevalidation._mock_fetcher(
+                    LiteICSResponse(success=True, status_code=200, content=content)
+                )
+                with patch(
+                    "calendarbot_lite.calendar.lite_fetcher.LiteICSFetcher", return_value=fetcher
+                ):
+                    results.append(
+                        await server_module._fetch_and_parse_source(
+                            asyncio.Semaphore(1), source, {}, 14
+                        )
+                    )
+
+        assert [r[2] for r in results] == [{"parsed": True}, {"parsed": True}]
+        assert sent[0] == before
+        assert "test-event-2@example.com" in sent[1]
+        assert "test-event-1@example.com" not in sent[1]
+        assert sorted(e.subject for e in results[1][1]) == ["Review (moved)", "Test Meeting"]
+
+
+class TestWarmStartCache:
+    """Integration tests for persisting the source cache and restoring it at startup."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_warm_start_when_cache_persisted_then_window_served_and_marked_stale(
+        self, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Persisted events are restored into an empty window and reported stale until refreshed."""
+        from calendarbot_lite.core.health_tracker import HealthTracker
+        from calendarbot_lite.domain.event_cache_store import EventCacheStore
+
+        monkeypatch.setattr(
+            server_module, "_event_cache_store", EventCacheStore(tmp_path / "events.json")
+        )
+        monkeypatch.setattr(server_module, "_health_tracker", HealthTracker())
+
+        source_url = "https://example.com/calendar.ics"
+        config = {"ics_sources": [{"name": "Test", "url": source_url}]}
+        start = server_module._now_utc() + datetime.timedelta(hours=2)
+        event = LiteCalendarEvent(
+            id="upcoming@example.com",
+            subject="Upcoming",
+            start=LiteDateTimeInfo(date_time=start, time_zone="UTC"),
+            end=LiteDateTimeInfo(date_time=start + datetime.timedelta(hours=1), time_zone="UTC"),
+        )
+        server_module._source_cache_metadata[source_url] = server_module.SourceCacheEntry(
+            content_hash="hash1",
+            last_fetch_success=datetime.datetime.now(datetime.UTC),
+            cached_events=[event],
+            etag='"v1"',
+        )
+        await server_module._persist_event_cache(config)
+
+        # Simulate a restart: empty in-memory cache and window
+        server_module._source_cache_metadata.clear()
+        event_window_ref: list[tuple[LiteCalendarEvent, ...]] = [()]
+
+        count = await server_module._warm_start_from_disk(
+            config, None, event_window_ref, asyncio.Lock()
+        )
+
+        assert count == 1
+        assert [e.id for e in event_window_ref[0]] == ["upcoming@example.com"]
+        assert server_module._source_cache_metadata[source_url].etag == '"v1"'
+        status = server_module._health_tracker.get_warm_start_status()
+        assert status["warm_started"] is True
+        assert status["stale"] is True
+
+        server_module._health_tracker.record_source_success(source_url)
+        assert server_module._health_tracker.get_warm_start_status()["stale"] is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_warm_start_when_cache_file_corrupt_then_cold_start(
+        self, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A corrupt cache file leaves the window empty instead of failing startup."""
+        from calendarbot_lite.domain.event_cache_store import EventCacheStore
+
+        path = tmp_path / "events.json"
+        path.write_text("{truncated", encoding="utf-8")
+        monkeypatch.setattr(server_module, "_event_cache_store", EventCacheStore(path))
+        event_window_ref: list[tuple[LiteCalendarEvent, ...]] = [()]
+
+        count = await server_module._warm_start_from_disk(
+            {"ics_sources": ["https://example.com/calendar.ics"]},
+            None,
+            event_window_ref,
+            asyncio.Lock(),
+        )
+
+        assert count == 0
+        assert event_window_ref[0] == ()
+        assert server_module._source_cache_metadata == {}
+
+
 # =============================================================================
 # Phase 4 Tests (Error Handling)
 # =============================================================================
@@ -803,6 +1099,334 @@ class TestRefreshOptimizationErrorHandling:
         assert server_module._event_window[0][1].id == "event2@example.com"
 
 
+class TestMemoryBudget:
+    """Integration tests for refreshes that do not fit the memory budget."""
+
+    @pytest.fixture
+    def tight_governor(self) -> Any:
+        from calendarbot_lite.core.memory_budget import MemoryBudgetGovernor
+
+        original = server_module._memory_governor
+        server_module._memory_governor = MemoryBudgetGovernor(0.001, metrics_provider=dict)
+        yield server_module._memory_governor
+        server_module._memory_governor = original
+
+    @staticmethod
+    def _cache(source_url: str, sample_event: LiteCalendarEvent) -> None:
+        server_module._source_cache_metadata[source_url] = server_module.SourceCacheEntry(
+            content_hash="stale",
+            last_fetch_success=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+            cached_events=[sample_event],
+            content_bytes=4096,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_feed_when_too_large_for_budget_then_cached_events_kept(
+        self, tight_governor: Any, sample_ics_content: str, sample_event: LiteCalendarEvent
+    ) -> None:
+        """A changed feed that does not fit the budget keeps the cached events unparsed."""
+        from calendarbot_lite.calendar.lite_models import LiteICSResponse
+
+        source_url = "https://example.com/calendar.ics"
+        self._cache(source_url, sample_event)
+        fetcher = TestConditionalRevalidation._mock_fetcher(
+            LiteICSResponse(success=True, status_code=200, content=sample_ics_content)
+        )
+
+        with (
+            patch("calendarbot_lite.calendar.lite_fetcher.LiteICSFetcher", return_value=fetcher),
+            patch("calendarbot_lite.calendar.lite_parser.LiteICSParser") as parser_cls,
+        ):
+            result = await server_module._fetch_and_parse_source(
+                asyncio.Semaphore(1), {"name": "Test", "url": source_url}, {}, 14
+            )
+
+        assert result == ("Test", [sample_event], {"memory_deferred": True})
+        parser_cls.assert_not_called()
+        assert tight_governor.in_flight_mb == 0
+        assert server_module._source_cache_metadata[source_url].content_hash == "stale"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_plan_when_budget_exhausted_then_sources_kept_without_fetching(
+        self, tight_governor: Any, sample_event: LiteCalendarEvent
+    ) -> None:
+        """A refresh planned with no headroom keeps cached sources without fetching them."""
+        source_url = "https://example.com/calendar.ics"
+        self._cache(source_url, sample_event)
+        sources = [{"name": "Test", "url": source_url}]
+
+        concurrency, keep_cached = server_module._plan_refresh_memory(sources, 4)
+        with patch("calendarbot_lite.calendar.lite_fetcher.LiteICSFetcher") as fetcher_cls:
+            result = await server_module._fetch_and_parse_source(
+                asyncio.Semaphore(1), sources[0], {}, 14, keep_cached=keep_cached
+            )
+
+        assert (concurrency, keep_cached) == (1, True)
+        assert result == ("Test", [sample_event], {"memory_deferred": True})
+        fetcher_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_refresh_when_memory_deferred_then_source_reported_stale(
+        self, sample_event: LiteCalendarEvent
+    ) -> None:
+        """Cached events kept under memory pressure do not count as a successful fetch."""
+        source = {"name": "Test", "url": "https://example.com/calendar.ics"}
+        server_module._health_tracker.record_source_success(source["url"])
+
+        async def fetch(*args: Any, **kwargs: Any) -> Any:
+            return ("Test", [sample_event], {"memory_deferred": True})
+
+        with patch.object(server_module, "_fetch_and_parse_source", side_effect=fetch):
+            await server_module._refresh_once({"ics_sources": [source]}, None, [()], asyncio.Lock())
+
+        (status,) = server_module._health_tracker.get_source_status()
+        assert status["stale"] is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_plan_when_serialized_then_unchanged_feed_still_reused(
+        self, sample_ics_content: str, sample_event: LiteCalendarEvent
+    ) -> None:
+        """A degraded refresh still revalidates and reuses the events of an unchanged feed."""
+        from calendarbot_lite.calendar.lite_models import LiteICSResponse
+        from calendarbot_lite.core.memory_budget import MemoryBudgetGovernor
+
+        sources = [
+            {"name": "Test", "url": "https://example.com/calendar.ics"},
+            {"name": "Other", "url": "https://example.com/other.ics"},
+        ]
+        for source in sources:
+            server_module._source_cache_metadata[source["url"]] = server_module.SourceCacheEntry(
+                content_hash=server_module._compute_normalized_hash(sample_ics_content),
+                last_fetch_success=datetime.datetime.now(datetime.UTC),
+                cached_events=[sample_event],
+                etag='"v1"',
+                content_bytes=4096,
+            )
+        fetcher = TestConditionalRevalidation._mock_fetcher(
+            LiteICSResponse(success=True, status_code=200, content=sample_ics_content)
+        )
+
+        # One 4 KB feed (~0.03 MB) fits the budget, two side by side do not
+        with (
+            patch.object(
+                server_module, "_memory_governor", MemoryBudgetGovernor(0.05, metrics_provider=dict)
+            ),
+            patch("calendarbot_lite.calendar.lite_fetcher.LiteICSFetcher", return_value=fetcher),
+        ):
+            concurrency, keep_cached = server_module._plan_refresh_memory(sources, 2)
+            result = await server_module._fetch_and_parse_source(
+                asyncio.Semaphore(concurrency), sources[0], {}, 14, keep_cached=keep_cached
+            )
+
+        assert (concurrency, keep_cached) == (1, False)
+        assert result == ("Test", [sample_event], {"hash_matched": True})
+        _, kwargs = fetcher.fetch_ics.call_args
+        assert kwargs["conditional_headers"] is not None
+
+
+class TestProgressiveRefresh:
+    """Integration tests for sources that refresh (and publish) independently."""
+
+    SOURCES: ClassVar[list[dict[str, str]]] = [
+        {"name": "Fast", "url": "https://fast.example/cal.ics"},
+        {"name": "Slow", "url": "https://slow.example/cal.ics"},
+    ]
+
+    @staticmethod
+    def _upcoming(sample_event: LiteCalendarEvent, event_id: str, hours: int) -> LiteCalendarEvent:
+        start = datetime.datetime.now(datetime.UTC) + datetime.timedelta(hours=hours)
+        return sample_event.model_copy(
+            update={
+                "id": event_id,
+                "start": LiteDateTimeInfo(date_time=start, time_zone="UTC"),
+                "end": LiteDateTimeInfo(
+                    date_time=start + datetime.timedelta(hours=1), time_zone="UTC"
+                ),
+            }
+        )
+
+    def _cache_slow_source(self, event: LiteCalendarEvent) -> None:
+        server_module._source_cache_metadata[self.SOURCES[1]["url"]] = (
+            server_module.SourceCacheEntry(
+                content_hash="slow",
+                last_fetch_success=datetime.datetime.now(datetime.UTC),
+                cached_events=[event],
+            )
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_refresh_when_one_source_slow_then_others_published_first(
+        self, sample_event: LiteCalendarEvent
+    ) -> None:
+        """A fast source's events are published next to the slow source's cached events."""
+        fast = self._upcoming(sample_event, "fast", 1)
+        slow_cached = self._upcoming(sample_event, "slow-cached", 2)
+        slow_fresh = self._upcoming(sample_event, "slow-fresh", 3)
+        self._cache_slow_source(slow_cached)
+        release_slow = asyncio.Event()
+
+        async def fetch(semaphore: Any, src_cfg: Any, *args: Any, **kwargs: Any) -> Any:
+            if src_cfg["name"] == "Slow":
+                await release_slow.wait()
+                return ("Slow", [slow_fresh], {"parsed": True})
+            return ("Fast", [fast], {"parsed": True})
+
+        event_window_ref: list[Any] = [(self._upcoming(sample_event, "old", 1),)]
+        config = {"ics_sources": self.SOURCES, "fetch_concurrency": 2}
+        with patch.object(server_module, "_fetch_and_parse_source", side_effect=fetch):
+            refresh = asyncio.create_task(
+                server_module._refresh_once(config, None, event_window_ref, asyncio.Lock())
+            )
+            for _ in range(100):
+                if any(e.id == "fast" for e in event_window_ref[0]):
+                    break
+                await asyncio.sleep(0.01)
+
+            assert {e.id for e in event_window_ref[0]} == {"fast", "slow-cached"}
+            assert not refresh.done()
+
+            release_slow.set()
+            await refresh
+
+        assert {e.id for e in event_window_ref[0]} == {"fast", "slow-fresh"}
+        status = server_module._health_tracker.get_source_status()
+        assert {s["name"] for s in status} == {"Fast", "Slow"}
+        assert not any(s["stale"] for s in status)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_refresh_when_window_size_limited_then_occurrence_query_sees_all_events(
+        self, sample_event: LiteCalendarEvent
+    ) -> None:
+        """The published occurrence query covers events cut by event_window_size."""
+        events = [self._upcoming(sample_event, f"meeting-{hours}", hours) for hours in (1, 2, 3)]
+
+        async def fetch(semaphore: Any, src_cfg: Any, *args: Any, **kwargs: Any) -> Any:
+            if src_cfg["name"] == "Slow":
+                return ("Slow", events[1:], {"parsed": True})
+            return ("Fast", events[:1], {"parsed": True})
+
+        event_window_ref: list[Any] = [()]
+        config = {"ics_sources": self.SOURCES, "fetch_concurrency": 2, "event_window_size": 1}
+        with patch.object(server_module, "_fetch_and_parse_source", side_effect=fetch):
+            await server_module._refresh_once(config, None, event_window_ref, asyncio.Lock())
+
+        window = event_window_ref[0]
+        assert [e.id for e in window] == ["meeting-1"]
+        assert window.occurrences is not None
+        upcoming = window.occurrences.next_after(server_module._now_utc(), limit=5)
+        assert [e.id for e in upcoming] == ["meeting-1", "meeting-2", "meeting-3"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_refresh_when_one_source_slow_and_one_failing_then_failing_served_stale(
+        self, sample_event: LiteCalendarEvent
+    ) -> None:
+        """A failed source keeps its cached events in partial and final windows alike."""
+        fast = self._upcoming(sample_event, "fast", 1)
+        failing_cached = self._upcoming(sample_event, "failing-cached", 2)
+        slow_cached = self._upcoming(sample_event, "slow-cached", 3)
+        slow_fresh = self._upcoming(sample_event, "slow-fresh", 4)
+        self._cache_slow_source(slow_cached)
+        failing = {"name": "Failing", "url": "https://failing.example/cal.ics"}
+        server_module._source_cache_metadata[failing["url"]] = server_module.SourceCacheEntry(
+            content_hash="failing",
+            last_fetch_success=datetime.datetime.now(datetime.UTC),
+            cached_events=[failing_cached],
+        )
+        release_slow = asyncio.Event()
+
+        async def fetch(semaphore: Any, src_cfg: Any, *args: Any, **kwargs: Any) -> Any:
+            if src_cfg["name"] == "Slow":
+                await release_slow.wait()
+                return ("Slow", [slow_fresh], {"parsed": True})
+            if src_cfg["name"] == "Failing":
+                return []  # Fetch or parse error, logged and swallowed
+            return ("Fast", [fast], {"parsed": True})
+
+        event_window_ref: list[Any] = [()]
+        config = {"ics_sources": [*self.SOURCES, failing], "fetch_concurrency": 3}
+        with patch.object(server_module, "_fetch_and_parse_source", side_effect=fetch):
+            refresh = asyncio.create_task(
+                server_module._refresh_once(config, None, event_window_ref, asyncio.Lock())
+            )
+            for _ in range(100):
+                if any(e.id == "fast" for e in event_window_ref[0]):
+                    break
+                await asyncio.sleep(0.01)
+
+            assert {e.id for e in event_window_ref[0]} == {"fast", "failing-cached", "slow-cached"}
+
+            release_slow.set()
+            await refresh
+
+        assert {e.id for e in event_window_ref[0]} == {"fast", "failing-cached", "slow-fresh"}
+        status = {s["name"]: s for s in server_module._health_tracker.get_source_status()}
+        assert status["Failing"]["stale"] is True
+        assert status["Failing"]["consecutive_failures"] == 1
+        assert status["Fast"]["stale"] is False
+        assert status["Slow"]["stale"] is False
+        assert status["Slow"]["last_latency_ms"] >= status["Fast"]["last_latency_ms"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_refresh_when_source_hangs_then_times_out_and_served_stale(
+        self, sample_event: LiteCalendarEvent, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A hung source no longer fails the whole refresh; its cached events stay, marked stale."""
+        fast = self._upcoming(sample_event, "fast", 1)
+        slow_cached = self._upcoming(sample_event, "slow-cached", 2)
+        self._cache_slow_source(slow_cached)
+        monkeypatch.setattr(server_module, "SOURCE_REFRESH_TIMEOUT_S", 0.05)
+
+        async def fetch(semaphore: Any, src_cfg: Any, *args: Any, **kwargs: Any) -> Any:
+            if src_cfg["name"] == "Slow":
+                await asyncio.sleep(3600)
+            return ("Fast", [fast], {"parsed": True})
+
+        event_window_ref: list[Any] = [()]
+        config = {"ics_sources": self.SOURCES, "fetch_concurrency": 2}
+        with patch.object(server_module, "_fetch_and_parse_source", side_effect=fetch):
+            await server_module._refresh_once(config, None, event_window_ref, asyncio.Lock())
+
+        assert {e.id for e in event_window_ref[0]} == {"fast", "slow-cached"}
+        status = {s["name"]: s for s in server_module._health_tracker.get_source_status()}
+        assert status["Fast"]["stale"] is False
+        assert status["Slow"]["stale"] is True
+        assert status["Slow"]["consecutive_failures"] == 1
+        assert status["Slow"]["last_latency_ms"] == 50
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("setup_cache")
+    async def test_refresh_when_sources_queued_then_latency_excludes_wait(
+        self, sample_event: LiteCalendarEvent
+    ) -> None:
+        """A source waiting for a free slot is not charged for the sources ahead of it."""
+        fast = self._upcoming(sample_event, "fast", 1)
+
+        async def fetch(
+            semaphore: Any, src_cfg: Any, *args: Any, on_start: Any = None, **kwargs: Any
+        ) -> Any:
+            async with semaphore:
+                on_start()
+                await asyncio.sleep(0.1)
+                return (src_cfg["name"], [fast], {"parsed": True})
+
+        config = {"ics_sources": self.SOURCES, "fetch_concurrency": 1}
+        with patch.object(server_module, "_fetch_and_parse_source", side_effect=fetch):
+            await server_module._refresh_once(config, None, [()], asyncio.Lock())
+
+        status = {s["name"]: s for s in server_module._health_tracker.get_source_status()}
+        # The second source waited ~100 ms for the first one and then ran ~100 ms
+        assert 100 <= status["Fast"]["last_latency_ms"] < 190
+        assert 100 <= status["Slow"]["last_latency_ms"] < 190
+
+
 # =============================================================================
 # Performance Validation Tests
 # =============================================================================
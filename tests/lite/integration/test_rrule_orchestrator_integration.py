@@ -62,7 +62,7 @@ def test_rrule_orchestrator_expands_recurring_events(tmp_path):
     assert len(events) == 3, f"Expected 3 expanded instances from FREQ=DAILY;COUNT=3, got {len(events)}"
 
     # All events should be based on the same base UID (test-rrule-1)
-    # The parser appends occurrence time + hash for uniqueness: test-rrule-1_20251101T090000_<hash>
+    # The parser appends the occurrence's UTC start: test-rrule-1_20251101T090000Z
     base_uid = "test-rrule-1"
     for event in events:
         assert event.id.startswith(base_uid), f"Expected ID to start with '{base_uid}', got {event.id}"
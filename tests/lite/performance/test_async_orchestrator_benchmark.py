@@ -0,0 +1,64 @@
+"""Benchmark for run_coroutine_from_sync on the persistent worker loop.
+
+RRULE expansion calls run_coroutine_from_sync once per expansion pass. This
+compares the per-call overhead of the persistent worker loop against the
+previous pattern of a one-off thread plus a new event loop for every call.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from calendarbot_lite.core.async_utils import AsyncOrchestrator
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+BENCHMARK_CALLS = 500
+
+
+async def _tiny_expansion() -> int:
+    await asyncio.sleep(0)
+    return 1
+
+
+def _per_call_thread_and_loop(coro_func) -> int:
+    """The pre-worker pattern: a fresh thread and event loop for every call."""
+
+    def run_in_new_loop() -> int:
+        new_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(new_loop)
+        try:
+            return new_loop.run_until_complete(coro_func())
+        finally:
+            new_loop.close()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_in_new_loop).result()
+
+
+def test_run_coroutine_from_sync_when_benchmarked_then_faster_than_per_call_loop() -> None:
+    """Submitting to the persistent worker beats creating a thread and loop per call."""
+    orchestrator = AsyncOrchestrator()
+    orchestrator.run_coroutine_from_sync(_tiny_expansion)  # start the worker
+
+    try:
+        start = time.perf_counter()
+        for _ in range(BENCHMARK_CALLS):
+            orchestrator.run_coroutine_from_sync(_tiny_expansion)
+        worker_s = time.perf_counter() - start
+    finally:
+        asyncio.run(orchestrator.shutdown())
+
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_CALLS):
+        _per_call_thread_and_loop(_tiny_expansion)
+    per_call_s = time.perf_counter() - start
+
+    speedup = per_call_s / worker_s
+    print(
+        f"\n{BENCHMARK_CALLS} calls: persistent worker {worker_s * 1000:.1f}ms, "
+        f"per-call thread+loop {per_call_s * 1000:.1f}ms ({speedup:.1f}x)"
+    )
+    assert speedup > 1.5, f"persistent worker only {speedup:.1f}x faster than per-call loop"
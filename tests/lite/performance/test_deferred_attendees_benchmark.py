@@ -0,0 +1,103 @@
+"""Benchmark for deferring attendee decoding until an endpoint reads attendees.
+
+Parses a 5,000-event meeting feed (a dozen attendees per event from a shared
+team, descriptions with meeting links) through the streaming tokenizer and
+the event mapper, as a refresh does, then decodes every event's attendees as
+an eager parse would have. Reports the parse time and the memory retained by
+the events before and after decoding.
+"""
+
+import gc
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from calendarbot_lite.calendar.lite_attendee_parser import _parse_attendee_line
+from calendarbot_lite.calendar.lite_intern import InternTable
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_streaming_parser import LiteStreamingICSParser
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+EVENTS = 5000
+ATTENDEES_PER_EVENT = 12
+TEAM = [(f"Member {i}", f"member{i}@example.com") for i in range(40)]
+START = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+
+
+def _feed() -> str:
+    blocks = []
+    for i in range(EVENTS):
+        start = START + timedelta(hours=i)
+        team = TEAM[i % 28 : i % 28 + ATTENDEES_PER_EVENT]
+        blocks.append(
+            "BEGIN:VEVENT\r\n"
+            f"UID:meeting-{i}@example.com\r\n"
+            f"DTSTART:{start:%Y%m%dT%H%M%S}Z\r\n"
+            f"DTEND:{start + timedelta(minutes=30):%Y%m%dT%H%M%S}Z\r\n"
+            f"SUMMARY:Meeting {i}\r\n"
+            f"DESCRIPTION:Agenda for meeting {i}: review the numbers\\, plan next steps. "
+            f"Join https://teams.microsoft.com/l/meetup-join/{i % 50}\r\n"
+            f"LOCATION:Room {i % 12}\r\n"
+            "ORGANIZER;CN=Owner:mailto:owner@example.com\r\n"
+            + "".join(
+                f"ATTENDEE;CN={name};ROLE=REQ-PARTICIPANT;PARTSTAT=ACCEPTED;RSVP=TRUE:"
+                f"mailto:{email}\r\n"
+                for name, email in team
+            )
+            + "END:VEVENT\r\n"
+        )
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+        + "".join(blocks)
+        + "END:VCALENDAR\r\n"
+    )
+
+
+def _parse(parser: LiteICSParser, feed: str) -> list:
+    intern_table = InternTable()
+    return [
+        parser._parse_event_component(item["component"], None, intern_table)
+        for item in LiteStreamingICSParser().parse_stream(feed)
+        if item["type"] == "event"
+    ]
+
+
+def test_deferred_attendees_when_parsing_large_feed_then_decoded_only_on_read() -> None:
+    feed = _feed()
+    parser = LiteICSParser(SimpleNamespace())
+
+    parse_seconds = min(_timed(lambda: _parse(parser, feed)) for _ in range(3))
+
+    events = _parse(parser, feed)
+    _parse_attendee_line.cache_clear()
+    decode_seconds = _timed(lambda: [list(event.attendees or []) for event in events])
+
+    _parse_attendee_line.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    events = _parse(parser, feed)
+    gc.collect()
+    deferred_bytes, _ = tracemalloc.get_traced_memory()
+    decoded = sum(len(event.attendees or []) for event in events)
+    gc.collect()
+    decoded_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(events) == EVENTS
+    assert decoded == EVENTS * ATTENDEES_PER_EVENT
+    print(
+        f"\n{EVENTS} events: parsed in {parse_seconds:.2f}s, decoding every event's "
+        f"attendees adds {decode_seconds:.2f}s; retained {deferred_bytes / 1024:.0f} KiB "
+        f"deferred, {decoded_bytes / 1024:.0f} KiB once all attendees are decoded"
+    )
+    assert decoded_bytes > deferred_bytes
+
+
+def _timed(func) -> float:  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
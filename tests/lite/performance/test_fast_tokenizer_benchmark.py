@@ -0,0 +1,102 @@
+"""Benchmark and equivalence check for the fast VEVENT tokenizer.
+
+Runs every VEVENT in the tests/fixtures/ics corpus through both the fast
+tokenizer and icalendar, checks that the component mapper produces identical
+LiteCalendarEvent fields from either, and compares tokenization time.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+from icalendar import Calendar
+
+from calendarbot_lite.calendar.lite_attendee_parser import LiteAttendeeParser
+from calendarbot_lite.calendar.lite_datetime_utils import LiteDateTimeParser
+from calendarbot_lite.calendar.lite_event_parser import LiteEventComponentParser
+from calendarbot_lite.calendar.lite_fast_tokenizer import parse_vevent_lines
+from calendarbot_lite.calendar.lite_streaming_parser import LiteStreamingICSParser
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures" / "ics"
+BENCHMARK_ROUNDS = 30
+
+
+class _EventLineCollector(LiteStreamingICSParser):
+    """Streaming parser that records unfolded VEVENT lines instead of parsing them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.blocks: list[list[str]] = []
+
+    def _parse_complete_event(self):
+        self.blocks.append(list(self._current_event_lines))
+        return iter(())
+
+
+def _icalendar_component(lines: list[str]):
+    """Parse event lines exactly like the streaming parser's icalendar path."""
+    event_ics = "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:CalendarBot-Lite-Streaming\n"
+    event_ics += "\n".join(lines) + "\nEND:VCALENDAR\n"
+    return next(c for c in Calendar.from_ical(event_ics).walk() if c.name == "VEVENT")
+
+
+@pytest.fixture(scope="module")
+def corpus_blocks() -> list[list[str]]:
+    """Unfolded VEVENT line blocks from every fixture calendar."""
+    blocks: list[list[str]] = []
+    for path in sorted(FIXTURES_DIR.rglob("*.ics")):
+        collector = _EventLineCollector()
+        list(collector.parse_stream(path.read_text(encoding="utf-8")))
+        blocks.extend(collector.blocks)
+    assert blocks, f"no VEVENTs found under {FIXTURES_DIR}"
+    return blocks
+
+
+def test_fast_tokenizer_when_fixture_corpus_then_fields_match_icalendar(corpus_blocks) -> None:
+    """Every event the fast path accepts maps to identical fields and RRULE metadata."""
+    mapper = LiteEventComponentParser(LiteDateTimeParser(), LiteAttendeeParser())
+    fast_count = 0
+
+    for lines in corpus_blocks:
+        fast = parse_vevent_lines(lines)
+        if fast is None:
+            continue
+        fast_count += 1
+
+        actual = mapper.parse_event_component(fast, "America/Los_Angeles")
+        expected = mapper.parse_event_component(_icalendar_component(lines), "America/Los_Angeles")
+
+        assert actual is not None, lines
+        assert expected is not None, lines
+        assert actual.model_dump() == expected.model_dump(), lines
+        assert actual.__dict__.get("rrule_string") == expected.__dict__.get("rrule_string")
+        assert actual.__dict__.get("exdates") == expected.__dict__.get("exdates")
+
+    # Every non-recurring fixture event should take the fast path
+    assert fast_count >= len(corpus_blocks) // 3
+
+
+def test_fast_tokenizer_when_benchmarked_then_faster_than_icalendar(corpus_blocks) -> None:
+    """Tokenizing the fast-path events beats rebuilding a VCALENDAR for icalendar."""
+    fast_blocks = [lines for lines in corpus_blocks if parse_vevent_lines(lines) is not None]
+
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_ROUNDS):
+        for lines in fast_blocks:
+            parse_vevent_lines(lines)
+    fast_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_ROUNDS):
+        for lines in fast_blocks:
+            _icalendar_component(lines)
+    icalendar_s = time.perf_counter() - start
+
+    speedup = icalendar_s / fast_s
+    print(
+        f"\n{len(fast_blocks) * BENCHMARK_ROUNDS} events: fast tokenizer {fast_s * 1000:.1f}ms, "
+        f"icalendar {icalendar_s * 1000:.1f}ms ({speedup:.1f}x)"
+    )
+    assert speedup > 2, f"fast tokenizer only {speedup:.1f}x faster than icalendar"
@@ -0,0 +1,93 @@
+"""Benchmark for indexing huge ICS feeds before parsing them.
+
+Parses an archive calendar above the streaming threshold (eight years of past
+meetings plus a few weeks of upcoming ones) with a parse window, once with the
+index pass selecting the VEVENTs to tokenize and once with every VEVENT going
+through the tokenizer to be dropped there, and checks both give the same
+events.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_streaming_parser import STREAMING_THRESHOLD
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+PAST_DAYS = 8 * 365
+FUTURE_DAYS = 30
+EVENTS_PER_DAY = 10
+
+
+class WindowSettings:
+    enable_rrule_expansion = True
+    rrule_expansion_days = 14
+    expansion_days_window = 365
+    parse_window_lookback_days = 1
+
+
+def _feed() -> str:
+    blocks = []
+    for day in range(-PAST_DAYS, FUTURE_DAYS):
+        for slot in range(EVENTS_PER_DAY):
+            start = NOW + timedelta(days=day, hours=slot - 4)
+            blocks.append(
+                "BEGIN:VEVENT\r\n"
+                f"UID:meeting-{day}-{slot}@example.com\r\n"
+                f"DTSTART;TZID=Europe/Berlin:{start:%Y%m%dT%H%M%S}\r\n"
+                f"DTEND;TZID=Europe/Berlin:{start + timedelta(minutes=45):%Y%m%dT%H%M%S}\r\n"
+                f"SUMMARY:Meeting {day}/{slot}\r\n"
+                "DESCRIPTION:Agenda: review the numbers and plan the next steps\r\n"
+                "LOCATION:Room 4\r\n"
+                "ORGANIZER;CN=Owner:mailto:owner@example.com\r\n"
+                "ATTENDEE;CN=Ann;PARTSTAT=ACCEPTED:mailto:ann@example.com\r\n"
+                "ATTENDEE;CN=Bob;PARTSTAT=TENTATIVE:mailto:bob@example.com\r\n"
+                "BEGIN:VALARM\r\nACTION:DISPLAY\r\nTRIGGER:-PT15M\r\nEND:VALARM\r\n"
+                "END:VEVENT\r\n"
+            )
+    blocks.append(
+        "BEGIN:VEVENT\r\nUID:standup@example.com\r\n"
+        f"DTSTART:{NOW - timedelta(days=PAST_DAYS):%Y%m%dT%H%M%S}Z\r\n"
+        "DURATION:PT15M\r\nRRULE:FREQ=DAILY\r\nSUMMARY:Standup\r\nEND:VEVENT\r\n"
+    )
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+        + "".join(blocks)
+        + "END:VCALENDAR\r\n"
+    )
+
+
+def test_indexed_parse_when_archive_feed_then_faster_with_same_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The index pass keeps history out of the tokenizer altogether."""
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", NOW.isoformat())
+    feed = _feed()
+    assert len(feed.encode("utf-8")) >= STREAMING_THRESHOLD
+
+    parser = LiteICSParser(WindowSettings())
+    start = time.perf_counter()
+    indexed = parser.parse_ics_content(feed)
+    indexed_s = time.perf_counter() - start
+    index_ms = indexed.phase_timings["index"]["ms"]
+
+    monkeypatch.setattr(parser, "_select_window_events", lambda content, _window: (content, 0))
+    start = time.perf_counter()
+    tokenized = parser.parse_ics_content(feed)
+    tokenized_s = time.perf_counter() - start
+
+    assert indexed.success
+    assert tokenized.success
+    assert sorted(e.id for e in indexed.events) == sorted(e.id for e in tokenized.events)
+    speedup = tokenized_s / indexed_s
+    print(
+        f"\n{len(feed) / 1024 / 1024:.1f} MB, {(PAST_DAYS + FUTURE_DAYS) * EVENTS_PER_DAY} "
+        f"events ({indexed.event_count} parsed): tokenizer filtering "
+        f"{tokenized_s * 1000:.0f}ms, indexed {indexed_s * 1000:.0f}ms "
+        f"(index pass {index_ms:.0f}ms, {speedup:.1f}x)"
+    )
+    assert speedup > 1.5, f"indexed parse only {speedup:.1f}x faster"
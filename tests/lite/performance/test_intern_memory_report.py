@@ -0,0 +1,97 @@
+"""Memory report for per-refresh interning of repeated event fields.
+
+Parses a large recurring feed (weekly series with RECURRENCE-ID overrides,
+shared rooms, team attendees and meeting links) with and without an
+InternTable and compares the memory retained by the parsed events.
+"""
+
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from icalendar import Calendar
+
+from calendarbot_lite.calendar.lite_intern import InternTable
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+SERIES = 300
+OVERRIDES_PER_SERIES = 6
+ATTENDEES_PER_EVENT = 8
+TEAM = [(f"Member {i}", f"member{i}@example.com") for i in range(24)]
+ROOMS = [f"Building 2 - Room {i:03d}" for i in range(12)]
+
+
+def _recurring_feed() -> str:
+    """Build weekly series, each followed by its RECURRENCE-ID overrides."""
+    base = datetime(2025, 11, 3, 9, 0)
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Test//EN"]
+    for s in range(SERIES):
+        uid = f"series-{s}@example.com"
+        start = base + timedelta(days=s % 5, minutes=30 * (s % 12))
+        body = [
+            f"SUMMARY:Project {s % 40} weekly sync",
+            f"LOCATION:{ROOMS[s % len(ROOMS)]}",
+            f"DESCRIPTION:Join: https://teams.microsoft.com/l/meetup-join/project-{s % 40}",
+        ]
+        body += [
+            f"ATTENDEE;CN={name};PARTSTAT=ACCEPTED:mailto:{email}"
+            for name, email in TEAM[s % 16 : s % 16 + ATTENDEES_PER_EVENT]
+        ]
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid}",
+            f"DTSTART;TZID=America/New_York:{start:%Y%m%dT%H%M%S}",
+            f"DTEND;TZID=America/New_York:{start + timedelta(minutes=30):%Y%m%dT%H%M%S}",
+            "RRULE:FREQ=WEEKLY;INTERVAL=1",
+            *body,
+            "END:VEVENT",
+        ]
+        for week in range(1, OVERRIDES_PER_SERIES + 1):
+            slot = start + timedelta(weeks=week)
+            moved = slot + timedelta(hours=1)
+            lines += [
+                "BEGIN:VEVENT",
+                f"UID:{uid}",
+                f"RECURRENCE-ID;TZID=America/New_York:{slot:%Y%m%dT%H%M%S}",
+                f"DTSTART;TZID=America/New_York:{moved:%Y%m%dT%H%M%S}",
+                f"DTEND;TZID=America/New_York:{moved + timedelta(minutes=30):%Y%m%dT%H%M%S}",
+                *body,
+                "END:VEVENT",
+            ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _retained_bytes(parser, components, intern_table) -> tuple[int, list]:
+    """Parse every component and return the bytes still allocated (table included)."""
+    gc.collect()
+    tracemalloc.start()
+    events = [parser._parse_event_component(c, None, intern_table) for c in components]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, events
+
+
+def test_intern_table_when_parsing_recurring_feed_then_retains_less_memory() -> None:
+    parser = LiteICSParser(SimpleNamespace())
+    components = [c for c in Calendar.from_ical(_recurring_feed()).walk() if c.name == "VEVENT"]
+
+    plain_bytes, plain = _retained_bytes(parser, components, None)
+    table = InternTable()
+    interned_bytes, interned = _retained_bytes(parser, components, table)
+
+    assert len(interned) == SERIES * (OVERRIDES_PER_SERIES + 1)
+    assert [e.model_dump() for e in interned] == [e.model_dump() for e in plain]
+
+    saved = 1 - interned_bytes / plain_bytes
+    print(
+        f"\n{len(interned)} events: {plain_bytes / 1024:.0f} KiB without interning, "
+        f"{interned_bytes / 1024:.0f} KiB with ({saved:.0%} saved, "
+        f"{table.hits}/{table.lookups} lookups shared)"
+    )
+    assert saved > 0.3, f"interning only saved {saved:.0%}"
@@ -16,12 +16,18 @@ Run with: pytest tests/lite/ -m memory -v
 
 import asyncio
 import gc
+import tracemalloc
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 
 import pytest
 
-from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteEventStatus
+from calendarbot_lite.calendar.lite_models import (
+    LiteCalendarEvent,
+    LiteDateTimeInfo,
+    LiteEventStatus,
+    LiteLocation,
+)
 from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool
 from calendarbot_lite.calendar.lite_streaming_parser import parse_ics_stream
 
@@ -213,6 +219,69 @@ async def test_recurring_event_expansion_memory_usage():
     gc.collect()
 
 
+@pytest.mark.asyncio
+@pytest.mark.limit_memory("25 MB")  # pytest-memray: full pydantic occurrences need ~50MB
+async def test_compact_expanded_window_memory_usage():
+    """Test memory retained by an expanded window of compact occurrences.
+
+    Target: <25MB for 20,000 occurrences of 200 parsed masters held at once
+
+    Expanded occurrences of parsed masters are ExpandedOccurrence records that
+    share the master's fields; materializing them as LiteCalendarEvent costs
+    several times more per occurrence.
+    """
+    settings = SimpleNamespace(
+        rrule_worker_concurrency=1,
+        max_occurrences_per_rule=250,
+        expansion_days_window=365,
+        expansion_time_budget_ms_per_rule=5000,
+        expansion_yield_frequency=50,
+        expansion_cache_entries=0,
+    )
+    pool = RRuleWorkerPool(settings)
+
+    masters = []
+    for i in range(200):
+        start_dt = datetime(2025, 1, 1, 9, 0, tzinfo=UTC) + timedelta(minutes=i)
+        masters.append(
+            LiteCalendarEvent(
+                id=f"compact-master-{i}",
+                subject=f"Recurring Meeting {i}",
+                body_preview="Standing agenda. " * 10,
+                start=LiteDateTimeInfo(date_time=start_dt, time_zone="UTC"),
+                end=LiteDateTimeInfo(date_time=start_dt + timedelta(hours=1), time_zone="UTC"),
+                location=LiteLocation(display_name="Conference Room 1"),
+                is_recurring=True,
+            )
+        )
+
+    gc.collect()
+    tracemalloc.start()
+    window = []
+    for master in masters:
+        window.extend(await pool.expand_event_to_list(master, "FREQ=DAILY;COUNT=100"))
+    gc.collect()
+    compact_bytes, _ = tracemalloc.get_traced_memory()
+
+    materialized = [occurrence.to_event() for occurrence in window[:2000]]
+    gc.collect()
+    total_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    compact_per_occurrence = compact_bytes / len(window)
+    full_per_occurrence = (total_bytes - compact_bytes) / len(materialized)
+    print(
+        f"\n{len(window)} occurrences: compact {compact_per_occurrence:.0f} B each, "
+        f"materialized {full_per_occurrence:.0f} B each"
+    )
+    assert len(window) == 20000
+    assert full_per_occurrence > 3 * compact_per_occurrence
+
+    del window, materialized
+    await pool.shutdown()
+    gc.collect()
+
+
 @pytest.mark.asyncio
 @pytest.mark.limit_memory("100 MB")  # pytest-memray: fail if exceeds 100MB
 async def test_concurrent_calendar_fetch_memory_usage(tmp_path):
@@ -0,0 +1,122 @@
+"""Benchmark for skipping out-of-window events during parsing.
+
+Parses a feed holding several years of past single meetings (with attendees
+and descriptions) plus a few weeks of upcoming ones, with and without the
+parse window, checks both leave the same events once the time window is
+applied and compares the parse time. The streaming path gains most: old events
+are dropped right after tokenizing and no longer crowd out upcoming events
+under the stored-event cap.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.domain.pipeline import ProcessingContext
+from calendarbot_lite.domain.pipeline_stages import TimeWindowStage
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+PAST_DAYS = 3 * 365
+FUTURE_DAYS = 60
+EVENTS_PER_DAY = 4
+
+
+class PlainSettings:
+    enable_rrule_expansion = True
+    rrule_expansion_days = 14
+    expansion_days_window = 365
+
+
+class WindowSettings(PlainSettings):
+    parse_window_lookback_days = 1
+
+
+def _feed() -> str:
+    blocks = []
+    for day in range(-PAST_DAYS, FUTURE_DAYS):
+        for slot in range(EVENTS_PER_DAY):
+            start = NOW + timedelta(days=day, hours=slot * 2 - 4)
+            blocks.append(
+                "BEGIN:VEVENT\r\n"
+                f"UID:meeting-{day}-{slot}@example.com\r\n"
+                f"DTSTART:{start:%Y%m%dT%H%M%S}Z\r\n"
+                f"DTEND:{start + timedelta(minutes=45):%Y%m%dT%H%M%S}Z\r\n"
+                f"SUMMARY:Meeting {day}/{slot}\r\n"
+                "DESCRIPTION:Agenda: review the numbers and plan the next steps\r\n"
+                "LOCATION:Room 4\r\n"
+                "ORGANIZER;CN=Owner:mailto:owner@example.com\r\n"
+                "ATTENDEE;CN=Ann;PARTSTAT=ACCEPTED:mailto:ann@example.com\r\n"
+                "ATTENDEE;CN=Bob;PARTSTAT=TENTATIVE:mailto:bob@example.com\r\n"
+                "END:VEVENT\r\n"
+            )
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+        + "".join(blocks)
+        + "END:VCALENDAR\r\n"
+    )
+
+
+async def _windowed(events: list) -> list[str]:
+    context = ProcessingContext(
+        events=events,
+        window_start=NOW - timedelta(hours=24),
+        window_end=NOW + timedelta(days=365),
+    )
+    await TimeWindowStage().process(context)
+    return sorted(e.id for e in context.events)
+
+
+async def test_parse_window_when_benchmarked_then_faster_with_same_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Skipping years of history before mapping events makes the parse cheaper."""
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", NOW.isoformat())
+    feed = _feed()
+
+    start = time.perf_counter()
+    plain = LiteICSParser(PlainSettings()).parse_ics_content(feed)
+    plain_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    windowed = LiteICSParser(WindowSettings()).parse_ics_content(feed)
+    windowed_s = time.perf_counter() - start
+
+    assert await _windowed(windowed.events) == await _windowed(plain.events)
+    speedup = plain_s / windowed_s
+    print(
+        f"\n{plain.event_count} events ({windowed.event_count} in window): "
+        f"all {plain_s * 1000:.0f}ms, windowed {windowed_s * 1000:.0f}ms ({speedup:.1f}x)"
+    )
+    # Calendar.from_ical still reads the whole feed, so only the mapping is saved
+    assert windowed.event_count < plain.event_count / 10
+
+
+async def test_parse_window_when_streaming_then_skips_before_mapping(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The streaming path drops old events after tokenizing, before the stored-event cap."""
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", NOW.isoformat())
+    feed = _feed()
+    expected = await _windowed(LiteICSParser(PlainSettings()).parse_ics_content(feed).events)
+
+    start = time.perf_counter()
+    plain = LiteICSParser(PlainSettings())._parse_with_streaming(feed)
+    plain_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    windowed = LiteICSParser(WindowSettings())._parse_with_streaming(feed)
+    windowed_s = time.perf_counter() - start
+
+    # Without the window, history fills the stored-event cap and upcoming events are lost
+    assert await _windowed(windowed.events) == expected
+    assert len(await _windowed(plain.events)) < len(expected)
+    speedup = plain_s / windowed_s
+    print(
+        f"\nstreaming: all {plain_s * 1000:.0f}ms, windowed {windowed_s * 1000:.0f}ms "
+        f"({speedup:.1f}x)"
+    )
+    assert speedup > 1.5, f"parse window only {speedup:.1f}x faster when streaming"
@@ -0,0 +1,75 @@
+"""Benchmark for the arithmetic DAILY/WEEKLY RRULE fast path.
+
+Expands a mix of typical corporate rules (daily standups, weekly and biweekly
+syncs with BYDAY) over a one-year window with both the fast path and
+dateutil, checks the occurrences agree and compares the time taken.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool
+from calendarbot_lite.calendar.lite_rrule_fastpath import build_simple_recurrence
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+BENCHMARK_ROUNDS = 20
+RULES = [
+    "FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR",
+    "FREQ=DAILY;INTERVAL=2",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU",
+    "FREQ=WEEKLY;BYDAY=TH;UNTIL=20261231T000000Z",
+    "FREQ=DAILY;COUNT=200",
+]
+
+
+class DummySettings:
+    rrule_worker_concurrency = 1
+    max_occurrences_per_rule = 250
+    expansion_days_window = 365
+    expansion_time_budget_ms_per_rule = 5000
+    expansion_yield_frequency = 50
+    expansion_cache_entries = 0
+
+
+def test_rrule_fastpath_when_benchmarked_then_faster_than_dateutil() -> None:
+    """Computing simple rules arithmetically beats iterating dateutil rule sets."""
+    pool = RRuleWorkerPool(DummySettings())
+    master = SimpleNamespace(subject="benchmark")
+    dtstart = datetime(2025, 1, 6, 9, 30, tzinfo=ZoneInfo("America/Los_Angeles"))
+    exdates = ["20250303T173000Z", "20251124T173000Z"]
+    parsed_exdates = pool._parse_exdates(exdates, master)
+    after = datetime(2025, 6, 1, tzinfo=UTC)
+    before = after + timedelta(days=365)
+
+    occurrences = 0
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_ROUNDS):
+        for rrule in RULES:
+            fast = build_simple_recurrence(dtstart, rrule, parsed_exdates)
+            occurrences += len(fast.between(after, before, inc=True))
+    fast_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_ROUNDS):
+        for rrule in RULES:
+            rule_set = pool._build_rule_set(dtstart, rrule, exdates, master)
+            rule_set.between(after, before, inc=True)
+    dateutil_s = time.perf_counter() - start
+
+    for rrule in RULES:
+        assert build_simple_recurrence(dtstart, rrule, parsed_exdates).between(
+            after, before, inc=True
+        ) == pool._build_rule_set(dtstart, rrule, exdates, master).between(after, before, inc=True)
+
+    speedup = dateutil_s / fast_s
+    print(
+        f"\n{occurrences} occurrences: fast path {fast_s * 1000:.1f}ms, "
+        f"dateutil {dateutil_s * 1000:.1f}ms ({speedup:.1f}x)"
+    )
+    assert speedup > 2, f"fast path only {speedup:.1f}x faster than dateutil"
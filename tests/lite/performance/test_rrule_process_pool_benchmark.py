@@ -0,0 +1,106 @@
+"""Benchmark for RRULE expansion in a process pool.
+
+Expands a few hundred long-running series whose rules need dateutil (monthly
+and yearly BYDAY/BYSETPOS patterns with years of history) once in-process and
+once across the expansion worker pool, checks both produce the same instances
+and compares the time taken.
+
+On a single-core machine the pool can only add overhead, so the speedup is
+asserted only when more than one CPU is available.
+"""
+
+import os
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteDateTimeInfo
+from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool
+from calendarbot_lite.calendar.lite_rrule_process_pool import RRuleProcessPool
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+MASTER_COUNT = 300
+RULES = [
+    "FREQ=MONTHLY;BYDAY=1MO,3MO",
+    "FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1",
+    "FREQ=YEARLY;BYMONTH=1,4,7,10;BYDAY=2TU",
+    "FREQ=DAILY;BYHOUR=9,14;BYMINUTE=0",
+]
+
+
+class DummySettings:
+    rrule_worker_concurrency = 1
+    max_occurrences_per_rule = 250
+    expansion_days_window = 365
+    expansion_time_budget_ms_per_rule = 5000
+    expansion_yield_frequency = 50
+    expansion_cache_entries = 0
+
+
+def _candidates() -> list[tuple[LiteCalendarEvent, str, None]]:
+    candidates = []
+    for i in range(MASTER_COUNT):
+        # Series started years ago with a COUNT far in the future, so dateutil
+        # iterates from DTSTART instead of the recent-past lookback
+        start = datetime(2015, 1, 1 + i % 28, 9, 0, tzinfo=UTC) + timedelta(minutes=i)
+        master = LiteCalendarEvent(
+            id=f"series-{i}",
+            subject=f"Series {i}",
+            start=LiteDateTimeInfo(date_time=start),
+            end=LiteDateTimeInfo(date_time=start + timedelta(minutes=30)),
+            is_recurring=True,
+        )
+        candidates.append((master, f"{RULES[i % len(RULES)]};COUNT=5000", None))
+    return candidates
+
+
+async def test_rrule_process_pool_when_benchmarked_then_matches_in_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Spreading expansion over worker processes gives the same instances, faster on multi-core."""
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", "2026-06-01T10:00:00+00:00")
+    candidates = _candidates()
+    cpu_count = os.cpu_count() or 1
+    process_pool = RRuleProcessPool(max_workers=min(cpu_count, 3))
+    try:
+        # Warm up the workers so process start-up is not timed
+        warm_up = RRuleWorkerPool(DummySettings()).expand_in_processes(
+            candidates[:16], process_pool
+        )
+        async for _ in warm_up:
+            pass
+
+        start = time.perf_counter()
+        in_process = [
+            inst
+            for master, rrule, exdates in candidates
+            async for inst in RRuleWorkerPool(DummySettings()).expand_rrule_stream(
+                master, rrule, exdates
+            )
+        ]
+        in_process_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pooled = [
+            inst
+            async for inst in RRuleWorkerPool(DummySettings()).expand_in_processes(
+                candidates, process_pool
+            )
+        ]
+        pooled_s = time.perf_counter() - start
+    finally:
+        process_pool.shutdown()
+
+    assert [(i.id, i.end.date_time) for i in pooled] == [
+        (i.id, i.end.date_time) for i in in_process
+    ]
+    speedup = in_process_s / pooled_s
+    print(
+        f"\n{MASTER_COUNT} masters, {len(pooled)} occurrences: in-process "
+        f"{in_process_s * 1000:.0f}ms, {process_pool.max_workers} workers "
+        f"{pooled_s * 1000:.0f}ms ({speedup:.2f}x)"
+    )
+    if cpu_count > 1:
+        assert speedup > 1.2, f"process pool only {speedup:.2f}x faster than in-process"
@@ -14,6 +14,7 @@ from unittest.mock import patch
 import pytest
 
 from calendarbot_lite.calendar.lite_models import (
+    ExpandedOccurrence,
     LiteCalendarEvent,
     LiteDateTimeInfo,
     LiteEventStatus,
@@ -370,9 +371,10 @@ class TestRRuleStreamingOptimization:
         assert len(streaming_events) == 50, "Should produce 50 events"
         assert streaming_time < 1.0, "Streaming should be reasonably fast"
 
-        # Verify all events are valid instances
+        # Verify all events are valid instances (compact occurrences of a parsed master)
         for event in streaming_events:
-            assert isinstance(event, LiteCalendarEvent)
+            assert isinstance(event, ExpandedOccurrence)
+            assert isinstance(event.to_event(), LiteCalendarEvent)
             assert event.is_expanded_instance is True
             assert event.rrule_master_uid == sample_event.id
 
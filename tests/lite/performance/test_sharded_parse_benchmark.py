@@ -0,0 +1,79 @@
+"""Benchmark for sharded multi-process parsing of a large feed.
+
+Parses a shared-mailbox style export (thousands of one-off meetings with
+attendees plus some recurring series) in one process, then split into one
+shard per worker for every worker count the machine supports, and reports the
+speedup by core count. Every sharded result must equal the single-process one.
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from calendarbot_lite.calendar.lite_parse_executor import MAX_PARSE_WORKERS, ParseExecutor
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+EVENT_COUNT = 4000
+
+
+def _export(count: int) -> str:
+    events = []
+    for i in range(count):
+        attendees = "".join(
+            f"ATTENDEE;CN=Person {j};PARTSTAT=ACCEPTED:mailto:person{j}@example.com\r\n"
+            for j in range(i % 7, i % 7 + 5)
+        )
+        rrule = "RRULE:FREQ=WEEKLY;COUNT=8\r\n" if i % 20 == 0 else ""
+        events.append(
+            "BEGIN:VEVENT\r\n"
+            f"UID:event-{i}@example.com\r\n"
+            "DTSTAMP:20260101T000000Z\r\n"
+            f"DTSTART;TZID=America/New_York:2026{(i % 12) + 1:02d}{(i % 28) + 1:02d}"
+            f"T{(i % 9) + 8:02d}0000\r\n"
+            "DURATION:PT45M\r\n"
+            f"SUMMARY:Customer call {i}\r\n"
+            f"LOCATION:Room {i % 30}\r\n"
+            f"DESCRIPTION:Agenda item {i}. Join https://zoom.us/j/{i:09d}\r\n"
+            f"{attendees}{rrule}"
+            "END:VEVENT\r\n"
+        )
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+        "X-WR-CALNAME:Shared mailbox\r\n" + "".join(events) + "END:VCALENDAR\r\n"
+    )
+
+
+async def test_sharded_parse_when_benchmarked_then_reports_speedup_by_core_count() -> None:
+    parser = LiteICSParser(SimpleNamespace(enable_rrule_expansion=True, rrule_expansion_days=365))
+    content = _export(EVENT_COUNT)
+
+    start = time.perf_counter()
+    expected = parser.parse_ics_content(content)
+    single_s = time.perf_counter() - start
+    expected_dump = expected.model_dump(exclude={"parse_time", "phase_timings"})
+
+    timings = {}
+    for workers in range(1, min(os.cpu_count() or 1, MAX_PARSE_WORKERS) + 1):
+        executor = ParseExecutor(max_workers=workers)
+        try:
+            await executor.parse(parser, _export(2))  # Start and warm up the workers
+            start = time.perf_counter()
+            result = await executor.parse_sharded(parser, content, shard_count=workers)
+            timings[workers] = time.perf_counter() - start
+        finally:
+            executor.shutdown()
+        assert result.model_dump(exclude={"parse_time", "phase_timings"}) == expected_dump
+
+    print(
+        f"\n{len(content) / 1e6:.1f} MB, {EVENT_COUNT} VEVENTs: single process {single_s:.2f}s; "
+        + ", ".join(
+            f"{workers} worker(s) {t:.2f}s ({single_s / t:.2f}x)" for workers, t in timings.items()
+        )
+    )
+    if len(timings) > 1:
+        best = single_s / timings[max(timings)]
+        assert best > 1.2, f"{max(timings)} workers only {best:.2f}x faster than one process"
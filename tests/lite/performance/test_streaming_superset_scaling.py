@@ -0,0 +1,60 @@
+"""Scaling check for the bounded raw-component superset of the streaming parse.
+
+Feeds growing numbers of components through _StreamingParseState with the
+superset limit growing alongside the feed (as a deployment raising
+RAW_COMPONENTS_SUPERSET_LIMIT for a large calendar would). The superset used
+to be capped by re-slicing the whole list after every append, so once the
+limit was reached each component cost O(limit) and quadrupling the feed grew
+the time roughly sixteenfold; the bounded deques evict in O(1).
+"""
+
+import gc
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from calendarbot_lite.calendar.lite_parser import _StreamingParseState
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+FEED_SIZES = [20000, 40000, 80000]
+TIMING_RUNS = 3
+
+
+def _components(count: int) -> list[dict[str, str]]:
+    """Every third component is a recurring master, as in a typical work calendar."""
+    return [
+        {"UID": f"event-{i}", "RRULE": "FREQ=WEEKLY"} if i % 3 == 0 else {"UID": f"event-{i}"}
+        for i in range(count)
+    ]
+
+
+def test_keep_raw_component_when_feed_quadruples_then_time_scales_linearly() -> None:
+    timings = []
+    for size in FEED_SIZES:
+        components = _components(size)
+        settings = SimpleNamespace(raw_components_superset_limit=size // 4)
+        best = float("inf")
+        for _ in range(TIMING_RUNS):
+            state = _StreamingParseState(settings)
+            gc.collect()
+            start = time.perf_counter()
+            for component in components:
+                state.keep_raw_component(component)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+
+        assert len(state.raw_components_superset()) == state.masters_limit + state.nonmasters_limit
+        newest = (state.raw_components_masters[-1], state.raw_components_nonmasters[-1])
+        assert components[-1] in newest
+
+    print(
+        "\n"
+        + ", ".join(
+            f"{size}: {t * 1000:.1f}ms" for size, t in zip(FEED_SIZES, timings, strict=True)
+        )
+    )
+    # 4x the components: linear work grows ~4x, quadratic work would grow ~16x
+    growth = timings[-1] / timings[0]
+    assert growth < 8, f"superset maintenance grew {growth:.1f}x for 4x components: {timings}"
@@ -0,0 +1,97 @@
+"""Scaling check for UID-indexed EXDATE and RECURRENCE-ID override collection.
+
+Builds feeds of recurring masters that each have several RECURRENCE-ID
+overrides and times candidate collection plus override collection for merging
+(the work shared through UIDIndex, without the RRULE expansion itself). Before
+the index, every master rescanned every event, so doubling the feed roughly
+quadrupled the time.
+"""
+
+import gc
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from icalendar import Event as ICalEvent
+
+from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteDateTimeInfo
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_uid_index import UIDIndex
+
+pytestmark = [pytest.mark.integration, pytest.mark.performance, pytest.mark.slow]
+
+FEED_SIZES = [1250, 2500, 5000, 10000]
+OVERRIDES_PER_MASTER = 3
+TIMING_RUNS = 3
+
+
+def _feed(total_events: int) -> tuple[list[LiteCalendarEvent], list[ICalEvent]]:
+    """Build masters plus RECURRENCE-ID overrides totalling ``total_events`` events."""
+    base = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    events: list[LiteCalendarEvent] = []
+    components: list[ICalEvent] = []
+    for m in range(total_events // (OVERRIDES_PER_MASTER + 1)):
+        uid = f"series-{m}"
+        component = ICalEvent()
+        component.add("UID", uid)
+        component.add("DTSTART", base)
+        component.add("RRULE", {"FREQ": "WEEKLY"})
+        components.append(component)
+        events.append(_event(uid, base, is_recurring=True))
+        for week in range(1, OVERRIDES_PER_MASTER + 1):
+            slot = base + timedelta(weeks=week)
+            events.append(
+                _event(uid, slot + timedelta(hours=2), recurrence_id=f"{slot:%Y%m%dT%H%M%S}Z")
+            )
+    return events, components
+
+
+def _event(
+    uid: str, start: datetime, is_recurring: bool = False, recurrence_id: str | None = None
+) -> LiteCalendarEvent:
+    return LiteCalendarEvent(
+        id=uid,
+        subject=uid,
+        start=LiteDateTimeInfo(date_time=start),
+        end=LiteDateTimeInfo(date_time=start + timedelta(minutes=30)),
+        is_recurring=is_recurring,
+        recurrence_id=recurrence_id,
+    )
+
+
+def test_override_collection_when_feed_doubles_then_time_scales_linearly() -> None:
+    settings = Mock()
+    settings.rrule_worker_concurrency = 1
+    settings.expansion_cache_entries = 0
+    parser = LiteICSParser(settings)
+    orchestrator = parser._rrule_orchestrator
+    merger = parser._event_merger
+
+    timings = []
+    for size in FEED_SIZES:
+        events, components = _feed(size)
+        best = float("inf")
+        for _ in range(TIMING_RUNS):
+            gc.collect()
+            start = time.perf_counter()
+            uid_index = UIDIndex.build(events, components)
+            candidates = orchestrator._collect_expansion_candidates(uid_index)
+            overrides = merger._collect_recurrence_overrides(uid_index.override_events())
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+
+        masters = size // (OVERRIDES_PER_MASTER + 1)
+        assert len(candidates) == masters
+        assert all(len(exdates) == OVERRIDES_PER_MASTER for _, _, exdates in candidates)
+        assert len(overrides) == masters * OVERRIDES_PER_MASTER
+
+    print(
+        "\n"
+        + ", ".join(
+            f"{size}: {t * 1000:.1f}ms" for size, t in zip(FEED_SIZES, timings, strict=True)
+        )
+    )
+    # 8x the events: linear work grows ~8x, quadratic work would grow ~64x
+    growth = timings[-1] / timings[0]
+    assert growth < 20, f"override collection grew {growth:.1f}x for 8x events: {timings}"
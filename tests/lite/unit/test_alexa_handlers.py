@@ -24,10 +24,12 @@ from calendarbot_lite.alexa.alexa_handlers import (
     AlexaEndpointBase,
     DoneForDayHandler,
     LaunchSummaryHandler,
+    MorningSummaryHandler,
     NextMeetingHandler,
     TimeUntilHandler,
 )
 from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteDateTimeInfo
+from calendarbot_lite.domain.event_window import EventWindow
 
 # ============================================================================
 # Fixtures
@@ -781,6 +783,49 @@ async def test_launch_summary_handler_when_meeting_in_progress_then_acknowledges
 # ============================================================================
 
 
+@pytest.mark.unit
+async def test_morning_summary_handler_when_published_event_window_then_returns_summary(
+    mock_time_provider: Mock,
+    mock_skipped_store: Mock,
+    mock_presenter: Mock,
+    mock_request: Mock,
+) -> None:
+    """Test MorningSummaryHandler summarizes the published EventWindow as is."""
+    morning_meeting = LiteCalendarEvent(
+        id="morning-meeting",
+        subject="Planning",
+        start=LiteDateTimeInfo(
+            date_time=datetime.datetime(2024, 1, 16, 8, 0, 0, tzinfo=datetime.UTC),
+            time_zone="UTC",
+        ),
+        end=LiteDateTimeInfo(
+            date_time=datetime.datetime(2024, 1, 16, 9, 0, 0, tzinfo=datetime.UTC),
+            time_zone="UTC",
+        ),
+        is_all_day=False,
+    )
+    handler = MorningSummaryHandler(
+        bearer_token=None,
+        time_provider=mock_time_provider,
+        skipped_store=mock_skipped_store,
+        response_cache=None,
+        presenter=mock_presenter,  # type: ignore[arg-type]
+    )
+
+    mock_request.query = {"date": "2024-01-16", "timezone": "UTC"}
+    window = EventWindow([morning_meeting])
+
+    response = await handler.handle_request(mock_request, window, mock_time_provider())
+
+    assert response.status == 200
+    import json
+
+    data = json.loads(response.body)  # type: ignore[arg-type]
+
+    assert data["summary"]["total_meetings_equivalent"] == 1
+    assert data["speech_text"]
+
+
 # ============================================================================
 # Caching Tests
 # ============================================================================
@@ -1,6 +1,7 @@
 """Unit tests for async_utils module."""
 
 import asyncio
+import threading
 
 import pytest
 
@@ -147,6 +148,60 @@ async def test_run_coroutine_from_sync_with_running_loop(orchestrator):
     assert result == "from thread pool"
 
 
+def test_run_coroutine_from_sync_reuses_worker_thread(orchestrator):
+    """Repeated calls run on the same persistent worker thread."""
+
+    async def thread_name():
+        return threading.current_thread().name
+
+    first = orchestrator.run_coroutine_from_sync(thread_name)
+    second = orchestrator.run_coroutine_from_sync(thread_name)
+
+    assert first == second == "calendarbot-async-worker"
+    assert first != threading.current_thread().name
+
+
+def test_run_coroutine_from_sync_timeout_raises(orchestrator):
+    """Timeouts apply on the worker loop and leave it usable."""
+
+    async def slow():
+        await asyncio.sleep(1.0)
+
+    async def fast():
+        return "ok"
+
+    with pytest.raises(asyncio.TimeoutError):
+        orchestrator.run_coroutine_from_sync(slow, timeout=0.05)
+    assert orchestrator.run_coroutine_from_sync(fast) == "ok"
+
+
+def test_run_coroutine_from_sync_nested_call(orchestrator):
+    """A sync call made from the worker loop does not deadlock."""
+
+    async def inner():
+        return "inner"
+
+    async def outer():
+        return orchestrator.run_coroutine_from_sync(inner)
+
+    assert orchestrator.run_coroutine_from_sync(outer) == "inner"
+
+
+def test_run_coroutine_from_sync_restarts_after_shutdown(orchestrator):
+    """The worker is started again on the next call after shutdown."""
+
+    async def operation():
+        return threading.current_thread()
+
+    first_thread = orchestrator.run_coroutine_from_sync(operation)
+    asyncio.run(orchestrator.shutdown())
+
+    assert not first_thread.is_alive()
+    second_thread = orchestrator.run_coroutine_from_sync(operation)
+    assert second_thread is not first_thread
+    assert second_thread.is_alive()
+
+
 @pytest.mark.asyncio
 async def test_shutdown(orchestrator):
     """Test orchestrator shutdown."""
@@ -0,0 +1,111 @@
+"""Unit tests for the on-disk parsed-event cache used for warm starts."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteDateTimeInfo
+from calendarbot_lite.domain.event_cache_store import (
+    CACHE_FORMAT_VERSION,
+    EventCacheStore,
+    PersistedSource,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+SECRET_URL = "https://calendar.example.com/ics/private-token-abc123/basic.ics"
+
+
+def _event(event_id: str, hour: int) -> LiteCalendarEvent:
+    start = datetime(2026, 3, 2, hour, 0, tzinfo=UTC)
+    return LiteCalendarEvent(
+        id=event_id,
+        subject=f"Meeting {event_id}",
+        start=LiteDateTimeInfo(date_time=start, time_zone="America/New_York"),
+        end=LiteDateTimeInfo(date_time=start + timedelta(hours=1), time_zone="America/New_York"),
+        is_recurring=True,
+        is_expanded_instance=True,
+        rrule_master_uid="series@example.com",
+    )
+
+
+def _persisted() -> PersistedSource:
+    return PersistedSource(
+        content_hash="abc123",
+        last_fetch_success=datetime(2026, 3, 1, 8, 0, tzinfo=UTC),
+        events=[_event("a", 9), _event("b", 10)],
+        etag='"v1"',
+        last_modified="Sun, 01 Mar 2026 08:00:00 GMT",
+        content_bytes=4096,
+    )
+
+
+def test_save_and_load_when_round_tripped_then_entries_restored(tmp_path):
+    """Saved events, hash and validators come back unchanged for configured sources."""
+    store = EventCacheStore(tmp_path / "cache" / "events.json")
+    saved_at = datetime(2026, 3, 1, 8, 5, tzinfo=UTC)
+    assert store.save({SECRET_URL: _persisted()}, saved_at) is True
+
+    loaded = store.load([SECRET_URL])
+
+    assert loaded.saved_at == saved_at
+    restored = loaded.sources[SECRET_URL]
+    original = _persisted()
+    assert restored.events == original.events
+    assert restored.content_hash == original.content_hash
+    assert restored.etag == original.etag
+    assert restored.last_modified == original.last_modified
+    assert restored.content_bytes == original.content_bytes
+    assert restored.last_fetch_success == original.last_fetch_success
+
+
+def test_save_when_url_contains_token_then_url_not_written(tmp_path):
+    """Source URLs may embed secrets, so only their digest is stored on disk."""
+    path = tmp_path / "events.json"
+    EventCacheStore(path).save({SECRET_URL: _persisted()}, datetime.now(UTC))
+
+    assert "private-token-abc123" not in path.read_text(encoding="utf-8")
+
+
+def test_load_when_source_no_longer_configured_then_entry_dropped(tmp_path):
+    """Only currently configured sources are restored."""
+    store = EventCacheStore(tmp_path / "events.json")
+    store.save({SECRET_URL: _persisted()}, datetime.now(UTC))
+
+    assert store.load(["https://other.example.com/cal.ics"]).sources == {}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "{not json",
+        "[]",
+        json.dumps({"version": CACHE_FORMAT_VERSION + 1, "saved_at": None, "sources": {}}),
+    ],
+    ids=["corrupt", "wrong_root", "version_mismatch"],
+)
+def test_load_when_file_unusable_then_ignored(tmp_path, content):
+    """Corrupt or version-mismatched cache files yield an empty result instead of raising."""
+    path = tmp_path / "events.json"
+    path.write_text(content, encoding="utf-8")
+
+    loaded = EventCacheStore(path).load([SECRET_URL])
+
+    assert loaded.sources == {}
+    assert loaded.saved_at is None
+
+
+def test_load_when_one_entry_malformed_then_other_sources_kept(tmp_path):
+    """A malformed entry is skipped without discarding the rest of the file."""
+    path = tmp_path / "events.json"
+    other_url = "https://example.com/other.ics"
+    store = EventCacheStore(path)
+    store.save({SECRET_URL: _persisted(), other_url: _persisted()}, datetime.now(UTC))
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    first_key = next(iter(data["sources"]))
+    data["sources"][first_key]["events"] = [{"id": "missing-required-fields"}]
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert len(store.load([SECRET_URL, other_url]).sources) == 1
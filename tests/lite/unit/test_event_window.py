@@ -0,0 +1,95 @@
+"""Unit tests for the indexed event window (calendarbot_lite.domain.event_window)."""
+
+import pickle
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteDateTimeInfo
+from calendarbot_lite.domain.event_window import EventWindow
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _event(
+    event_id: str,
+    start: datetime,
+    minutes: int = 30,
+    is_all_day: bool = False,
+) -> LiteCalendarEvent:
+    return LiteCalendarEvent(
+        id=event_id,
+        subject=event_id,
+        start=LiteDateTimeInfo(date_time=start),
+        end=LiteDateTimeInfo(date_time=start + timedelta(minutes=minutes)),
+        is_all_day=is_all_day,
+    )
+
+
+@pytest.fixture
+def window() -> EventWindow:
+    # Deliberately unsorted, as combined multi-source windows can be
+    return EventWindow(
+        (
+            _event("late", datetime(2025, 11, 5, 15, 0, tzinfo=UTC)),
+            _event("long", datetime(2025, 11, 5, 8, 0, tzinfo=UTC), minutes=300),
+            _event("early", datetime(2025, 11, 5, 9, 0, tzinfo=UTC)),
+            _event("holiday", datetime(2025, 11, 5, tzinfo=UTC), 1440, is_all_day=True),
+            _event("tie", datetime(2025, 11, 5, 15, 0, tzinfo=UTC)),
+        )
+    )
+
+
+def test_window_is_a_tuple_in_original_order(window: EventWindow) -> None:
+    assert isinstance(window, tuple)
+    assert [e.id for e in window] == ["late", "long", "early", "holiday", "tie"]
+    assert [e.id for e in window[:2]] == ["late", "long"]
+
+
+def test_starting_after_is_strict_and_sorted(window: EventWindow) -> None:
+    after = window.starting_after(datetime(2025, 11, 5, 9, 0, tzinfo=UTC))
+    assert [e.id for e in after] == ["late", "tie"]
+
+
+def test_upcoming_includes_all_day_events(window: EventWindow) -> None:
+    upcoming = window.upcoming(datetime(2025, 11, 5, 10, 0, tzinfo=UTC))
+    assert [e.id for e in upcoming] == ["holiday", "late", "tie"]
+
+
+def test_covering_finds_long_running_events(window: EventWindow) -> None:
+    covering = window.covering(datetime(2025, 11, 5, 9, 15, tzinfo=UTC))
+    assert [e.id for e in covering] == ["holiday", "long", "early"]
+
+    at_end = window.covering(datetime(2025, 11, 5, 13, 0, tzinfo=UTC))
+    assert "long" not in {e.id for e in at_end}
+
+
+def test_overlapping_returns_timed_matches_and_all_day_candidates(window: EventWindow) -> None:
+    found = window.overlapping(
+        datetime(2025, 11, 5, 12, 30, tzinfo=UTC),
+        datetime(2025, 11, 5, 15, 0, tzinfo=UTC),
+    )
+    assert {e.id for e in found} == {"long", "late", "tie", "holiday"}
+
+
+def test_naive_events_are_unindexed_overlap_candidates() -> None:
+    naive = _event("naive", datetime(2025, 11, 5, 9, 0))
+    window = EventWindow((naive,))
+
+    assert list(window.starting_after(datetime(2025, 11, 1, tzinfo=UTC))) == []
+    assert window.overlapping(
+        datetime(2025, 12, 1, tzinfo=UTC), datetime(2025, 12, 2, tzinfo=UTC)
+    ) == [naive]
+
+
+def test_of_reuses_existing_index(window: EventWindow) -> None:
+    assert EventWindow.of(window) is window
+    assert isinstance(EventWindow.of(tuple(window)), EventWindow)
+
+
+def test_window_survives_pickling(window: EventWindow) -> None:
+    restored = pickle.loads(pickle.dumps(window))
+    assert restored == window
+    assert [e.id for e in restored.starting_after(datetime(2025, 11, 5, tzinfo=UTC))] == [
+        e.id for e in window.starting_after(datetime(2025, 11, 5, tzinfo=UTC))
+    ]
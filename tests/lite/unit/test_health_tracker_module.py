@@ -194,3 +194,77 @@ class TestHealthTracker:
         # Each instance maintains its own state
         assert tracker1.get_event_count() == 10
         assert tracker2.get_event_count() == 20
+
+    def test_record_source_not_modified_accumulates_totals(self):
+        """Should accumulate 304 refreshes and saved bytes per source and overall."""
+        self.tracker.record_source_success("https://a.example/cal.ics")
+        self.tracker.record_source_not_modified("https://a.example/cal.ics", 1000)
+        self.tracker.record_source_not_modified("https://a.example/cal.ics", 500)
+        self.tracker.record_source_not_modified("https://b.example/cal.ics", 250)
+
+        summary = self.tracker.get_source_health_summary()
+        assert summary["https://a.example/cal.ics"]["not_modified_refreshes"] == 2
+        assert summary["https://a.example/cal.ics"]["bytes_saved"] == 1500
+        assert summary["https://a.example/cal.ics"]["consecutive_failures"] == 0
+
+        assert self.tracker.get_revalidation_summary() == {
+            "not_modified_refreshes": 3,
+            "bytes_saved": 1750,
+        }
+
+    def test_warm_start_status_when_source_refreshed_then_no_longer_stale(self):
+        """Sources restored from the disk cache stay stale until fetched successfully."""
+        assert self.tracker.get_warm_start_status()["warm_started"] is False
+
+        saved_at = time.time() - 120
+        self.tracker.record_warm_start(
+            ["https://a.example/cal.ics", "https://b.example/cal.ics"], saved_at
+        )
+        status = self.tracker.get_warm_start_status()
+        assert status["warm_started"] is True
+        assert status["stale"] is True
+        assert status["stale_sources"] == 2
+        assert status["cache_age_s"] >= 120
+
+        self.tracker.record_source_success("https://a.example/cal.ics")
+        assert self.tracker.get_warm_start_status()["stale_sources"] == 1
+
+        self.tracker.record_source_success("https://b.example/cal.ics")
+        assert self.tracker.get_warm_start_status()["stale"] is False
+
+    def test_source_status_when_refreshed_then_reports_latency_and_staleness(self):
+        """Per-source status is keyed by name and marks sources not refreshed last time."""
+        self.tracker.record_source_latency("https://a.example/cal.ics?token=x", "Work", 0.25)
+        self.tracker.record_source_success("https://a.example/cal.ics?token=x")
+        self.tracker.record_source_latency("https://b.example/cal.ics", "Home", 120.0)
+        self.tracker.record_source_failure("https://b.example/cal.ics", "timed out")
+        self.tracker.record_source_failure("https://c.example/cal.ics", "boom")
+
+        status = {s["name"]: s for s in self.tracker.get_source_status()}
+
+        assert status["Work"] == {
+            "name": "Work",
+            "last_latency_ms": 250,
+            "last_success_age_s": 0,
+            "consecutive_failures": 0,
+            "stale": False,
+        }
+        assert status["Home"]["last_latency_ms"] == 120000
+        assert status["Home"]["last_success_age_s"] is None
+        assert status["Home"]["stale"] is True
+        assert status["c.example"]["consecutive_failures"] == 1
+        assert "token" not in str(status)
+
+    def test_source_status_when_deferred_by_memory_budget_then_stale_until_success(self):
+        """Cached events kept to fit the memory budget were not fetched, so they are stale."""
+        url = "https://a.example/cal.ics"
+        self.tracker.record_source_latency(url, "Work", 0.1)
+        self.tracker.record_source_success(url)
+
+        self.tracker.record_source_deferred(url)
+        (status,) = self.tracker.get_source_status()
+        assert status["stale"] is True
+        assert status["consecutive_failures"] == 0
+
+        self.tracker.record_source_success(url)
+        assert self.tracker.get_source_status()[0]["stale"] is False
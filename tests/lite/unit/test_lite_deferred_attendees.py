@@ -0,0 +1,115 @@
+"""Unit tests for deferred (decode-on-read) event attendees."""
+
+import pickle
+
+import pytest
+from icalendar import Calendar
+
+from calendarbot_lite.calendar.lite_attendee_parser import LiteAttendeeParser
+from calendarbot_lite.calendar.lite_datetime_utils import LiteDateTimeParser
+from calendarbot_lite.calendar.lite_event_parser import LiteEventComponentParser
+from calendarbot_lite.calendar.lite_fast_tokenizer import decode_address_line, parse_vevent_lines
+from calendarbot_lite.calendar.lite_intern import InternTable
+from calendarbot_lite.calendar.lite_models import LiteCalendarEvent
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+LINES = [
+    "BEGIN:VEVENT",
+    "UID:evt-1@example.com",
+    "DTSTART:20260301T090000Z",
+    "DTEND:20260301T100000Z",
+    "SUMMARY:Planning",
+    'ATTENDEE;CN="Smith, John";ROLE=OPT-PARTICIPANT;PARTSTAT=ACCEPTED:mailto:john@x.com',
+    "ATTENDEE;PARTSTAT=DECLINED:mailto:amy@example.com",
+    "ATTENDEE;CN=Room;ROLE=NON-PARTICIPANT;X-EMPTY=:mailto:room\\,4@example.com",
+    "END:VEVENT",
+]
+
+
+@pytest.fixture
+def mapper() -> LiteEventComponentParser:
+    return LiteEventComponentParser(LiteDateTimeParser(), LiteAttendeeParser())
+
+
+def _icalendar_event(mapper: LiteEventComponentParser) -> LiteCalendarEvent:
+    ics = "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:test\n" + "\n".join(LINES) + "\nEND:VCALENDAR\n"
+    event = mapper.parse_event_component(Calendar.from_ical(ics).walk("VEVENT")[0])
+    assert event is not None
+    return event
+
+
+def _deferred_event(
+    mapper: LiteEventComponentParser, intern_table: InternTable | None = None
+) -> LiteCalendarEvent:
+    component = parse_vevent_lines(LINES)
+    assert component is not None
+    event = mapper.parse_event_component(component, None, intern_table)  # type: ignore[arg-type]
+    assert event is not None
+    return event
+
+
+def test_fast_path_event_when_parsed_then_attendees_stay_raw_until_read(
+    mapper: LiteEventComponentParser,
+) -> None:
+    expected = _icalendar_event(mapper)
+    event = _deferred_event(mapper)
+
+    assert event.deferred_attendee_lines == tuple(LINES[5:8])
+
+    assert event.attendees == expected.attendees
+    assert event.deferred_attendee_lines is None
+    assert [a.email for a in event.attendees or []] == [
+        "john@x.com",
+        "amy@example.com",
+        "room,4@example.com",
+    ]
+
+
+def test_model_dump_when_deferred_then_matches_eager_and_stays_deferred(
+    mapper: LiteEventComponentParser,
+) -> None:
+    expected = _icalendar_event(mapper)
+    event = _deferred_event(mapper)
+
+    assert event.model_dump() == expected.model_dump()
+    assert event.model_dump(mode="json", exclude_defaults=True) == expected.model_dump(
+        mode="json", exclude_defaults=True
+    )
+    assert event.deferred_attendee_lines is not None
+    assert event == expected
+
+
+def test_copies_when_deferred_then_decode_independently(mapper: LiteEventComponentParser) -> None:
+    expected = _icalendar_event(mapper).attendees
+    event = _deferred_event(mapper, InternTable())
+
+    restored = pickle.loads(pickle.dumps(event))
+    copied = event.model_copy(deep=True)
+
+    assert restored.deferred_attendee_lines == event.deferred_attendee_lines
+    assert restored.attendees == expected
+    assert copied.attendees == expected
+    assert event.deferred_attendee_lines is not None
+
+
+def test_attendees_when_assigned_then_replace_deferred_lines(
+    mapper: LiteEventComponentParser,
+) -> None:
+    event = _deferred_event(mapper)
+
+    event.attendees = None
+
+    assert event.attendees is None
+    assert event.deferred_attendee_lines is None
+
+
+def test_decode_address_line_when_params_unusual_then_matches_icalendar() -> None:
+    line = 'ATTENDEE;CN=Ann ;MEMBER="a","b":mailto:ann@example.com'
+    ics = f"BEGIN:VCALENDAR\nBEGIN:VEVENT\n{line}\nEND:VEVENT\nEND:VCALENDAR\n"
+    expected = Calendar.from_ical(ics).walk("VEVENT")[0]["ATTENDEE"]
+
+    decoded = decode_address_line(line)
+
+    assert decoded == str(expected)
+    assert decoded.params == dict(expected.params)
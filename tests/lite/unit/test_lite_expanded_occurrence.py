@@ -0,0 +1,91 @@
+"""Unit tests for compact RRULE-expanded occurrences."""
+
+import pickle
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from calendarbot_lite.calendar.lite_models import (
+    ExpandedOccurrence,
+    LiteCalendarEvent,
+    LiteDateTimeInfo,
+    LiteEventStatus,
+    LiteLocation,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _master() -> LiteCalendarEvent:
+    start = datetime(2025, 11, 3, 9, 0, tzinfo=UTC)
+    return LiteCalendarEvent(
+        id="series-1",
+        subject="Standup",
+        body_preview="Daily sync",
+        start=LiteDateTimeInfo(date_time=start, time_zone="America/New_York"),
+        end=LiteDateTimeInfo(date_time=start + timedelta(minutes=15), time_zone="America/New_York"),
+        show_as=LiteEventStatus.TENTATIVE,
+        location=LiteLocation(display_name="Room 4"),
+        is_online_meeting=True,
+        online_meeting_url="https://example.com/meet",
+        is_recurring=True,
+        last_modified_date_time=start - timedelta(days=3),
+    )
+
+
+def _occurrence(master: LiteCalendarEvent) -> ExpandedOccurrence:
+    start = datetime(2025, 11, 5, 9, 0, tzinfo=UTC)
+    return ExpandedOccurrence(
+        master, "series-1_20251105T090000", start, start + timedelta(minutes=15)
+    )
+
+
+def test_fields_read_through_to_master() -> None:
+    master = _master()
+    occurrence = _occurrence(master)
+
+    assert occurrence.subject == "Standup"
+    assert occurrence.location is master.location
+    assert occurrence.rrule_master_uid == "series-1"
+    assert occurrence.start.time_zone == "America/New_York"
+    assert occurrence.is_expanded_instance is True
+    assert occurrence.is_recurring is False
+    assert occurrence.is_busy_status is master.is_busy_status
+
+
+def test_to_event_and_model_dump_match_full_event() -> None:
+    occurrence = _occurrence(_master())
+    event = occurrence.to_event()
+
+    assert isinstance(event, LiteCalendarEvent)
+    assert event.id == occurrence.id
+    assert event.start == occurrence.start
+    assert event.end == occurrence.end
+    assert event.rrule_master_uid == "series-1"
+    assert event.is_expanded_instance is True
+    assert occurrence.model_dump(mode="json") == event.model_dump(mode="json")
+
+
+def test_occurrence_has_no_instance_dict_and_pickles() -> None:
+    occurrence = _occurrence(_master())
+
+    assert not hasattr(occurrence, "__dict__")
+    with pytest.raises(AttributeError):
+        occurrence.subject = "changed"
+    assert pickle.loads(pickle.dumps(occurrence)) == occurrence
+
+
+def test_equal_occurrences_when_hashed_then_deduplicated() -> None:
+    master = _master()
+    occurrence = _occurrence(master)
+    later = ExpandedOccurrence(
+        master,
+        "series-1_20251106T090000",
+        occurrence.start.date_time + timedelta(days=1),
+        occurrence.end.date_time + timedelta(days=1),
+    )
+
+    assert occurrence == _occurrence(master)
+    assert hash(occurrence) == hash(_occurrence(master))
+    assert {occurrence, _occurrence(master), later} == {occurrence, later}
+    assert hash(occurrence.start) == hash(_occurrence(master).start)
@@ -0,0 +1,158 @@
+"""Unit tests for the fast-path VEVENT tokenizer."""
+
+import pytest
+from icalendar import Calendar
+
+from calendarbot_lite.calendar.lite_attendee_parser import LiteAttendeeParser
+from calendarbot_lite.calendar.lite_datetime_utils import LiteDateTimeParser
+from calendarbot_lite.calendar.lite_event_parser import LiteEventComponentParser
+from calendarbot_lite.calendar.lite_fast_tokenizer import parse_vevent_lines
+from calendarbot_lite.calendar.lite_streaming_parser import LiteStreamingICSParser
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _lines(*props: str) -> list[str]:
+    return ["BEGIN:VEVENT", "UID:evt-1@example.com", *props, "END:VEVENT"]
+
+
+def _icalendar_component(lines: list[str]):
+    ics = "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:test\n" + "\n".join(lines) + "\nEND:VCALENDAR\n"
+    return Calendar.from_ical(ics).walk("VEVENT")[0]
+
+
+@pytest.fixture
+def mapper() -> LiteEventComponentParser:
+    class _Settings:
+        user_email = "jane@example.com"
+
+    return LiteEventComponentParser(LiteDateTimeParser(), LiteAttendeeParser(), _Settings())
+
+
+@pytest.mark.parametrize(
+    "props",
+    [
+        ("DTSTART:20260301T090000Z", "DTEND:20260301T100000Z", r"SUMMARY:Plan\, review\; ship"),
+        (
+            "DTSTART;TZID=America/New_York:20260301T090000",
+            "DURATION:PT45M",
+            r"DESCRIPTION:Line one\nLine two\\ https://teams.microsoft.com/l/meetup-join/abc",
+            "LOCATION:Room 4",
+        ),
+        ("DTSTART;VALUE=DATE:20260301", "DTEND;VALUE=DATE:20260302", "TRANSP:TRANSPARENT"),
+        ("DTSTART;TZID=Pacific Standard Time:20260301T090000", "STATUS:TENTATIVE"),
+        ("DTSTART;TZID=Unknown/Zone:20260301T090000", "CREATED:20260101T000000Z"),
+        (
+            "DTSTART:20260301T090000",
+            "ORGANIZER;CN=Jane Doe:mailto:jane@example.com",
+            'ATTENDEE;CN="Smith, John";ROLE=OPT-PARTICIPANT;PARTSTAT=ACCEPTED:mailto:john@x.com',
+            "ATTENDEE;PARTSTAT=DECLINED:mailto:amy@example.com",
+            "X-MICROSOFT-CDO-BUSYSTATUS:FREE",
+            "SUMMARY:Following: sync",
+        ),
+        ("DTSTART:20260301T090000Z", "X-OUTLOOK-DELETED:TRUE", "LAST-MODIFIED:20260201"),
+        (
+            "DTSTART:20260301T090000Z",
+            'DESCRIPTION;ALTREP="cid:part1.0001@example.org":See: notes',
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            "DESCRIPTION:Reminder",
+            "TRIGGER:-PT15M",
+            "END:VALARM",
+            "DTSTAMP:20260101T000000Z",
+            "X-ALT-DESC;FMTTYPE=text/html:<b>ignored</b>",
+        ),
+    ],
+    ids=[
+        "utc_escapes",
+        "tzid_duration",
+        "all_day",
+        "windows_tzid",
+        "unknown_tzid",
+        "attendees",
+        "ms_deleted",
+        "valarm_and_ignored",
+    ],
+)
+def test_parse_vevent_lines_when_plain_event_then_maps_like_icalendar(mapper, props) -> None:
+    """Fast components map to the same LiteCalendarEvent as icalendar components."""
+    lines = _lines(*props)
+
+    fast = parse_vevent_lines(lines)
+
+    assert fast is not None
+    expected = mapper.parse_event_component(_icalendar_component(lines), "America/New_York")
+    actual = mapper.parse_event_component(fast, "America/New_York")
+    assert actual is not None
+    assert expected is not None
+    assert actual.model_dump() == expected.model_dump()
+
+
+@pytest.mark.parametrize(
+    "props",
+    [
+        ("DTSTART:20260301T090000Z", "RRULE:FREQ=WEEKLY"),
+        ("DTSTART:20260301T090000Z", "RECURRENCE-ID:20260301T090000Z"),
+        ("DTSTART:20260301T090000Z", "EXDATE:20260308T090000Z"),
+        ("DTSTART:20260301T090000Z", "REQUEST-STATUS:2.0;Success"),
+        ("DTSTART:20260301T090000Z", "SUMMARY:a", "SUMMARY:b"),
+        ("DTSTART:20260301T090000Z", "ATTENDEE;CN=A^nB:mailto:a@example.com"),
+        ("DTSTART:20260301T090000Z", "ATTENDEE;MEMBER=a,b:mailto:a@example.com"),
+        ("DTSTART:20260301T0900",),
+        ("DTSTART;TZID=Europe/Berlin:20260301",),
+        ("DTSTART:20260301T090000Z", "DURATION:1H"),
+        ("DTSTART:20260301T090000Z", "BEGIN:VTODO", "END:VTODO"),
+        ("DTSTART:20260301T090000Z", "SUMMARY;VALUE=URI:x"),
+    ],
+    ids=[
+        "rrule",
+        "recurrence_id",
+        "exdate",
+        "unknown_property",
+        "repeated_summary",
+        "caret_param",
+        "multi_value_param",
+        "short_datetime",
+        "tzid_date",
+        "bad_duration",
+        "nested_component",
+        "value_param",
+    ],
+)
+def test_parse_vevent_lines_when_unsupported_then_returns_none(props) -> None:
+    """Anything the fast path does not fully understand is left to icalendar."""
+    assert parse_vevent_lines(_lines(*props)) is None
+
+
+def test_parse_vevent_lines_when_single_or_repeated_attendee_then_shape_matches_icalendar() -> None:
+    """A single ATTENDEE is a scalar, repeated ones a list, as with icalendar."""
+    single = parse_vevent_lines(_lines("ATTENDEE;CN=A:mailto:a@example.com"))
+    repeated = parse_vevent_lines(
+        _lines("ATTENDEE:mailto:a@example.com", "attendee:mailto:b@example.com")
+    )
+
+    assert single is not None
+    assert repeated is not None
+    assert single.get("attendee") == "mailto:a@example.com"
+    assert single.get("ATTENDEE").params == {"CN": "A"}
+    assert repeated.get("ATTENDEE") == ["mailto:a@example.com", "mailto:b@example.com"]
+    assert "RRULE" not in repeated
+
+
+def test_streaming_parser_when_mixed_events_then_only_recurring_fall_back() -> None:
+    """The streaming parser tokenizes plain events itself and counts icalendar fallbacks."""
+    ics = (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:test\r\n"
+        "BEGIN:VEVENT\r\nUID:single\r\nDTSTART:20260301T090000Z\r\nSUMMARY:One-off\r\n"
+        "END:VEVENT\r\n"
+        "BEGIN:VEVENT\r\nUID:series\r\nDTSTART:20260301T090000Z\r\nRRULE:FREQ=DAILY\r\n"
+        "SUMMARY:Series\r\nEND:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+    parser = LiteStreamingICSParser()
+
+    items = [item for item in parser.parse_stream(ics) if item["type"] == "event"]
+
+    assert [str(item["component"].get("UID")) for item in items] == ["single", "series"]
+    assert parser.fast_path_events == 1
+    assert parser.fallback_events == 1
@@ -0,0 +1,212 @@
+"""Unit tests for per-VEVENT fingerprints and incremental reparsing."""
+
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from calendarbot_lite.calendar.lite_fingerprint import ICSSplitter, split_ics
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+HEADER = "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\nX-WR-CALNAME:Team\r\n"
+
+
+def _vevent(
+    uid: str, summary: str, start: str, extra: str = "", dtstamp: str = "20260101T000000Z"
+) -> str:
+    return (
+        "BEGIN:VEVENT\r\n"
+        f"UID:{uid}\r\n"
+        f"DTSTAMP:{dtstamp}\r\n"
+        f"DTSTART:{start}\r\n"
+        "DURATION:PT1H\r\n"
+        f"SUMMARY:{summary}\r\n"
+        f"{extra}"
+        "END:VEVENT\r\n"
+    )
+
+
+def _calendar(*events: str) -> str:
+    return HEADER + "".join(events) + "END:VCALENDAR\r\n"
+
+
+@pytest.fixture
+def parser() -> LiteICSParser:
+    settings = SimpleNamespace(
+        enable_rrule_expansion=True,
+        rrule_expansion_days=30,
+        expansion_days_window=30,
+        max_occurrences_per_rule=250,
+    )
+    return LiteICSParser(settings)
+
+
+async def _chunks(content: str, size: int = 7) -> AsyncIterator[bytes]:
+    body = content.encode("utf-8")
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def _event_keys(events: list) -> set:
+    return {
+        (e.rrule_master_uid or e.id, e.subject, e.start.date_time, e.recurrence_id) for e in events
+    }
+
+
+def test_split_ics_when_dtstamp_changes_then_digest_stable() -> None:
+    """DTSTAMP is regenerated on every export and must not change the fingerprint."""
+    a = split_ics(_calendar(_vevent("a@x", "Standup", "20260301T090000Z")))
+    b = split_ics(
+        _calendar(_vevent("a@x", "Standup", "20260301T090000Z", dtstamp="20260202T000000Z"))
+    )
+
+    assert a.group_digests() == b.group_digests()
+    assert a.envelope_digest == b.envelope_digest
+    assert a.blocks[0].uid == "a@x"
+
+
+def test_split_ics_when_uid_folded_then_unfolded_and_valarm_ignored_for_identity() -> None:
+    """Folded UIDs are unfolded; a nested VALARM UID does not replace the event UID."""
+    block = (
+        "BEGIN:VEVENT\r\n"
+        "UID:very-long-\r\n"
+        " uid@example.com\r\n"
+        "DTSTART:20260301T090000Z\r\n"
+        "RECURRENCE-ID:20260301T090000Z\r\n"
+        "BEGIN:VALARM\r\n"
+        "UID:alarm-uid\r\n"
+        "END:VALARM\r\n"
+        "END:VEVENT\r\n"
+    )
+    split = split_ics(_calendar(block))
+
+    assert split.blocks[0].uid == "very-long-uid@example.com"
+    assert split.blocks[0].recurrence_id == "20260301T090000Z"
+    assert split.build_calendar(split.blocks) == _calendar(block)
+
+
+def test_parse_incremental_when_one_event_changes_then_only_its_group_reparsed(
+    parser: LiteICSParser,
+) -> None:
+    """Unchanged UID groups (including RRULE series) are reused; the result matches a full parse."""
+    series = _vevent("series@x", "Weekly", "20260105T150000Z", extra="RRULE:FREQ=WEEKLY\r\n")
+    single = _vevent("single@x", "Review", "20260310T100000Z")
+    before = _calendar(series, single)
+    after = _calendar(
+        _vevent(
+            "series@x",
+            "Weekly",
+            "20260105T150000Z",
+            extra="RRULE:FREQ=WEEKLY\r\n",
+            dtstamp="20260301T000000Z",
+        ),
+        _vevent("single@x", "Review (moved)", "20260311T100000Z"),
+    )
+
+    first, state = parser.parse_ics_content_incremental(before)
+    assert first.success
+    assert state is not None
+
+    parsed_inputs: list[str] = []
+    original = parser.parse_ics_content
+
+    def _spy(content, source_url=None):
+        parsed_inputs.append(content)
+        return original(content, source_url)
+
+    with patch.object(parser, "parse_ics_content", side_effect=_spy):
+        second, next_state = parser.parse_ics_content_incremental(after, state)
+
+    assert second.success
+    assert next_state is not None
+    assert len(parsed_inputs) == 1
+    assert "single@x" in parsed_inputs[0]
+    assert "series@x" not in parsed_inputs[0]
+    assert _event_keys(second.events) == _event_keys(parser.parse_ics_content(after).events)
+    assert second.calendar_name == "Team"
+
+
+def test_parse_incremental_when_event_removed_then_its_events_dropped(
+    parser: LiteICSParser,
+) -> None:
+    """Removing a VEVENT removes its events without reparsing the others."""
+    keep = _vevent("keep@x", "Keep", "20260310T100000Z")
+    drop = _vevent("drop@x", "Drop", "20260311T100000Z")
+
+    _, state = parser.parse_ics_content_incremental(_calendar(keep, drop))
+    result, _ = parser.parse_ics_content_incremental(_calendar(keep), state)
+
+    assert [e.id for e in result.events] == ["keep@x"]
+    assert result.event_count == 1
+
+
+def test_parse_incremental_when_envelope_changes_then_full_reparse(
+    parser: LiteICSParser,
+) -> None:
+    """A changed calendar header (e.g. default timezone) invalidates every group."""
+    event = _vevent("a@x", "Standup", "20260301T090000Z")
+    _, state = parser.parse_ics_content_incremental(_calendar(event))
+
+    changed = _calendar(event).replace(
+        "X-WR-CALNAME:Team", "X-WR-CALNAME:Team\r\nX-WR-TIMEZONE:UTC"
+    )
+    with patch.object(parser, "parse_ics_content", wraps=parser.parse_ics_content) as spy:
+        parser.parse_ics_content_incremental(changed, state)
+
+    assert spy.call_args.args[0] == changed
+
+
+def test_splitter_when_streamed_in_chunks_then_same_fingerprints_as_split_ics() -> None:
+    """Fingerprints of a chunked byte stream match those of the buffered feed."""
+    content = _calendar(
+        _vevent("a@x", "Caf\u00e9", "20260301T090000Z", extra="RRULE:FREQ=DAILY\r\n"),
+        _vevent("b@x", "Review", "20260310T100000Z"),
+    )
+    splitter = ICSSplitter(keep_text=False)
+    body = content.encode("utf-8")
+    for i in range(0, len(body), 5):
+        splitter.update(body[i : i + 5])
+    streamed = splitter.finish()
+    buffered = split_ics(content)
+
+    assert streamed.envelope_digest == buffered.envelope_digest
+    assert streamed.group_digests() == buffered.group_digests()
+    assert [b.has_rrule for b in streamed.blocks] == [True, False]
+    assert all(b.text == "" for b in streamed.blocks)
+
+
+@pytest.mark.asyncio
+async def test_parse_stream_incremental_when_series_unchanged_then_not_expanded_again(
+    parser: LiteICSParser,
+) -> None:
+    """A streamed parse reuses the expansions of unchanged UID groups from the last state."""
+    series = _vevent("series@x", "Weekly", "20260105T150000Z", extra="RRULE:FREQ=WEEKLY\r\n")
+    before = _calendar(series, _vevent("single@x", "Review", "20260310T100000Z"))
+    after = _calendar(
+        _vevent(
+            "series@x",
+            "Weekly",
+            "20260105T150000Z",
+            extra="RRULE:FREQ=WEEKLY\r\n",
+            dtstamp="20260301T000000Z",
+        ),
+        _vevent("single@x", "Review (moved)", "20260311T100000Z"),
+    )
+
+    _, state = await parser.parse_ics_stream_incremental(_chunks(before))
+    assert state is not None
+    with patch.object(
+        parser, "_expand_recurring_events", wraps=parser._expand_recurring_events
+    ) as expand:
+        result, next_state = await parser.parse_ics_stream_incremental(_chunks(after), state)
+
+    assert result.success
+    expand.assert_not_called()
+    assert next_state is not None
+    assert next_state.events_by_uid["series@x"] == state.events_by_uid["series@x"]
+    assert _event_keys(result.events) == _event_keys(parser.parse_ics_content(after).events)
+    assert result.event_count == 2
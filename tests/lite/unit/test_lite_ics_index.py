@@ -0,0 +1,129 @@
+"""Unit tests for the index-then-parse first pass over huge ICS feeds."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from calendarbot_lite.calendar.lite_ics_index import index_ics
+from calendarbot_lite.calendar.lite_parse_window import ParseWindow
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+WINDOW = ParseWindow(start=NOW - timedelta(days=1), end=NOW + timedelta(days=30))
+
+HEAD = "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+VTIMEZONE = (
+    "BEGIN:VTIMEZONE\r\nTZID:US/Pacific\r\nBEGIN:STANDARD\r\nDTSTART:19701101T020000\r\n"
+    "TZOFFSETFROM:-0700\r\nTZOFFSETTO:-0800\r\nEND:STANDARD\r\nEND:VTIMEZONE\r\n"
+)
+
+
+def _event(uid: str, *lines: str) -> str:
+    return (
+        "BEGIN:VEVENT\r\n"
+        + f"UID:{uid}\r\n"
+        + "".join(f"{line}\r\n" for line in lines)
+        + ("END:VEVENT\r\n")
+    )
+
+
+EVENTS = {
+    "ancient": _event(
+        "ancient", "DTSTART:20200301T090000Z", "DTEND:20200301T100000Z", "SUMMARY:Old"
+    ),
+    "soon": _event(
+        "soon",
+        "DTSTART;TZID=US/Pacific:20250616T090000",
+        "DURATION:PT30M",
+        "BEGIN:VALARM",
+        "TRIGGER:-PT15M",
+        "DURATION:P400D",
+        "END:VALARM",
+    ),
+    "series": _event(
+        "series", "DTSTART:20200106T090000Z", "DTEND:20200106T093000Z", "RRULE:FREQ=WEEKLY"
+    ),
+    "moved": _event(
+        "series",
+        "RECURRENCE-ID:20250616T090000Z",
+        "DTSTART:20200110T090000Z",
+        "DTEND:20200110T093000Z",
+    ),
+    "edge": _event("edge", "DTSTART;VALUE=DATE:20250613", "DTEND;VALUE=DATE:20250614"),
+    "odd": _event("odd", "DTSTART:tomorrow", "SUMMARY:Unreadable start"),
+    "far": _event('urn:uuid:far;"x"', "DTSTART:20270101T090000Z", "DTEND:20270101T100000Z"),
+}
+FEED = HEAD + "".join(EVENTS.values()) + VTIMEZONE + "END:VCALENDAR\r\n"
+
+
+def test_index_when_feed_scanned_then_records_each_vevent() -> None:
+    index = index_ics(FEED)
+
+    assert index is not None
+    assert [FEED[e.start : e.end] for e in index.events] == list(EVENTS.values())
+    assert [e.uid for e in index.events][-1] == 'urn:uuid:far;"x"'
+    soon = index.events[1]
+    assert soon.dtstart == datetime(2025, 6, 16, 9, 0, tzinfo=UTC)
+    assert soon.dtend == soon.dtstart + timedelta(minutes=30)  # Not the VALARM DURATION
+    assert soon.local_time
+    assert not soon.recurring
+    assert index.events[2].recurring
+    assert index.events[3].recurrence_id == datetime(2025, 6, 16, 9, 0, tzinfo=UTC)
+    assert index.events[5].unreadable
+    assert index.build_calendar(index.events) == FEED
+
+
+def test_select_when_window_set_then_keeps_everything_the_window_may_need() -> None:
+    index = index_ics(FEED)
+    assert index is not None
+
+    selected = index.select(WINDOW)
+
+    assert [FEED[e.start : e.end] for e in selected] == [
+        EVENTS[name] for name in ("soon", "series", "moved", "edge", "odd")
+    ]
+    rebuilt = index.build_calendar(selected)
+    assert rebuilt.startswith(HEAD)
+    assert rebuilt.endswith(VTIMEZONE + "END:VCALENDAR\r\n")
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        HEAD + "END:VCALENDAR\r\n",
+        HEAD + "BEGIN:VEVENT\r\nUID:open\r\nEND:VCALENDAR\r\n",
+        HEAD + "END:VEVENT\r\nEND:VCALENDAR\r\n",
+        HEAD + "BEGIN:VEVENT\r\nBEGIN:VEVENT\r\nEND:VEVENT\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n",
+    ],
+)
+def test_index_when_no_or_malformed_vevents_then_none(content: str) -> None:
+    assert index_ics(content) is None
+
+
+class WindowSettings:
+    enable_rrule_expansion = True
+    rrule_expansion_days = 14
+    expansion_days_window = 30
+    parse_window_lookback_days = 1
+
+
+def test_streaming_parse_when_indexed_then_matches_tokenizer_filtering(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", NOW.isoformat())
+    parser = LiteICSParser(WindowSettings())
+
+    feed = FEED.replace(EVENTS["odd"], "")  # Fails the streaming parse with or without index
+    indexed = parser._parse_with_streaming(feed)
+    indexed_skips = parser._streaming_parser.window_skipped_events
+    monkeypatch.setattr(parser, "_select_window_events", lambda content, _window: (content, 0))
+    tokenized = parser._parse_with_streaming(feed)
+
+    assert indexed.success
+    assert tokenized.success
+    assert sorted(e.id for e in indexed.events) == sorted(e.id for e in tokenized.events)
+    assert indexed_skips == parser._streaming_parser.window_skipped_events == 2
+    assert indexed.phase_timings["index"]["calls"] == 1
+    assert {"soon", "edge"} <= {e.id for e in indexed.events}
@@ -0,0 +1,85 @@
+"""Unit tests for calendarbot_lite.calendar.lite_intern."""
+
+from types import SimpleNamespace
+
+import pytest
+from icalendar import Calendar
+
+from calendarbot_lite.calendar.lite_intern import InternTable
+from calendarbot_lite.calendar.lite_models import LiteAttendee, LiteResponseStatus
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+SERIES_ICS = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//EN
+BEGIN:VEVENT
+UID:standup@example.com
+SUMMARY:Team Standup
+LOCATION:Room 4
+DTSTART;TZID=America/New_York:20251103T090000
+DTEND;TZID=America/New_York:20251103T091500
+RRULE:FREQ=DAILY;COUNT=5
+ATTENDEE;CN=Ada;PARTSTAT=ACCEPTED:mailto:ada@example.com
+END:VEVENT
+BEGIN:VEVENT
+UID:standup@example.com
+RECURRENCE-ID;TZID=America/New_York:20251104T090000
+SUMMARY:Team Standup
+LOCATION:Room 4
+DTSTART;TZID=America/New_York:20251104T100000
+DTEND;TZID=America/New_York:20251104T101500
+ATTENDEE;CN=Ada;PARTSTAT=ACCEPTED:mailto:ada@example.com
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_string_returns_first_equal_instance() -> None:
+    table = InternTable()
+    first = "".join(["Team ", "Standup"])
+    second = "".join(["Team", " Standup"])
+
+    assert table.string(first) is first
+    assert table.string(second) is first
+    assert table.string(None) is None
+    assert (table.lookups, table.hits) == (2, 1)
+
+
+def test_locations_and_attendees_are_shared() -> None:
+    table = InternTable()
+    ada = LiteAttendee(name="Ada", email="ada@example.com")
+
+    assert table.location("Room 4") is table.location("Room 4")
+    assert table.attendee(ada) is table.attendee(ada.model_copy())
+    declined = ada.model_copy(update={"response_status": LiteResponseStatus.DECLINED})
+    assert table.attendee(declined) is not table.attendee(ada)
+
+
+def test_parsed_series_shares_repeated_fields() -> None:
+    parser = LiteICSParser(SimpleNamespace())
+    table = InternTable()
+    components = [c for c in Calendar.from_ical(SERIES_ICS).walk() if c.name == "VEVENT"]
+
+    master, override = (parser._parse_event_component(c, None, table) for c in components)
+
+    assert master.id is override.id
+    assert master.subject is override.subject
+    assert master.location is override.location
+    assert master.attendees[0] is override.attendees[0]
+    assert master.start.time_zone is override.end.time_zone
+
+
+def test_parse_result_is_unchanged_by_interning() -> None:
+    parser = LiteICSParser(SimpleNamespace())
+    components = [c for c in Calendar.from_ical(SERIES_ICS).walk() if c.name == "VEVENT"]
+
+    plain = [parser._parse_event_component(c, None) for c in components]
+    interned = [parser._parse_event_component(c, None, InternTable()) for c in components]
+
+    assert [e.model_dump() for e in interned] == [e.model_dump() for e in plain]
+    assert [e.model_fields_set for e in interned] == [e.model_fields_set for e in plain]
+    assert [e.__dict__.get("rrule_string") for e in interned] == [
+        e.__dict__.get("rrule_string") for e in plain
+    ]
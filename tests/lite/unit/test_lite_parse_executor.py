@@ -0,0 +1,198 @@
+"""Unit tests for the process-pool ICS parse executor."""
+
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from calendarbot_lite.calendar.lite_models import ExpandedOccurrence, LiteCalendarEvent
+from calendarbot_lite.calendar.lite_parse_executor import ParseExecutor, snapshot_settings
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.domain.pipeline import ProcessingContext
+from calendarbot_lite.domain.pipeline_stages import ParseStage
+
+pytestmark = pytest.mark.unit
+
+
+def _calendar(count: int) -> str:
+    events = "".join(
+        "BEGIN:VEVENT\r\n"
+        f"UID:event-{i}@example.com\r\n"
+        "DTSTAMP:20260101T000000Z\r\n"
+        f"DTSTART:202603{(i % 28) + 1:02d}T{(i % 10) + 8:02d}0000Z\r\n"
+        "DURATION:PT30M\r\n"
+        f"SUMMARY:Meeting {i}\r\n"
+        f"{'RRULE:FREQ=WEEKLY;COUNT=4' if i % 5 == 0 else 'LOCATION:Room 1'}\r\n"
+        "END:VEVENT\r\n"
+        for i in range(count)
+    )
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+        f"X-WR-CALNAME:Team\r\n{events}END:VCALENDAR\r\n"
+    )
+
+
+@pytest.fixture
+def parser() -> LiteICSParser:
+    class _Settings:
+        rrule_expansion_days = 30
+        enable_rrule_expansion = True
+
+    return LiteICSParser(_Settings())
+
+
+@pytest.fixture
+def executor():
+    parse_executor = ParseExecutor(max_workers=1)
+    yield parse_executor
+    parse_executor.shutdown()
+
+
+def _keys(events: list) -> list:
+    return sorted(
+        (e.rrule_master_uid or e.id, e.subject, e.start.date_time, e.is_expanded_instance)
+        for e in events
+    )
+
+
+def test_snapshot_settings_when_adhoc_class_then_plain_attributes_only() -> None:
+    """Local settings classes are reduced to picklable attributes."""
+
+    class _Settings:
+        rrule_expansion_days = 14
+        user_email = "me@example.com"
+        helper = staticmethod(lambda: None)
+
+    assert snapshot_settings(_Settings()) == {
+        "rrule_expansion_days": 14,
+        "user_email": "me@example.com",
+    }
+
+
+async def test_parse_when_run_in_worker_then_matches_in_process_parse(
+    parser: LiteICSParser, executor: ParseExecutor
+) -> None:
+    """Events rebuilt from worker records equal those of an in-process parse."""
+    content = _calendar(40)
+
+    result = await executor.parse(parser, content, source_url="https://example.com/cal.ics")
+    expected = parser.parse_ics_content(content, "https://example.com/cal.ics")
+
+    assert result.success
+    assert result.calendar_name == "Team"
+    assert result.event_count == expected.event_count
+    assert _keys(result.events) == _keys(expected.events)
+
+
+async def test_parse_when_run_in_worker_then_occurrences_stay_compact(
+    parser: LiteICSParser, executor: ParseExecutor
+) -> None:
+    """Expanded occurrences come back as ExpandedOccurrence sharing one master per series."""
+    result = await executor.parse(parser, _calendar(10))
+
+    occurrences = [e for e in result.events if isinstance(e, ExpandedOccurrence)]
+    assert occurrences
+    assert all(isinstance(e, (LiteCalendarEvent, ExpandedOccurrence)) for e in result.events)
+    masters = {id(o.master) for o in occurrences}
+    assert len(masters) == len({o.rrule_master_uid for o in occurrences})
+
+
+async def test_parse_when_large_feed_then_event_loop_keeps_running(
+    parser: LiteICSParser, executor: ParseExecutor
+) -> None:
+    """Other coroutines keep being scheduled while a large feed is parsed."""
+    ticks = 0
+    done = asyncio.Event()
+
+    async def _ticker() -> None:
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(_ticker())
+    result = await executor.parse(parser, _calendar(1500))
+    done.set()
+    await ticker
+
+    assert result.success
+    assert ticks > 5
+
+
+async def test_parse_when_pool_broken_then_falls_back_to_in_process(
+    parser: LiteICSParser, executor: ParseExecutor
+) -> None:
+    """A crashed worker pool does not fail the refresh."""
+    content = _calendar(3)
+    loop = asyncio.get_running_loop()
+
+    with patch.object(loop, "run_in_executor", side_effect=BrokenProcessPool("worker died")):
+        result = await executor.parse(parser, content)
+
+    assert result.success
+    assert len(result.events) == len(parser.parse_ics_content(content).events)
+
+
+async def test_parse_stage_when_incremental_with_executor_then_only_changes_sent(
+    parser: LiteICSParser,
+) -> None:
+    """With an executor, only the changed part of an incremental parse leaves the process."""
+    before = _calendar(3)
+    after = before.replace("SUMMARY:Meeting 1\r\n", "SUMMARY:Meeting 1 (moved)\r\n")
+    _, state = parser.parse_ics_content_incremental(before)
+
+    sent: list[str] = []
+
+    async def _fake_parse(p, content, source_url=None, optimized=False):
+        sent.append(content)
+        return p.parse_ics_content(content, source_url)
+
+    context = ProcessingContext(raw_content=after, extra={"fingerprint_state": state})
+    stage = ParseStage(parser, executor=SimpleNamespace(parse=_fake_parse))
+    result = await stage.process(context)
+
+    assert result.success
+    assert len(sent) == 1
+    assert "event-1@example.com" in sent[0]
+    assert "event-2@example.com" not in sent[0]
+    assert _keys(context.events) == _keys(parser.parse_ics_content(after).events)
+    assert context.extra["fingerprint_state"] is not None
+
+
+async def test_parse_sharded_when_run_in_workers_then_matches_in_process_parse(
+    parser: LiteICSParser, executor: ParseExecutor
+) -> None:
+    """Shards parsed in worker processes combine into the single-process result."""
+    content = _calendar(60)
+
+    result = await executor.parse_sharded(parser, content, "https://example.com/cal.ics", 3)
+    expected = parser.parse_ics_content(content, "https://example.com/cal.ics")
+
+    assert result.success
+    assert result.model_dump(exclude={"parse_time", "phase_timings"}) == expected.model_dump(
+        exclude={"parse_time", "phase_timings"}
+    )
+    # Phases timed in the workers are merged into the result
+    assert set(result.phase_timings) == set(expected.phase_timings)
+
+
+async def test_parse_when_sharded_and_feed_large_then_parses_sharded(
+    parser: LiteICSParser,
+) -> None:
+    """Sharded executors split large feeds; small feeds still go to one worker."""
+    executor = ParseExecutor(max_workers=1, sharded=True)
+    executor.max_workers = 2  # More than one worker even on a single-CPU runner
+    executor.parse_sharded = AsyncMock(return_value="sharded")  # type: ignore[method-assign]
+    content = _calendar(3)
+
+    with patch("calendarbot_lite.calendar.lite_parse_executor.SHARD_MIN_BYTES", len(content)):
+        assert await executor.parse(parser, content) == "sharded"
+    try:
+        result = await executor.parse(parser, content)
+    finally:
+        executor.shutdown()
+
+    assert result.success
+    executor.parse_sharded.assert_awaited_once_with(parser, content, None)
@@ -0,0 +1,176 @@
+"""Unit tests for parse-time window prefiltering."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from icalendar import Calendar
+
+from calendarbot_lite.calendar.lite_parse_window import ParseWindow
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_streaming_parser import LiteStreamingICSParser
+from calendarbot_lite.domain.pipeline import ProcessingContext
+from calendarbot_lite.domain.pipeline_stages import TimeWindowStage
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+
+FEED = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//Test//EN
+BEGIN:VEVENT
+UID:ancient@example.com
+DTSTART:20200301T090000Z
+DTEND:20200301T100000Z
+SUMMARY:Years ago
+ATTENDEE;CN=Ann:mailto:ann@example.com
+END:VEVENT
+BEGIN:VEVENT
+UID:yesterday@example.com
+DTSTART:20250614T150000Z
+DTEND:20250614T160000Z
+SUMMARY:Yesterday
+END:VEVENT
+BEGIN:VEVENT
+UID:soon@example.com
+DTSTART:20250616T090000Z
+DURATION:PT30M
+SUMMARY:Tomorrow
+END:VEVENT
+BEGIN:VEVENT
+UID:far@example.com
+DTSTART:20270101T090000Z
+DTEND:20270101T100000Z
+SUMMARY:Too far ahead
+END:VEVENT
+BEGIN:VEVENT
+UID:allday@example.com
+DTSTART;VALUE=DATE:20250615
+DTEND;VALUE=DATE:20250616
+SUMMARY:All day today
+END:VEVENT
+BEGIN:VEVENT
+UID:series@example.com
+DTSTART:20200106T090000Z
+DTEND:20200106T093000Z
+RRULE:FREQ=WEEKLY;BYDAY=MO
+SUMMARY:Old weekly series
+END:VEVENT
+BEGIN:VEVENT
+UID:series@example.com
+RECURRENCE-ID:20250616T090000Z
+DTSTART:20200110T090000Z
+DTEND:20200110T093000Z
+SUMMARY:Moved far back
+END:VEVENT
+BEGIN:VEVENT
+UID:series@example.com
+RECURRENCE-ID:20210104T090000Z
+DTSTART:20210105T090000Z
+DTEND:20210105T093000Z
+SUMMARY:Old override
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+class WindowSettings:
+    enable_rrule_expansion = True
+    rrule_expansion_days = 14
+    expansion_days_window = 365
+    parse_window_lookback_days = 1
+
+
+class PlainSettings:
+    enable_rrule_expansion = True
+    rrule_expansion_days = 14
+    expansion_days_window = 365
+
+
+@pytest.fixture(autouse=True)
+def _fixed_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", NOW.isoformat())
+
+
+def _components() -> dict[str, object]:
+    calendar = Calendar.from_ical(FEED)
+    return {str(c.get("SUMMARY")): c for c in calendar.walk("VEVENT")}
+
+
+async def _windowed(events: list) -> list[tuple[str, datetime]]:
+    context = ProcessingContext(
+        events=events,
+        window_start=NOW - timedelta(hours=24),
+        window_end=NOW + timedelta(days=365),
+    )
+    await TimeWindowStage().process(context)
+    return sorted((e.id, e.start.date_time) for e in context.events)
+
+
+def test_from_settings_when_lookback_unset_then_none() -> None:
+    assert ParseWindow.from_settings(PlainSettings(), NOW) is None
+    assert ParseWindow.from_settings(SimpleNamespace(parse_window_lookback_days=-1), NOW) is None
+
+    window = ParseWindow.from_settings(WindowSettings(), NOW)
+
+    assert window == ParseWindow(start=NOW - timedelta(days=1), end=NOW + timedelta(days=365))
+
+
+def test_admits_when_components_checked_then_only_out_of_window_singles_rejected() -> None:
+    window = ParseWindow.from_settings(WindowSettings(), NOW)
+    assert window is not None
+
+    admitted = {summary for summary, c in _components().items() if window.admits(c)}
+
+    assert admitted == {
+        "Yesterday",
+        "Tomorrow",
+        "All day today",
+        "Old weekly series",  # RRULE masters are always kept
+        "Moved far back",  # Replaces an in-window slot
+    }
+
+
+def test_parse_when_window_set_then_same_windowed_events_and_fewer_parsed() -> None:
+    plain = LiteICSParser(PlainSettings()).parse_ics_content(FEED)
+    windowed = LiteICSParser(WindowSettings()).parse_ics_content(FEED)
+
+    assert plain.success
+    assert windowed.success
+    assert windowed.event_count == plain.event_count - 3
+    assert not any(e.id in {"ancient@example.com", "far@example.com"} for e in windowed.events)
+
+
+async def test_windowed_parse_matches_plain_parse_after_time_window() -> None:
+    plain = LiteICSParser(PlainSettings()).parse_ics_content(FEED)
+    windowed = LiteICSParser(WindowSettings()).parse_ics_content(FEED)
+
+    assert await _windowed(windowed.events) == await _windowed(plain.events)
+    # The moved override still replaces its slot in the expanded series
+    assert "series@example.com_20250616T090000Z" not in {e.id for e in windowed.events}
+    assert "series@example.com_20250623T090000Z" in {e.id for e in windowed.events}
+
+
+async def test_streaming_and_sharded_parse_when_window_set_then_match_in_memory_parse() -> None:
+    parser = LiteICSParser(WindowSettings())
+    expected = await _windowed(parser.parse_ics_content(FEED).events)
+
+    streamed = parser._parse_with_streaming(FEED)
+    sharded = parser.parse_ics_content_sharded(FEED, shard_count=3)
+
+    assert await _windowed(streamed.events) == expected
+    assert await _windowed(sharded.events) == expected
+    assert parser._streaming_parser.window_skipped_events == 3
+
+
+def test_streaming_tokenizer_when_window_set_then_skipped_events_not_yielded() -> None:
+    tokenizer = LiteStreamingICSParser()
+    tokenizer.parse_window = ParseWindow.from_settings(WindowSettings(), NOW)
+
+    uids = [str(item["component"].get("UID")) for item in tokenizer.parse_stream(FEED)]
+
+    assert "ancient@example.com" not in uids
+    assert "far@example.com" not in uids
+    assert uids.count("series@example.com") == 2
+    assert tokenizer.window_skipped_events == 3
@@ -482,7 +482,7 @@ class TestExpandRecurringEvents:
             mock_expand.return_value = []
             parser._expand_recurring_events(events, components)
 
-            mock_expand.assert_called_once_with(events, components)
+            mock_expand.assert_called_once_with(events, components, None, None)
 
 
 class TestMergeAndDeduplicateEvents:
@@ -497,7 +497,7 @@ class TestMergeAndDeduplicateEvents:
             mock_merge.return_value = []
             parser._merge_expanded_events(original, expanded)
 
-            mock_merge.assert_called_once_with(original, expanded)
+            mock_merge.assert_called_once_with(original, expanded, None)
 
     def test_deduplicate_events_delegates(self, parser):
         """Test that deduplication delegates to event merger."""
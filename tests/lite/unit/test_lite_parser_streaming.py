@@ -491,6 +491,31 @@ X-WR-TIMEZONE:UTC
     gc.collect()
 
 
+@pytest.mark.asyncio
+async def test_lite_parser_parse_ics_stream_when_chunked_then_matches_buffered_streaming():
+    """LiteICSParser.parse_ics_stream yields the same events as the buffered streaming path."""
+    from types import SimpleNamespace
+
+    from calendarbot_lite.calendar.lite_parser import LiteICSParser
+
+    settings = SimpleNamespace(enable_rrule_expansion=True, rrule_expansion_days=14)
+    ics_content = create_test_ics_content()
+    ics_bytes = ics_content.encode("utf-8")
+    chunks = [ics_bytes[i : i + 37] for i in range(0, len(ics_bytes), 37)]
+
+    streamed = await LiteICSParser(settings).parse_ics_stream(
+        AsyncByteIterator(chunks), source_url="test://example.com"
+    )
+    buffered = LiteICSParser(settings)._parse_with_streaming(ics_content, "test://example.com")
+
+    assert streamed.success
+    assert streamed.raw_content is None
+    assert streamed.calendar_name == "Test Calendar"
+    assert [(e.id, e.subject, e.start.date_time) for e in streamed.events] == [
+        (e.id, e.subject, e.start.date_time) for e in buffered.events
+    ]
+
+
 if __name__ == "__main__":
     # Run basic test manually
     asyncio.run(test_streaming_parser_basic_functionality())
@@ -1,8 +1,11 @@
 """Unit tests for lite_parser_telemetry module."""
 
+from types import SimpleNamespace
+
 import pytest
 
-from calendarbot_lite.calendar.lite_parser_telemetry import ParserTelemetry
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_parser_telemetry import PARSE_PHASES, ParserTelemetry
 
 pytestmark = pytest.mark.unit
 
@@ -254,5 +257,79 @@ class TestParserTelemetry:
         assert str(telemetry.warnings) in message
 
 
+def _feed(events: int) -> str:
+    blocks = [
+        "BEGIN:VEVENT\r\n"
+        f"UID:event-{i}@example.com\r\n"
+        "DTSTART:20990105T090000Z\r\n"
+        "DTEND:20990105T100000Z\r\n"
+        f"SUMMARY:Meeting {i}\r\n"
+        "DESCRIPTION:Join https://teams.microsoft.com/l/meetup-join/1\r\n"
+        "ATTENDEE;CN=Ann:mailto:ann@example.com\r\n"
+        + ("RRULE:FREQ=DAILY;COUNT=2\r\n" if i == 0 else "")
+        + "END:VEVENT\r\n"
+        for i in range(events)
+    ]
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+        + "".join(blocks)
+        + "END:VCALENDAR\r\n"
+    )
+
+
+class TestParserPhaseTimings:
+    """Tests for per-phase parse profiling."""
+
+    def test_phase_when_timed_repeatedly_then_time_and_calls_accumulate(self):
+        """Test that a phase timer adds up every timed section."""
+        telemetry = ParserTelemetry()
+
+        for _ in range(3):
+            with telemetry.phase("datetime"):
+                pass
+        with telemetry.phase("unfold"):
+            sum(range(1000))
+
+        timings = telemetry.get_phase_timings()
+        assert list(timings) == ["unfold", "datetime"]  # Pipeline order
+        assert timings["datetime"]["calls"] == 3
+        assert timings["unfold"]["ms"] > 0
+
+    def test_add_phase_timings_when_merging_worker_timings_then_summed(self):
+        """Test that timings from shards add to the local timers."""
+        telemetry = ParserTelemetry()
+        with telemetry.phase("from_ical"):
+            pass
+        local_ms = telemetry.get_phase_timings()["from_ical"]["ms"]
+
+        telemetry.add_phase_timings({"from_ical": {"ms": 5.0, "calls": 2}})
+        telemetry.add_phase_timings({"attendees": {"ms": 1.5, "calls": 4}})
+
+        timings = telemetry.get_phase_timings()
+        assert timings["from_ical"] == {"ms": round(local_ms + 5.0, 3), "calls": 3}
+        assert timings["attendees"] == {"ms": 1.5, "calls": 4}
+
+    def test_parse_result_when_parsed_then_reports_each_phase(self):
+        """Test that every parse path reports the phases it ran."""
+        parser = LiteICSParser(SimpleNamespace(enable_rrule_expansion=True))
+        feed = _feed(6)
+        mapping_phases = {"datetime", "attendees", "online_meeting"}
+
+        in_memory = parser.parse_ics_content(feed)
+        streamed = parser._parse_with_streaming(feed)
+        sharded = parser.parse_ics_content_sharded(feed, shard_count=3)
+
+        assert set(in_memory.phase_timings) == {"from_ical", "rrule_expansion"} | mapping_phases
+        # The RRULE master falls back to icalendar; there is no parse window to index for
+        assert set(streamed.phase_timings) == set(PARSE_PHASES) - {"index"}
+        assert streamed.phase_timings["tokenize"]["calls"] == 6
+        assert streamed.phase_timings["from_ical"]["calls"] == 1
+        assert set(sharded.phase_timings) == set(in_memory.phase_timings)
+        assert sharded.phase_timings["from_ical"]["calls"] == 4  # 3 shards + envelope
+        for result in (in_memory, streamed, sharded):
+            assert result.phase_timings["datetime"]["calls"] == 6
+            assert result.phase_timings["rrule_expansion"]["calls"] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Unit tests for the sliding-window RRULE expansion cache.
+
+Covers:
+- RRuleExpansionCache fingerprint matching, invalidation and LRU eviction
+- RRuleWorkerPool reusing cached occurrences when the window slides forward
+- equivalence of cached and from-scratch expansion (including rebased rules)
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from calendarbot_lite.calendar.lite_models import LiteEventStatus
+from calendarbot_lite.calendar.lite_rrule_cache import (
+    CachedExpansion,
+    RRuleExpansionCache,
+    expansion_fingerprint,
+)
+from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+class DummySettings:
+    rrule_worker_concurrency = 1
+    max_occurrences_per_rule = 250
+    expansion_days_window = 60
+    expansion_time_budget_ms_per_rule = 5000
+    expansion_yield_frequency = 50
+
+
+def _master(start_dt: datetime, master_id: str = "master-cache") -> SimpleNamespace:
+    master = SimpleNamespace()
+    master.start = SimpleNamespace(date_time=start_dt, time_zone=str(start_dt.tzinfo))
+    master.end = SimpleNamespace(date_time=start_dt + timedelta(minutes=30), time_zone="UTC")
+    master.id = master_id
+    master.subject = "Cached series"
+    master.body_preview = ""
+    master.is_all_day = False
+    master.show_as = LiteEventStatus.BUSY
+    master.is_cancelled = False
+    master.is_organizer = True
+    master.location = None
+    master.is_online_meeting = False
+    master.online_meeting_url = None
+    master.last_modified_date_time = None
+    return master
+
+
+async def _starts(pool: RRuleWorkerPool, master, rrule: str, exdates=None) -> list[datetime]:
+    instances = await pool.expand_event_to_list(master, rrule, exdates=exdates)
+    return [inst.start.date_time for inst in instances]
+
+
+def _entry(fingerprint: tuple[str, ...]) -> CachedExpansion:
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    return CachedExpansion(
+        fingerprint=fingerprint, window_start=now, covered_until=now, occurrences=[]
+    )
+
+
+def test_cache_get_drops_entry_when_fingerprint_changes() -> None:
+    cache = RRuleExpansionCache(max_entries=4)
+    cache.put("a", _entry(("a", "FREQ=DAILY")))
+
+    assert cache.get("a", ("a", "FREQ=DAILY")) is not None
+    assert cache.get("a", ("a", "FREQ=WEEKLY")) is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = RRuleExpansionCache(max_entries=2)
+    cache.put("a", _entry(("a",)))
+    cache.put("b", _entry(("b",)))
+    cache.get("a", ("a",))
+    cache.put("c", _entry(("c",)))
+
+    assert cache.get("b", ("b",)) is None
+    assert cache.get("a", ("a",)) is not None
+    assert cache.get("c", ("c",)) is not None
+
+
+def test_cache_with_zero_entries_stores_nothing() -> None:
+    cache = RRuleExpansionCache(max_entries=0)
+    cache.put("a", _entry(("a",)))
+    assert len(cache) == 0
+
+
+def test_fingerprint_ignores_exdate_order() -> None:
+    master = _master(datetime(2025, 1, 6, 9, 0, tzinfo=UTC))
+    first = expansion_fingerprint(master, "FREQ=DAILY", ["20250107T090000Z", "20250108T090000Z"])
+    second = expansion_fingerprint(master, "FREQ=DAILY", ["20250108T090000Z", "20250107T090000Z"])
+    assert first == second
+    assert first != expansion_fingerprint(master, "FREQ=DAILY", ["20250107T090000Z"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("rrule", "tz"),
+    [
+        ("FREQ=DAILY", UTC),
+        ("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE", UTC),
+        ("FREQ=MONTHLY;BYMONTHDAY=31", UTC),
+        ("FREQ=WEEKLY;BYDAY=TU,TH", ZoneInfo("America/Los_Angeles")),
+        ("FREQ=DAILY;COUNT=200", UTC),
+    ],
+)
+async def test_slid_window_matches_fresh_expansion(
+    monkeypatch: pytest.MonkeyPatch, rrule: str, tz
+) -> None:
+    """Refreshing after the window moved must give the same instances as a cold pool."""
+    master = _master(datetime(2025, 1, 6, 9, 0, tzinfo=tz))
+    exdates = ["20250303T170000Z"]
+    cached_pool = RRuleWorkerPool(DummySettings())
+
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", "2025-03-01T10:00:00+00:00")
+    await _starts(cached_pool, master, rrule, exdates)
+
+    # Slide across a DST change so rebased rules must keep local wall-clock time
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", "2025-03-20T10:00:00+00:00")
+    reused = await _starts(cached_pool, master, rrule, exdates)
+    fresh = await _starts(RRuleWorkerPool(DummySettings()), master, rrule, exdates)
+
+    assert cached_pool.expansion_cache.hits == 1
+    assert reused == fresh
+
+
+@pytest.mark.asyncio
+async def test_changed_exdates_invalidate_cached_series(monkeypatch: pytest.MonkeyPatch) -> None:
+    master = _master(datetime(2025, 1, 6, 9, 0, tzinfo=UTC))
+    pool = RRuleWorkerPool(DummySettings())
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", "2025-03-01T10:00:00+00:00")
+
+    before = await _starts(pool, master, "FREQ=DAILY")
+    excluded = datetime(2025, 3, 5, 9, 0, tzinfo=UTC)
+    after = await _starts(pool, master, "FREQ=DAILY", exdates=["20250305T090000Z"])
+
+    assert excluded in before
+    assert excluded not in after
+    assert pool.expansion_cache.hits == 0
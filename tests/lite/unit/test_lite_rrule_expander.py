@@ -5,15 +5,17 @@ Covers:
 - basic RRULE expansion for DAILY/COUNT
 - EXDATE exclusion handling
 - honoring expansion limits (COUNT)
+- stable instance IDs across expansions
 """
 
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
+from zoneinfo import ZoneInfo
 
 import pytest
 
 from calendarbot_lite.calendar.lite_models import LiteEventStatus
-from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool
+from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool, make_instance_id
 
 pytestmark = [pytest.mark.unit, pytest.mark.fast]
 
@@ -95,6 +97,41 @@ async def test_expand_event_respects_exdate_exclusion() -> None:
     assert excluded_dt not in starts
 
 
+def test_make_instance_id_uses_utc_start() -> None:
+    """Instance IDs depend only on master UID and UTC start, whatever the input timezone."""
+    local = datetime(2025, 11, 4, 9, 0, tzinfo=ZoneInfo("America/Los_Angeles"))
+    assert make_instance_id("uid-1", local) == "uid-1_20251104T170000Z"
+    assert make_instance_id("uid-1", local.astimezone(UTC)) == "uid-1_20251104T170000Z"
+    assert make_instance_id("uid-1", datetime(2025, 11, 4, 17, 0)) == "uid-1_20251104T170000Z"
+
+
+@pytest.mark.asyncio
+async def test_expanded_instance_ids_are_stable_across_expansions() -> None:
+    """Expanding the same master twice yields the same instance IDs."""
+    start_dt = datetime(2025, 3, 3, 9, 0, tzinfo=UTC)
+    master = SimpleNamespace()
+    master.start = SimpleNamespace(date_time=start_dt, time_zone="UTC")
+    master.end = SimpleNamespace(date_time=start_dt + timedelta(minutes=30), time_zone="UTC")
+    master.id = "master-stable"
+    master.subject = "Standup"
+    master.body_preview = ""
+    master.is_all_day = False
+    master.show_as = LiteEventStatus.BUSY
+    master.is_cancelled = False
+    master.is_organizer = True
+    master.location = None
+    master.is_online_meeting = False
+    master.online_meeting_url = None
+    master.last_modified_date_time = None
+
+    rrule = "FREQ=DAILY;COUNT=3"
+    first = await RRuleWorkerPool(DummySettings()).expand_event_to_list(master, rrule)  # type: ignore[arg-type]
+    second = await RRuleWorkerPool(DummySettings()).expand_event_to_list(master, rrule)  # type: ignore[arg-type]
+
+    assert [e.id for e in first] == [e.id for e in second]
+    assert first[0].id == "master-stable_20250303T090000Z"
+
+
 @pytest.mark.asyncio
 async def test_old_weekly_recurring_event_shows_future_occurrences(monkeypatch: pytest.MonkeyPatch) -> None:
     """
@@ -0,0 +1,166 @@
+"""Unit tests for the arithmetic DAILY/WEEKLY RRULE fast path.
+
+Every supported rule must produce exactly the occurrences dateutil produces:
+checked on the recurring ICS fixtures (DST crossings, EXDATEs, UNTIL/COUNT)
+and on a seeded sweep of generated rules, with and without NumPy.
+"""
+
+import random
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+from icalendar import Calendar
+
+from calendarbot_lite.calendar import lite_rrule_fastpath
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool
+from calendarbot_lite.calendar.lite_rrule_fastpath import SimpleRule, build_simple_recurrence
+from calendarbot_lite.calendar.lite_uid_index import UIDIndex
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures" / "ics"
+ZONES = ["UTC", "America/New_York", "America/Los_Angeles", "Europe/London", "Australia/Sydney"]
+
+
+class DummySettings:
+    rrule_worker_concurrency = 1
+    max_occurrences_per_rule = 250
+    expansion_days_window = 365
+    expansion_time_budget_ms_per_rule = 5000
+    expansion_yield_frequency = 50
+    expansion_cache_entries = 0
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def numpy_mode(request, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(lite_rrule_fastpath, "np", None)
+    return request.param
+
+
+def _as_compared(occurrences) -> list[tuple[datetime, object]]:
+    return [(o, o.utcoffset()) for o in occurrences]
+
+
+def _assert_matches_dateutil(pool, master, rrule, exdates, windows) -> None:
+    dtstart = master.start.date_time
+    fast = build_simple_recurrence(dtstart, rrule, pool._parse_exdates(exdates, master))
+    assert fast is not None, rrule
+    reference = pool._build_rule_set(dtstart, rrule, exdates, master)
+    for after, before in windows:
+        assert _as_compared(fast.between(after, before, inc=True)) == _as_compared(
+            reference.between(after, before, inc=True)
+        ), (rrule, dtstart, after, before)
+
+
+def _fixture_candidates():
+    parser = LiteICSParser(SimpleNamespace(**vars(DummySettings)))
+    for path in sorted(FIXTURES_DIR.rglob("*.ics")):
+        calendar = Calendar.from_ical(path.read_text(encoding="utf-8"))
+        components = [c for c in calendar.walk() if c.name == "VEVENT"]
+        events = [parser._parse_event_component(c, "America/Los_Angeles") for c in components]
+        uid_index = UIDIndex.build([e for e in events if e], components)
+        for master, rrule, exdates in parser._rrule_orchestrator._collect_expansion_candidates(
+            uid_index
+        ):
+            if SimpleRule.parse(rrule) is not None:
+                yield pytest.param(master, rrule, exdates, id=f"{path.stem}-{master.id}")
+
+
+@pytest.mark.parametrize(("master", "rrule", "exdates"), list(_fixture_candidates()))
+def test_fixture_rules_match_dateutil(numpy_mode, master, rrule, exdates) -> None:
+    pool = RRuleWorkerPool(DummySettings())
+    start = master.start.date_time.astimezone(UTC)
+    windows = [
+        (start - timedelta(days=1), start + timedelta(days=400)),
+        (start + timedelta(days=3, hours=5), start + timedelta(days=45)),
+        (datetime(2025, 10, 25, tzinfo=UTC), datetime(2025, 11, 15, tzinfo=UTC)),
+    ]
+    _assert_matches_dateutil(pool, master, rrule, exdates, windows)
+
+
+def _random_case(rng: random.Random):
+    tz = ZoneInfo(rng.choice(ZONES))
+    day = date(2024, 1, 1) + timedelta(days=rng.randrange(900))
+    hour, minute = rng.choice([(0, 30), (1, 30), (2, 30), (9, 0), (17, 45), (23, 15)])
+    dtstart = datetime(day.year, day.month, day.day, hour, minute, 7, 500, tzinfo=tz)
+
+    parts = [f"FREQ={rng.choice(['DAILY', 'WEEKLY'])}"]
+    if rng.random() < 0.6:
+        parts.append(f"INTERVAL={rng.randint(1, 3)}")
+    if rng.random() < 0.6:
+        days = rng.sample(["MO", "TU", "WE", "TH", "FR", "SA", "SU"], rng.randint(1, 4))
+        parts.append("BYDAY=" + ",".join(days))
+    if rng.random() < 0.4:
+        parts.append(f"WKST={rng.choice(['MO', 'SU', 'WE'])}")
+    ending = rng.random()
+    if ending < 0.3:
+        parts.append(f"COUNT={rng.randint(1, 60)}")
+    elif ending < 0.6:
+        until = dtstart.astimezone(UTC) + timedelta(
+            days=rng.randint(0, 300), hours=rng.randint(0, 23)
+        )
+        parts.append(f"UNTIL={until:%Y%m%dT%H%M%S}Z")
+    return dtstart, ";".join(parts)
+
+
+def test_generated_rules_match_dateutil(numpy_mode) -> None:
+    rng = random.Random(20251105)
+    pool = RRuleWorkerPool(DummySettings())
+    for _ in range(300):
+        dtstart, rrule = _random_case(rng)
+        master = SimpleNamespace(start=SimpleNamespace(date_time=dtstart), subject="generated")
+
+        first = pool._build_rule_set(dtstart, rrule, None, master)[:20]
+        exdates = [
+            f"{o.astimezone(UTC):%Y%m%dT%H%M%S}Z" for o in rng.sample(first, len(first) // 3)
+        ]
+        exdates.append(f"TZID={dtstart.tzinfo}:{dtstart:%Y%m%d}T120000")
+
+        start = dtstart.astimezone(UTC)
+        offset = timedelta(days=rng.randint(0, 200), minutes=rng.randint(0, 1439))
+        windows = [
+            (start - timedelta(days=2), start + timedelta(days=500)),
+            (start + offset, start + offset + timedelta(days=rng.randint(1, 120))),
+            (start, start),
+        ]
+        _assert_matches_dateutil(pool, master, rrule, exdates, windows)
+
+
+@pytest.mark.parametrize(
+    "rrule",
+    [
+        "FREQ=MONTHLY;BYMONTHDAY=5",
+        "FREQ=HOURLY;COUNT=4",
+        "FREQ=WEEKLY;BYDAY=1MO",
+        "FREQ=WEEKLY;BYSETPOS=-1;BYDAY=MO,FR",
+        "FREQ=DAILY;UNTIL=20251231",
+        "FREQ=DAILY;COUNT=3;UNTIL=20251231T000000Z",
+        "FREQ=DAILY;INTERVAL=0",
+        "RRULE:FREQ=DAILY\nEXDATE:20251105T090000Z",
+    ],
+)
+def test_unsupported_rules_fall_back(rrule: str) -> None:
+    assert SimpleRule.parse(rrule) is None
+
+
+def test_naive_dtstart_falls_back() -> None:
+    assert build_simple_recurrence(datetime(2025, 11, 3, 9, 0), "FREQ=DAILY") is None
+
+
+def test_worker_pool_uses_fast_path_for_simple_rules() -> None:
+    pool = RRuleWorkerPool(DummySettings())
+    master = SimpleNamespace(subject="x")
+    dtstart = datetime(2025, 11, 3, 9, 0, tzinfo=ZoneInfo("America/New_York"))
+
+    simple = pool._build_recurrence(dtstart, "FREQ=WEEKLY;BYDAY=MO,TH", None, master)
+    monthly = pool._build_recurrence(dtstart, "FREQ=MONTHLY;BYMONTHDAY=3", None, master)
+
+    assert isinstance(simple, lite_rrule_fastpath.SimpleRecurrence)
+    assert not isinstance(monthly, lite_rrule_fastpath.SimpleRecurrence)
@@ -0,0 +1,183 @@
+"""Unit tests for process-pool RRULE expansion."""
+
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from calendarbot_lite.calendar import lite_rrule_expander
+from calendarbot_lite.calendar.lite_models import (
+    ExpandedOccurrence,
+    LiteCalendarEvent,
+    LiteDateTimeInfo,
+)
+from calendarbot_lite.calendar.lite_rrule_expander import RRuleWorkerPool, expand_events_streaming
+from calendarbot_lite.calendar.lite_rrule_process_pool import (
+    ExpandedBatch,
+    ExpansionJob,
+    RRuleProcessPool,
+    _expand_batch_in_worker,
+    partition_jobs,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+RULES = [
+    "FREQ=DAILY",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=MONTHLY;BYMONTHDAY=15",
+    "FREQ=DAILY;COUNT=10",
+    "FREQ=YEARLY;BYMONTH=3;BYDAY=2TU",
+]
+
+
+class DummySettings:
+    rrule_worker_concurrency = 1
+    max_occurrences_per_rule = 250
+    expansion_days_window = 120
+    expansion_time_budget_ms_per_rule = 5000
+    expansion_yield_frequency = 50
+    rrule_expansion_processes = 2
+
+
+class InProcessPool:
+    """Stands in for RRuleProcessPool, running the worker function in this process."""
+
+    def __init__(self) -> None:
+        self.jobs: list[ExpansionJob] = []
+
+    async def expand(self, jobs: list[ExpansionJob], settings: dict) -> ExpandedBatch:
+        self.jobs.extend(jobs)
+        return _expand_batch_in_worker(jobs, settings)
+
+
+def _masters(count: int) -> list[tuple[LiteCalendarEvent, str, list[str] | None]]:
+    tz = ZoneInfo("America/Los_Angeles")
+    candidates = []
+    for i in range(count):
+        start = datetime(2025, 1, 6 + i % 20, 9 + i % 8, 30, tzinfo=tz)
+        master = LiteCalendarEvent(
+            id=f"series-{i}",
+            subject=f"Series {i}",
+            start=LiteDateTimeInfo(date_time=start, time_zone="America/Los_Angeles"),
+            end=LiteDateTimeInfo(date_time=start + timedelta(minutes=45)),
+            is_recurring=True,
+        )
+        exdates = [f"{start.astimezone(UTC) + timedelta(days=7):%Y%m%dT%H%M%S}Z"] if i % 3 else None
+        candidates.append((master, RULES[i % len(RULES)], exdates))
+    return candidates
+
+
+async def _in_process(pool: RRuleWorkerPool, candidates) -> list:
+    return [
+        inst
+        for master, rrule, exdates in candidates
+        async for inst in pool.expand_rrule_stream(master, rrule, exdates)
+    ]
+
+
+def _keys(instances: list) -> list[tuple[str, datetime, datetime]]:
+    return [(i.id, i.start.date_time, i.end.date_time) for i in instances]
+
+
+@pytest.fixture(autouse=True)
+def _fixed_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", "2025-03-01T10:00:00+00:00")
+
+
+def test_partition_jobs_when_dealt_then_every_job_once() -> None:
+    jobs = list(range(10))
+
+    batches = partition_jobs(jobs, 4)  # type: ignore[arg-type]
+
+    assert batches == [[0, 4, 8], [1, 5, 9], [2, 6], [3, 7]]
+    assert partition_jobs(jobs[:2], 4) == [[0], [1]]  # type: ignore[arg-type]
+
+
+def test_worker_batch_when_rule_invalid_then_reported_as_failure() -> None:
+    start = datetime(2025, 3, 3, 9, 0, tzinfo=UTC)
+    job = ExpansionJob(
+        master_id="broken",
+        dtstart=start,
+        duration=timedelta(hours=1),
+        rrule_string="FREQ=NEVER",
+        exdates=None,
+        start_window=start,
+        end_window=start + timedelta(days=7),
+    )
+    ok = ExpansionJob(**{**job.__dict__, "master_id": "ok", "rrule_string": "FREQ=DAILY"})
+
+    batch = _expand_batch_in_worker([job, ok], RRuleWorkerPool(DummySettings()).process_settings())
+
+    assert [master_id for master_id, _ in batch.failures] == ["broken"]
+    assert len(batch.occurrences) == 8
+    assert batch.occurrences[0] == ("ok", start.timestamp(), start.timestamp() + 3600)
+
+
+async def test_expand_in_processes_when_compared_then_same_instances_as_in_process() -> None:
+    candidates = _masters(20)
+    expected = await _in_process(RRuleWorkerPool(DummySettings()), candidates)
+
+    actual = [
+        inst
+        async for inst in RRuleWorkerPool(DummySettings()).expand_in_processes(
+            candidates, InProcessPool()
+        )
+    ]
+
+    assert _keys(actual) == _keys(expected)
+    assert all(isinstance(inst, ExpandedOccurrence) for inst in actual)
+
+
+async def test_expand_in_processes_when_window_slides_then_cached_masters_stay_local(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    candidates = _masters(20)
+    pool = RRuleWorkerPool(DummySettings())
+    first_pool, second_pool = InProcessPool(), InProcessPool()
+    first = [inst async for inst in pool.expand_in_processes(candidates, first_pool)]
+
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", "2025-03-11T10:00:00+00:00")
+    second = [inst async for inst in pool.expand_in_processes(candidates, second_pool)]
+
+    assert len(first_pool.jobs) == 20
+    assert _keys(second) != _keys(first)
+    assert second_pool.jobs == []
+    assert _keys(second) == _keys(await _in_process(RRuleWorkerPool(DummySettings()), candidates))
+
+
+async def test_expand_in_processes_when_real_pool_then_same_instances_as_in_process() -> None:
+    candidates = _masters(16)
+    expected = await _in_process(RRuleWorkerPool(DummySettings()), candidates)
+    process_pool = RRuleProcessPool(max_workers=1)
+    try:
+        actual = [
+            inst
+            async for inst in RRuleWorkerPool(DummySettings()).expand_in_processes(
+                candidates, process_pool
+            )
+        ]
+    finally:
+        process_pool.shutdown()
+
+    assert _keys(actual) == _keys(expected)
+
+
+async def test_expand_events_streaming_when_pool_broken_then_expands_in_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class BrokenPool:
+        async def expand(self, jobs, settings):  # type: ignore[no-untyped-def]
+            raise BrokenProcessPool("worker died")
+
+    candidates = _masters(16)
+    monkeypatch.setattr(lite_rrule_expander, "_worker_pool", RRuleWorkerPool(DummySettings()))
+    monkeypatch.setattr(
+        "calendarbot_lite.calendar.lite_rrule_process_pool.get_rrule_process_pool",
+        lambda _max_workers: BrokenPool(),
+    )
+
+    actual = [inst async for inst in expand_events_streaming(candidates, DummySettings())]
+
+    assert _keys(actual) == _keys(await _in_process(RRuleWorkerPool(DummySettings()), candidates))
@@ -0,0 +1,141 @@
+"""Unit tests for sharded ICS parsing."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_sharding import plan_shards
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures" / "ics"
+
+HEADER = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//Test//EN\r\n"
+    "X-WR-CALNAME:Team\r\nX-WR-TIMEZONE:Europe/Berlin\r\n"
+)
+# Outlook-style zone name that only the VTIMEZONE defines
+VTIMEZONE = (
+    "BEGIN:VTIMEZONE\r\nTZID:Custom Standard Time\r\n"
+    "BEGIN:STANDARD\r\nDTSTART:16010101T030000\r\nTZOFFSETFROM:+0200\r\n"
+    "TZOFFSETTO:+0100\r\nRRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU\r\nEND:STANDARD\r\n"
+    "BEGIN:DAYLIGHT\r\nDTSTART:16010101T020000\r\nTZOFFSETFROM:+0100\r\n"
+    "TZOFFSETTO:+0200\r\nRRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU\r\nEND:DAYLIGHT\r\n"
+    "END:VTIMEZONE\r\n"
+)
+
+
+def _vevent(uid: str, start: str, extra: str = "") -> str:
+    return (
+        "BEGIN:VEVENT\r\n"
+        f"UID:{uid}\r\n"
+        f"DTSTART;TZID=Custom Standard Time:{start}\r\n"
+        "DURATION:PT1H\r\n"
+        f"SUMMARY:Meeting {uid}\r\n"
+        f"{extra}"
+        "END:VEVENT\r\n"
+    )
+
+
+def _calendar(*events: str) -> str:
+    return HEADER + VTIMEZONE + "".join(events) + "END:VCALENDAR\r\n"
+
+
+@pytest.fixture
+def parser() -> LiteICSParser:
+    return LiteICSParser(SimpleNamespace(enable_rrule_expansion=True, rrule_expansion_days=30))
+
+
+def _assert_same_result(sharded, expected) -> None:
+    assert sharded.model_dump(exclude={"parse_time", "phase_timings"}) == expected.model_dump(
+        exclude={"parse_time", "phase_timings"}
+    )
+    for got, want in zip(sharded.events, expected.events, strict=True):
+        assert got.start.date_time.tzinfo == want.start.date_time.tzinfo
+        assert getattr(got, "rrule_string", None) == getattr(want, "rrule_string", None)
+        assert getattr(got, "exdates", None) == getattr(want, "exdates", None)
+
+
+def test_plan_shards_splits_blocks_evenly_inside_envelope() -> None:
+    content = _calendar(*(_vevent(f"e{i}", f"202603{i + 1:02d}T090000") for i in range(9)))
+
+    plan = plan_shards(content, 3)
+
+    assert len(plan.shards) == 3
+    assert plan.envelope == HEADER + VTIMEZONE + "END:VCALENDAR\r\n"
+    for shard in plan.shards:
+        assert shard.startswith(HEADER + VTIMEZONE)
+        assert shard.count("BEGIN:VEVENT") == 3
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        HEADER + "END:VCALENDAR\r\n",
+        _calendar(_vevent("a", "20260301T090000")) + "BEGIN:VEVENT\r\nUID:cut\r\n",
+    ],
+    ids=["no-events", "unterminated-event"],
+)
+def test_plan_shards_keeps_unsplittable_feed_whole(content: str) -> None:
+    plan = plan_shards(content, 4)
+
+    assert plan.shards == [content]
+
+
+def test_sharded_parse_when_overrides_precede_masters_then_matches_single_parse(
+    parser: LiteICSParser,
+) -> None:
+    events = [
+        _vevent(
+            "series",
+            "20260310T100000",
+            "RECURRENCE-ID;TZID=Custom Standard Time:20260309T090000\r\n",
+        ),
+        _vevent("other", "20260302T140000"),
+        _vevent(
+            "series",
+            "20260302T090000",
+            "RRULE:FREQ=DAILY;COUNT=10\r\nEXDATE;TZID=Custom Standard Time:20260304T090000\r\n",
+        ),
+        _vevent("free", "20260303T090000", "TRANSP:TRANSPARENT\r\n"),
+        _vevent("other", "20260302T140000"),
+        "BEGIN:VEVENT\r\nUID:broken\r\nSUMMARY:No start\r\nEND:VEVENT\r\n",
+    ]
+    content = _calendar(*events)
+    expected = parser.parse_ics_content(content)
+
+    for shard_count in (2, 3, 6):
+        _assert_same_result(parser.parse_ics_content_sharded(content, None, shard_count), expected)
+
+
+@pytest.mark.parametrize("path", sorted(FIXTURES_DIR.rglob("*.ics")), ids=lambda p: p.stem)
+def test_sharded_parse_when_fixture_then_matches_single_parse(
+    parser: LiteICSParser, path: Path
+) -> None:
+    content = path.read_text(encoding="utf-8")
+
+    _assert_same_result(
+        parser.parse_ics_content_sharded(content, "https://example.com/cal.ics", 3),
+        parser.parse_ics_content(content, "https://example.com/cal.ics"),
+    )
+
+
+def test_sharded_parse_when_shard_is_not_a_calendar_then_fails(parser: LiteICSParser) -> None:
+    plan = parser.prepare_sharded_parse(
+        _calendar(_vevent("a", "20260301T090000"), _vevent("b", "20260302T090000")), 2
+    )
+    plan.shards[1] = "not a calendar"
+
+    result = parser.complete_sharded_parse(plan, [parser.parse_ics_shard(s) for s in plan.shards])
+
+    assert not result.success
+    assert result.error_message
+
+
+def test_sharded_parse_when_empty_then_reports_empty_content(parser: LiteICSParser) -> None:
+    result = parser.parse_ics_content_sharded("  ")
+
+    assert not result.success
+    assert result.error_message == "Empty ICS content"
@@ -0,0 +1,128 @@
+"""Unit tests for memoized TZID and VTIMEZONE resolution."""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from calendarbot_lite.calendar import lite_timezone_cache
+from calendarbot_lite.calendar.lite_datetime_utils import TimezoneParser
+from calendarbot_lite.calendar.lite_streaming_parser import LiteStreamingICSParser
+from calendarbot_lite.calendar.lite_timezone_cache import TimezoneResolver, resolve_tzid_name
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _vtimezone(tzid: str, offset: str) -> str:
+    return f"""BEGIN:VTIMEZONE
+TZID:{tzid}
+BEGIN:STANDARD
+DTSTART:19700101T000000
+TZOFFSETFROM:{offset}
+TZOFFSETTO:{offset}
+END:STANDARD
+END:VTIMEZONE"""
+
+
+def _feed(tzid: str, offset: str) -> str:
+    return f"""BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//Test//EN
+{_vtimezone(tzid, offset)}
+BEGIN:VEVENT
+UID:single@example.com
+DTSTART;TZID={tzid}:20250616T090000
+DTEND;TZID={tzid}:20250616T100000
+SUMMARY:Single
+END:VEVENT
+BEGIN:VEVENT
+UID:series@example.com
+DTSTART;TZID={tzid}:20250616T110000
+DTEND;TZID={tzid}:20250616T113000
+RRULE:FREQ=DAILY;COUNT=3
+SUMMARY:Series
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def _offset(value: datetime) -> timedelta:
+    offset = value.utcoffset()
+    assert offset is not None
+    return offset
+
+
+def test_streaming_parse_when_feed_defines_custom_zone_then_events_use_it() -> None:
+    tzid = "CalendarBot Test Zone A"
+    parser = LiteStreamingICSParser()
+
+    items = [item for item in parser.parse_stream(_feed(tzid, "+0530")) if item["type"] == "event"]
+
+    assert parser.timezone_resolver.defined_tzids == [tzid]
+    assert parser.fast_path_events == 1  # The RRULE master falls back to icalendar
+    for item in items:
+        assert _offset(item["component"].get("DTSTART").dt) == timedelta(hours=5, minutes=30)
+    assert "VTIMEZONE" not in str(items[0]["metadata"])
+
+
+def test_resolve_when_called_repeatedly_then_looked_up_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def counting_lookup(tz_id: str):  # type: ignore[no-untyped-def]
+        calls.append(tz_id)
+        return resolve_tzid_name(tz_id)
+
+    monkeypatch.setattr(lite_timezone_cache, "resolve_tzid_name", counting_lookup)
+    resolver = TimezoneResolver()
+
+    zones = [resolver.resolve("Europe/Berlin") for _ in range(50)]
+    zones += [resolver.resolve("W. Europe Standard Time") for _ in range(50)]
+
+    assert calls == ["Europe/Berlin", "W. Europe Standard Time"]
+    assert resolver.lookups == 100
+    assert resolver.hits == 98
+    assert set(zones) == {ZoneInfo("Europe/Berlin")}
+
+
+def test_resolve_when_custom_zone_redefined_then_new_definition_used() -> None:
+    tzid = "CalendarBot Test Zone B"
+    resolver = TimezoneResolver()
+    start = datetime(2025, 6, 16, 9, 0)
+
+    resolver.add_vtimezone(_vtimezone(tzid, "+0200"))
+    first = resolver.resolve(tzid)
+    resolver.add_vtimezone(_vtimezone(tzid, "-0300"))
+    second = resolver.resolve(tzid)
+
+    assert first is not None
+    assert second is not None
+    assert _offset(start.replace(tzinfo=first)) == timedelta(hours=2)
+    assert _offset(start.replace(tzinfo=second)) == timedelta(hours=-3)
+    assert len(resolver) == 2
+
+
+def test_resolve_when_known_zone_redefined_by_feed_then_system_zone_used() -> None:
+    resolver = TimezoneResolver()
+
+    resolver.add_vtimezone(_vtimezone("US/Pacific", "-0800"))
+
+    assert resolver.resolve("US/Pacific") == ZoneInfo("America/Los_Angeles")
+    assert resolver.resolve("No Such Zone") is None
+    assert resolver.add_vtimezone("BEGIN:VTIMEZONE\nEND:VTIMEZONE") is None
+
+
+def test_tzid_string_parsing_when_repeated_then_name_resolved_once() -> None:
+    resolve_tzid_name.cache_clear()
+    parser = TimezoneParser()
+
+    results = {
+        parser.parse_datetime_with_tzid(f"TZID=Pacific Standard Time:202510{day:02d}T090000")
+        for day in range(1, 21)
+    }
+
+    assert len(results) == 20
+    assert min(results).hour == 16  # 09:00 PDT in UTC
+    info = resolve_tzid_name.cache_info()
+    assert (info.misses, info.hits) == (1, 19)
@@ -0,0 +1,66 @@
+"""Unit tests for calendarbot_lite.calendar.lite_uid_index."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from icalendar import Event as ICalEvent
+
+from calendarbot_lite.calendar.lite_models import LiteCalendarEvent, LiteDateTimeInfo
+from calendarbot_lite.calendar.lite_uid_index import UIDIndex
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _component(uid: str, rrule: bool = False) -> ICalEvent:
+    component = ICalEvent()
+    component.add("UID", uid)
+    if rrule:
+        component.add("RRULE", {"FREQ": "WEEKLY"})
+    return component
+
+
+def _event(
+    uid: str, is_recurring: bool = False, recurrence_id: str | None = None
+) -> LiteCalendarEvent:
+    start = datetime(2025, 11, 3, 9, 0, tzinfo=UTC)
+    return LiteCalendarEvent(
+        id=uid,
+        subject=uid or "untitled",
+        start=LiteDateTimeInfo(date_time=start),
+        end=LiteDateTimeInfo(date_time=start + timedelta(minutes=30)),
+        is_recurring=is_recurring,
+        recurrence_id=recurrence_id,
+    )
+
+
+def test_build_prefers_recurring_masters_over_instances() -> None:
+    instance_component = _component("series")
+    master_component = _component("series", rrule=True)
+    override = _event("series", recurrence_id="20251110T090000Z")
+    master = _event("series", is_recurring=True)
+
+    index = UIDIndex.build([override, master], [instance_component, master_component])
+
+    assert index.components["series"] is master_component
+    assert index.events_by_id["series"] is master
+
+
+def test_overrides_are_grouped_by_uid_in_parse_order() -> None:
+    first = _event("a", recurrence_id="20251110T090000Z")
+    other = _event("b", recurrence_id="20251111T090000Z")
+    second = _event("a", recurrence_id="TZID=Europe/Berlin:20251117T100000")
+
+    index = UIDIndex.build([first, _event("a", is_recurring=True), other, second], [])
+
+    assert index.recurrence_ids("a") == ["20251110T090000Z", "TZID=Europe/Berlin:20251117T100000"]
+    assert index.recurrence_ids("missing") == []
+    assert index.override_events() == [first, other, second]
+
+
+def test_events_and_components_without_uid_are_skipped() -> None:
+    index = UIDIndex()
+    index.add_event(_event(""))
+    index.add_component(object())
+
+    assert index.events_by_id == {}
+    assert index.components == {}
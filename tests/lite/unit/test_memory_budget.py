@@ -0,0 +1,92 @@
+"""Unit tests for the refresh memory-budget governor."""
+
+import asyncio
+
+import pytest
+
+from calendarbot_lite.core.memory_budget import MemoryBudgetGovernor, estimate_source_mb
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+MB = 1024 * 1024
+
+
+def _governor(budget_mb: float, available_mb: float | None = None) -> MemoryBudgetGovernor:
+    metrics = {} if available_mb is None else {"memory_free_mb": available_mb}
+    return MemoryBudgetGovernor(budget_mb, reserve_mb=0, metrics_provider=lambda: metrics)
+
+
+def test_estimate_when_feed_larger_then_more_memory() -> None:
+    assert estimate_source_mb(0) == 0
+    assert estimate_source_mb(MB) == pytest.approx(8.0)
+    assert estimate_source_mb(2 * MB) == pytest.approx(2 * estimate_source_mb(MB))
+
+
+def test_plan_when_everything_fits_then_settings_unchanged() -> None:
+    plan = _governor(100).plan_refresh([MB, MB, MB], 3)
+
+    assert (plan.fetch_concurrency, plan.keep_cached) == (3, False)
+    assert not plan.degraded
+
+
+def test_plan_when_large_sources_do_not_fit_together_then_serialized() -> None:
+    plan = _governor(100).plan_refresh([5 * MB, 5 * MB, 5 * MB, MB], 4)
+
+    assert plan.fetch_concurrency == 2  # 2 x 40 MB fit in 100 MB, 3 x 40 MB do not
+    assert not plan.keep_cached
+    assert plan.steps == ["serialize_sources"]
+
+
+def test_plan_when_available_memory_lower_then_headroom_capped() -> None:
+    plan = _governor(100, available_mb=65).plan_refresh([5 * MB, 5 * MB], 2)
+
+    assert plan.fetch_concurrency == 1
+    assert plan.steps == ["serialize_sources"]
+    assert plan.headroom_mb == 65
+
+
+def test_plan_when_nothing_fits_then_cached_events_kept() -> None:
+    plan = _governor(100, available_mb=10).plan_refresh([20 * MB], 1)
+
+    assert plan.fetch_concurrency == 1
+    assert plan.keep_cached
+    assert plan.steps == ["keep_cached_events"]
+
+
+def test_available_when_metrics_fail_then_budget_only() -> None:
+    def failing() -> dict:
+        raise OSError("no /proc")
+
+    governor = MemoryBudgetGovernor(50, metrics_provider=failing)
+
+    assert governor.available_mb() is None
+    assert governor.headroom_mb() == 50
+
+
+@pytest.mark.asyncio
+async def test_admit_when_estimate_does_not_fit_next_to_others_then_waits() -> None:
+    governor = _governor(10)
+    order: list[str] = []
+
+    async def parse(name: str, estimate_mb: float) -> None:
+        async with governor.reserve(estimate_mb) as fits:
+            assert fits
+            order.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} end")
+
+    await asyncio.gather(parse("a", 6), parse("b", 6), parse("c", 3))
+
+    assert order.index("b start") > order.index("a end")
+    assert order.index("c start") < order.index("a end")
+    assert governor.in_flight_mb == 0
+
+
+@pytest.mark.asyncio
+async def test_admit_when_estimate_exceeds_budget_alone_then_admitted_unfit() -> None:
+    governor = _governor(10)
+
+    async with governor.reserve(12) as fits:
+        assert not fits
+        assert governor.in_flight_mb == 12
+    assert governor.in_flight_mb == 0
@@ -0,0 +1,203 @@
+"""Unit tests for lazy occurrence lookups (calendarbot_lite.domain.occurrence_query)."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from calendarbot_lite.alexa.alexa_utils import compute_done_for_day_info
+from calendarbot_lite.calendar.lite_models import (
+    ExpandedOccurrence,
+    LiteCalendarEvent,
+    LiteDateTimeInfo,
+)
+from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.domain.event_prioritizer import EventPrioritizer
+from calendarbot_lite.domain.event_window import EventWindow
+from calendarbot_lite.domain.occurrence_query import OccurrenceQuery
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+QUERY_ICS = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//Test//EN
+BEGIN:VEVENT
+UID:weekly-standup
+DTSTART;TZID=America/New_York:20251006T090000
+DTEND;TZID=America/New_York:20251006T093000
+RRULE:FREQ=WEEKLY;BYDAY=MO,TH
+EXDATE;TZID=America/New_York:20251110T090000
+SUMMARY:Standup
+STATUS:CONFIRMED
+TRANSP:OPAQUE
+END:VEVENT
+BEGIN:VEVENT
+UID:weekly-standup
+RECURRENCE-ID;TZID=America/New_York:20251113T090000
+DTSTART;TZID=America/New_York:20251113T140000
+DTEND;TZID=America/New_York:20251113T143000
+SUMMARY:Standup (moved)
+STATUS:CONFIRMED
+TRANSP:OPAQUE
+END:VEVENT
+BEGIN:VEVENT
+UID:one-off
+DTSTART:20251110T150000Z
+DTEND:20251110T160000Z
+SUMMARY:Design review
+STATUS:CONFIRMED
+TRANSP:OPAQUE
+END:VEVENT
+BEGIN:VEVENT
+UID:cancelled-one-off
+DTSTART:20251111T150000Z
+DTEND:20251111T160000Z
+SUMMARY:Cancelled sync
+STATUS:CANCELLED
+TRANSP:OPAQUE
+END:VEVENT
+END:VCALENDAR
+"""
+
+# The expander stopped after these occurrences (as max_occurrences_per_rule or the
+# expansion window would), so later standups come from stepping the rule
+CUT_OFF = datetime(2025, 11, 7, tzinfo=UTC)
+
+
+@pytest.fixture
+def events(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    monkeypatch.setenv("CALENDARBOT_TEST_TIME", "2025-11-05T12:00:00+00:00")
+    settings = Mock()
+    settings.enable_rrule_expansion = True
+    settings.rrule_expansion_days = 365
+    settings.max_occurrences_per_rule = 250
+    settings.raw_components_superset_limit = 1500
+    settings.rrule_worker_concurrency = 1
+    settings.expansion_days_window = 365
+    settings.expansion_time_budget_ms_per_rule = 5000
+    settings.expansion_yield_frequency = 50
+    settings.expansion_cache_entries = 0
+    settings.parse_window_lookback_days = None
+    return LiteICSParser(settings).parse_ics_content(QUERY_ICS).events
+
+
+def _cut(events: list[Any]) -> list[Any]:
+    """Drop the series' occurrences after CUT_OFF, as a truncated expansion would."""
+    return [
+        e for e in events if not (isinstance(e, ExpandedOccurrence) and e.start.date_time > CUT_OFF)
+    ]
+
+
+def _upcoming(events: list[Any], instant: datetime, limit: int) -> list[tuple[datetime, str]]:
+    return sorted((e.start.date_time, e.id) for e in events if e.start.date_time > instant)[:limit]
+
+
+def test_next_after_when_expansion_cut_short_then_series_continues(events: list[Any]) -> None:
+    """Occurrences past the expanded ones match what full expansion produces."""
+    start = datetime(2025, 11, 6, tzinfo=UTC)
+
+    upcoming = OccurrenceQuery(_cut(events)).next_after(start, limit=8)
+
+    assert [(o.start.date_time, o.id) for o in upcoming] == _upcoming(events, start, 8)
+    assert upcoming[0].subject == "Standup"
+    assert "Cancelled sync" not in {o.subject for o in upcoming}
+
+
+def test_next_after_when_continuing_then_exdate_and_override_honoured(events: list[Any]) -> None:
+    query = OccurrenceQuery(_cut(events))
+
+    upcoming = query.next_after(datetime(2025, 11, 10, tzinfo=UTC), limit=3)
+
+    assert [(o.start.date_time, o.subject) for o in upcoming] == [
+        (datetime(2025, 11, 10, 15, 0, tzinfo=UTC), "Design review"),
+        (datetime(2025, 11, 13, 19, 0, tzinfo=UTC), "Standup (moved)"),
+        (datetime(2025, 11, 17, 14, 0, tzinfo=UTC), "Standup"),
+    ]
+
+
+def test_next_after_when_answered_by_expanded_occurrences_then_rule_not_stepped(
+    events: list[Any],
+) -> None:
+    query = OccurrenceQuery(events)
+
+    upcoming = query.next_after(datetime(2025, 11, 6, tzinfo=UTC), limit=3)
+
+    assert len(upcoming) == 3
+    assert [series.master.id for series in query.series] == ["weekly-standup"]
+    assert query.series[0]._rule_set is None
+
+
+def test_next_after_when_predicate_given_then_filters(events: list[Any]) -> None:
+    query = OccurrenceQuery(_cut(events))
+    skipped = {"weekly-standup_20251106T140000Z"}
+
+    upcoming = query.next_after(
+        datetime(2025, 11, 6, tzinfo=UTC), where=lambda o: o.id not in skipped
+    )
+
+    assert upcoming[0].start.date_time == datetime(2025, 11, 10, 15, 0, tzinfo=UTC)
+
+
+def test_covering_when_in_progress_then_returned(events: list[Any]) -> None:
+    query = OccurrenceQuery(_cut(events))
+
+    during = query.covering(datetime(2025, 11, 17, 14, 15, tzinfo=UTC))
+    at_end = query.covering(datetime(2025, 11, 17, 14, 30, tzinfo=UTC))
+    one_off = query.covering(datetime(2025, 11, 10, 15, 30, tzinfo=UTC))
+
+    assert [o.id for o in during] == ["weekly-standup_20251117T140000Z"]
+    assert at_end == []
+    assert [o.id for o in one_off] == ["one-off"]
+
+
+def test_count_in_range_when_half_open_then_end_excluded(events: list[Any]) -> None:
+    query = OccurrenceQuery(_cut(events))
+    week_start = datetime(2025, 11, 10, tzinfo=UTC)
+
+    # Mon 10th is excluded; design review (Mon) and the moved Thursday remain
+    assert query.count_in_range(week_start, week_start + timedelta(days=7)) == 2
+    assert query.count_in_range(week_start, datetime(2025, 11, 10, 15, 0, tzinfo=UTC)) == 0
+
+
+def test_find_next_event_when_window_exhausted_then_uses_occurrence_query(
+    events: list[Any],
+) -> None:
+    """Skipping every window event still finds the next meeting past the window."""
+    now = datetime(2025, 11, 6, 12, 0, tzinfo=UTC)
+    window_events = [e for e in _cut(events) if e.start.date_time <= CUT_OFF]
+    skipped = {e.id for e in window_events}
+    store = Mock()
+    store.is_skipped = Mock(side_effect=lambda event_id: event_id in skipped)
+    prioritizer = EventPrioritizer(Mock(return_value=False))
+
+    assert prioritizer.find_next_event(EventWindow(window_events), now, store) is None
+    result = prioritizer.find_next_event(
+        EventWindow(window_events, OccurrenceQuery(_cut(events))), now, store
+    )
+
+    assert result is not None
+    assert result[0].subject == "Design review"
+
+
+@pytest.mark.asyncio
+async def test_done_for_day_when_window_cut_then_counts_meetings_from_query() -> None:
+    now = datetime(2025, 11, 10, 8, 0, tzinfo=UTC)
+    day = [
+        LiteCalendarEvent(
+            id=f"meeting-{hour}",
+            subject=f"Meeting {hour}",
+            start=LiteDateTimeInfo(date_time=now.replace(hour=hour)),
+            end=LiteDateTimeInfo(date_time=now.replace(hour=hour, minute=30)),
+        )
+        for hour in (9, 11, 16)
+    ]
+    window = EventWindow(day[:1], OccurrenceQuery(day))
+
+    async def passthrough(events: list[Any], **_: Any) -> list[Any]:
+        return list(events)
+
+    info = await compute_done_for_day_info(window, "UTC", now, passthrough)
+
+    assert info["meetings_count"] == 3
+    assert info["last_meeting_end_utc"] == now.replace(hour=16, minute=30)
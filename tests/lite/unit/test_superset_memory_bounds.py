@@ -10,7 +10,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from calendarbot_lite.calendar.lite_parser import LiteICSParser
+from calendarbot_lite.calendar.lite_parser import LiteICSParser, _StreamingParseState
 
 pytestmark = pytest.mark.unit
 
@@ -348,6 +348,20 @@ class TestSupersetMemoryBounds:
         # We can verify this by checking that expansion worked
         # (expansion requires the components to be in the superset)
 
+    def test_streaming_state_keeps_newest_components_per_kind(self, mock_settings):
+        """Test that the bounded deques evict the oldest component of each kind."""
+        state = _StreamingParseState(mock_settings)
+        masters = [{"UID": f"master-{i}", "RRULE": "FREQ=DAILY"} for i in range(100)]
+        singles = [{"UID": f"single-{i}"} for i in range(50)]
+
+        for component in [*masters, *singles]:
+            state.keep_raw_component(component)
+
+        # limit=100 -> 70 masters, 30 non-masters, newest of each retained in feed order
+        assert list(state.raw_components_masters) == masters[-70:]
+        assert list(state.raw_components_nonmasters) == singles[-30:]
+        assert state.raw_components_superset() == masters[-70:] + singles[-30:]
+
 
 class TestSupersetPerformance:
     """Performance tests to ensure the fix doesn't degrade performance."""